@@ -17,8 +17,8 @@ echo $PWD
 
 rm -rf functions* *.pyc $5.tgz \
 *Analysis.py analysis_slurm.sh functions.h utils*.py \
-data weights_mva tmva_helper_xml.* \
-mysf.* \
-jsns config jsonpog-integration 
+data weights_mva tmva_helper_xml.* bdt_forest.* multihisto_helper.* \
+mysf.* jit_cache.py jit_cache.h runs_sums.h \
+jsns config jsonpog-integration normcache theorynorm catalog corrcache jitcache 
 
 ls -l
@@ -65,11 +65,28 @@ echo ${USERPROXY}
 
 voms-proxy-init --voms cms --valid 168:00 -pwstdin < $HOME/.grid-cert-passphrase
 
+normCacheFiles=""
+if [ -d normcache ]; then
+  normCacheFiles="normcache/*"
+fi
+catalogFiles=""
+if [ -d catalog ]; then
+  catalogFiles="catalog/*"
+fi
+corrCacheFiles=""
+if [ -d corrcache ]; then
+  corrCacheFiles="corrcache/*"
+fi
+theoryNormFiles=""
+if [ -d theorynorm ]; then
+  theoryNormFiles="theorynorm/*"
+fi
+
 tar cvzf ${whichAna}.tgz \
 *Analysis.py analysis_slurm.sh functions.h utils*.py \
-data/* weights_mva/* tmva_helper_xml.* \
-mysf.h \
-jsns/* config/* jsonpog-integration/*
+data/* weights_mva/* tmva_helper_xml.* bdt_forest.* multihisto_helper.* \
+mysf.h jit_cache.py jit_cache.h runs_sums.h \
+jsns/* config/* jsonpog-integration/* ${normCacheFiles} ${theoryNormFiles} ${catalogFiles} ${corrCacheFiles}
 
 while IFS= read -r line; do
 
@@ -0,0 +1,175 @@
+#include <ROOT/RVec.hxx>
+
+#include <algorithm>
+#include <cmath>
+#include <memory>
+#include <stdexcept>
+#include <vector>
+
+// Gradient boosted forest read from TMVA BDTG weights (see bdt_forest.py).
+// Every tree is stored as a complete binary tree of depth fDepth in flat arrays:
+// internal node i has the children 2i+1 (x < cut) and 2i+2 (x >= cut), shallower
+// leaves are replicated down to fDepth, so the traversal is a fixed number of
+// steps without data dependent branches. Read only after construction, the same
+// object can be used by all the slots.
+class bdt_forest {
+
+    public:
+        bdt_forest(unsigned int nVars, unsigned int depth, const std::vector<int> &var, const std::vector<float> &cut, const std::vector<float> &leaf) :
+            fNVars(nVars), fDepth(depth), fVar(var), fCut(cut), fLeaf(leaf) {
+
+            fNInternal = (1u << fDepth) - 1;
+            fNLeaves = 1u << fDepth;
+            fNTrees = fLeaf.size() / fNLeaves;
+            if (fVar.size() != fNTrees * fNInternal || fCut.size() != fNTrees * fNInternal || fLeaf.size() != fNTrees * fNLeaves)
+                throw std::runtime_error("bdt_forest: inconsistent forest arrays.");
+            for (auto v : fVar) {
+                if (v < 0 || (unsigned int)v >= fNVars)
+                    throw std::runtime_error("bdt_forest: variable index out of range.");
+            }
+        }
+
+        // x: nSets x nVars, out: nSets classification outputs, same as TMVA::Reader::EvaluateMVA
+        // (2/(1+exp(-2*sum))-1, and -999 if an input is NaN)
+        void Evaluate(const float *x, unsigned int nSets, float *out) const {
+
+            const unsigned int nChunk = 64;
+            double sum[nChunk];
+            for (unsigned int first = 0; first < nSets; first += nChunk) {
+                const unsigned int n = std::min(nChunk, nSets - first);
+                const float *xChunk = x + std::size_t(first) * fNVars;
+                std::fill(sum, sum + n, 0.0);
+
+                // trees outside, sets inside: each tree is loaded once for all the sets
+                for (unsigned int tree = 0; tree < fNTrees; tree++) {
+                    const int *var = fVar.data() + std::size_t(tree) * fNInternal;
+                    const float *cut = fCut.data() + std::size_t(tree) * fNInternal;
+                    const float *leaf = fLeaf.data() + std::size_t(tree) * fNLeaves;
+                    for (unsigned int set = 0; set < n; set++) {
+                        const float *xSet = xChunk + std::size_t(set) * fNVars;
+                        unsigned int idx = 0;
+                        for (unsigned int d = 0; d < fDepth; d++) {
+                            idx = 2 * idx + 1 + (xSet[var[idx]] >= cut[idx]);
+                        }
+                        sum[set] += leaf[idx - fNInternal];
+                    }
+                }
+
+                for (unsigned int set = 0; set < n; set++) {
+                    const float *xSet = xChunk + std::size_t(set) * fNVars;
+                    const bool isNaN = std::any_of(xSet, xSet + fNVars, [](float v) { return std::isnan(v); });
+                    out[first + set] = isNaN ? -999.0f : static_cast<float>(2.0 / (1.0 + std::exp(-2.0 * sum[set])) - 1.0);
+                }
+            }
+        }
+
+        // same interface as tmva_helper_xml
+        std::vector<float> operator()(unsigned int, const ROOT::VecOps::RVec<float> &x) const {
+            if (x.size() != fNVars)
+                throw std::runtime_error("Size of input vector is not equal to number of variables.");
+            std::vector<float> out(1);
+            Evaluate(x.data(), 1, out.data());
+            return out;
+        }
+
+        unsigned int GetNVars() const { return fNVars; }
+        unsigned int GetNTrees() const { return fNTrees; }
+        unsigned int GetDepth() const { return fDepth; }
+
+    private:
+        unsigned int fNVars;
+        unsigned int fDepth;
+        unsigned int fNInternal;
+        unsigned int fNLeaves;
+        unsigned int fNTrees;
+        std::vector<int> fVar;
+        std::vector<float> fCut;
+        std::vector<float> fLeaf;
+};
+
+// Nominal and variation input sets of an event (nSets x nVars) in one call, like
+// tmva_helper_xml_variations: the sets failing their preselection (-999) and the
+// ones identical to the nominal are not evaluated, the others are evaluated together
+// in one batch. Per-slot storage allocated once, returned as a non-owning RVec on it
+class bdt_forest_variations {
+    public:
+        bdt_forest_variations(const bdt_forest &forest, const unsigned int nSets, const unsigned int nSlots) : forest_(&forest), nSets_(nSets) {
+
+            const unsigned int nSlotsActual = std::max(nSlots, 1U);
+            out_ = std::make_shared<std::vector<ROOT::VecOps::RVec<float>>>(nSlotsActual, ROOT::VecOps::RVec<float>(nSets));
+            buffer_ = std::make_shared<std::vector<std::vector<float>>>(nSlotsActual, std::vector<float>(nSets * forest.GetNVars()));
+            index_ = std::make_shared<std::vector<std::vector<unsigned int>>>(nSlotsActual, std::vector<unsigned int>(nSets));
+            nEvaluated_ = std::make_shared<std::vector<unsigned long>>(nSlotsActual, 0);
+            nSkipped_ = std::make_shared<std::vector<unsigned long>>(nSlotsActual, 0);
+            nFailed_ = std::make_shared<std::vector<unsigned long>>(nSlotsActual, 0);
+        }
+
+        ROOT::VecOps::RVec<float> operator()(unsigned int slot, const ROOT::VecOps::RVec<float> &vars, const ROOT::VecOps::RVec<int> &pass) {
+
+            const unsigned int nVars = forest_->GetNVars();
+            if (vars.size() != nSets_ * nVars)
+                throw std::runtime_error("Size of input vector is not equal to number of sets times number of variables.");
+            if (pass.size() != nSets_)
+                throw std::runtime_error("Size of preselection vector is not equal to number of sets.");
+
+            auto &out = (*out_)[slot];
+            auto &buffer = (*buffer_)[slot];
+            auto &index = (*index_)[slot];
+
+            // distinct preselected sets packed at the front of the buffer
+            unsigned int nDistinct = 0;
+            unsigned int nFailed = 0;
+            for (unsigned int set = 0; set < nSets_; set++) {
+                const float *xSet = vars.data() + set * nVars;
+                if (pass[set] == 0) { nFailed++; continue; }
+                if (set > 0 && pass[0] != 0 && std::equal(xSet, xSet + nVars, vars.data())) continue;
+                std::copy(xSet, xSet + nVars, buffer.begin() + nDistinct * nVars);
+                index[nDistinct++] = set;
+            }
+
+            forest_->Evaluate(buffer.data(), nDistinct, out.data());
+
+            // scatter back, from the last one so that nothing is overwritten before being moved
+            // (index[i] >= i), then the sets not evaluated: -999 or a copy of the nominal
+            for (unsigned int i = nDistinct; i-- > 0;) {
+                out[index[i]] = out[i];
+            }
+            for (unsigned int set = 0, i = 0; set < nSets_; set++) {
+                if (i < nDistinct && index[i] == set) { i++; continue; }
+                out[set] = pass[set] == 0 ? -999.0f : out[0];
+            }
+
+            (*nEvaluated_)[slot] += nDistinct;
+            (*nSkipped_)[slot] += nSets_ - nDistinct - nFailed;
+            (*nFailed_)[slot] += nFailed;
+            return ROOT::VecOps::RVec<float>(out.data(), out.size());
+        }
+
+        unsigned long GetNEvaluated() const {
+            unsigned long n = 0;
+            for (auto x : *nEvaluated_) n += x;
+            return n;
+        }
+
+        unsigned long GetNSkipped() const {
+            unsigned long n = 0;
+            for (auto x : *nSkipped_) n += x;
+            return n;
+        }
+
+        unsigned long GetNFailed() const {
+            unsigned long n = 0;
+            for (auto x : *nFailed_) n += x;
+            return n;
+        }
+
+    private:
+        const bdt_forest *forest_;
+        unsigned int nSets_;
+        std::shared_ptr<std::vector<ROOT::VecOps::RVec<float>>> out_;
+        std::shared_ptr<std::vector<std::vector<float>>> buffer_;
+        std::shared_ptr<std::vector<std::vector<unsigned int>>> index_;
+        std::shared_ptr<std::vector<unsigned long>> nEvaluated_;
+        std::shared_ptr<std::vector<unsigned long>> nSkipped_;
+        std::shared_ptr<std::vector<unsigned long>> nFailed_;
+};
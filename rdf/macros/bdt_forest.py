@@ -0,0 +1,119 @@
+import ROOT
+import xml.etree.ElementTree as ET
+ROOT.gInterpreter.Declare('#include "bdt_forest.h"')
+
+# Drop-in replacement of TMVAHelperXML for TMVA BDTG (gradient boosted, classification)
+# weights: the XML is parsed once into a flat forest of complete binary trees
+# evaluated in compiled code (bdt_forest.h), without any TMVA::Reader
+class BDTForest():
+
+    def __init__(self, model_input, model_name=""):
+        root = ET.parse(model_input).getroot()
+
+        info = {x.get("name"): x.get("value") for x in root.iter("Info")}
+        options = {x.get("name"): x.text for x in root.iter("Option")}
+        if(info.get("AnalysisType") != "Classification" or options.get("BoostType") != "Grad"):
+            raise Exception(f"{model_input}: only BDTG classification weights are supported.")
+        transformations = root.find("Transformations")
+        if(transformations is not None and int(transformations.get("NTransformations", "0")) != 0):
+            raise Exception(f"{model_input}: input variable transformations are not supported.")
+
+        self.variables = [x.get("Label") for x in sorted(root.find("Variables").iter("Variable"), key=lambda x: int(x.get("VarIndex")))]
+        self.ranges = [(float(x.get("Min")), float(x.get("Max"))) for x in sorted(root.find("Variables").iter("Variable"), key=lambda x: int(x.get("VarIndex")))]
+        self.model_input = model_input
+        self.model_name = model_name
+        self.nthreads = ROOT.GetThreadPoolSize()
+
+        trees = [x.find("Node") for x in root.find("Weights").iter("BinaryTree")]
+        self.depth = max([int(x.get("depth")) for tree in trees for x in tree.iter("Node") if int(x.get("nType")) != 0])
+        nInternal = 2**self.depth - 1
+        nLeaves = 2**self.depth
+        var = [0] * (len(trees) * nInternal)
+        cut = [0.0] * (len(trees) * nInternal)
+        leaf = [0.0] * (len(trees) * nLeaves)
+
+        # node idx of tree itree: internal nodes at itree*nInternal+idx,
+        # leaves (idx >= nInternal) at itree*nLeaves+idx-nInternal
+        def fillNode(node, itree, idx, depth):
+            if(depth == self.depth):
+                if(int(node.get("nType")) == 0):
+                    raise Exception(f"{model_input}: tree {itree} deeper than {self.depth}.")
+                leaf[itree*nLeaves+idx-nInternal] = float(node.get("res"))
+                return
+            if(int(node.get("nType")) != 0):
+                # leaf above the full depth: replicated in both the children
+                fillNode(node, itree, 2*idx+1, depth+1)
+                fillNode(node, itree, 2*idx+2, depth+1)
+                return
+            if(int(node.get("NCoef")) != 0):
+                raise Exception(f"{model_input}: Fisher cuts are not supported.")
+            children = {x.get("pos"): x for x in node.findall("Node")}
+            var[itree*nInternal+idx] = int(node.get("IVar"))
+            cut[itree*nInternal+idx] = float(node.get("Cut"))
+            # TMVA goes right when x >= cut for cType 1, and the opposite for cType 0
+            right, left = children["r"], children["l"]
+            if(int(node.get("cType")) == 0):
+                right, left = left, right
+            fillNode(left, itree, 2*idx+1, depth+1)
+            fillNode(right, itree, 2*idx+2, depth+1)
+
+        for itree, tree in enumerate(trees):
+            fillNode(tree, itree, 0, 0)
+
+        self.forest = ROOT.bdt_forest(len(self.variables), self.depth, ROOT.std.vector['int'](var), ROOT.std.vector['float'](cut), ROOT.std.vector['float'](leaf))
+        print("BDT forest: {0} trees of depth {1}, {2} variables ({3})".format(self.forest.GetNTrees(),self.depth,len(self.variables),model_input))
+
+        self.var_col = f"tmva_vars_{self.model_name}"
+        self.variations = []
+        self.variation_helpers = []
+
+    def run_inference(self, df, col_name = "mva_score", theType = 0):
+
+        # check if columns exist in the dataframe
+        cols = df.GetColumnNames()
+        for var in self.variables:
+            if not var in cols:
+                raise Exception(f"Variable {var} not defined in dataframe.")
+
+        vars_str = ', '.join(self.variables)
+        if(theType == 0):
+            df = df.Define(self.var_col, f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
+        else:
+            df = df.Redefine(self.var_col, f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
+        df = df.DefineSlot(col_name, self.forest, [self.var_col])
+        return df
+
+    # same as TMVAHelperXML.run_inference_variations, the distinct input sets of
+    # an event are evaluated together in one batch
+    def run_inference_variations(self, df, col_name, var_strings, redefined_vars, presel=None):
+
+        cols = df.GetColumnNames()
+        sets = [self.variables]
+        for var_string in var_strings:
+            sets.append([f"{var}{var_string}" if var in redefined_vars else var for var in self.variables])
+        for var in [x for y in sets for x in y]:
+            if not var in cols:
+                raise Exception(f"Variable {var} not defined in dataframe.")
+
+        vars_str = ', '.join([x for y in sets for x in y])
+        helper = ROOT.bdt_forest_variations(self.forest, len(sets), self.nthreads)
+        self.variation_helpers.append(helper)
+        if presel is None:
+            presel_str = f"ROOT::VecOps::RVec<int>({len(sets)}, 1)"
+        else:
+            presel_str = "ROOT::VecOps::RVec<int>{{{0}}}".format(", ".join([f"int({presel.format(x)})" for x in [""] + var_strings]))
+
+        all_col = f"{col_name}_variations{len(self.variation_helpers)}"
+        df = df.Define(f"{self.var_col}_variations{len(self.variation_helpers)}", f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
+        df = df.Define(f"{self.var_col}_presel{len(self.variation_helpers)}", presel_str)
+        df = df.DefineSlot(all_col, helper, [f"{self.var_col}_variations{len(self.variation_helpers)}", f"{self.var_col}_presel{len(self.variation_helpers)}"])
+        if not col_name in cols:
+            df = df.Define(col_name, f"ROOT::VecOps::RVec<float>({all_col}.begin(), {all_col}.begin()+1)")
+        for nv, var_string in enumerate(var_strings):
+            df = df.Define(f"{col_name}{var_string}", f"ROOT::VecOps::RVec<float>({all_col}.begin()+{nv+1}, {all_col}.begin()+{nv+2})")
+            self.variations.append(var_string)
+        return df
+
+    def print_variation_stats(self):
+        for helper in self.variation_helpers:
+            print("BDT variations: {0} evaluated / {1} skipped (same inputs as the nominal) / {2} not preselected".format(helper.GetNEvaluated(),helper.GetNSkipped(),helper.GetNFailed()))
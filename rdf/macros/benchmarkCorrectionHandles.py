@@ -0,0 +1,105 @@
+import ROOT
+import os, sys, getopt
+
+import utilsAna # loads functions.h
+
+# Microbenchmark of the correction handles: the string-keyed compute_JSON_*_SF(s)
+# functions against the bound compute_JSON_*_h ones, on synthetic objects.
+# Prints the calls per second of both and the largest difference of the weights
+
+ROOT.gInterpreter.Declare('''
+#include <chrono>
+
+struct HandleBenchmark { double timeString; double timeHandle; double maxDiff; };
+
+HandleBenchmark benchmarkJSONHandles(int which, unsigned int nEvents, unsigned int nObjects, std::string key, int handle) {
+  TRandom3 rnd(1234);
+  std::vector<Vec_f> pt(nEvents), eta(nEvents), phi(nEvents), p(nEvents), btag(nEvents);
+  std::vector<Vec_i> flavor(nEvents);
+  const int flavors[3] = {0, 4, 5};
+  for(unsigned int n=0; n<nEvents; n++) {
+    for(unsigned int i=0; i<nObjects; i++) {
+      pt[n].push_back(25 + rnd.Exp(40)); eta[n].push_back(rnd.Uniform(-2.4,2.4)); phi[n].push_back(rnd.Uniform(-3.14,3.14));
+      p[n].push_back(pt[n][i]*cosh(eta[n][i])); btag[n].push_back(rnd.Rndm()); flavor[n].push_back(flavors[rnd.Integer(3)]);
+    }
+  }
+
+  std::vector<float> resultString(nEvents), resultHandle(nEvents);
+  auto start = std::chrono::steady_clock::now();
+  for(unsigned int n=0; n<nEvents; n++) {
+    if     (which == 0) resultString[n] = compute_JSON_BTV_SF(pt[n], eta[n], btag[n], flavor[n], key, 1, 0, 0.5);
+    else if(which == 1) resultString[n] = compute_JSON_MUO_SFs("syst", "syst", "syst", pt[n], eta[n], p[n], +1);
+    else if(which == 2) resultString[n] = compute_JSON_ELE_SFs(key, "sf", "sf", "Medium", pt[n], eta[n], phi[n]);
+  }
+  auto middle = std::chrono::steady_clock::now();
+  for(unsigned int n=0; n<nEvents; n++) {
+    if     (which == 0) resultHandle[n] = compute_JSON_BTV_SF_h(handle, pt[n], eta[n], btag[n], flavor[n], 0.5);
+    else if(which == 1) resultHandle[n] = compute_JSON_MUO_SFs_h(handle, pt[n], eta[n], p[n], +1);
+    else if(which == 2) resultHandle[n] = compute_JSON_ELE_SFs_h(handle, pt[n], eta[n], phi[n]);
+  }
+  auto end = std::chrono::steady_clock::now();
+
+  HandleBenchmark result;
+  result.timeString = std::chrono::duration<double>(middle - start).count();
+  result.timeHandle = std::chrono::duration<double>(end - middle).count();
+  result.maxDiff = 0;
+  for(unsigned int n=0; n<nEvents; n++) result.maxDiff = std::max(result.maxDiff, (double)std::abs(resultString[n] - resultHandle[n]));
+  return result;
+}
+''')
+
+if __name__ == "__main__":
+
+    year = 20220
+    nEvents = 100000
+    nObjects = 4
+
+    valid = ['year=', 'nEvents=', 'nObjects=', 'help']
+    usage  =  "Usage: benchmarkCorrectionHandles.py --year=<{0}>\n".format(year)
+    usage +=  "                                     --nEvents=<{0}>\n".format(nEvents)
+    usage +=  "                                     --nObjects=<{0}>".format(nObjects)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--year":
+            year = int(arg)
+        if opt == "--nEvents":
+            nEvents = int(arg)
+        if opt == "--nObjects":
+            nObjects = int(arg)
+
+    ROOT.initJSONSFs(year)
+
+    ELEYEAR = "NULL"
+    if  (year == 20220): ELEYEAR = "2022Re-recoBCD"
+    elif(year == 20221): ELEYEAR = "2022Re-recoE+PromptFG"
+    elif(year == 20230): ELEYEAR = "2023PromptC"
+    elif(year == 20231): ELEYEAR = "2023PromptD"
+    elif(year == 20240 or year == 20250): ELEYEAR = "2024Prompt"
+
+    btvKey = "up_jes"
+
+    tests = [("BTV", 0, btvKey, ROOT.bindJSON_BTV_SF(btvKey,1,0)),
+             ("MUO", 1, "", ROOT.bindJSON_MUO_SFs("syst","syst","syst")),
+             ("ELE", 2, ELEYEAR, ROOT.bindJSON_ELE_SFs(ELEYEAR,"sf","sf","Medium"))]
+
+    isFailure = False
+    for name, which, key, handle in tests:
+        result = ROOT.benchmarkJSONHandles(which, nEvents, nObjects, key, handle)
+        nCalls = nEvents * nObjects
+        print("{0}: {1} objects, strings {2:.0f} calls/s, handles {3:.0f} calls/s, speedup {4:.2f}, max difference {5:.3e}".format(
+              name,nCalls,nCalls/max(result.timeString,1e-9),nCalls/max(result.timeHandle,1e-9),result.timeString/max(result.timeHandle,1e-9),result.maxDiff))
+        if(result.maxDiff > 0): isFailure = True
+
+    if(isFailure == True):
+        print("FAILURE: the handles do not reproduce the string-keyed evaluation")
+        sys.exit(1)
+    print("SUCCESS: identical weights with the handles")
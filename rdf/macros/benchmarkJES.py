@@ -0,0 +1,104 @@
+import ROOT
+import os, sys, getopt, time
+
+import utilsAna # loads functions.h
+
+# Opt-in benchmark of the jet pt variations: the 28 per-source compute_JSON_JES_Unc calls
+# (plus the nominal and up JER calls) against the batched compute_JSON_JET_Var evaluator
+
+def defineJets(df):
+    return (df.Define("clean_Jet_pt"       ,"Jet_pt")
+              .Define("clean_Jet_eta"      ,"Jet_eta")
+              .Define("clean_Jet_phi"      ,"Jet_phi")
+              .Define("clean_Jet_area"     ,"Jet_area")
+              .Define("clean_Jet_rawFactor","Jet_rawFactor")
+              .Define("clean_Jet_genJetIdx","Jet_genJetIdx")
+              .Define("clean_Jet_ptNoJER"  ,"compute_JSON_JES_Unc(clean_Jet_pt,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run,0,-1)")
+              )
+
+def runPerSource(fileName):
+    df = defineJets(ROOT.RDataFrame("Events", fileName))
+    df =(df.Define("clean_Jet_ptDef"  , "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0,run,luminosityBlock,event)")
+           .Define("clean_Jet_ptJerUp", "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,+1,run,luminosityBlock,event)")
+           )
+    sumPt = "Sum(clean_Jet_ptDef)+Sum(clean_Jet_ptJerUp)"
+    for nv in range(0,28):
+        df = df.Define("clean_Jet_ptJes{0:02d}Up".format(nv), "compute_JSON_JES_Unc(clean_Jet_ptDef,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run,{0},-1)".format(nv+1))
+        sumPt += "+Sum(clean_Jet_ptJes{0:02d}Up)".format(nv)
+    result = df.Define("sumPt", sumPt).Sum("sumPt")
+
+    startTime = time.time()
+    result.GetValue()
+    return time.time()-startTime
+
+def runBatched(fileName, validate):
+    df = defineJets(ROOT.RDataFrame("Events", fileName))
+    df =(df.Define("clean_Jet_ptVar", "compute_JSON_JET_Var(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,run,luminosityBlock,event)")
+           .Define("sumPt", "Sum(clean_Jet_ptVar)")
+           )
+    result = df.Sum("sumPt")
+
+    startTime = time.time()
+    result.GetValue()
+    loopTime = time.time()-startTime
+
+    # validation in a separate event loop, not included in the timing
+    if(validate == 1):
+        diff = "0.0f"
+        for nv in range(0,28):
+            df = df.Define("diffJes{0:02d}Up".format(nv), "Max(abs(get_JSON_JET_Var(clean_Jet_ptVar,{0})-compute_JSON_JES_Unc(get_JSON_JET_Var(clean_Jet_ptVar,0),clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run,{1},-1)))".format(nv+2,nv+1))
+            diff = "std::max({0},diffJes{1:02d}Up)".format(diff,nv)
+        maxDiff = df.Define("maxDiff", diff).Max("maxDiff")
+        print("Largest per-jet difference batched vs per-source JES: {0}".format(maxDiff.GetValue()))
+
+    return loopTime
+
+if __name__ == "__main__":
+
+    fileName = ""
+    year = 20220
+    nThreads = 1
+    validate = 1
+
+    valid = ['input=', 'year=', 'nThreads=', 'validate=', 'help']
+    usage  =  "Usage: benchmarkJES.py --input=<{0}>\n".format(fileName)
+    usage +=  "                       --year=<{0}>\n".format(year)
+    usage +=  "                       --nThreads=<{0}>\n".format(nThreads)
+    usage +=  "                       --validate=<{0}>".format(validate)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--input":
+            fileName = str(arg)
+        if opt == "--year":
+            year = int(arg)
+        if opt == "--nThreads":
+            nThreads = int(arg)
+        if opt == "--validate":
+            validate = int(arg)
+
+    if(not os.path.exists(fileName)):
+        print("Input file does not exist: {0}".format(fileName))
+        sys.exit(1)
+
+    if(nThreads > 1): ROOT.ROOT.EnableImplicitMT(nThreads)
+
+    ROOT.initJSONSFs(year)
+
+    nEvents = ROOT.RDataFrame("Events", fileName).Count().GetValue()
+
+    timePerSource = runPerSource(fileName)
+    timeBatched = runBatched(fileName, validate)
+
+    print("Events: {0} / threads: {1}".format(nEvents,nThreads))
+    print("Per-source JES/JER: {0:.2f} s ({1:.0f} events/s)".format(timePerSource,nEvents/max(timePerSource,1e-9)))
+    print("Batched JES/JER   : {0:.2f} s ({1:.0f} events/s)".format(timeBatched,nEvents/max(timeBatched,1e-9)))
+    print("Speedup: {0:.2f}".format(timePerSource/max(timeBatched,1e-9)))
@@ -0,0 +1,101 @@
+import ROOT
+import os, sys, getopt, re, subprocess
+
+# Opt-in benchmark of the systematic variations of an analysis: the legacy backend
+# (one filtered node per variation) against the RDataFrame::Vary backend (declareVary).
+# Each backend runs the analysis on the same job in its own process, the JIT cache
+# report gives the graph building, jitting and event loop times and the two output
+# files are compared histogram by histogram
+
+def runBackend(analysis, year, process, whichJob, isVary):
+    code  = "import sys, runpy, utilsSelection\n"
+    code += "utilsSelection.varyAnalyses[:] = {0}\n".format(["{0}".format(analysis)] if isVary == True else [])
+    code += "sys.argv = ['{0}Analysis.py', '--year={1}', '--process={2}', '--whichJob={3}']\n".format(analysis,year,process,whichJob)
+    code += "runpy.run_path('{0}Analysis.py', run_name='__main__')\n".format(analysis)
+    output = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True).stdout
+
+    timing = re.search("JIT cache \\w+: graph building ([\\d.]+) s, jitting ([\\d.]+) s, event loop ([\\d.]+) s \\((\\d+) events", output)
+    if(timing is None):
+        print(output)
+        print("No timing found for the {0} backend, is useJitCache set in {1}Analysis.py?".format("vary" if isVary == True else "legacy",analysis))
+        sys.exit(1)
+    return [float(timing.group(1)), float(timing.group(2)), float(timing.group(3)), int(timing.group(4))]
+
+def compareHistos(legacyName, varyName, tolerance):
+    legacyFile = ROOT.TFile(legacyName)
+    varyFile = ROOT.TFile(varyName)
+    names = sorted(set([x.GetName() for x in legacyFile.GetListOfKeys()] + [x.GetName() for x in varyFile.GetListOfKeys()]))
+    nDiff = 0
+    maxDiff = 0.0
+    for name in names:
+        hLegacy = legacyFile.Get(name)
+        hVary = varyFile.Get(name)
+        if(not hLegacy or not hVary):
+            print("Only in the {0} output: {1}".format("legacy" if hLegacy else "vary",name))
+            nDiff += 1
+            continue
+        diff = 0.0
+        for i in range(hLegacy.GetNcells()):
+            diff = max(diff, abs(hLegacy.GetBinContent(i)-hVary.GetBinContent(i))/max(abs(hLegacy.GetBinContent(i)),1e-9))
+        maxDiff = max(maxDiff, diff)
+        if(diff > tolerance):
+            print("Different {0}: relative difference {1:.2e}".format(name,diff))
+            nDiff += 1
+    print("Compared {0} histograms: {1} differences, largest relative difference {2:.2e}".format(len(names),nDiff,maxDiff))
+
+if __name__ == "__main__":
+
+    analysis = "wz"
+    year = 2022
+    process = -1
+    whichJob = -1
+    tolerance = 1e-6
+
+    valid = ['analysis=', 'year=', 'process=', 'whichJob=', 'tolerance=', 'help']
+    usage  =  "Usage: benchmarkVary.py --analysis=<{0}>\n".format(analysis)
+    usage +=  "                        --year=<{0}>\n".format(year)
+    usage +=  "                        --process=<{0}>\n".format(process)
+    usage +=  "                        --whichJob=<{0}>\n".format(whichJob)
+    usage +=  "                        --tolerance=<{0}>".format(tolerance)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--analysis":
+            analysis = str(arg)
+        if opt == "--year":
+            year = int(arg)
+        if opt == "--process":
+            process = int(arg)
+        if opt == "--whichJob":
+            whichJob = int(arg)
+        if opt == "--tolerance":
+            tolerance = float(arg)
+
+    if(not os.path.exists("{0}Analysis.py".format(analysis))):
+        print("Analysis does not exist: {0}Analysis.py".format(analysis))
+        sys.exit(1)
+
+    outputName = "fillhisto_{0}Analysis_sample{1}_year{2}_job{3}.root".format(analysis,process,year,whichJob)
+    timing = {}
+    for backend in ["legacy", "vary"]:
+        timing[backend] = runBackend(analysis, year, process, whichJob, backend == "vary")
+        if(not os.path.exists(outputName)):
+            print("Output file not found for the {0} backend: {1}".format(backend,outputName))
+            sys.exit(1)
+        os.replace(outputName, outputName.replace(".root", "_{0}.root".format(backend)))
+
+    print("Backend: graph building / jitting / event loop / events/s")
+    for backend in ["legacy", "vary"]:
+        (buildTime, jitTime, loopTime, nEvents) = timing[backend]
+        print("{0:6s} : {1:.1f} s / {2:.1f} s / {3:.1f} s / {4:.0f}".format(backend,buildTime,jitTime,loopTime,nEvents/max(loopTime,1e-9)))
+    print("Speedup (total): {0:.2f}".format(sum(timing["legacy"][0:3])/max(sum(timing["vary"][0:3]),1e-9)))
+
+    compareHistos(outputName.replace(".root", "_legacy.root"), outputName.replace(".root", "_vary.root"), tolerance)
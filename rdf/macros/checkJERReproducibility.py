@@ -0,0 +1,127 @@
+import ROOT
+import os, sys, getopt, json, subprocess
+
+import utilsAna # loads functions.h
+
+# Checks that the JER smearing (counter-based random numbers seeded from
+# run/luminosityBlock/event/jet index) gives bit-identical jets with any number
+# of threads. Every thread count runs in its own process; the per-event jet pts
+# are compared exactly. Without --input a synthetic sample with jets, GenJets and
+# rho is used, so the check does not need any NanoAOD file; in both cases the jets
+# go through compute_JSON_JET_Var and compute_JSON_JER_Unc with the corrections of the year.
+
+# the JER smeared jets, as in the analyses: all the variations in one call and the nominal alone
+def defineJERJets(df):
+    return (df.Define("jetPt", "compute_JSON_JET_Var(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,run,luminosityBlock,event)")
+              .Define("jetPtDef", "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0,run,luminosityBlock,event)")
+              .Define("jetPtAll", "Concatenate(ROOT::VecOps::RVec<double>(jetPt),ROOT::VecOps::RVec<double>(jetPtDef))")
+              )
+
+# synthetic events: up to 6 jets over the full eta range (including 2.5 < |eta| < 3.0),
+# with gen matched, badly matched and unmatched jets
+def defineSyntheticJets(df):
+    return (df.Define("run", "(UInt_t)(1 + rdfentry_ / 100000)")
+              .Define("luminosityBlock", "(UInt_t)(1 + rdfentry_ / 1000)")
+              .Define("event", "(ULong64_t)(rdfentry_)")
+              .Define("nJet", "(int)(rdfentry_ % 7)")
+              .Define("clean_Jet_ptNoJER", "Vec_f v(nJet); for(int i=0; i<nJet; i++) v[i] = 15.0 + 5.0*((rdfentry_*7+i*3) % 97); return v;")
+              .Define("clean_Jet_eta", "Vec_f v(nJet); for(int i=0; i<nJet; i++) v[i] = -4.7 + 9.4*((rdfentry_*13+i*5) % 95)/94.0; return v;")
+              .Define("clean_Jet_genJetIdx", "Vec_i v(nJet); for(int i=0; i<nJet; i++) v[i] = (rdfentry_+i) % 4 == 0 ? -1 : i; return v;")
+              .Define("GenJet_pt", "Vec_f v(nJet); for(int i=0; i<nJet; i++) v[i] = clean_Jet_ptNoJER[i]*(1.0 + 0.04*((int)((rdfentry_+i) % 9) - 4)); return v;")
+              .Define("Rho_fixedGridRhoFastjetAll", "(float)(5.0 + 0.5*(rdfentry_ % 80))")
+              )
+
+def runWorker(fileName, year, nThreads, nEvents, outputName):
+
+    if(nThreads > 1): ROOT.ROOT.EnableImplicitMT(nThreads)
+
+    ROOT.initJSONSFs(year)
+    if(fileName != ""):
+        from benchmarkJES import defineJets
+        df = defineJERJets(defineJets(ROOT.RDataFrame("Events", fileName)))
+    else:
+        df = defineJERJets(defineSyntheticJets(ROOT.RDataFrame(nEvents)))
+
+    events = df.Take["ULong64_t"]("event")
+    runs = df.Take["UInt_t"]("run")
+    jets = df.Take["ROOT::VecOps::RVec<double>"]("jetPtAll")
+
+    # float.hex keeps the comparison exact
+    result = {}
+    for run, event, jet in zip(runs.GetValue(), events.GetValue(), jets.GetValue()):
+        result["{0}:{1}".format(run,event)] = [float(x).hex() for x in jet]
+
+    with open(outputName, "w") as outputFile:
+        json.dump(result, outputFile, sort_keys=True)
+
+if __name__ == "__main__":
+
+    fileName = ""
+    year = 20220
+    nThreadsList = "1,4,10"
+    nEvents = 200000
+    nThreads = -1
+    outputName = "jerReproducibility"
+
+    valid = ['input=', 'year=', 'threads=', 'nEvents=', 'nThreads=', 'output=', 'help']
+    usage  =  "Usage: checkJERReproducibility.py --input=<{0}> (empty: synthetic sample)\n".format(fileName)
+    usage +=  "                                  --year=<{0}>\n".format(year)
+    usage +=  "                                  --threads=<{0}>\n".format(nThreadsList)
+    usage +=  "                                  --nEvents=<{0}> (synthetic sample only)\n".format(nEvents)
+    usage +=  "                                  --output=<{0}>".format(outputName)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--input":
+            fileName = str(arg)
+        if opt == "--year":
+            year = int(arg)
+        if opt == "--threads":
+            nThreadsList = str(arg)
+        if opt == "--nEvents":
+            nEvents = int(arg)
+        if opt == "--nThreads":
+            nThreads = int(arg)
+        if opt == "--output":
+            outputName = str(arg)
+
+    # worker: one thread count, called by the main process below
+    if(nThreads > 0):
+        runWorker(fileName, year, nThreads, nEvents, outputName)
+        sys.exit(0)
+
+    if(fileName != "" and not os.path.exists(fileName)):
+        print("Input file does not exist: {0}".format(fileName))
+        sys.exit(1)
+
+    results = {}
+    for nThreadsNOW in [int(x) for x in nThreadsList.split(",")]:
+        outputNameNOW = "{0}_{1}.json".format(outputName,nThreadsNOW)
+        returncode = subprocess.call("python3 checkJERReproducibility.py --input={0} --year={1} --nEvents={2} --nThreads={3} --output={4}".format(fileName,year,nEvents,nThreadsNOW,outputNameNOW), shell=True)
+        if(returncode != 0):
+            print("Worker with {0} threads failed ({1})".format(nThreadsNOW,returncode))
+            sys.exit(1)
+        with open(outputNameNOW) as jsonFile:
+            results[nThreadsNOW] = json.load(jsonFile)
+        os.remove(outputNameNOW)
+
+    isFailure = False
+    reference = sorted(results.keys())[0]
+    for nThreadsNOW in sorted(results.keys()):
+        nDiff = len([x for x in results[reference] if results[nThreadsNOW].get(x) != results[reference][x]])
+        nDiff += len([x for x in results[nThreadsNOW] if x not in results[reference]])
+        print("{0} threads: {1} events, {2} different from {3} thread(s)".format(nThreadsNOW,len(results[nThreadsNOW]),nDiff,reference))
+        if(nDiff > 0): isFailure = True
+
+    if(isFailure == True):
+        print("FAILURE: the JER smearing depends on the number of threads")
+        sys.exit(1)
+    print("SUCCESS: identical JER smearing with {0} threads".format(nThreadsList))
@@ -5,7 +5,7 @@ from array import array
 ROOT.ROOT.EnableImplicitMT(10)
 from utilsCategory import plotCategory
 from utilsAna import getMClist, getDATAlist
-from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi
+from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi, getMCNormalization, getFileListFingerprint, getFileWeights
 from utilsSelection import selectionJetMet, selectionElMu, selectionTrigger1L
 
 # 0 = T, 1 = M, 2 = L
@@ -323,16 +323,14 @@ def readMCSample(sampleNOW, year, skimType, whichJob, group, puWeights):
     files = getMClist(sampleNOW, skimType)
     print("Total files: {0}".format(len(files)))
 
-    dfRuns = ROOT.RDataFrame("Runs", files)
-    genEventSumWeight = dfRuns.Sum("genEventSumw").GetValue()
-    genEventSumNoWeight = dfRuns.Sum("genEventCount").GetValue()
-    runGetEntries = dfRuns.Count().GetValue()
+    fingerprint = getFileListFingerprint(files)
+    genEventSumWeight, genEventSumNoWeight, _, _, _, runGetEntries = getMCNormalization(sampleNOW, skimType, files, fingerprint)
 
     weight = (SwitchSample(sampleNOW, skimType)[1] / genEventSumWeight)*getLumi(year)
     weightApprox = (SwitchSample(sampleNOW, skimType)[1] / genEventSumNoWeight)*getLumi(year)
 
     if(whichJob != -1):
-        groupedFile = groupFiles(files, group)
+        groupedFile = groupFiles(files, group, getFileWeights(files, SwitchSample(sampleNOW, skimType)[0], fingerprint))
         files = groupedFile[whichJob]
         if(len(files) == 0):
             print("no files in job/group: {0} / {1}".format(whichJob, group))
@@ -26,11 +26,14 @@
 #include <array>
 #include <string>
 #include <vector>
+#include <deque>
 #include <unordered_map>
 #include <utility>
 #include <algorithm>
 #include <limits>
 #include <map>
+#include <memory>
+#include <chrono>
 
 #include <ROOT/RVec.hxx>
 #include <ROOT/RDataFrame.hxx>
@@ -45,146 +48,255 @@ typedef ROOT::Math::LorentzVector<ROOT::Math::PtEtaPhiM4D<double> > PtEtaPhiMVec
 typedef ROOT::Math::LorentzVector<ROOT::Math::PxPyPzM4D<double> > PxPyPzMVector;
 std::unordered_map< UInt_t, std::vector< std::pair<UInt_t,UInt_t> > > jsonMap;
 
-TH2D histoFakeEtaPt_mu[9];
-TH2D histoFakeEtaPt_el[9];
-TH2D histoLepSFEtaPt_mu;
-TH2D histoLepSFEtaPt_el;
-TH2D histoTriggerSFEtaPt_0_0;
-TH2D histoTriggerSFEtaPt_0_1;
-TH2D histoTriggerSFEtaPt_0_2;
-TH2D histoTriggerSFEtaPt_0_3;
-TH2D histoTriggerSFEtaPt_1_0;
-TH2D histoTriggerSFEtaPt_1_1;
-TH2D histoTriggerSFEtaPt_1_2;
-TH2D histoTriggerSFEtaPt_1_3;
-TH2D histoTriggerSFEtaPt_2_0;
-TH2D histoTriggerSFEtaPt_2_1;
-TH2D histoTriggerSFEtaPt_2_2;
-TH2D histoTriggerSFEtaPt_2_3;
-TH2D histoTriggerSFEtaPt_3_0;
-TH2D histoTriggerSFEtaPt_3_1;
-TH2D histoTriggerSFEtaPt_3_2;
-TH2D histoTriggerSFEtaPt_3_3;
-TH2D histoBTVEffEtaPtLF;
-TH2D histoBTVEffEtaPtCJ;
-TH2D histoBTVEffEtaPtBJ;
-TH1D puWeights;
-TH1D puWeightsUp;
-TH1D puWeightsDown;
-TH1D histo_wwpt;
-TH1D histo_wwpt_scaleup;
-TH1D histo_wwpt_scaledown;
-TH1D histo_wwpt_resumup;
-TH1D histo_wwpt_resumdown;
-TH1D histoWSEtaEff;
-TH2D histoWSEtaPtEff;
-TH1D histoWSEtaSF;
-TH1D histoWSEtaSF_unc;
-TH2D histoWSEtaPtSF;
-TH2D histoTriggerDAEtaPt[10];
-TH2D histoTriggerMCEtaPt[10];
-TH1D hVV_KF_EWK[2]; // 0 (WW), 1 (WZ)
-TH1D hVV_KF_EWK_unc[2]; // 0 (WW), 1 (WZ)
+// Immutable copy of the binning, contents and errors of a TH1/TH2 scale factor histogram,
+// built once in initHisto1D/initHisto2D and only read in the event loop, shared by all the
+// threads without locks. The bin is found as in TAxis::FindFixBin (direct index for uniform
+// binning, binary search on the edges otherwise) and clamped to the first/last bin as in
+// getValFromTH1/getValFromTH2, kZero returns 0 outside the axis range instead
+class LookupAxis {
+  public:
+    LookupAxis() {}
+    LookupAxis(const TAxis *axis) : nBins_(axis->GetNbins()), xMin_(axis->GetXmin()), xMax_(axis->GetXmax()) {
+      const TArrayD *xbins = axis->GetXbins();
+      if(xbins->GetSize() > 0) edges_.assign(xbins->GetArray(), xbins->GetArray() + xbins->GetSize());
+    }
+    // 0 underflow, nBins+1 overflow (also for NaN)
+    int findBin(double x) const {
+      if(x < xMin_) return 0;
+      if(!(x < xMax_)) return nBins_ + 1;
+      if(edges_.empty()) return 1 + int(nBins_*(x-xMin_)/(xMax_-xMin_));
+      return std::upper_bound(edges_.begin(), edges_.end(), x) - edges_.begin();
+    }
+    int clampBin(int bin) const { return std::max(1, std::min(nBins_, bin)); }
+    int getNbins() const { return nBins_; }
+    size_t getSize() const { return sizeof(*this) + edges_.capacity()*sizeof(double); }
+
+  private:
+    int nBins_ = 1;
+    double xMin_ = 0;
+    double xMax_ = 1;
+    std::vector<double> edges_;
+};
+
+class LookupTable {
+  public:
+    enum Overflow { kClamp = 0, kZero = 1 };
+
+    LookupTable() : content_(1, 0.0), error_(1, 0.0) {}
+    LookupTable(const TH1 &h, Overflow overflow = kClamp) : xAxis_(h.GetXaxis()), overflow_(overflow) {
+      if(h.GetDimension() > 1) yAxis_ = LookupAxis(h.GetYaxis());
+      for(int j=1; j<=yAxis_.getNbins(); j++) {
+        for(int i=1; i<=xAxis_.getNbins(); i++) {
+          int bin = h.GetDimension() > 1 ? h.GetBin(i, j) : i;
+          content_.push_back(h.GetBinContent(bin));
+          error_.push_back(h.GetBinError(bin));
+        }
+      }
+    }
+
+    float getVal1D(float x, float sumError = 0.0) const {
+      return getVal2D(x, 0.5, sumError);
+    }
+    float getVal2D(float x, float y, float sumError = 0.0) const {
+      int xbin = xAxis_.findBin(x);
+      int ybin = yAxis_.findBin(y);
+      if(overflow_ == kZero && (xbin != xAxis_.clampBin(xbin) || ybin != yAxis_.clampBin(ybin))) return 0;
+      int bin = (yAxis_.clampBin(ybin)-1)*xAxis_.getNbins() + xAxis_.clampBin(xbin)-1;
+      if(sumError) return content_[bin] + sumError * error_[bin];
+      else         return content_[bin];
+    }
+    // bytes held by the table
+    size_t getSize() const {
+      return sizeof(*this) + xAxis_.getSize() + yAxis_.getSize() - 2*sizeof(LookupAxis) + (content_.capacity() + error_.capacity())*sizeof(double);
+    }
+
+  private:
+    LookupAxis xAxis_;
+    LookupAxis yAxis_;
+    Overflow overflow_ = kClamp;
+    std::vector<double> content_;
+    std::vector<double> error_;
+};
+
+// scale factor tables read per event, filled by slot name (see sfSlots) with loadSFTable
+// or through the legacy initHisto1D/initHisto2D indices
+LookupTable lutFakeEtaPt_mu[9];
+LookupTable lutFakeEtaPt_el[9];
+LookupTable lutLepSFEtaPt_mu;
+LookupTable lutLepSFEtaPt_el;
+LookupTable lutTriggerSFEtaPt[4][4]; // [ltype][eta category]
+LookupTable lutBTVEffEtaPt[3]; // LF, CJ, BJ
+LookupTable lutPUWeights[3]; // nominal, up, down
+LookupTable lutWWPt[5]; // nominal, scaleup, scaledown, resumup, resumdown
+LookupTable lutWSEtaEff;
+LookupTable lutWSEtaPtEff;
+LookupTable lutWSEtaSF;
+LookupTable lutWSEtaSF_unc;
+LookupTable lutWSEtaPtSF;
+LookupTable lutTriggerDAEtaPt[10];
+LookupTable lutTriggerMCEtaPt[10];
+LookupTable lutVV_KF_EWK[2]; // 0 (WW), 1 (WZ)
+LookupTable lutVV_KF_EWK_unc[2]; // 0 (WW), 1 (WZ)
 auto corrSFs = MyCorrections(2018);
 
+std::unordered_map<std::string, LookupTable*> makeSFSlots(){
+  std::unordered_map<std::string, LookupTable*> slots;
+  for(int i=0; i<9; i++){
+    slots[Form("fake_mu_%d",i)] = &lutFakeEtaPt_mu[i];
+    slots[Form("fake_el_%d",i)] = &lutFakeEtaPt_el[i];
+  }
+  slots["lepsf_mu"] = &lutLepSFEtaPt_mu;
+  slots["lepsf_el"] = &lutLepSFEtaPt_el;
+  for(int i=0; i<4; i++){
+    for(int j=0; j<4; j++) slots[Form("trigsf_%d_%d",i,j)] = &lutTriggerSFEtaPt[i][j];
+  }
+  slots["btveff_lf"] = &lutBTVEffEtaPt[0];
+  slots["btveff_cj"] = &lutBTVEffEtaPt[1];
+  slots["btveff_bj"] = &lutBTVEffEtaPt[2];
+  slots["pu"]      = &lutPUWeights[0];
+  slots["pu_up"]   = &lutPUWeights[1];
+  slots["pu_down"] = &lutPUWeights[2];
+  slots["wwpt"]           = &lutWWPt[0];
+  slots["wwpt_scaleup"]   = &lutWWPt[1];
+  slots["wwpt_scaledown"] = &lutWWPt[2];
+  slots["wwpt_resumup"]   = &lutWWPt[3];
+  slots["wwpt_resumdown"] = &lutWWPt[4];
+  slots["ws_eta_eff"]    = &lutWSEtaEff;
+  slots["ws_etapt_eff"]  = &lutWSEtaPtEff;
+  slots["ws_eta_sf"]     = &lutWSEtaSF;
+  slots["ws_eta_sf_unc"] = &lutWSEtaSF_unc;
+  slots["ws_etapt_sf"]   = &lutWSEtaPtSF;
+  for(int i=0; i<10; i++){
+    slots[Form("trigda_%d",i)] = &lutTriggerDAEtaPt[i];
+    slots[Form("trigmc_%d",i)] = &lutTriggerMCEtaPt[i];
+  }
+  slots["kf_ewk_ww"]     = &lutVV_KF_EWK[0];
+  slots["kf_ewk_wz"]     = &lutVV_KF_EWK[1];
+  slots["kf_ewk_ww_unc"] = &lutVV_KF_EWK_unc[0];
+  slots["kf_ewk_wz_unc"] = &lutVV_KF_EWK_unc[1];
+  return slots;
+}
+const std::unordered_map<std::string, LookupTable*> sfSlots = makeSFSlots();
+
+// Named scale factor registry: loadSFTable reads only the requested histogram, from the
+// consolidated file of the year (makeSFRegistry.py) or from any other file, and keeps just
+// its LookupTable. The files stay open until closeSFFiles, which also prints the load time
+// and the size of every table. Not to be used while an event loop is running
+struct SFTableInfo {
+  std::string slot;
+  std::string name;
+  double loadTime;
+  size_t size;
+};
+std::vector<SFTableInfo> sfTableInfos;
+std::map<std::string, std::unique_ptr<TFile>> sfFiles;
+
+bool setSFTable(const std::string& slot, const TH1& h){
+  auto it = sfSlots.find(slot);
+  if(it == sfSlots.end()) {
+    printf("Unknown scale factor table %s\n",slot.c_str());
+    return false;
+  }
+  *it->second = LookupTable(h);
+  return true;
+}
+
+bool loadSFTable(const std::string& slot, const std::string& fileName, const std::string& histoName){
+  auto start = std::chrono::steady_clock::now();
+  if(sfFiles.find(fileName) == sfFiles.end()) {
+    std::unique_ptr<TFile> file(TFile::Open(fileName.c_str()));
+    if(!file || file->IsZombie()) {
+      printf("Cannot open scale factor file %s\n",fileName.c_str());
+      return false;
+    }
+    sfFiles[fileName] = std::move(file);
+  }
+  std::unique_ptr<TH1> h(sfFiles[fileName]->Get<TH1>(histoName.c_str()));
+  if(!h) {
+    printf("Scale factor histogram %s not found in %s\n",histoName.c_str(),fileName.c_str());
+    return false;
+  }
+  h->SetDirectory(0);
+  if(!setSFTable(slot, *h)) return false;
+  double loadTime = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+  sfTableInfos.push_back({slot, fileName + ":" + histoName, loadTime, sfSlots.at(slot)->getSize()});
+  return true;
+}
+
+void closeSFFiles(){
+  double totalTime = 0;
+  size_t totalSize = 0;
+  for(const auto& info : sfTableInfos) {
+    printf("SF table %-14s %8.2f ms %8zu bytes (%s)\n",info.slot.c_str(),1000*info.loadTime,info.size,info.name.c_str());
+    totalTime += info.loadTime;
+    totalSize += info.size;
+  }
+  printf("SF tables: %zu loaded from %zu files in %.2f ms, %zu bytes\n",sfTableInfos.size(),sfFiles.size(),1000*totalTime,totalSize);
+  sfTableInfos.clear();
+  sfFiles.clear();
+}
+
+// all the members of a theory weight vector times the event weight as one column, e.g. the
+// 103 LHEPdfWeight members: the members beyond nValid (or missing) get the event weight
+Vec_d compute_theory_weights(const Vec_f& members, double weight, unsigned int n, unsigned int nValid){
+  Vec_d weights(n, weight);
+  const unsigned int nMembers = std::min<size_t>(std::min(n, nValid), members.size());
+  for(unsigned int i=0; i<nMembers; i++) weights[i] = weight*members[i];
+  return weights;
+}
+
+// wrong-sign efficiencies, not read from any file
+void initWSEfficiencyTables(){
+  const int nBinEta = 5; Float_t xbinsEta[nBinEta+1] = {0.0, 0.5, 1.0, 1.5, 2.0, 2.5};
+  double eff[nBinEta] = {0.000047,0.000102,0.000331,0.001151,0.001918};
+  TH1D histoWSEtaEff("histoWSEtaEff", "histoWSEtaEff", nBinEta, xbinsEta);
+  histoWSEtaEff.SetDirectory(0);
+  for(int i=0; i<nBinEta; i++){
+    histoWSEtaEff.SetBinContent(i+1,eff[i]);
+  }
+  lutWSEtaEff = LookupTable(histoWSEtaEff);
+
+  const int nBinEta1 = 2; Float_t xbinsEta1[nBinEta1+1] = {0.0, 1.5, 2.5};
+  const int nBinPt1  = 3; Float_t xbinsPt1 [nBinPt1+1]  = {10, 25, 40, 80};
+  double eff1[nBinEta1*nBinPt1] = {0.000300,0.000156,0.000113,0.001053,0.001387,0.001557};
+  TH2D histoWSEtaPtEff("histoWSEtaPtEff", "histoWSEtaPtEff", nBinEta1, xbinsEta1, nBinPt1, xbinsPt1);
+  histoWSEtaPtEff.SetDirectory(0);
+  histoWSEtaPtEff.SetBinContent(1,1,eff1[0]);
+  histoWSEtaPtEff.SetBinContent(1,2,eff1[1]);
+  histoWSEtaPtEff.SetBinContent(1,3,eff1[2]);
+  histoWSEtaPtEff.SetBinContent(2,1,eff1[3]);
+  histoWSEtaPtEff.SetBinContent(2,2,eff1[4]);
+  histoWSEtaPtEff.SetBinContent(2,3,eff1[5]);
+  lutWSEtaPtEff = LookupTable(histoWSEtaPtEff);
+}
+
+// legacy indices of initHisto2D/initHisto1D, 60 (2D) and 14 (1D) are the wrong-sign efficiencies
+const char *histo2DSlots[60] = {
+  "fake_mu_0", "fake_el_0", "lepsf_mu", "lepsf_el",
+  "trigsf_0_0", "trigsf_0_1", "trigsf_0_2", "trigsf_0_3", "trigsf_1_0", "trigsf_1_1", "trigsf_1_2", "trigsf_1_3",
+  "trigsf_2_0", "trigsf_2_1", "trigsf_2_2", "trigsf_2_3", "trigsf_3_0", "trigsf_3_1", "trigsf_3_2", "trigsf_3_3",
+  "btveff_lf", "btveff_cj", "btveff_bj",
+  "fake_mu_1", "fake_mu_2", "fake_mu_3", "fake_mu_4", "fake_mu_5", "fake_mu_6", "fake_mu_7", "fake_mu_8",
+  "fake_el_1", "fake_el_2", "fake_el_3", "fake_el_4", "fake_el_5", "fake_el_6", "fake_el_7", "fake_el_8",
+  "ws_etapt_sf",
+  "trigda_0", "trigda_1", "trigda_2", "trigda_3", "trigda_4", "trigda_5", "trigda_6", "trigda_7", "trigda_8", "trigda_9",
+  "trigmc_0", "trigmc_1", "trigmc_2", "trigmc_3", "trigmc_4", "trigmc_5", "trigmc_6", "trigmc_7", "trigmc_8", "trigmc_9"};
+const char *histo1DSlots[14] = {
+  "pu", "pu_up", "pu_down",
+  "wwpt", "wwpt_scaleup", "wwpt_scaledown", "wwpt_resumup", "wwpt_resumdown",
+  "ws_eta_sf", "ws_eta_sf_unc",
+  "kf_ewk_ww", "kf_ewk_wz", "kf_ewk_ww_unc", "kf_ewk_wz_unc"};
+
 void initHisto2D(TH2D h, int nsel){
-  if     (nsel ==  0) histoFakeEtaPt_mu[0] = h;
-  else if(nsel ==  1) histoFakeEtaPt_el[0] = h;
-  else if(nsel ==  2) histoLepSFEtaPt_mu = h;
-  else if(nsel ==  3) histoLepSFEtaPt_el = h;
-  else if(nsel ==  4) histoTriggerSFEtaPt_0_0 = h;
-  else if(nsel ==  5) histoTriggerSFEtaPt_0_1 = h;
-  else if(nsel ==  6) histoTriggerSFEtaPt_0_2 = h;
-  else if(nsel ==  7) histoTriggerSFEtaPt_0_3 = h;
-  else if(nsel ==  8) histoTriggerSFEtaPt_1_0 = h;
-  else if(nsel ==  9) histoTriggerSFEtaPt_1_1 = h;
-  else if(nsel == 10) histoTriggerSFEtaPt_1_2 = h;
-  else if(nsel == 11) histoTriggerSFEtaPt_1_3 = h;
-  else if(nsel == 12) histoTriggerSFEtaPt_2_0 = h;
-  else if(nsel == 13) histoTriggerSFEtaPt_2_1 = h;
-  else if(nsel == 14) histoTriggerSFEtaPt_2_2 = h;
-  else if(nsel == 15) histoTriggerSFEtaPt_2_3 = h;
-  else if(nsel == 16) histoTriggerSFEtaPt_3_0 = h;
-  else if(nsel == 17) histoTriggerSFEtaPt_3_1 = h;
-  else if(nsel == 18) histoTriggerSFEtaPt_3_2 = h;
-  else if(nsel == 19) histoTriggerSFEtaPt_3_3 = h;
-  else if(nsel == 20) histoBTVEffEtaPtLF = h;
-  else if(nsel == 21) histoBTVEffEtaPtCJ = h;
-  else if(nsel == 22) histoBTVEffEtaPtBJ = h;
-  else if(nsel == 23) histoFakeEtaPt_mu[1] = h;
-  else if(nsel == 24) histoFakeEtaPt_mu[2] = h;
-  else if(nsel == 25) histoFakeEtaPt_mu[3] = h;
-  else if(nsel == 26) histoFakeEtaPt_mu[4] = h;
-  else if(nsel == 27) histoFakeEtaPt_mu[5] = h;
-  else if(nsel == 28) histoFakeEtaPt_mu[6] = h;
-  else if(nsel == 29) histoFakeEtaPt_mu[7] = h;
-  else if(nsel == 30) histoFakeEtaPt_mu[8] = h;
-  else if(nsel == 31) histoFakeEtaPt_el[1] = h;
-  else if(nsel == 32) histoFakeEtaPt_el[2] = h;
-  else if(nsel == 33) histoFakeEtaPt_el[3] = h;
-  else if(nsel == 34) histoFakeEtaPt_el[4] = h;
-  else if(nsel == 35) histoFakeEtaPt_el[5] = h;
-  else if(nsel == 36) histoFakeEtaPt_el[6] = h;
-  else if(nsel == 37) histoFakeEtaPt_el[7] = h;
-  else if(nsel == 38) histoFakeEtaPt_el[8] = h;
-  else if(nsel == 39) histoWSEtaPtSF = h;
-  else if(nsel == 40) histoTriggerDAEtaPt[0] = h;
-  else if(nsel == 41) histoTriggerDAEtaPt[1] = h;
-  else if(nsel == 42) histoTriggerDAEtaPt[2] = h;
-  else if(nsel == 43) histoTriggerDAEtaPt[3] = h;
-  else if(nsel == 44) histoTriggerDAEtaPt[4] = h;
-  else if(nsel == 45) histoTriggerDAEtaPt[5] = h;
-  else if(nsel == 46) histoTriggerDAEtaPt[6] = h;
-  else if(nsel == 47) histoTriggerDAEtaPt[7] = h;
-  else if(nsel == 48) histoTriggerDAEtaPt[8] = h;
-  else if(nsel == 49) histoTriggerDAEtaPt[9] = h;
-  else if(nsel == 50) histoTriggerMCEtaPt[0] = h;
-  else if(nsel == 51) histoTriggerMCEtaPt[1] = h;
-  else if(nsel == 52) histoTriggerMCEtaPt[2] = h;
-  else if(nsel == 53) histoTriggerMCEtaPt[3] = h;
-  else if(nsel == 54) histoTriggerMCEtaPt[4] = h;
-  else if(nsel == 55) histoTriggerMCEtaPt[5] = h;
-  else if(nsel == 56) histoTriggerMCEtaPt[6] = h;
-  else if(nsel == 57) histoTriggerMCEtaPt[7] = h;
-  else if(nsel == 58) histoTriggerMCEtaPt[8] = h;
-  else if(nsel == 59) histoTriggerMCEtaPt[9] = h;
-  else if(nsel == 60) {
-    const int nBinEta1 = 2; Float_t xbinsEta1[nBinEta1+1] = {0.0, 1.5, 2.5};
-    const int nBinPt1  = 3; Float_t xbinsPt1 [nBinPt1+1]  = {10, 25, 40, 80};
-    double eff[nBinEta1*nBinPt1] = {0.000300,0.000156,0.000113,0.001053,0.001387,0.001557};
-    histoWSEtaPtEff = TH2D("histoWSEtaPtEff", "histoWSEtaPtEff", nBinEta1, xbinsEta1, nBinPt1, xbinsPt1);
-    histoWSEtaPtEff.SetBinContent(1,1,eff[0]);
-    histoWSEtaPtEff.SetBinContent(1,2,eff[1]);
-    histoWSEtaPtEff.SetBinContent(1,3,eff[2]);
-    histoWSEtaPtEff.SetBinContent(2,1,eff[3]);
-    histoWSEtaPtEff.SetBinContent(2,2,eff[4]);
-    histoWSEtaPtEff.SetBinContent(2,3,eff[5]);
-  }
+  if     (nsel == 60) initWSEfficiencyTables();
+  else if(nsel >= 0 && nsel < 60) setSFTable(histo2DSlots[nsel], h);
+  else printf("Wrong initHisto2D index %d\n",nsel);
 }
 
 void initHisto1D(TH1D h, int nsel){
-  if     (nsel ==  0) puWeights = h;
-  else if(nsel ==  1) puWeightsUp = h;
-  else if(nsel ==  2) puWeightsDown = h;
-  else if(nsel ==  3) histo_wwpt = h;
-  else if(nsel ==  4) histo_wwpt_scaleup = h;
-  else if(nsel ==  5) histo_wwpt_scaledown = h;
-  else if(nsel ==  6) histo_wwpt_resumup = h;
-  else if(nsel ==  7) histo_wwpt_resumdown = h;
-  else if(nsel ==  8) histoWSEtaSF = h;
-  else if(nsel ==  9) histoWSEtaSF_unc = h;
-  else if(nsel == 10) hVV_KF_EWK[0] = h;
-  else if(nsel == 11) hVV_KF_EWK[1] = h;
-  else if(nsel == 12) hVV_KF_EWK_unc[0] = h;
-  else if(nsel == 13) hVV_KF_EWK_unc[1] = h;
-  else if(nsel == 14) {
-    const int nBinEta = 5; Float_t xbinsEta[nBinEta+1] = {0.0, 0.5, 1.0, 1.5, 2.0, 2.5};
-    double eff[nBinEta] = {0.000047,0.000102,0.000331,0.001151,0.001918};
-    histoWSEtaEff = TH1D("histoWSEtaEff", "histoWSEtaEff", nBinEta, xbinsEta);
-    for(int i=0; i<nBinEta; i++){
-      histoWSEtaEff.SetBinContent(i+1,eff[i]);
-    }
-  }
+  if     (nsel == 14) initWSEfficiencyTables();
+  else if(nsel >= 0 && nsel < 14) setSFTable(histo1DSlots[nsel], h);
+  else printf("Wrong initHisto1D index %d\n",nsel);
 }
 
 float getValFromTH1(const TH1& h, const float& x, const float& sumError=0.0) {
@@ -208,6 +320,7 @@ float getValFromTH2(const TH2& h, const float& x, const float& y, const float& s
 
 void initJSONSFs(int year){
   corrSFs = MyCorrections(year);
+  printCorrectionSetStats();
 }
 
 // PUJetID SFs
@@ -322,9 +435,9 @@ float compute_JSON_BTV_SF(Vec_f jet_pt, Vec_f jet_eta, Vec_f jet_btag, Vec_i jet
     else printf("btag flavorToStudy no possible\n");
 
     double eff = 1;
-    if     (jet_flavor[i] == 0) {const TH2D& hcorr0 = histoBTVEffEtaPtLF; eff = getValFromTH2(hcorr0, fabs(jet_eta[i]),min(jet_pt[i],999.999f));}
-    else if(jet_flavor[i] == 4) {const TH2D& hcorr1 = histoBTVEffEtaPtCJ; eff = getValFromTH2(hcorr1, fabs(jet_eta[i]),min(jet_pt[i],999.999f));}
-    else if(jet_flavor[i] == 5) {const TH2D& hcorr2 = histoBTVEffEtaPtBJ; eff = getValFromTH2(hcorr2, fabs(jet_eta[i]),min(jet_pt[i],999.999f));}
+    if     (jet_flavor[i] == 0) eff = lutBTVEffEtaPt[0].getVal2D(fabs(jet_eta[i]),min(jet_pt[i],999.999f));
+    else if(jet_flavor[i] == 4) eff = lutBTVEffEtaPt[1].getVal2D(fabs(jet_eta[i]),min(jet_pt[i],999.999f));
+    else if(jet_flavor[i] == 5) eff = lutBTVEffEtaPt[2].getVal2D(fabs(jet_eta[i]),min(jet_pt[i],999.999f));
     if(jet_btag[i] > bcut) {
       sfTot[0] *= sf * eff; sfTot[1] *= eff;
     }
@@ -435,6 +548,171 @@ float compute_JSON_TAU_SFs(const Vec_f& tau_pt, const Vec_f& tau_eta, const Vec_
   return sfTot;
 }
 
+// Bound versions of compute_JSON_BTV_SF/MUO_SFs/ELE_SFs/PHO_SFs/TAU_SFs: bindJSON_* resolves
+// the string keys into correction handles once, when the dataframe is built (after
+// initJSONSFs), and returns the index given to compute_JSON_*_h in the Define, so the
+// per-object calls only pass numbers. Handles are only added before the event loops
+// and never removed, each one keeps the corrections of the year it was bound with
+struct BTVSFHandles { CorrectionHandle sf[3]; }; // flavor 0, 4, 5
+struct MUOSFHandles { CorrectionHandle sf[3][3][2]; bool isNominal[3]; }; // [TRK/ID/ISO][nominal/valType/stat][low/high pt]
+struct ELESFHandles { CorrectionHandle trk[3]; CorrectionHandle id; }; // trk: RecoBelow20, Reco20to75, RecoAbove75
+struct PHOSFHandles { CorrectionHandle sf; };
+struct TAUSFHandles { CorrectionHandle sf; };
+std::deque<BTVSFHandles> btvSFHandles;
+std::deque<MUOSFHandles> muoSFHandles;
+std::deque<ELESFHandles> eleSFHandles;
+std::deque<PHOSFHandles> phoSFHandles;
+std::deque<TAUSFHandles> tauSFHandles;
+
+int bindJSON_BTV_SF(std::string keyS, int flavorToStudy, const int sel){
+  const char *valType = "T";
+  if     (sel == 1) valType = "M";
+  else if(sel == 2) valType = "L";
+  BTVSFHandles h;
+  const int flavor[3] = {0, 4, 5};
+  for(int i=0; i<3; i++) {
+    // same choice as compute_JSON_BTV_SF: key for the flavor studied, central otherwise
+    bool useKey = (flavorToStudy > 0 && flavor[i] != 0) || (flavorToStudy < 0 && flavor[i] == 0);
+    h.sf[i] = corrSFs.bind_btvSF(useKey ? keyS.c_str() : "central", valType, flavor[i]);
+  }
+  btvSFHandles.push_back(h);
+  return btvSFHandles.size()-1;
+}
+
+float compute_JSON_BTV_SF_h(const int handle, const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_f& jet_btag, const Vec_i& jet_flavor, const float bcut)
+{
+  const BTVSFHandles& h = btvSFHandles[handle];
+  double sfTot[2] = {1.0, 1.0};
+  for(unsigned int i=0;i<jet_pt.size();i++) {
+    if(jet_flavor[i] != 0 && jet_flavor[i] != 4 && jet_flavor[i] != 5) continue;
+    if(jet_pt[i] <= 20 || fabs(jet_eta[i]) >= 2.5) continue;
+    const int flavorIndex = jet_flavor[i] == 0 ? 0 : (jet_flavor[i] == 4 ? 1 : 2);
+    double sf = h.sf[flavorIndex].evaluate({std::min((double)std::abs(jet_eta[i]),2.399), std::min((double)jet_pt[i],999.999)});
+
+    double eff = 1;
+    if     (jet_flavor[i] == 0) eff = lutBTVEffEtaPt[0].getVal2D(fabs(jet_eta[i]),min(jet_pt[i],999.999f));
+    else if(jet_flavor[i] == 4) eff = lutBTVEffEtaPt[1].getVal2D(fabs(jet_eta[i]),min(jet_pt[i],999.999f));
+    else if(jet_flavor[i] == 5) eff = lutBTVEffEtaPt[2].getVal2D(fabs(jet_eta[i]),min(jet_pt[i],999.999f));
+    if(jet_btag[i] > bcut) {
+      sfTot[0] *= sf * eff; sfTot[1] *= eff;
+    }
+    else {
+      sfTot[0] *= (1.0 - sf * eff); sfTot[1] *= (1.0 - eff);
+    }
+  }
+
+  if(sfTot[1] > 0) return sfTot[0]/sfTot[1];
+  return 1.0;
+}
+
+int bindJSON_MUO_SFs(std::string valType0S, std::string valType1S, std::string valType2S){
+  MUOSFHandles h;
+  const std::string valTypeS[3] = {valType0S, valType1S, valType2S};
+  for(int sfType=0; sfType<3; sfType++) {
+    const char *valTypes[3] = {"nominal", valTypeS[sfType].c_str(), "stat"};
+    for(int v=0; v<3; v++) {
+      h.sf[sfType][v][0] = corrSFs.bind_muonSF(sfType, false, valTypes[v]);
+      h.sf[sfType][v][1] = corrSFs.bind_muonSF(sfType, true,  valTypes[v]);
+    }
+    h.isNominal[sfType] = valTypeS[sfType] == "nominal";
+  }
+  muoSFHandles.push_back(h);
+  return muoSFHandles.size()-1;
+}
+
+// same ranges as MyCorrections::eval_muonTRKSF/IDSF/ISOSF, v: 0 (nominal), 1 (valType), 2 (stat)
+double eval_JSON_MUO_SF_h(const MUOSFHandles& h, int sfType, int v, double eta, double pt, double p){
+  eta = std::max(std::min(eta,2.399),-2.399);
+  pt = std::max(pt,15.001);
+  if(pt > 200)     return h.sf[sfType][v][1].evaluate({fabs(eta), sfType == 0 ? p : pt});
+  if(sfType == 0)  return v == 0 ? 1.0 : 0.0;
+  return h.sf[sfType][v][0].evaluate({eta, pt});
+}
+
+float compute_JSON_MUO_SFs_h(const int handle, const Vec_f& mu_pt, const Vec_f& mu_eta, const Vec_f& mu_p, const double type){
+  if(mu_pt.size() == 0) return 1.0;
+  const MUOSFHandles& h = muoSFHandles[handle];
+  double sfTot = 1.0;
+  for(unsigned int i=0;i<mu_pt.size();i++) {
+    for(int sfType=0; sfType<3; sfType++) {
+      double sf = eval_JSON_MUO_SF_h(h,sfType,0,mu_eta[i],mu_pt[i],mu_p[i]);
+      if(h.isNominal[sfType] == false) sf = sf + type * sqrt(TMath::Power(eval_JSON_MUO_SF_h(h,sfType,1,mu_eta[i],mu_pt[i],mu_p[i]),2)+TMath::Power(eval_JSON_MUO_SF_h(h,sfType,2,mu_eta[i],mu_pt[i],mu_p[i]),2));
+      sfTot = sfTot*sf;
+    }
+    if(sfTot <= 0) printf("muoeffPROBLEM(%d) %.3f %.3f %.3f %.3f\n",i,mu_pt[i],mu_eta[i],mu_p[i],sfTot);
+  }
+
+  return sfTot;
+}
+
+int bindJSON_ELE_SFs(std::string yearS, std::string valType0S, std::string valType1S, std::string workingPointS){
+  ELESFHandles h;
+  const char *recoName[3] = {"RecoBelow20", "Reco20to75", "RecoAbove75"};
+  for(int i=0; i<3; i++) h.trk[i] = corrSFs.bind_electronSF(0, yearS.c_str(), valType0S.c_str(), recoName[i]);
+  if     (workingPointS == "mediumMVA") h.id = corrSFs.bind_electronSF(2, yearS.c_str(), valType1S.c_str(), "Medium");
+  else if(workingPointS == "tightMVA")  h.id = corrSFs.bind_electronSF(2, yearS.c_str(), valType1S.c_str(), "Tight");
+  else                                  h.id = corrSFs.bind_electronSF(1, yearS.c_str(), valType1S.c_str(), workingPointS.c_str());
+  eleSFHandles.push_back(h);
+  return eleSFHandles.size()-1;
+}
+
+float compute_JSON_ELE_SFs_h(const int handle, const Vec_f& el_pt, const Vec_f& el_eta, const Vec_f& el_phi){
+  if(el_pt.size() == 0) return 1.0;
+  const ELESFHandles& h = eleSFHandles[handle];
+  double sfTot = 1.0;
+  for(unsigned int i=0;i<el_pt.size();i++) {
+    double pt_used = max(el_pt[i],10.001f);
+    int recoIndex = 2;
+    if     (pt_used < 20) recoIndex = 0;
+    else if(pt_used < 75) recoIndex = 1;
+    pt_used = std::min(pt_used,999.9);
+    double sf0 = h.trk[recoIndex].evaluate({el_eta[i],pt_used,el_phi[i]});
+    double sf1 = h.id.evaluate({el_eta[i],pt_used,el_phi[i]});
+    sfTot = sfTot*sf0*sf1;
+    if(sfTot <= 0) printf("eleffPROBLEM(%d) %.3f %.3f %.3f %.3f %.3f %.3f\n",i,el_pt[i],el_eta[i],el_phi[i],sf0,sf1,sfTot);
+  }
+
+  return sfTot;
+}
+
+int bindJSON_PHO_SFs(std::string yearS, std::string valTypeS, std::string workingPointS){
+  PHOSFHandles h;
+  h.sf = corrSFs.bind_photonSF(yearS.c_str(), valTypeS.c_str(), workingPointS.c_str());
+  phoSFHandles.push_back(h);
+  return phoSFHandles.size()-1;
+}
+
+float compute_JSON_PHO_SFs_h(const int handle, const Vec_f& ph_pt, const Vec_f& ph_eta, const Vec_f& ph_phi){
+  if(ph_pt.size() == 0) return 1.0;
+  const PHOSFHandles& h = phoSFHandles[handle];
+  double sfTot = 1.0;
+  for(unsigned int i=0;i<ph_pt.size();i++) {
+    sfTot = sfTot*h.sf.evaluate({ph_eta[i],std::max((double)ph_pt[i],20.001),ph_phi[i]});
+  }
+
+  return sfTot;
+}
+
+int bindJSON_TAU_SFs(std::string valTypeS){
+  TAUSFHandles h;
+  h.sf = corrSFs.bind_tauJETSF("Tight", "Tight", valTypeS.c_str());
+  tauSFHandles.push_back(h);
+  return tauSFHandles.size()-1;
+}
+
+float compute_JSON_TAU_SFs_h(const int handle, const Vec_f& tau_pt, const Vec_f& tau_eta, const Vec_i& tau_dm, const Vec_i& tau_gen){
+  if(tau_pt.size() == 0) return 1.0;
+  const TAUSFHandles& h = tauSFHandles[handle];
+  double sfTot = 1.0;
+  for(unsigned int i=0;i<tau_pt.size();i++) {
+    int dm = tau_dm[i];
+    if(dm == 5 || dm == 6) dm = 0;
+    sfTot = sfTot*h.sf.evaluate({std::min(std::max((double)tau_pt[i],20.001),1999.999),(double)dm,(double)tau_gen[i]});
+  }
+
+  return sfTot;
+}
+
 Vec_f compute_JSON_JES_Unc(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_f& jet_phi, const Vec_f& jet_rawFactor, const Vec_f& jet_area, const double rho, const int run, int type, int jetTypeCorr){
   // jetTypeCorr == -1 (MC) 0/1/2/... A/B/C/... (DATA)
   bool debug = false;
@@ -458,7 +736,42 @@ Vec_f compute_JSON_JES_Unc(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_
   return new_jet_pt;
 }
 
-Vec_f compute_JSON_JER_Unc(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_i& jet_genJetIdx, const Vec_f& GenJet_pt, const double rho, int type){
+// Counter-based random numbers: each value is a hash of (run, luminosityBlock, event,
+// index, stream) and of a global seed, with no state shared between the slots, so the
+// results do not depend on the number of threads nor on the event processing order.
+// stream separates the independent uses (e.g. one per kernel) of the same object index
+ULong64_t rngSeed = 0x4d4954414e414c59ULL;
+enum RngStream { kRngJER = 1 };
+
+inline ULong64_t rng_mix(ULong64_t x){
+  // splitmix64 finalizer
+  x += 0x9e3779b97f4a7c15ULL;
+  x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL;
+  x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL;
+  return x ^ (x >> 31);
+}
+
+inline ULong64_t rng_counter(const UInt_t run, const UInt_t lumi, const ULong64_t event, const unsigned int index, const unsigned int stream){
+  ULong64_t h = rng_mix(rngSeed ^ ((ULong64_t)run << 32 | lumi));
+  h = rng_mix(h ^ event);
+  return rng_mix(h ^ ((ULong64_t)stream << 32 | index));
+}
+
+// uniform in (0,1)
+inline double rng_uniform(const ULong64_t counter){
+  return ((counter >> 11) + 0.5) * (1.0 / 9007199254740992.0);
+}
+
+inline double rng_gaus(const double mean, const double sigma, const UInt_t run, const UInt_t lumi, const ULong64_t event, const unsigned int index, const unsigned int stream){
+  const ULong64_t counter = rng_counter(run, lumi, event, index, stream);
+  // Box-Muller with the two uniforms taken from the counter and its next hash
+  const double u1 = rng_uniform(counter);
+  const double u2 = rng_uniform(rng_mix(counter));
+  return mean + sigma * sqrt(-2.0 * log(u1)) * cos(2.0 * M_PI * u2);
+}
+
+Vec_f compute_JSON_JER_Unc(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_i& jet_genJetIdx, const Vec_f& GenJet_pt, const double rho, int type,
+                           const UInt_t run, const UInt_t lumi, const ULong64_t event){
   bool debug = false;
   if(debug) printf("jer: %lu %f %d\n",jet_pt.size(),rho,type);
   Vec_f new_jet_pt(jet_pt.size(), 1.0);
@@ -479,7 +792,7 @@ Vec_f compute_JSON_JER_Unc(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_
       }
     } // gen matched jets
     if(isMatchedJet == false && (fabs(jet_eta[idx]) < 2.5 || fabs(jet_eta[idx]) > 3.0)) {
-      sf = max(1.0 + gRandom->Gaus(0.0,pt_res_gen) * sqrt(max(s_jer*s_jer-1.0, 0.0)), 0.0);
+      sf = max(1.0 + rng_gaus(0.0,pt_res_gen,run,lumi,event,idx,kRngJER) * sqrt(max(s_jer*s_jer-1.0, 0.0)), 0.0);
     }
     // new jet pt
     new_jet_pt[idx] = jet_pt[idx] * sf;
@@ -489,6 +802,52 @@ Vec_f compute_JSON_JER_Unc(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_
   return new_jet_pt;
 }
 
+// All the jet pt variations in one pass, stored as [variation][jet]:
+// 0 = nominal (JER smeared), 1 = JER up, 2-29 = JES sources 0-27 up on top of the nominal
+// The nominal and JER up share the same random smearing, identical to compute_JSON_JER_Unc
+const int nJetPtVariations = 30;
+Vec_f compute_JSON_JET_Var(const Vec_f& jet_pt, const Vec_f& jet_eta, const Vec_i& jet_genJetIdx, const Vec_f& GenJet_pt, const double rho,
+                           const UInt_t run, const UInt_t lumi, const ULong64_t event){
+  bool debug = false;
+  if(debug) printf("jetvar: %lu %f\n",jet_pt.size(),rho);
+  const unsigned int nJets = jet_pt.size();
+  Vec_f new_jet_pt(nJetPtVariations*nJets, 1.0);
+  double unc[28];
+
+  for (unsigned int idx = 0; idx < nJets; ++idx) {
+    double s_jer[2] = {corrSFs.eval_jerScaleFactor(jet_eta[idx], jet_pt[idx], 0), corrSFs.eval_jerScaleFactor(jet_eta[idx], jet_pt[idx], +1)};
+    double pt_res_gen = corrSFs.eval_jerPtResolution(jet_eta[idx], jet_pt[idx], rho);
+    double sf[2] = {1.0, 1.0};
+
+    bool isMatchedJet = false;
+    if(jet_genJetIdx[idx] >= 0 && GenJet_pt.size() > (unsigned)jet_genJetIdx[idx]) {
+      double pt_diff_rel = (jet_pt[idx]-GenJet_pt[jet_genJetIdx[idx]])/jet_pt[idx];
+      double maxSigmaPtRel = 3;
+      if(pt_diff_rel < maxSigmaPtRel*pt_res_gen){
+          isMatchedJet = true;
+          for(int i=0; i<2; i++) sf[i] = max(1.0 + (s_jer[i]-1.0)*pt_diff_rel, 0.0);
+      }
+    } // gen matched jets
+    if(isMatchedJet == false && (fabs(jet_eta[idx]) < 2.5 || fabs(jet_eta[idx]) > 3.0)) {
+      double rnd = rng_gaus(0.0,pt_res_gen,run,lumi,event,idx,kRngJER);
+      for(int i=0; i<2; i++) sf[i] = max(1.0 + rnd * sqrt(max(s_jer[i]*s_jer[i]-1.0, 0.0)), 0.0);
+    }
+    new_jet_pt[0*nJets+idx] = jet_pt[idx] * sf[0];
+    new_jet_pt[1*nJets+idx] = jet_pt[idx] * sf[1];
+
+    corrSFs.eval_jesUncAll(jet_eta[idx], new_jet_pt[idx], unc);
+    for(int i=0; i<28; i++) new_jet_pt[(i+2)*nJets+idx] = new_jet_pt[idx] * (1.0+unc[i]);
+    if(debug) printf("jetvar(%d): %.3f %.3f / %.3f %.3f %.3f\n",idx,jet_pt[idx],jet_eta[idx],new_jet_pt[idx],new_jet_pt[nJets+idx],new_jet_pt[2*nJets+idx]);
+  }
+
+  return new_jet_pt;
+}
+
+Vec_f get_JSON_JET_Var(const Vec_f& jet_pt_var, int type){
+  const unsigned int nJets = jet_pt_var.size()/nJetPtVariations;
+  return Vec_f(jet_pt_var.begin()+type*nJets, jet_pt_var.begin()+(type+1)*nJets);
+}
+
 float compute_JSON_MET_Unc(const double MET_pt, const double MET_phi, const double RAWMET_pt, const double RAWMET_phi, 
 const Vec_f& Jet_chEmEF, const Vec_f& Jet_neEmEF, const Vec_f& Jet_muonSubtrFactor, const Vec_f& Jet_rawFactor,
 const Vec_f& Jet_pt_def, const Vec_f& Jet_pt_mod, const Vec_f& Jet_eta, const Vec_f& Jet_phi, const Vec_f& Jet_mass, int type){
@@ -788,10 +1147,10 @@ float compute_WSEfficiency(const int nsel, const Vec_f& el_pt, const Vec_f& el_e
   if(el_eta.size() == 0) return 1.0;
 
   if(nsel == 0){
-    if(el_eta.size() == 1) return getValFromTH1(histoWSEtaEff, std::min(fabs(el_eta[0]),2.4999f));
+    if(el_eta.size() == 1) return lutWSEtaEff.getVal1D(std::min(fabs(el_eta[0]),2.4999f));
     if(el_eta.size() >= 2) {
-      double eff[2] = {getValFromTH1(histoWSEtaEff, std::min(fabs(el_eta[0]),2.4999f)),
-                       getValFromTH1(histoWSEtaEff, std::min(fabs(el_eta[1]),2.4999f))};
+      double eff[2] = {lutWSEtaEff.getVal1D(std::min(fabs(el_eta[0]),2.4999f)),
+                       lutWSEtaEff.getVal1D(std::min(fabs(el_eta[1]),2.4999f))};
 
       double total_eff = (1.0-eff[0])*eff[1] + (1.0-eff[1])*eff[0];
 
@@ -801,10 +1160,10 @@ float compute_WSEfficiency(const int nsel, const Vec_f& el_pt, const Vec_f& el_e
     }
   }
   else if(nsel == 1){
-    if(el_eta.size() == 1) return getValFromTH2(histoWSEtaPtEff, std::min(fabs(el_eta[0]),2.4999f), std::min(el_pt[0],49.999f));
+    if(el_eta.size() == 1) return lutWSEtaPtEff.getVal2D(std::min(fabs(el_eta[0]),2.4999f), std::min(el_pt[0],49.999f));
     if(el_eta.size() >= 2) {
-      double eff[2] = {getValFromTH2(histoWSEtaPtEff, std::min(fabs(el_eta[0]),2.4999f), std::min(el_pt[0],49.999f)),
-                       getValFromTH2(histoWSEtaPtEff, std::min(fabs(el_eta[1]),2.4999f), std::min(el_pt[1],49.999f))};
+      double eff[2] = {lutWSEtaPtEff.getVal2D(std::min(fabs(el_eta[0]),2.4999f), std::min(el_pt[0],49.999f)),
+                       lutWSEtaPtEff.getVal2D(std::min(fabs(el_eta[1]),2.4999f), std::min(el_pt[1],49.999f))};
 
       double total_eff = (1.0-eff[0])*eff[1] + (1.0-eff[1])*eff[0];
 
@@ -832,16 +1191,13 @@ float compute_WSSF(const int type,
     if(GenPart_pdgId[el_genPartIdx[i]] * el_charge[i] > 0) { // Wrong charge
       double sf = 1.0;
       if     (type == 1){
-        const TH1D& hcorr = histoWSEtaSF;
-        sf = getValFromTH1(hcorr, std::min(fabs(el_eta[i]),2.4999f));
+        sf = lutWSEtaSF.getVal1D(std::min(fabs(el_eta[i]),2.4999f));
       }
       else if(type == 2){
-        const TH1D& hcorr = histoWSEtaSF_unc;
-        sf = getValFromTH1(hcorr, std::min(fabs(el_eta[i]),2.4999f));
+        sf = lutWSEtaSF_unc.getVal1D(std::min(fabs(el_eta[i]),2.4999f));
       }
       else if(type == 3){
-        const TH2D& hcorr = histoWSEtaPtSF;
-        sf = getValFromTH2(hcorr, std::min(fabs(el_eta[i]),2.4999f), std::min(el_pt[i],49.999f));
+        sf = lutWSEtaPtSF.getVal2D(std::min(fabs(el_eta[i]),2.4999f), std::min(el_pt[i],49.999f));
       }
       if(sf <= 0) {
 	printf("PROBLEM IN WSSF %d (%d) %.3f %.3f %.3f %.3f\n",type,i,el_pt[i],el_eta[i],sf,sfTot);
@@ -868,24 +1224,20 @@ float compute_EWKCorr(const int type, const TString theCat, const float mjjGen){
                                       || theCat.Contains("WWJJto2L2Nu-OS-noTop-EWK_Tune")    || theCat.Contains("WWJJto2L2Nu-SS-noTop-EWK_Tune")) {
     if(!theCat.Contains("sherpa")){ // no sherpa correction
       if(type == 0) {
-        const TH1D& hcorr = hVV_KF_EWK[0];
-        sf = getValFromTH1(hcorr, mjjGen);
+        sf = lutVV_KF_EWK[0].getVal1D(mjjGen);
       }
       else if(type == 1) {
-        const TH1D& hcorr = hVV_KF_EWK_unc[0];
-        sf = getValFromTH1(hcorr, mjjGen);
+        sf = lutVV_KF_EWK_unc[0].getVal1D(mjjGen);
       }
     }
   }
   else if(theCat.Contains("WZto3LNu-2Jets_EW")
        || theCat.Contains("WZJJto3LNu-EWK")) {
     if(type == 0) {
-      const TH1D& hcorr = hVV_KF_EWK[1];
-      sf = getValFromTH1(hcorr, mjjGen);
+      sf = lutVV_KF_EWK[1].getVal1D(mjjGen);
     }
     else if(type == 1) {
-      const TH1D& hcorr = hVV_KF_EWK_unc[1];
-      sf = getValFromTH1(hcorr, mjjGen);
+      sf = lutVV_KF_EWK_unc[1].getVal1D(mjjGen);
     }
   }
 
@@ -939,20 +1291,20 @@ float compute_fakeRate(const bool isData,
   double sfTot = 1.0;
   for(unsigned int i=0;i<mu_pt.size();i++) {
     if(tight_mu[i] == 1) continue;
-    const TH2D& hcorr = histoFakeEtaPt_mu[mType];
+    const LookupTable& hcorr = lutFakeEtaPt_mu[mType];
     float ptFakeVar = mu_pt[i];
     if(whichAna == 3) ptFakeVar = mu_pt[i]*(1+std::max(mu_jetRelIso[i],0.0f))*0.9;
-    double sf = getValFromTH2(hcorr, fabs(mu_eta[i]),ptFakeVar) * addSF[0];
+    double sf = hcorr.getVal2D(fabs(mu_eta[i]),ptFakeVar) * addSF[0];
     sfTot = -sfTot*sf/(1-sf);
     if(debug) printf("fakemu(%d) %.3f %.3f %.3f %.3f %.3f\n",i,ptFakeVar,mu_eta[i],sf,sf/(1-sf),sfTot);
   }
 
   for(unsigned int i=0;i<el_pt.size();i++) {
     if(tight_el[i] == 1) continue;
-    const TH2D& hcorr = histoFakeEtaPt_el[eType];
+    const LookupTable& hcorr = lutFakeEtaPt_el[eType];
     float ptFakeVar = el_pt[i];
     if(whichAna == 3) ptFakeVar = el_pt[i]*(1+std::max(el_jetRelIso[i],0.0f))*0.9;
-    double sf = getValFromTH2(hcorr, fabs(el_eta[i]), ptFakeVar) * addSF[1];
+    double sf = hcorr.getVal2D(fabs(el_eta[i]), ptFakeVar) * addSF[1];
     sfTot = -sfTot*sf/(1-sf);
     if(debug) printf("fakeel(%d) %.3f %.3f %.3f %.3f %.3f\n",i,el_pt[i],ptFakeVar,sf,sf/(1-sf),sfTot);
   }
@@ -967,8 +1319,7 @@ float compute_MuonSF(const Vec_f& mu_pt, const Vec_f& mu_eta, const float sumErr
   if(debug) printf("mueff: %lu %f\n",mu_pt.size(),sumError);
   double sfTot = 1.0;
   for(unsigned int i=0;i<mu_pt.size();i++) {
-    const TH2D& hcorr = histoLepSFEtaPt_mu;
-    double sf = getValFromTH2(hcorr, mu_eta[i],mu_pt[i],sumError);
+    double sf = lutLepSFEtaPt_mu.getVal2D(mu_eta[i],mu_pt[i],sumError);
     sfTot = sfTot*sf;
     if(debug) printf("lepmu(%d) %.3f %.3f %.3f %.3f\n",i,mu_pt[i],mu_eta[i],sf,sfTot);
   }
@@ -982,8 +1333,7 @@ float compute_ElectronSF(const Vec_f& el_pt, const Vec_f& el_eta, const float su
   if(debug) printf("eleff: %lu %f\n",el_pt.size(),sumError);
   double sfTot = 1.0;
   for(unsigned int i=0;i<el_pt.size();i++) {
-    const TH2D& hcorr = histoLepSFEtaPt_el;
-    double sf = getValFromTH2(hcorr, el_eta[i], el_pt[i],sumError);
+    double sf = lutLepSFEtaPt_el.getVal2D(el_eta[i], el_pt[i],sumError);
     sfTot = sfTot*sf;
     if(debug) printf("lepel(%d) %.3f %.3f %.3f %.3f\n",i,el_pt[i],el_eta[i],sf,sfTot);
   }
@@ -999,17 +1349,8 @@ float compute_PURecoSF(const Vec_f& mu_pt, const Vec_f& mu_eta,
   double sfTot = 1.0;
 
   double sf = 1.0;
-  if     (type == 0){
-    const TH1D& hcorr = puWeights;
-    sf = getValFromTH1(hcorr, std::min(nPU,72.999f));
-  }
-  else if(type == 1){
-    const TH1D& hcorr = puWeightsUp;
-    sf = getValFromTH1(hcorr, std::min(nPU,72.999f));
-  }
-  else if(type == 2){
-    const TH1D& hcorr = puWeightsDown;
-    sf = getValFromTH1(hcorr, std::min(nPU,72.999f));
+  if(type >= 0 && type <= 2){
+    sf = lutPUWeights[type].getVal1D(std::min(nPU,72.999f));
   }
   else {
     printf("Wrong type %d\n",type);
@@ -1024,25 +1365,15 @@ float compute_TriggerSF(float ptl1, float ptl2, float etal1, float etal2, int lt
 
   if(ltype >= 4) return 1.0;
 
-  TH2D hcorr;
-  if     (etal1 <= 1.5 && etal2 <= 1.5 && ltype == 0) hcorr = histoTriggerSFEtaPt_0_0;
-  else if(etal1 >  1.5 && etal2 <= 1.5 && ltype == 0) hcorr = histoTriggerSFEtaPt_0_1;
-  else if(etal1 <= 1.5 && etal2 >  1.5 && ltype == 0) hcorr = histoTriggerSFEtaPt_0_2;
-  else if(etal1 >  1.5 && etal2 >  1.5 && ltype == 0) hcorr = histoTriggerSFEtaPt_0_3;
-  else if(etal1 <= 1.5 && etal2 <= 1.5 && ltype == 1) hcorr = histoTriggerSFEtaPt_1_0;
-  else if(etal1 >  1.5 && etal2 <= 1.5 && ltype == 1) hcorr = histoTriggerSFEtaPt_1_1;
-  else if(etal1 <= 1.5 && etal2 >  1.5 && ltype == 1) hcorr = histoTriggerSFEtaPt_1_2;
-  else if(etal1 >  1.5 && etal2 >  1.5 && ltype == 1) hcorr = histoTriggerSFEtaPt_1_3;
-  else if(etal1 <= 1.5 && etal2 <= 1.5 && ltype == 2) hcorr = histoTriggerSFEtaPt_2_0;
-  else if(etal1 >  1.5 && etal2 <= 1.5 && ltype == 2) hcorr = histoTriggerSFEtaPt_2_1;
-  else if(etal1 <= 1.5 && etal2 >  1.5 && ltype == 2) hcorr = histoTriggerSFEtaPt_2_2;
-  else if(etal1 >  1.5 && etal2 >  1.5 && ltype == 2) hcorr = histoTriggerSFEtaPt_2_3;
-  else if(etal1 <= 1.5 && etal2 <= 1.5 && ltype == 3) hcorr = histoTriggerSFEtaPt_3_0;
-  else if(etal1 >  1.5 && etal2 <= 1.5 && ltype == 3) hcorr = histoTriggerSFEtaPt_3_1;
-  else if(etal1 <= 1.5 && etal2 >  1.5 && ltype == 3) hcorr = histoTriggerSFEtaPt_3_2;
-  else if(etal1 >  1.5 && etal2 >  1.5 && ltype == 3) hcorr = histoTriggerSFEtaPt_3_3;
+  // eta categories 0 (B,B), 1 (E,B), 2 (B,E), 3 (E,E), no category for NaN
+  int etaType = -1;
+  if     (etal1 <= 1.5 && etal2 <= 1.5) etaType = 0;
+  else if(etal1 >  1.5 && etal2 <= 1.5) etaType = 1;
+  else if(etal1 <= 1.5 && etal2 >  1.5) etaType = 2;
+  else if(etal1 >  1.5 && etal2 >  1.5) etaType = 3;
+  float sf = 0;
+  if(ltype >= 0 && etaType >= 0) sf = lutTriggerSFEtaPt[ltype][etaType].getVal2D(ptl1, ptl2, unc);
   else printf("Problem trigger type (%d) %f %f\n",ltype,etal1,etal2);
-  float sf = getValFromTH2(hcorr, ptl1, ptl2, unc);
   if(sf == 0) {sf = 1.0; /*printf("PROBLEM sf==0! %.3f %.3f %.2f %.2f %d\n",ptl1,ptl2,etal1,etal2,ltype);*/}
   return sf;
 }
@@ -1065,48 +1396,48 @@ float compute_TriggerForSingleLegsSF(float ptl1, float ptl2, float etal1, float
   float effda_sgl_1 = 1; float effda_sgl_2 = 1; float effda_dbl_leadingleg = 1; float effda_dbl_trailingleg = 1;
   float effmc_sgl_1 = 1; float effmc_sgl_2 = 1; float effmc_dbl_leadingleg = 1; float effmc_dbl_trailingleg = 1;
   if     (ltype == 0){ // mm
-    effda_sgl_1           = getValFromTH2(histoTriggerDAEtaPt[1], fabs(etal1), ptl1);
-    effda_sgl_2           = getValFromTH2(histoTriggerDAEtaPt[1], fabs(etal2), ptl2);
-    effda_dbl_leadingleg  = getValFromTH2(histoTriggerDAEtaPt[4], fabs(etal1), ptl1);
-    effda_dbl_trailingleg = getValFromTH2(histoTriggerDAEtaPt[5], fabs(etal2), ptl2);
+    effda_sgl_1           = lutTriggerDAEtaPt[1].getVal2D(fabs(etal1), ptl1);
+    effda_sgl_2           = lutTriggerDAEtaPt[1].getVal2D(fabs(etal2), ptl2);
+    effda_dbl_leadingleg  = lutTriggerDAEtaPt[4].getVal2D(fabs(etal1), ptl1);
+    effda_dbl_trailingleg = lutTriggerDAEtaPt[5].getVal2D(fabs(etal2), ptl2);
 
-    effmc_sgl_1           = getValFromTH2(histoTriggerMCEtaPt[1], fabs(etal1), ptl1);
-    effmc_sgl_2           = getValFromTH2(histoTriggerMCEtaPt[1], fabs(etal2), ptl2);
-    effmc_dbl_leadingleg  = getValFromTH2(histoTriggerMCEtaPt[4], fabs(etal1), ptl1);
-    effmc_dbl_trailingleg = getValFromTH2(histoTriggerMCEtaPt[5], fabs(etal2), ptl2);
+    effmc_sgl_1           = lutTriggerMCEtaPt[1].getVal2D(fabs(etal1), ptl1);
+    effmc_sgl_2           = lutTriggerMCEtaPt[1].getVal2D(fabs(etal2), ptl2);
+    effmc_dbl_leadingleg  = lutTriggerMCEtaPt[4].getVal2D(fabs(etal1), ptl1);
+    effmc_dbl_trailingleg = lutTriggerMCEtaPt[5].getVal2D(fabs(etal2), ptl2);
   }
   else if(ltype == 1){ // ee
-    effda_sgl_1           = getValFromTH2(histoTriggerDAEtaPt[0], fabs(etal1), ptl1);
-    effda_sgl_2           = getValFromTH2(histoTriggerDAEtaPt[0], fabs(etal2), ptl2);
-    effda_dbl_leadingleg  = getValFromTH2(histoTriggerDAEtaPt[2], fabs(etal1), ptl1);
-    effda_dbl_trailingleg = getValFromTH2(histoTriggerDAEtaPt[3], fabs(etal2), ptl2);
+    effda_sgl_1           = lutTriggerDAEtaPt[0].getVal2D(fabs(etal1), ptl1);
+    effda_sgl_2           = lutTriggerDAEtaPt[0].getVal2D(fabs(etal2), ptl2);
+    effda_dbl_leadingleg  = lutTriggerDAEtaPt[2].getVal2D(fabs(etal1), ptl1);
+    effda_dbl_trailingleg = lutTriggerDAEtaPt[3].getVal2D(fabs(etal2), ptl2);
 
-    effmc_sgl_1           = getValFromTH2(histoTriggerMCEtaPt[0], fabs(etal1), ptl1);
-    effmc_sgl_2           = getValFromTH2(histoTriggerMCEtaPt[0], fabs(etal2), ptl2);
-    effmc_dbl_leadingleg  = getValFromTH2(histoTriggerMCEtaPt[2], fabs(etal1), ptl1);
-    effmc_dbl_trailingleg = getValFromTH2(histoTriggerMCEtaPt[3], fabs(etal2), ptl2);
+    effmc_sgl_1           = lutTriggerMCEtaPt[0].getVal2D(fabs(etal1), ptl1);
+    effmc_sgl_2           = lutTriggerMCEtaPt[0].getVal2D(fabs(etal2), ptl2);
+    effmc_dbl_leadingleg  = lutTriggerMCEtaPt[2].getVal2D(fabs(etal1), ptl1);
+    effmc_dbl_trailingleg = lutTriggerMCEtaPt[3].getVal2D(fabs(etal2), ptl2);
   }
   else if(ltype == 2){ // me
-    effda_sgl_1           = getValFromTH2(histoTriggerDAEtaPt[1], fabs(etal1), ptl1);
-    effda_sgl_2           = getValFromTH2(histoTriggerDAEtaPt[0], fabs(etal2), ptl2);
-    effda_dbl_leadingleg  = getValFromTH2(histoTriggerDAEtaPt[8], fabs(etal1), ptl1);
-    effda_dbl_trailingleg = getValFromTH2(histoTriggerDAEtaPt[9], fabs(etal2), ptl2);
+    effda_sgl_1           = lutTriggerDAEtaPt[1].getVal2D(fabs(etal1), ptl1);
+    effda_sgl_2           = lutTriggerDAEtaPt[0].getVal2D(fabs(etal2), ptl2);
+    effda_dbl_leadingleg  = lutTriggerDAEtaPt[8].getVal2D(fabs(etal1), ptl1);
+    effda_dbl_trailingleg = lutTriggerDAEtaPt[9].getVal2D(fabs(etal2), ptl2);
 
-    effmc_sgl_1           = getValFromTH2(histoTriggerMCEtaPt[1], fabs(etal1), ptl1);
-    effmc_sgl_2           = getValFromTH2(histoTriggerMCEtaPt[0], fabs(etal2), ptl2);
-    effmc_dbl_leadingleg  = getValFromTH2(histoTriggerMCEtaPt[8], fabs(etal1), ptl1);
-    effmc_dbl_trailingleg = getValFromTH2(histoTriggerMCEtaPt[9], fabs(etal2), ptl2);
+    effmc_sgl_1           = lutTriggerMCEtaPt[1].getVal2D(fabs(etal1), ptl1);
+    effmc_sgl_2           = lutTriggerMCEtaPt[0].getVal2D(fabs(etal2), ptl2);
+    effmc_dbl_leadingleg  = lutTriggerMCEtaPt[8].getVal2D(fabs(etal1), ptl1);
+    effmc_dbl_trailingleg = lutTriggerMCEtaPt[9].getVal2D(fabs(etal2), ptl2);
   }
   else if(ltype == 3){ // em
-    effda_sgl_1           = getValFromTH2(histoTriggerDAEtaPt[0], fabs(etal1), ptl1);
-    effda_sgl_2           = getValFromTH2(histoTriggerDAEtaPt[1], fabs(etal2), ptl2);
-    effda_dbl_leadingleg  = getValFromTH2(histoTriggerDAEtaPt[6], fabs(etal1), ptl1);
-    effda_dbl_trailingleg = getValFromTH2(histoTriggerDAEtaPt[7], fabs(etal2), ptl2);
+    effda_sgl_1           = lutTriggerDAEtaPt[0].getVal2D(fabs(etal1), ptl1);
+    effda_sgl_2           = lutTriggerDAEtaPt[1].getVal2D(fabs(etal2), ptl2);
+    effda_dbl_leadingleg  = lutTriggerDAEtaPt[6].getVal2D(fabs(etal1), ptl1);
+    effda_dbl_trailingleg = lutTriggerDAEtaPt[7].getVal2D(fabs(etal2), ptl2);
 
-    effmc_sgl_1           = getValFromTH2(histoTriggerMCEtaPt[0], fabs(etal1), ptl1);
-    effmc_sgl_2           = getValFromTH2(histoTriggerMCEtaPt[1], fabs(etal2), ptl2);
-    effmc_dbl_leadingleg  = getValFromTH2(histoTriggerMCEtaPt[6], fabs(etal1), ptl1);
-    effmc_dbl_trailingleg = getValFromTH2(histoTriggerMCEtaPt[7], fabs(etal2), ptl2);
+    effmc_sgl_1           = lutTriggerMCEtaPt[0].getVal2D(fabs(etal1), ptl1);
+    effmc_sgl_2           = lutTriggerMCEtaPt[1].getVal2D(fabs(etal2), ptl2);
+    effmc_dbl_leadingleg  = lutTriggerMCEtaPt[6].getVal2D(fabs(etal1), ptl1);
+    effmc_dbl_trailingleg = lutTriggerMCEtaPt[7].getVal2D(fabs(etal2), ptl2);
   }
   
   float evt_effda =  effda_sgl_1 * (1-effda_sgl_2)
@@ -1613,6 +1944,16 @@ float compute_jet_lepton_final_var(const float mjj, const float detajj, const fl
   return 0.0;
 }
 
+// compute_jet_lepton_final_var for each variation of a bundle (e.g. the *JesVar columns of makeJESBundle)
+Vec_d compute_jet_lepton_final_vars(const Vec_f& mjj, const Vec_f& detajj, const Vec_f& dphijj, const Vec_f& zepvv, const Vec_f& bdt, const float mll, const Vec_f& njets, unsigned int var)
+{
+  Vec_d theVars(mjj.size());
+  for(unsigned int i=0; i<mjj.size(); i++) {
+    theVars[i] = compute_jet_lepton_final_var(mjj[i], detajj[i], dphijj[i], zepvv[i], bdt[i], mll, njets[i], var);
+  }
+  return theVars;
+}
+
 
 // Jet-lepton variables
 float compute_jet_lepton_var(Vec_f pt, Vec_f eta, Vec_f phi, Vec_f mass, 
@@ -1710,6 +2051,146 @@ float compute_jet_var(Vec_f pt, Vec_f eta, Vec_f phi, Vec_f mass, unsigned int v
   return theVar;
 }
 
+// compute_jet_var for var 0-9 at once, same leading pair (the first two jets)
+void compute_jet_vars(const Vec_f& pt, const Vec_f& eta, const Vec_f& phi, const Vec_f& mass, float *theVars)
+{
+  if(pt.size() < 2) {
+    for(int i=0; i<10; i++) theVars[i] = -1;
+    return;
+  }
+  PtEtaPhiMVector p1(pt[0], eta[0], phi[0], mass[0]);
+  PtEtaPhiMVector p2(pt[1], eta[1], phi[1], mass[1]);
+
+  theVars[0] = (p1 + p2).M();
+  theVars[1] = (p1 + p2).Pt();
+  theVars[2] = fabs(p1.Eta()-p2.Eta());
+  theVars[3] = deltaPhi(p1.Phi(), p2.Phi());
+  theVars[4] = p1.Pt();
+  theVars[5] = p2.Pt();
+  theVars[6] = abs(p1.Eta());
+  theVars[7] = abs(p2.Eta());
+  theVars[8] = p1.Phi();
+  theVars[9] = p2.Phi();
+}
+
+// compute_jet_lepton_var for var 0-7 at once
+void compute_jet_lepton_vars(const Vec_f& pt, const Vec_f& eta, const Vec_f& phi, const Vec_f& mass,
+                             const Vec_f& mu_pt, const Vec_f& mu_eta, const Vec_f& mu_phi, const Vec_f& mu_mass,
+                             const Vec_f& el_pt, const Vec_f& el_eta, const Vec_f& el_phi, const Vec_f& el_mass,
+                             const float met_pt, const float met_phi, float *theVars)
+{
+  if(mu_pt.size() + el_pt.size() == 0 || pt.size() < 2) {
+    for(int i=0; i<8; i++) theVars[i] = -1;
+    return;
+  }
+
+  PtEtaPhiMVector p1(pt[0], eta[0], phi[0], mass[0]);
+  PtEtaPhiMVector p2(pt[1], eta[1], phi[1], mass[1]);
+
+  float deltaEtaJJ = fabs(p1.Eta()-p2.Eta());
+  float maxZ = 0.0;
+  float sumHT = p1.Pt() + p2.Pt() + met_pt;
+
+  PtEtaPhiMVector p4momVV = PtEtaPhiMVector(met_pt,0,met_phi,0);
+  PtEtaPhiMVector p4momTot = PtEtaPhiMVector(met_pt,0,met_phi,0) + p1 + p2;
+
+  for(unsigned int i=0;i<mu_pt.size();i++) {
+    p4momVV = p4momVV + PtEtaPhiMVector(mu_pt[i],mu_eta[i],mu_phi[i],mu_mass[i]);
+    p4momTot = p4momTot + PtEtaPhiMVector(mu_pt[i],mu_eta[i],mu_phi[i],mu_mass[i]);
+    if(fabs(mu_eta[i]-(p1.Eta()+p2.Eta())/2.)/deltaEtaJJ > maxZ) maxZ = fabs(mu_eta[i]-(p1.Eta()+p2.Eta())/2.)/deltaEtaJJ;
+    sumHT += mu_pt[i];
+  }
+
+  for(unsigned int i=0;i<el_pt.size();i++) {
+    p4momVV = p4momVV + PtEtaPhiMVector(el_pt[i],el_eta[i],el_phi[i],el_mass[i]);
+    p4momTot = p4momTot + PtEtaPhiMVector(el_pt[i],el_eta[i],el_phi[i],el_mass[i]);
+    if(fabs(el_eta[i]-(p1.Eta()+p2.Eta())/2.)/deltaEtaJJ > maxZ) maxZ = fabs(el_eta[i]-(p1.Eta()+p2.Eta())/2.)/deltaEtaJJ;
+    sumHT += el_pt[i];
+  }
+
+  theVars[0] = fabs(p4momVV.Eta()-(p1.Eta()+p2.Eta())/2.)/deltaEtaJJ;
+  theVars[1] = maxZ;
+  theVars[2] = sumHT;
+  theVars[3] = p4momVV.Pt();
+  theVars[4] = p4momTot.Pt();
+  theVars[5] = fabs(p4momVV.Eta()-p1.Eta());
+  theVars[6] = fabs(p4momVV.Eta()-p2.Eta());
+  theVars[7] = (p4momVV.Pt()-(p1+p2).Pt())/(p1+p2).Pt();
+}
+
+// The scalar columns of makeJES for nVar jet pt variations in one call per event:
+// jet_pt_var is stored as [variation][jet], the result as [quantity][variation] in
+// the order of jesBundleQuantities (utilsSelection.py). As in makeJES the varied
+// good/vbs jet pt are paired with the eta/phi/mass of the nominal selection and the
+// MET (met_pt, met_phi) is propagated from the nominal jets (jet_pt_def) to the varied ones
+const int nJESBundleQuantities = 35;
+Vec_f compute_jes_bundle(const Vec_f& jet_pt_var, const unsigned int nVar, const Vec_f& jet_pt_def,
+                         const Vec_f& jet_eta, const Vec_f& jet_phi, const Vec_f& jet_mass, const Vec_f& jet_btag,
+                         const Vec_f& jet_chEmEF, const Vec_f& jet_neEmEF, const Vec_f& jet_muonSubtrFactor, const Vec_f& jet_rawFactor,
+                         const Vec_f& good_jet_eta, const Vec_f& good_jet_phi, const Vec_f& good_jet_mass,
+                         const Vec_f& vbs_jet_eta, const Vec_f& vbs_jet_phi, const Vec_f& vbs_jet_mass,
+                         const Vec_f& mu_pt, const Vec_f& mu_eta, const Vec_f& mu_phi, const Vec_f& mu_mass,
+                         const Vec_f& el_pt, const Vec_f& el_eta, const Vec_f& el_phi, const Vec_f& el_mass,
+                         const float met_pt, const float met_phi, const float rawmet_pt, const float rawmet_phi,
+                         const double jetEtaCut, const double bTagCut, const int jetTypeCorr, const int year)
+{
+  const unsigned int nJets = jet_eta.size();
+  Vec_f bundle(nJESBundleQuantities*nVar, 0.0);
+  if(jet_pt_var.size() != nVar*nJets) {
+    printf("Different jet sizes in JES bundle!!!\n");
+    return bundle;
+  }
+
+  const float ngood_cen_jets = Sum(abs(jet_eta) < 2.5)*1.0f;
+  const float ngood_fwd_jets = Sum(abs(jet_eta) > 2.5)*1.0f;
+  float theVars[nJESBundleQuantities];
+  for(unsigned int nv=0; nv<nVar; nv++) {
+    const Vec_f pt(jet_pt_var.begin()+nv*nJets, jet_pt_var.begin()+(nv+1)*nJets);
+
+    const auto good_jet = abs(jet_eta) < jetEtaCut && pt > 30 && (pt > 50 || abs(jet_eta) < 2.5 || abs(jet_eta) > 3.0);
+    const Vec_f good_jet_eta_var = jet_eta[good_jet];
+    const Vec_b good_jet_vetoMapMask = cleaningJetVetoMapMask(good_jet_eta_var, jet_phi[good_jet], jetTypeCorr, year);
+    theVars[0] = Sum(good_jet)*1.0f;
+    theVars[1] = Sum(good_jet_vetoMapMask > 0)*1.0f;
+    theVars[2] = ngood_cen_jets;
+    theVars[3] = ngood_fwd_jets;
+    theVars[4] = Sum(abs(good_jet_eta_var) < 2.5 && jet_btag[good_jet] > bTagCut)*1.0f;
+    compute_jet_vars(pt[good_jet], good_jet_eta, good_jet_phi, good_jet_mass, &theVars[5]);
+
+    const auto goodbtag_jet = abs(jet_eta) < 2.5 && pt > 20;
+    theVars[13] = Sum(jet_btag[goodbtag_jet] > bTagCut)*1.0f;
+
+    const auto vbs_jet = abs(jet_eta) < 4.9 && pt > 50;
+    const Vec_f vbs_jet_pt = pt[vbs_jet];
+    theVars[14] = Sum(vbs_jet)*1.0f;
+    float vbsVars[10];
+    compute_jet_vars(vbs_jet_pt, vbs_jet_eta, vbs_jet_phi, vbs_jet_mass, vbsVars);
+    for(int i=0; i<10; i++) theVars[15+i] = vbsVars[i];
+
+    theVars[25] = compute_JSON_MET_Unc(met_pt,met_phi,rawmet_pt,rawmet_phi,jet_chEmEF,jet_neEmEF,jet_muonSubtrFactor,jet_rawFactor,jet_pt_def,pt,jet_eta,jet_phi,jet_mass,1);
+    theVars[26] = compute_JSON_MET_Unc(met_pt,met_phi,rawmet_pt,rawmet_phi,jet_chEmEF,jet_neEmEF,jet_muonSubtrFactor,jet_rawFactor,jet_pt_def,pt,jet_eta,jet_phi,jet_mass,2);
+    compute_jet_lepton_vars(vbs_jet_pt, vbs_jet_eta, vbs_jet_phi, vbs_jet_mass, mu_pt, mu_eta, mu_phi, mu_mass, el_pt, el_eta, el_phi, el_mass,
+                            theVars[25], theVars[26], &theVars[27]);
+
+    for(int i=0; i<nJESBundleQuantities; i++) bundle[i*nVar+nv] = theVars[i];
+  }
+
+  return bundle;
+}
+
+// All the variations of one quantity of compute_jes_bundle
+Vec_f get_jes_bundle(const Vec_f& bundle, int quantity){
+  const unsigned int nVar = bundle.size()/nJESBundleQuantities;
+  return Vec_f(bundle.begin()+quantity*nVar, bundle.begin()+(quantity+1)*nVar);
+}
+
+// The jet pt variations as one [variation][jet] vector for compute_jes_bundle
+Vec_f stack_jet_pt_variations(const std::vector<Vec_f>& jet_pt){
+  Vec_f jet_pt_var;
+  for(unsigned int i=0; i<jet_pt.size(); i++) jet_pt_var.insert(jet_pt_var.end(), jet_pt[i].begin(), jet_pt[i].end());
+  return jet_pt_var;
+}
+
 // lepton+met variables
 float compute_lmet_var(const Vec_f& mu_pt, const Vec_f& mu_eta, const Vec_f& mu_phi, const Vec_f& mu_jetRelIso,
                        const Vec_f& el_pt, const Vec_f& el_eta, const Vec_f& el_phi, const Vec_f& el_jetRelIso,
@@ -2330,25 +2811,8 @@ float compute_ptww_weight(const Vec_f& GenDressedLepton_pt, const Vec_f& GenDres
   double ptww = std::min(p4mom.Pt(),499.999);
 
   double sf = 1.0;
-  if     (nsel == 0){
-    const TH1D& hcorr = histo_wwpt;
-    sf = getValFromTH1(hcorr, ptww);
-  }
-  else if(nsel == 1){
-    const TH1D& hcorr = histo_wwpt_scaleup;
-    sf = getValFromTH1(hcorr, ptww);
-  }
-  else if(nsel == 2){
-    const TH1D& hcorr = histo_wwpt_scaledown;
-    sf = getValFromTH1(hcorr, ptww);
-  }
-  else if(nsel == 3){
-    const TH1D& hcorr = histo_wwpt_resumup;
-    sf = getValFromTH1(hcorr, ptww);
-  }
-  else if(nsel == 4){
-    const TH1D& hcorr = histo_wwpt_resumdown;
-    sf = getValFromTH1(hcorr, ptww);
+  if(nsel >= 0 && nsel <= 4){
+    sf = lutWWPt[nsel].getVal1D(ptww);
   }
   else {
     printf("WRONG option!\n");
@@ -5,7 +5,7 @@ from array import array
 ROOT.ROOT.EnableImplicitMT(4)
 from utilsCategory import plotCategory
 from utilsAna import getMClist, getDATAlist
-from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLumi
+from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLumi, getMCNormalization, getFileListFingerprint, getFileWeights
 
 selectionJsonPath = "config/selection.json"
 if(not os.path.exists(selectionJsonPath)):
@@ -307,15 +307,14 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,puWeights,histoBTVEffEta
     files = getMClist(sampleNOW, skimType)
     print("Total files: {0}".format(len(files)))
 
-    rdfRunTree = ROOT.RDataFrame("Runs", files)
-    genEventSumWeight = rdfRunTree.Sum("genEventSumw").GetValue()
-    genEventSumNoWeight = rdfRunTree.Sum("genEventCount").GetValue()
+    fingerprint = getFileListFingerprint(files)
+    genEventSumWeight, genEventSumNoWeight, _, _, _, runGetEntries = getMCNormalization(sampleNOW, skimType, files, fingerprint)
 
     weight = (SwitchSample(sampleNOW, skimType)[1] / genEventSumWeight)*getLumi(year)
     weightApprox = (SwitchSample(sampleNOW, skimType)[1] / genEventSumNoWeight)*getLumi(year)
 
     if(whichJob != -1):
-        groupedFile = groupFiles(files, group)
+        groupedFile = groupFiles(files, group, getFileWeights(files, SwitchSample(sampleNOW, skimType)[0], fingerprint))
         files = groupedFile[whichJob]
         if(len(files) == 0):
             print("no files in job/group: {0} / {1}".format(whichJob, group))
@@ -325,7 +324,7 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,puWeights,histoBTVEffEta
     df = ROOT.RDataFrame("Events", files)
     nevents = df.Count().GetValue()
 
-    print("genEventSum({0}): {1} / Events(total/ntuple): {2} / {3}".format(rdfRunTree.Count().GetValue(),genEventSumWeight,genEventSumNoWeight,nevents))
+    print("genEventSum({0}): {1} / Events(total/ntuple): {2} / {3}".format(runGetEntries,genEventSumWeight,genEventSumNoWeight,nevents))
     print("WeightExact/Approx %f / %f / Cross section: %f" %(weight, weightApprox, SwitchSample(sampleNOW, skimType)[1]))
 
     PDType = os.path.basename(SwitchSample(sampleNOW, skimType)[0]).split('+')[0]
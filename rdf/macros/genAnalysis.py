@@ -4,11 +4,14 @@ from array import array
 
 ROOT.ROOT.EnableImplicitMT(10)
 from utilsCategory import plotCategory
-from utilsAna import getMClist, getDATAlist, getTriggerFromJson, getLumi
+from utilsAna import getMClist, getDATAlist, getTriggerFromJson, getLumi, getMCNormalization, getFileListFingerprint
 from utilsAna import SwitchSample
 from utilsSelection import selectionGenLepJet, selectionTheoryWeigths, makeFinalVariable
+from multihisto_helper import makeFinalVariablePDFBundle, unpackCategoryHistos
 
 isRun3Sel = True
+# the 103 PDF histograms of the final variables filled from weightPDFs in one action each
+usePDFBundle = True
 
 def analysis(df,count,category,weight,year,PDType,nSel,isData,histo_wwpt,ewkCorrWeights,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm):
 
@@ -69,8 +72,13 @@ def analysis(df,count,category,weight,year,PDType,nSel,isData,histo_wwpt,ewkCorr
     maxXF = 0.5
 
     startF = 140
-    for nv in range(0,114):
-        histo[startF+0+nv][x] = makeFinalVariable(dfcat,"weightForBTag",theCat,startF+0,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+0+nv][x] = makeFinalVariable(dfcat,"weightForBTag",theCat,startF+0,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfcat,"weightForBTag",theCat,startF+0,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+0+nv][x] = makeFinalVariable(dfcat,"weightForBTag",theCat,startF+0,x,BinXF,minXF,maxXF,nv)
 
     dfzllgen = (dfcat
           .Define("gen_z", "GenPart_pdgId == 23 && GenPart_status == 62")
@@ -125,8 +133,13 @@ def analysis(df,count,category,weight,year,PDType,nSel,isData,histo_wwpt,ewkCorr
     histo2D[100][x] = dfzllgen.Histo2D(("histo2d_{0}_{1}".format(100,x),"histo2d_{0}_{1}".format(100,x),10, 0, 5, 40, 0, 100),"Zrap","Zpt","weight")
 
     startF = 260
-    for nv in range(0,114):
-        histo[startF+0+nv][x] = makeFinalVariable(dfzllgen,"weightForBTag",theCat,startF+0,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+0+nv][x] = makeFinalVariable(dfzllgen,"weightForBTag",theCat,startF+0,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfzllgen,"weightForBTag",theCat,startF+0,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+0+nv][x] = makeFinalVariable(dfzllgen,"weightForBTag",theCat,startF+0,x,BinXF,minXF,maxXF,nv)
 
     dfzllgen = (dfzllgen
           .Define("genLep", "(abs(GenDressedLepton_pdgId) == 11 || abs(GenDressedLepton_pdgId) == 13)")
@@ -222,8 +235,13 @@ def analysis(df,count,category,weight,year,PDType,nSel,isData,histo_wwpt,ewkCorr
     maxXF = 2.5
 
     startF = 20
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfwwxgen,"theGenCat",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfwwxgen,"theGenCat",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfwwxgen,"theGenCat",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfwwxgen,"theGenCat",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     histo[134][x] = dfwwxgen.Histo1D(("histo_{0}_{1}".format(134,x), "histo_{0}_{1}".format(134,x),BinXF,minXF,maxXF),"theGenCat","weight")
     histo[135][x] = dfwwxgen.Histo1D(("histo_{0}_{1}".format(135,x), "histo_{0}_{1}".format(135,x),BinXF,minXF,maxXF),"theGenCat","theNNLOWeight0")
@@ -282,43 +300,73 @@ def analysis(df,count,category,weight,year,PDType,nSel,isData,histo_wwpt,ewkCorr
     minXF = -0.5
     maxXF = 3.5
     startF = 386
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfvbswzgen,"theGenCat",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswzgen,"theGenCat",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfvbswzgen,"theGenCat",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswzgen,"theGenCat",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     BinXF = 4
     minXF = -0.5
     maxXF = 3.5
     startF = 530
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat1",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat1",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfvbswwgen,"theGenCat1",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat1",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     BinXF = 4
     minXF = -0.5
     maxXF = 3.5
     startF = 650
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat2",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat2",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfvbswwgen,"theGenCat2",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat2",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     BinXF = 2
     minXF = -0.5
     maxXF = 1.5
     startF = 770
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat3",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat3",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfvbswwgen,"theGenCat3",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat3",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     BinXF = 4
     minXF = -0.5
     maxXF = 3.5
     startF = 890
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat4",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat4",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfvbswwgen,"theGenCat4",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat4",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     BinXF = 4
     minXF = -0.5
     maxXF = 3.5
     startF = 1010
-    for nv in range(0,114):
-        histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat5",theCat,startF,x,BinXF,minXF,maxXF,nv)
+    if(usePDFBundle == True):
+        for nv in range(0,11):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat5",theCat,startF,x,BinXF,minXF,maxXF,nv)
+        histo[startF+11][x] = makeFinalVariablePDFBundle(dfvbswwgen,"theGenCat5",theCat,startF,x,(BinXF,minXF,maxXF))
+    else:
+        for nv in range(0,114):
+            histo[startF+nv][x] = makeFinalVariable(dfvbswwgen,"theGenCat5",theCat,startF,x,BinXF,minXF,maxXF,nv)
 
     report0 = dfzllgen.Report()
     report1 = dfwwxgen.Report()
@@ -333,6 +381,8 @@ def analysis(df,count,category,weight,year,PDType,nSel,isData,histo_wwpt,ewkCorr
     print("---------------- SUMMARY VBSWZ -------------")
     report3.Print()
 
+    unpackCategoryHistos(histo)
+
     myfile = ROOT.TFile("fillhisto_genAnalysis_sample{0}_year{1}_job-1.root".format(count,year),'RECREATE')
     for nc in range(nCat):
         for j in range(nHisto):
@@ -373,49 +423,12 @@ def readMCSample(sampleNOW, year, skimType, nSel, histo_wwpt, ewkCorrWeights):
 
     df = ROOT.RDataFrame("Events", files)
 
-    genEventSumWeight = 0
-    genEventSumNoWeight = 0
-    nTheoryReplicas = [103, 9, 4]
-    genEventSumLHEScaleWeight = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-    genEventSumPSWeight = [0, 0, 0, 0, 0]
-
-    dfRuns = ROOT.RDataFrame("Runs", files)
-    genEventSumWeight = dfRuns.Sum("genEventSumw").GetValue()
-    genEventSumNoWeight = dfRuns.Sum("genEventCount").GetValue()
-    try:
-        if(dfRuns.Min("nLHEPdfSumw").GetValue() < nTheoryReplicas[0]):
-            nTheoryReplicas[0] = int(dfRuns.Min("nLHEPdfSumw").GetValue())
-    except Exception as e:
-        nTheoryReplicas[0] = 0
-    for n in range(9):
-        try:
-            if(dfRuns.Min("nLHEScaleSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumLHEScaleWeight{0}".format(n),"LHEScaleSumw[{0}]".format(n))
-                genEventSumLHEScaleWeight[n] = dfRuns.Sum("genEventSumLHEScaleWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[1] = int(dfRuns.Min("nLHEScaleSumw").GetValue())
-        except Exception as e:
-            genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[1] = n
-            print("Problem with LHEScaleWeights {0}".format(e))
+    fingerprint = getFileListFingerprint(files)
+    genEventSumWeight, genEventSumNoWeight, nTheoryReplicas, genEventSumLHEScaleWeight, genEventSumPSWeight, runGetEntries = getMCNormalization(sampleNOW, skimType, files, fingerprint)
+    # the PS weights are not used in this analysis
     for n in range(4):
-        try:
-            if(hasattr(dfRuns,"nPSSumw") and dfRuns.Min("nPSSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumPSWeight{0}".format(n),"PSSumw[{0}]".format(n))
-                genEventSumPSWeight[n] = dfRuns.Sum("genEventSumPSWeight{0}".format(n)).GetValue()
-            elif(hasattr(dfRuns,"nPSSumw")):
-                genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[2] = int(dfRuns.Min("nPSSumw").GetValue())
-            else:
-                genEventSumPSWeight[n] = 1.0
-                nTheoryReplicas[2] = 4
-        except Exception as e:
-            genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[2] = n
-            print("Problem with PSWeights {0}".format(e))
-    genEventSumPSWeight[4] = dfRuns.Count().GetValue()
-    runGetEntries = dfRuns.Count().GetValue()
+        genEventSumPSWeight[n] = 1.0
+    nTheoryReplicas[2] = 4
 
     if(("WWJJto2L2Nu-SS" in SwitchSample(sampleNOW, skimType)[0]) and ("sherpa" in SwitchSample(sampleNOW, skimType)[0])):
         print("WWJJto2L2Nu-SS sherpa sample")
@@ -0,0 +1,103 @@
+#ifndef JIT_CACHE_H
+#define JIT_CACHE_H
+
+#include <ROOT/RDataFrame.hxx>
+#include <ROOT/RDF/RActionImpl.hxx>
+#include "TTreeReader.h"
+
+#include <algorithm>
+#include <chrono>
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+// String Define/Filter/Redefine expressions of the analysis graphs compiled by
+// makeJitCache.py, looked up by the key computed in jit_cache.py. The compiled
+// library registers them at load time, without it the registry stays empty
+using jitcache_op = ROOT::RDF::RNode (*)(ROOT::RDF::RNode);
+
+std::unordered_map<std::string, jitcache_op> &jitcache_ops() {
+    static std::unordered_map<std::string, jitcache_op> ops;
+    return ops;
+}
+
+bool jitcache_register(const std::string &key, jitcache_op op) {
+    jitcache_ops()[key] = op;
+    return true;
+}
+
+bool jitcache_has_op(const std::string &key) {
+    return jitcache_ops().count(key) > 0;
+}
+
+unsigned int jitcache_n_ops() {
+    return jitcache_ops().size();
+}
+
+ROOT::RDF::RNode jitcache_apply_op(const std::string &key, ROOT::RDF::RNode df) {
+    return jitcache_ops().at(key)(df);
+}
+
+// Wall clock (seconds since epoch) at the start of the event loop, i.e. once
+// the jitting of the graph is done, at the first event and at the end
+class jitcache_clock_result {
+
+    public:
+        double fStart = 0;
+        double fFirstEvent = 0;
+        double fEnd = 0;
+        unsigned long long fEvents = 0;
+};
+
+double jitcache_now() {
+    return std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+}
+
+class jitcache_clock : public ROOT::Detail::RDF::RActionImpl<jitcache_clock> {
+
+    public:
+        using Result_t = jitcache_clock_result;
+
+        jitcache_clock() : fResult(std::make_shared<jitcache_clock_result>()) {
+
+            const unsigned int nSlots = ROOT::IsImplicitMTEnabled() ? ROOT::GetThreadPoolSize() : 1;
+            fFirstEvent = std::vector<double>(nSlots, 0.0);
+            fEvents = std::vector<unsigned long long>(nSlots, 0);
+        }
+
+        jitcache_clock(jitcache_clock &&) = default;
+        jitcache_clock(const jitcache_clock &) = delete;
+
+        std::shared_ptr<jitcache_clock_result> GetResultPtr() const { return fResult; }
+
+        void Initialize() { fResult->fStart = jitcache_now(); }
+
+        void InitTask(TTreeReader *, unsigned int) {}
+
+        void Exec(unsigned int slot, ULong64_t) {
+            if (fEvents[slot]++ == 0) fFirstEvent[slot] = jitcache_now();
+        }
+
+        void Finalize() {
+            fResult->fEnd = jitcache_now();
+            fResult->fFirstEvent = fResult->fEnd;
+            for (unsigned int islot = 0; islot < fEvents.size(); islot++) {
+                if (fEvents[islot] > 0) fResult->fFirstEvent = std::min(fResult->fFirstEvent, fFirstEvent[islot]);
+                fResult->fEvents += fEvents[islot];
+            }
+        }
+
+        std::string GetActionName() { return "jitcache_clock"; }
+
+    private:
+        std::shared_ptr<jitcache_clock_result> fResult;
+        std::vector<double> fFirstEvent;
+        std::vector<unsigned long long> fEvents;
+};
+
+ROOT::RDF::RResultPtr<jitcache_clock_result> book_jitcache_clock(ROOT::RDF::RNode df) {
+    return df.Book<ULong64_t>(jitcache_clock(), {"rdfentry_"});
+}
+
+#endif
@@ -0,0 +1,187 @@
+import ROOT
+import os, re, json, hashlib, time
+
+# Persistent compilation cache of the analysis graphs. makeJitCache.py compiles
+# functions.h together with the string Define/Filter/Redefine expressions recorded
+# by earlier jobs in one library, named after the hash of the headers and of the
+# ROOT version. When it is there the library is loaded instead of jitting
+# functions.h and the recorded expressions are booked compiled, the others are
+# jitted as usual and recorded in jitcache/graph_<tag>_<hash>.json for the next build
+
+def getHeaderHash(headers):
+    sha = hashlib.sha1()
+    sha.update(str(ROOT.gROOT.GetVersion()).encode())
+    done = []
+    todo = list(headers)
+    while(len(todo) > 0):
+        header = todo.pop(0)
+        if(header in done or not os.path.exists(header)): continue
+        done.append(header)
+        with open(header, "rb") as f:
+            content = f.read()
+        sha.update(header.encode())
+        sha.update(content)
+        todo += re.findall('#include\\s+"([^"]+)"', content.decode(errors="ignore"))
+    return sha.hexdigest()[:16]
+
+# source of the library, ACLiC builds <name>_cxx.so next to it
+def getLibrarySource(cacheDir, headers):
+    return os.path.join(cacheDir, "jitcache_{0}.cxx".format(getHeaderHash(headers)))
+
+def getLibraryName(cacheDir, headers):
+    return getLibrarySource(cacheDir, headers).replace(".cxx", "_cxx.so")
+
+# Loads functions.h, compiled from the cache library if useLibrary and the library exists
+def loadFunctions(cacheDir, headers, useLibrary):
+    isLoaded = False
+    libraryName = getLibraryName(cacheDir, headers)
+    if(useLibrary == True and os.path.exists(libraryName)):
+        isLoaded = ROOT.gSystem.Load(libraryName) >= 0
+        if(isLoaded == False): print("Failed loading {0}, jitting functions.h".format(libraryName))
+    if(isLoaded == False):
+        ROOT.gInterpreter.ProcessLine('#include "functions.h"')
+    ROOT.gInterpreter.Declare('#include "jit_cache.h"')
+    if(isLoaded == True):
+        print("Loaded {0}: {1} compiled expressions".format(libraryName,ROOT.jitcache_n_ops()))
+    return isLoaded
+
+# the dataframe under a JitCacheNode, for the C++ functions taking an RNode
+def getNode(df):
+    if(isinstance(df, JitCacheNode)): return df.node
+    return df
+
+def isNode(result):
+    name = getattr(type(result), "__cpp_name__", type(result).__name__)
+    return name.startswith("ROOT::RDF::RInterface<") or name.startswith("RInterface<")
+
+# String literals removed, identifiers not preceded by '.', '->' or '::'
+def getIdentifiers(expression):
+    expression = re.sub('"(\\\\.|[^"\\\\])*"', '""', expression)
+    identifiers = []
+    for token in re.findall("(?<![\\w.])(?<!->)(?<!::)[A-Za-z_]\\w*", expression):
+        if(token not in identifiers): identifiers.append(token)
+    return identifiers
+
+# C++ function booking op on an RNode with the columns read by the expression as
+# arguments, like the jitted RDataFrame code: an expression with a return
+# statement is the body of the function, otherwise its return value
+def getOpCode(op, functionName):
+    body = op["expression"] if re.search("\\breturn\\b", op["expression"]) else "return {0};".format(op["expression"])
+    args = ", ".join(["const {0} &{1}".format(t, c) for c, t in zip(op["columns"], op["types"])])
+    columns = ", ".join([json.dumps(c) for c in op["columns"]])
+    if(op["kind"] == "Filter"):
+        call = "Filter([]({0}) -> bool {{ {1} }}, {{{2}}}, {3})".format(args, body, columns, json.dumps(op["filterName"]))
+    else:
+        call = "{0}({1}, []({2}) {{ {3} }}, {{{4}}})".format(op["kind"], json.dumps(op["name"]), args, body, columns)
+    return "ROOT::RDF::RNode {0}(ROOT::RDF::RNode df) {{\n    using namespace ROOT::VecOps;\n    return df.{1};\n}}\n".format(functionName, call)
+
+class JitCacheNode():
+
+    # Dataframe node of a graph recorded by a JitCache: the string Define, Redefine
+    # and Filter calls go through the cache, everything else to the node itself
+    def __init__(self, cache, node):
+        self.cache = cache
+        self.node = node
+
+    def Define(self, name, expression, *args):
+        if(isinstance(expression, str) and len(args) == 0):
+            return self.cache.book(self.node, "Define", name, expression, "")
+        return self.cache.call(self.node.Define, name, expression, *args)
+
+    def Redefine(self, name, expression, *args):
+        if(isinstance(expression, str) and len(args) == 0):
+            return self.cache.book(self.node, "Redefine", name, expression, "")
+        return self.cache.call(self.node.Redefine, name, expression, *args)
+
+    def Filter(self, expression, *args):
+        if(isinstance(expression, str) and len(args) <= 1 and all(isinstance(x, str) for x in args)):
+            return self.cache.book(self.node, "Filter", "", expression, args[0] if len(args) > 0 else "")
+        return self.cache.call(self.node.Filter, expression, *args)
+
+    def __getattr__(self, attr):
+        method = getattr(self.node, attr)
+        if(not callable(method)): return method
+        return lambda *args, **kwargs: self.cache.call(method, *args, **kwargs)
+
+class JitCache():
+
+    # tag names the recorded graph files (e.g. the analysis), cacheDir is where
+    # they are written and where makeJitCache.py reads them
+    def __init__(self, tag, cacheDir):
+        self.tag = tag
+        self.cacheDir = cacheDir
+        self.ops = []
+        self.nCompiled = 0
+        self.nSkipped = 0
+        self.clock = None
+        self.startTime = time.time()
+        self.lastBookingTime = self.startTime
+
+    # Returns the dataframe to build the graph on, with a clock action timing the event loop
+    def wrap(self, df):
+        node = ROOT.RDF.AsRNode(df)
+        self.clock = ROOT.book_jitcache_clock(node)
+        return JitCacheNode(self, node)
+
+    def call(self, method, *args, **kwargs):
+        self.lastBookingTime = time.time()
+        result = method(*args, **kwargs)
+        if(isNode(result)): return JitCacheNode(self, result)
+        return result
+
+    # Description of a string expression with the columns it reads and their types,
+    # None if it can not be compiled outside of the graph
+    def getOp(self, node, kind, name, expression, filterName):
+        columns = [x for x in getIdentifiers(expression) if node.HasColumn(x)]
+        try:
+            types = [str(node.GetColumnType(x)) for x in columns]
+        except Exception:
+            return None
+        op = {"kind": kind, "name": name, "expression": expression, "filterName": filterName, "columns": columns, "types": types}
+        op["key"] = hashlib.sha1(json.dumps(op, sort_keys=True).encode()).hexdigest()[:20]
+        return op
+
+    def book(self, node, kind, name, expression, filterName):
+        self.lastBookingTime = time.time()
+        op = self.getOp(node, kind, name, expression, filterName)
+        if(op is None):
+            self.nSkipped += 1
+        else:
+            self.ops.append(op)
+            if(ROOT.jitcache_has_op(op["key"])):
+                self.nCompiled += 1
+                return JitCacheNode(self, ROOT.jitcache_apply_op(op["key"], ROOT.RDF.AsRNode(node)))
+
+        if(kind == "Define"):
+            result = node.Define(name, expression)
+        elif(kind == "Redefine"):
+            result = node.Redefine(name, expression)
+        elif(filterName != ""):
+            result = node.Filter(expression, filterName)
+        else:
+            result = node.Filter(expression)
+        return JitCacheNode(self, result)
+
+    def getGraphHash(self):
+        return hashlib.sha1(",".join([x["key"] for x in self.ops]).encode()).hexdigest()[:16]
+
+    # Compiled/jitted expressions and the time split in graph building, jitting
+    # (last booking to the start of the event loop) and event loop
+    def report(self):
+        clock = self.clock.GetValue()
+        nJitted = len(self.ops) - self.nCompiled + self.nSkipped
+        print("JIT cache {0}: graph {1}, {2} expressions, {3} compiled, {4} jitted ({5} not cacheable)".format(
+              self.tag,self.getGraphHash(),len(self.ops)+self.nSkipped,self.nCompiled,nJitted,self.nSkipped))
+        print("JIT cache {0}: graph building {1:.1f} s, jitting {2:.1f} s, event loop {3:.1f} s ({4} events, first after {5:.1f} s)".format(
+              self.tag,self.lastBookingTime-self.startTime,clock.fStart-self.lastBookingTime,clock.fEnd-clock.fStart,clock.fEvents,clock.fFirstEvent-clock.fStart))
+
+    # Records the graph for makeJitCache.py if some of its expressions were jitted
+    def write(self):
+        if(self.nCompiled == len(self.ops)): return
+        if(not os.path.exists(self.cacheDir)):
+            os.makedirs(self.cacheDir)
+        fileName = os.path.join(self.cacheDir, "graph_{0}_{1}.json".format(self.tag,self.getGraphHash()))
+        with open(fileName + ".tmp", "w") as f:
+            json.dump({"tag": self.tag, "graph": self.getGraphHash(), "ops": self.ops}, f)
+        os.replace(fileName + ".tmp", fileName)
+        print("JIT cache {0}: {1} expressions to compile recorded in {2}".format(self.tag,len(self.ops)-self.nCompiled,fileName))
@@ -0,0 +1,69 @@
+import ROOT
+import os, sys, getopt, gzip, shutil, time
+
+import utilsAna # loads functions.h and mysf.h
+
+# Writes the decompressed copies of the POG json.gz files read by MyCorrections
+# (mysf.h) into the correction cache directory, named after the content hash
+# computed by mysf.h itself. With the cache in place getCorrectionSet skips the
+# gzip decompression; copies of files no longer present are removed
+
+if __name__ == "__main__":
+
+    jsonDir = "jsonpog-integration/POG"
+    cacheDir = str(ROOT.correctionCacheDir)
+    force = 0
+
+    valid = ['jsonDir=', 'cacheDir=', 'force=', 'help']
+    usage  =  "Usage: makeCorrectionCache.py --jsonDir=<{0}>\n".format(jsonDir)
+    usage +=  "                              --cacheDir=<{0}>\n".format(cacheDir)
+    usage +=  "                              --force=<{0}>".format(force)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--jsonDir":
+            jsonDir = str(arg)
+        if opt == "--cacheDir":
+            cacheDir = str(arg)
+        if opt == "--force":
+            force = int(arg)
+
+    if(not os.path.exists(jsonDir)):
+        print("Directory does not exist: {0}".format(jsonDir))
+        sys.exit(1)
+
+    if(not os.path.exists(cacheDir)):
+        os.makedirs(cacheDir)
+    ROOT.correctionCacheDir = cacheDir
+
+    startTime = time.time()
+    cacheNames = []
+    nWritten = 0
+    for root, dirs, files in os.walk(jsonDir):
+        for fileName in sorted(files):
+            if(not fileName.endswith(".json.gz")): continue
+            fileNameNOW = os.path.join(root, fileName)
+            cacheName = str(ROOT.correctionCacheName(fileNameNOW, ROOT.correctionFileHash(fileNameNOW)))
+            cacheNames.append(os.path.basename(cacheName))
+            if(force == 0 and os.path.exists(cacheName)): continue
+            with gzip.open(fileNameNOW, "rb") as inputFile, open(cacheName + ".tmp", "wb") as outputFile:
+                shutil.copyfileobj(inputFile, outputFile)
+            os.replace(cacheName + ".tmp", cacheName)
+            print("Written {0} ({1})".format(cacheName,fileNameNOW))
+            nWritten += 1
+
+    nRemoved = 0
+    for fileName in os.listdir(cacheDir):
+        if(fileName not in cacheNames):
+            os.remove(os.path.join(cacheDir, fileName))
+            nRemoved += 1
+
+    print("Correction cache {0}: {1} files, {2} written, {3} removed ({4:.1f} s)".format(cacheDir,len(cacheNames),nWritten,nRemoved,time.time()-startTime))
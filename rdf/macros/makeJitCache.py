@@ -0,0 +1,101 @@
+import ROOT
+import os, sys, getopt, json, time
+from subprocess import call
+
+import correctionlib
+import utilsAna # loads functions.h
+from utilsAna import jitCacheDir, jitCacheHeaders
+from jit_cache import getLibrarySource, getLibraryName, getOpCode
+
+# Builds the library of the JIT cache (jit_cache.py): functions.h and the expressions
+# of all the graphs recorded in the cache directory, compiled with ACLiC. Every
+# expression is first checked with cling, the ones that do not compile stay jitted.
+# The library is built in a separate process, files of other header hashes are removed
+
+if __name__ == "__main__":
+
+    cacheDir = jitCacheDir
+    force = 0
+
+    valid = ['cacheDir=', 'force=', 'help']
+    usage  =  "Usage: makeJitCache.py --cacheDir=<{0}>\n".format(cacheDir)
+    usage +=  "                       --force=<{0}>".format(force)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--cacheDir":
+            cacheDir = str(arg)
+        if opt == "--force":
+            force = int(arg)
+
+    if(not os.path.exists(cacheDir)):
+        print("Directory does not exist: {0}".format(cacheDir))
+        sys.exit(1)
+
+    sourceName = getLibrarySource(cacheDir, jitCacheHeaders)
+    libraryName = getLibraryName(cacheDir, jitCacheHeaders)
+
+    startTime = time.time()
+    ops = {}
+    nGraphs = 0
+    for fileName in sorted(os.listdir(cacheDir)):
+        if(not fileName.startswith("graph_") or not fileName.endswith(".json")): continue
+        with open(os.path.join(cacheDir, fileName)) as f:
+            graph = json.load(f)
+        for op in graph["ops"]:
+            if(op["key"] not in ops): ops[op["key"]] = op
+        nGraphs += 1
+
+    code = []
+    nFailed = 0
+    for key, op in ops.items():
+        if(not ROOT.gInterpreter.Declare("namespace jitcache_check_{0} {{\n{1}}}".format(key, getOpCode(op, "op")))):
+            print("Not compiled: {0} {1} {2}".format(op["kind"],op["name"],op["expression"]))
+            nFailed += 1
+            continue
+        code.append(getOpCode(op, "jitcache_op_{0}".format(key)))
+        code.append('static bool jitcache_registered_{0} = jitcache_register("{0}", &jitcache_op_{0});\n'.format(key))
+
+    print("JIT cache {0}: {1} expressions from {2} graphs, {3} not compiled ({4:.1f} s)".format(cacheDir,len(ops),nGraphs,nFailed,time.time()-startTime))
+
+    source  = "// Generated by makeJitCache.py, do not edit\n"
+    source += '#include "functions.h"\n#include "jit_cache.h"\n\n'
+    source += "\n".join(code)
+    if(force == 0 and os.path.exists(libraryName) and os.path.exists(sourceName)):
+        with open(sourceName) as f:
+            if(f.read() == source):
+                print("Library {0} up to date".format(libraryName))
+                sys.exit(0)
+
+    with open(sourceName, "w") as f:
+        f.write(source)
+
+    # correctionlib as set up by register_pyroot_binding, the headers from this directory
+    correctionlibDir = os.path.dirname(correctionlib.__file__)
+    build  = "import ROOT, sys, correctionlib\n"
+    build += "correctionlib.register_pyroot_binding()\n"
+    build += "ROOT.gSystem.AddIncludePath('-I{0} -I{1}')\n".format(os.getcwd(), os.path.join(correctionlibDir, "include"))
+    build += "ROOT.gSystem.AddLinkedLibs('-L{0} -lcorrectionlib')\n".format(os.path.join(correctionlibDir, "lib"))
+    build += "sys.exit(0 if ROOT.gSystem.CompileMacro('{0}', 'kO') == 1 else 1)\n".format(sourceName)
+    startTime = time.time()
+    if(call([sys.executable, "-c", build]) != 0 or not os.path.exists(libraryName)):
+        print("FAILURE: {0} not built".format(libraryName))
+        sys.exit(1)
+
+    nRemoved = 0
+    libraryStem = os.path.basename(sourceName)[:-len(".cxx")]
+    for fileName in os.listdir(cacheDir):
+        if(fileName.startswith("jitcache_") and not fileName.startswith(libraryStem)):
+            os.remove(os.path.join(cacheDir, fileName))
+            nRemoved += 1
+
+    print("Library {0}: {1} compiled expressions, {2:.1f} kB, {3} old files removed ({4:.1f} s)".format(
+          libraryName,len(ops)-nFailed,os.path.getsize(libraryName)/1024.,nRemoved,time.time()-startTime))
@@ -0,0 +1,117 @@
+import ROOT
+import os, sys, getopt, time
+
+from utilsAna import getMClist, SwitchSample
+from utilsAna import getRunsSums, combineRunsSums, readNormCache, writeNormCache, getNormCacheName, getFileListFingerprint
+from utilsAna import makeTheoryNorm, readTheoryNorm, writeTheoryNorm, getTheoryNormName
+
+# Builds (or validates) the per-sample normalization cache used by readMCSample,
+# so that the analysis jobs do not need to loop over the Runs trees of all the files.
+# With --theoryNorm=1 the per-sample theory normalization is built instead, in one
+# event loop over the Runs trees of all the files of the sample
+
+def getSampleList(skimType):
+
+    sampleList = []
+    for sampleNOW in range(0, 1000):
+        if(isinstance(SwitchSample(sampleNOW, skimType), tuple)):
+            sampleList.append(sampleNOW)
+
+    return sampleList
+
+if __name__ == "__main__":
+
+    skimType = "2l"
+    process = -1
+    validate = 0
+    force = 0
+    theoryNorm = 0
+
+    valid = ['skimType=', 'process=', 'validate=', 'force=', 'theoryNorm=', 'help']
+    usage  =  "Usage: makeNormCache.py --skimType=<{0}>\n".format(skimType)
+    usage +=  "                        --process=<{0}>\n".format(process)
+    usage +=  "                        --validate=<{0}>\n".format(validate)
+    usage +=  "                        --force=<{0}>\n".format(force)
+    usage +=  "                        --theoryNorm=<{0}>".format(theoryNorm)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--skimType":
+            skimType = str(arg)
+        if opt == "--process":
+            process = int(arg)
+        if opt == "--validate":
+            validate = int(arg)
+        if opt == "--force":
+            force = int(arg)
+        if opt == "--theoryNorm":
+            theoryNorm = int(arg)
+
+    sampleList = getSampleList(skimType)
+    if(process >= 0):
+        sampleList = [process]
+
+    nBad = 0
+    for sampleNOW in sampleList:
+        directory = SwitchSample(sampleNOW, skimType)[0]
+        if(not os.path.exists(directory)):
+            print("Sample({0}) missing directory: {1}".format(sampleNOW,directory))
+            continue
+
+        files = getMClist(sampleNOW, skimType)
+        if(len(files) == 0):
+            print("Sample({0}) has no files".format(sampleNOW))
+            continue
+
+        startTime = time.time()
+        fingerprint = getFileListFingerprint(files)
+        if(theoryNorm == 1):
+            cache = readTheoryNorm(directory, fingerprint)
+            cacheName = getTheoryNormName(directory)
+        else:
+            cache = readNormCache(directory, fingerprint)
+            cacheName = getNormCacheName(directory)
+
+        if(validate == 1):
+            if(cache is None):
+                print("Sample({0}) NOT CACHED: {1}".format(sampleNOW,cacheName))
+                nBad += 1
+                continue
+            if(theoryNorm == 1):
+                cachedNorm = combineRunsSums([cache])
+            else:
+                cachedNorm = combineRunsSums([cache["files"][str(x)] for x in files])
+            currentNorm = combineRunsSums([getRunsSums(str(x)) for x in files])
+            isGood = True
+            for cachedValue, currentValue in zip(cachedNorm, currentNorm):
+                if(isinstance(cachedValue, list)):
+                    isGood = isGood and all([abs(x-y) <= 1e-6*max(abs(x),abs(y),1.0) for x, y in zip(cachedValue, currentValue)])
+                else:
+                    isGood = isGood and abs(cachedValue-currentValue) <= 1e-6*max(abs(cachedValue),abs(currentValue),1.0)
+            if(isGood == False):
+                nBad += 1
+            print("Sample({0}) {1}: {2} files ({3:.1f} s)".format(sampleNOW,"GOOD" if isGood else "BAD",len(files),time.time()-startTime))
+
+        elif((cache is None or force == 1) and theoryNorm == 1):
+            writeTheoryNorm(directory, fingerprint, makeTheoryNorm(files))
+            print("Sample({0}) cached: {1} files / {2} ({3:.1f} s)".format(sampleNOW,len(files),cacheName,time.time()-startTime))
+
+        elif(cache is None or force == 1):
+            listSums = [getRunsSums(str(x)) for x in files]
+            writeNormCache(directory, fingerprint, files, listSums)
+            print("Sample({0}) cached: {1} files / {2} ({3:.1f} s)".format(sampleNOW,len(files),getNormCacheName(directory),time.time()-startTime))
+
+        else:
+            print("Sample({0}) already cached: {1}".format(sampleNOW,cacheName))
+
+    if(nBad > 0):
+        print("Samples with a bad or missing cache: {0}".format(nBad))
+        sys.exit(1)
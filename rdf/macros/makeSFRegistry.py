@@ -0,0 +1,72 @@
+import ROOT
+import os, sys, getopt, re, time
+
+from utilsAna import sfRegistryFile
+
+# Consolidates the scale factor histograms of a year in one file, read by
+# utilsAna.loadSFTables: every data/ file of the year (name with _<year>) and
+# every file without a year is copied in a directory named after the file, with
+# YEAR in place of the year (data/histoFakeEtaPt_20220.root -> histoFakeEtaPt_YEAR)
+
+if __name__ == "__main__":
+
+    year = 20220
+    dataDir = "data"
+    outputName = ""
+
+    valid = ['year=', 'dataDir=', 'output=', 'help']
+    usage  =  "Usage: makeSFRegistry.py --year=<{0}>\n".format(year)
+    usage +=  "                         --dataDir=<{0}>\n".format(dataDir)
+    usage +=  "                         --output=<{0}>".format(sfRegistryFile.format(year))
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--year":
+            year = int(arg)
+        if opt == "--dataDir":
+            dataDir = str(arg)
+        if opt == "--output":
+            outputName = str(arg)
+
+    if(outputName == ""): outputName = sfRegistryFile.format(year)
+
+    startTime = time.time()
+    sources = []
+    for fileName in sorted(os.listdir(dataDir)):
+        if(not fileName.endswith(".root") or fileName.startswith("sfRegistry_")): continue
+        stem = fileName[:-len(".root")]
+        m = re.match("^(.*)_{0}(?!\\d)(.*)$".format(year), stem)
+        if(m is not None):
+            sources.append((fileName, "{0}_YEAR{1}".format(m.group(1),m.group(2))))
+        elif(re.search("_\\d{4,5}(?!\\d)", stem) is None):
+            sources.append((fileName, stem))
+
+    fOut = ROOT.TFile(outputName + ".tmp", "RECREATE")
+    nHistos = 0
+    for fileName, dirName in sources:
+        fIn = ROOT.TFile(os.path.join(dataDir, fileName))
+        outDir = fOut.mkdir(dirName)
+        nHistosFile = 0
+        for key in fIn.GetListOfKeys():
+            if(not ROOT.TClass.GetClass(key.GetClassName()).InheritsFrom("TH1")):
+                print("Skipping {0} ({1}) in {2}".format(key.GetName(),key.GetClassName(),fileName))
+                continue
+            histo = key.ReadObj()
+            histo.SetDirectory(0)
+            outDir.WriteObject(histo, key.GetName())
+            nHistosFile += 1
+        fIn.Close()
+        print("{0} -> {1}: {2} histograms".format(fileName,dirName,nHistosFile))
+        nHistos += nHistosFile
+    fOut.Close()
+    os.replace(outputName + ".tmp", outputName)
+
+    print("Scale factor registry {0}: {1} histograms from {2} files, {3:.1f} kB ({4:.1f} s)".format(outputName,nHistos,len(sources),os.path.getsize(outputName)/1024.,time.time()-startTime))
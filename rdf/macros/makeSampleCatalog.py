@@ -0,0 +1,88 @@
+import ROOT
+import os, sys, getopt, time
+
+import utilsAna
+from utilsAna import SwitchSample, loadSampleCatalog, writeSampleCatalog, refreshCatalogDirectory
+
+# Builds (or incrementally refreshes) the sample catalog used by findDIR, getMCNormalization
+# and getFileWeights, so that the analysis jobs do not walk the directories or read the Runs trees
+
+def getSampleDirectories(skimType):
+
+    directories = []
+
+    # all the skimmed datasets (data and MC)
+    dirT2 = "/ceph/submit/data/group/cms/store/user/ceballos/nanoaod/skims_submit/" + skimType
+    if(os.path.isdir(dirT2)):
+        for name in sorted(os.listdir(dirT2)):
+            if(os.path.isdir(os.path.join(dirT2, name))):
+                directories.append("{0}/{1}".format(dirT2,name))
+
+    # MC samples outside of the skim area
+    for sampleNOW in range(0, 1000):
+        sample = SwitchSample(sampleNOW, skimType)
+        if(isinstance(sample, tuple) and sample[0] not in directories and os.path.isdir(sample[0])):
+            directories.append(sample[0])
+
+    return directories
+
+if __name__ == "__main__":
+
+    skimType = "2l"
+    directory = ""
+    catalogFile = utilsAna.sampleCatalogFile
+    refresh = 0
+    force = 0
+
+    valid = ['skimType=', 'directory=', 'catalog=', 'refresh=', 'force=', 'help']
+    usage  =  "Usage: makeSampleCatalog.py --skimType=<{0}>\n".format(skimType)
+    usage +=  "                            --directory=<{0}>\n".format(directory)
+    usage +=  "                            --catalog=<{0}>\n".format(catalogFile)
+    usage +=  "                            --refresh=<{0}> (1: only the directories already in the catalog)\n".format(refresh)
+    usage +=  "                            --force=<{0}> (1: read again all the files)".format(force)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--skimType":
+            skimType = str(arg)
+        if opt == "--directory":
+            directory = str(arg)
+        if opt == "--catalog":
+            catalogFile = str(arg)
+        if opt == "--refresh":
+            refresh = int(arg)
+        if opt == "--force":
+            force = int(arg)
+
+    catalog = loadSampleCatalog(catalogFile)
+
+    if(directory != ""):
+        directories = [directory]
+    elif(refresh == 1):
+        directories = sorted(catalog["directories"].keys())
+    else:
+        directories = getSampleDirectories(skimType)
+
+    totalTime = time.time()
+    for directoryNOW in directories:
+        startTime = time.time()
+        if(not os.path.isdir(directoryNOW)):
+            print("Missing directory, removed from the catalog: {0}".format(directoryNOW))
+            catalog["directories"].pop(directoryNOW, None)
+            continue
+        nNew, nKept, nRemoved = refreshCatalogDirectory(catalog, directoryNOW, force == 1)
+        print("{0}: {1} new/modified, {2} unchanged, {3} removed ({4:.1f} s)".format(directoryNOW,nNew,nKept,nRemoved,time.time()-startTime))
+        # saved after each directory so that an interrupted build can be resumed
+        if(nNew > 0 or nRemoved > 0):
+            writeSampleCatalog(catalog, catalogFile)
+
+    writeSampleCatalog(catalog, catalogFile)
+    print("Catalog {0}: {1} directories, {2} files ({3:.1f} s)".format(catalogFile,len(catalog["directories"]),sum([len(x["files"]) for x in catalog["directories"].values()]),time.time()-totalTime))
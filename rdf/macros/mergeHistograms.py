@@ -1,18 +1,79 @@
 import ROOT
 from ROOT import TFile, TH1D, TH2D
-import os, sys, getopt, glob
+import os, sys, getopt, glob, time
+import multiprocessing
 from utilsCategory import plotCategory
 ROOT.PyConfig.DisableRootLogon = True
+ROOT.TH1.AddDirectory(False)
+
+# Streams every input file once and accumulates the histograms in memory keyed by name
+def readAndMerge(fileNames, histos = None):
+    if(histos is None): histos = {}
+    for fileName in fileNames:
+        inputFile = TFile(fileName)
+        if(not inputFile or inputFile.IsZombie()):
+            print("Cannot open file: {0}".format(fileName))
+            continue
+        for key in inputFile.GetListOfKeys():
+            name = key.GetName()
+            # only the latest cycle of each name
+            if(key.GetCycle() != inputFile.GetKey(name).GetCycle()): continue
+            obj = key.ReadObj()
+            if(not obj.InheritsFrom("TH1")): continue
+            if(name in histos):
+                histos[name].Add(obj)
+            else:
+                obj.SetDirectory(0)
+                histos[name] = obj
+        inputFile.Close()
+
+    return histos
+
+def writeHistos(histos, fileName):
+    outputFile = TFile(fileName, "RECREATE")
+    outputFile.cd()
+    for name in histos:
+        histos[name].Write(name)
+    outputFile.Close()
+
+# Worker: merges a group of files into one partial file
+def mergeGroup(args):
+    fileNames, fileName = args
+    writeHistos(readAndMerge(fileNames), fileName)
+    return fileName
+
+def foldOverflow1D(histo):
+    histo.SetBinContent(histo.GetNbinsX(),histo.GetBinContent(histo.GetNbinsX())+histo.GetBinContent(histo.GetNbinsX()+1))
+    histo.SetBinError  (histo.GetNbinsX(),pow(pow(histo.GetBinError(histo.GetNbinsX()),2)+pow(histo.GetBinError(histo.GetNbinsX()+1),2),0.5))
+    histo.SetBinContent(histo.GetNbinsX()+1,0.0)
+    histo.SetBinError  (histo.GetNbinsX()+1,0.0)
+
+def foldOverflow2D(histo):
+    for i in range(histo.GetNbinsX()):
+        histo.SetBinContent(i+1,histo.GetNbinsY(),histo.GetBinContent(i+1,histo.GetNbinsY())+histo.GetBinContent(i+1,histo.GetNbinsY()+1))
+        histo.SetBinError  (i+1,histo.GetNbinsY(),pow(pow(histo.GetBinError(i+1,histo.GetNbinsY()),2)+pow(histo.GetBinError(i+1,histo.GetNbinsY()+1),2),0.5))
+        histo.SetBinContent(i+1,histo.GetNbinsY()+1,0.0)
+        histo.SetBinError  (i+1,histo.GetNbinsY()+1,0.0)
+
+    for i in range(histo.GetNbinsY()):
+        histo.SetBinContent(histo.GetNbinsX(),i+1,histo.GetBinContent(histo.GetNbinsX(),i+1)+histo.GetBinContent(histo.GetNbinsX()+1,i+1))
+        histo.SetBinError  (histo.GetNbinsX(),i+1,pow(pow(histo.GetBinError(histo.GetNbinsX(),i+1),2)+pow(histo.GetBinError(histo.GetNbinsX()+1,i+1),2),0.5))
+        histo.SetBinContent(histo.GetNbinsX()+1,i+1,0.0)
+        histo.SetBinError  (histo.GetNbinsX()+1,i+1,0.0)
 
 if __name__ == "__main__":
     path = "fillhisto_zAnalysis"
     year = 2018
     output = "anaZ"
+    nWorkers = 4
+    groupSize = 20
 
-    valid = ['path=', "year=", 'output=', 'help']
+    valid = ['path=', "year=", 'output=', 'nWorkers=', 'groupSize=', 'help']
     usage  =  "Usage: ana.py --path=<{0}>\n".format(path)
     usage +=  "              --year=<{0}>\n".format(year)
-    usage +=  "              --output=<{0}>".format(output)
+    usage +=  "              --output=<{0}>\n".format(output)
+    usage +=  "              --nWorkers=<{0}>\n".format(nWorkers)
+    usage +=  "              --groupSize=<{0}>".format(groupSize)
     try:
         opts, args = getopt.getopt(sys.argv[1:], "", valid)
     except getopt.GetoptError as ex:
@@ -30,149 +91,133 @@ if __name__ == "__main__":
             year = int(arg)
         if opt == "--output":
             output = str(arg)
+        if opt == "--nWorkers":
+            nWorkers = int(arg)
+        if opt == "--groupSize":
+            groupSize = int(arg)
 
     paths_to_watch = path + "_sample*_year" + str(year) + "_job*.root"
     print("paths_to_watch: {0}".format(paths_to_watch))
-    inputDataFolders = glob.glob(paths_to_watch)
+    inputDataFolders = sorted(glob.glob(paths_to_watch))
     print("Total found files: {0}".format(len(inputDataFolders)))
     if(len(inputDataFolders) == 0):
         sys.exit(1)
 
     nCat, nHisto, nhistoNonPrompt, nhistoWS = plotCategory("kPlotCategories"), 1600, 50, 20
 
-    myfile = [0 for x in range(len(inputDataFolders))]
-    for nf in range(len(inputDataFolders)):
-        myfile[nf] = TFile(inputDataFolders[nf])
-
     if(not os.path.exists(output)):
         os.makedirs(output)
 
+    tmpFolder = "{0}/tmp_merge_{1}_{2}".format(output,os.path.basename(path),year)
+    if(not os.path.exists(tmpFolder)):
+        os.makedirs(tmpFolder)
+
+    # Stage 1: each worker streams a group of input files once into a partial file
+    startTime = time.time()
+    groups = [inputDataFolders[i:i+max(groupSize,1)] for i in range(0, len(inputDataFolders), max(groupSize,1))]
+    tasks = [(groups[ng], "{0}/partial_0_{1}.root".format(tmpFolder,ng)) for ng in range(len(groups))]
+    pool = multiprocessing.Pool(max(nWorkers,1))
+    partialFiles = pool.map(mergeGroup, tasks)
+    print("Stage read: {0} files in {1} groups ({2:.1f} s)".format(len(inputDataFolders),len(groups),time.time()-startTime))
+
+    # Stage 2: tree-reduce the partial files in pairs
+    startTime = time.time()
+    nLevel = 0
+    while(len(partialFiles) > 2):
+        nLevel += 1
+        tasks = [(partialFiles[i:i+2], "{0}/partial_{1}_{2}.root".format(tmpFolder,nLevel,i//2)) for i in range(0, len(partialFiles), 2)]
+        newPartialFiles = pool.map(mergeGroup, tasks)
+        for fileName in partialFiles:
+            os.remove(fileName)
+        partialFiles = newPartialFiles
+    pool.close()
+    pool.join()
+    histos = readAndMerge(partialFiles)
+    for fileName in partialFiles:
+        os.remove(fileName)
+    os.rmdir(tmpFolder)
+    print("Stage reduce: {0} levels, {1} histograms ({2:.1f} s)".format(nLevel+1,len(histos),time.time()-startTime))
+
+    # Stage 3: output files, same content and naming as before
+    startTime = time.time()
+    nOutputFiles = 0
+
     # 1DNonPrompt
-    isHistoNonPromptUsed = False
     outputFileName = "{0}/{1}_{2}_{3}.root".format(output,os.path.basename(path),year,"nonprompt")
-    print("Making 1D {0}".format(outputFileName))
-    outputFile = TFile(outputFileName, "RECREATE")
-    outputFile.cd()
-    histo = [0 for x in range(nhistoNonPrompt)]
-    for nc in range(nhistoNonPrompt):
-        histo[nc] = myfile[0].Get("histoNonPrompt_{0}".format(nc))
-        for nf in range(1,len(inputDataFolders)):
-            if(histo[nc]):
-                histo[nc].Add(myfile[nf].Get("histoNonPrompt_{0}".format(nc)))
-        if(histo[nc]):
-            isHistoNonPromptUsed = True
+    histo = [histos.get("histoNonPrompt_{0}".format(nc)) for nc in range(nhistoNonPrompt)]
+    if(any(histo)):
+        print("Making 1D {0}".format(outputFileName))
+        outputFile = TFile(outputFileName, "RECREATE")
+        outputFile.cd()
+        for nc in range(nhistoNonPrompt):
+            if(not histo[nc]): continue
             histo[nc].SetNameTitle("histoNonPrompt_{0}".format(nc),"histoNonPrompt_{0}".format(nc))
-            histo[nc].SetBinContent(histo[nc].GetNbinsX(),histo[nc].GetBinContent(histo[nc].GetNbinsX())+histo[nc].GetBinContent(histo[nc].GetNbinsX()+1))
-            histo[nc].SetBinError  (histo[nc].GetNbinsX(),pow(pow(histo[nc].GetBinError(histo[nc].GetNbinsX()),2)+pow(histo[nc].GetBinError(histo[nc].GetNbinsX()+1),2),0.5))
-            histo[nc].SetBinContent(histo[nc].GetNbinsX()+1,0.0)
-            histo[nc].SetBinError  (histo[nc].GetNbinsX()+1,0.0)
+            foldOverflow1D(histo[nc])
             histo[nc].Write()
-    outputFile.Close()
-    if(isHistoNonPromptUsed == False):
-        os.remove(outputFileName)
+        outputFile.Close()
+        nOutputFiles += 1
 
     # 1Dwrongsign
-    isHistowrongsignUsed = False
     outputFileName = "{0}/{1}_{2}_{3}.root".format(output,os.path.basename(path),year,"wrongsign")
-    print("Making 1D {0}".format(outputFileName))
-    outputFile = TFile(outputFileName, "RECREATE")
-    outputFile.cd()
-    histo = [0 for x in range(nhistoWS)]
-    for nc in range(nhistoWS):
-        histo[nc] = myfile[0].Get("histoWS_{0}".format(nc))
-        for nf in range(1,len(inputDataFolders)):
-            if(histo[nc]):
-                histo[nc].Add(myfile[nf].Get("histoWS_{0}".format(nc)))
-        if(histo[nc]):
-            isHistowrongsignUsed = True
+    histo = [histos.get("histoWS_{0}".format(nc)) for nc in range(nhistoWS)]
+    if(any(histo)):
+        print("Making 1D {0}".format(outputFileName))
+        outputFile = TFile(outputFileName, "RECREATE")
+        outputFile.cd()
+        for nc in range(nhistoWS):
+            if(not histo[nc]): continue
             histo[nc].SetNameTitle("histoWS_{0}".format(nc),"histoWS_{0}".format(nc))
-            histo[nc].SetBinContent(histo[nc].GetNbinsX(),histo[nc].GetBinContent(histo[nc].GetNbinsX())+histo[nc].GetBinContent(histo[nc].GetNbinsX()+1))
-            histo[nc].SetBinError  (histo[nc].GetNbinsX(),pow(pow(histo[nc].GetBinError(histo[nc].GetNbinsX()),2)+pow(histo[nc].GetBinError(histo[nc].GetNbinsX()+1),2),0.5))
-            histo[nc].SetBinContent(histo[nc].GetNbinsX()+1,0.0)
-            histo[nc].SetBinError  (histo[nc].GetNbinsX()+1,0.0)
+            foldOverflow1D(histo[nc])
             histo[nc].Write()
-    outputFile.Close()
-    if(isHistowrongsignUsed == False):
-        os.remove(outputFileName)
+        outputFile.Close()
+        nOutputFiles += 1
 
     for nh in range(nHisto):
         # 1D
-        histo = [0 for x in range(nCat)]
-        for nc in range(nCat):
-            histo[nc] = myfile[0].Get("histo_{0}_{1}".format(nh,nc))
-            for nf in range(1,len(inputDataFolders)):
-                if(histo[nc]):
-                    histo[nc].Add(myfile[nf].Get("histo_{0}_{1}".format(nh,nc)))
-
+        histo = [histos.get("histo_{0}_{1}".format(nh,nc)) for nc in range(nCat)]
         if(histo[0]):
             outputFileName = "{0}/{1}_{2}_{3}.root".format(output,os.path.basename(path),year,nh)
             print("Making 1D {0}".format(outputFileName))
             outputFile = TFile(outputFileName, "RECREATE")
             outputFile.cd()
             for nc in range(nCat):
+                if(not histo[nc]): continue
                 histo[nc].SetNameTitle("histo{0}".format(nc),"histo{0}".format(nc))
-                histo[nc].SetBinContent(histo[nc].GetNbinsX(),histo[nc].GetBinContent(histo[nc].GetNbinsX())+histo[nc].GetBinContent(histo[nc].GetNbinsX()+1))
-                histo[nc].SetBinError  (histo[nc].GetNbinsX(),pow(pow(histo[nc].GetBinError(histo[nc].GetNbinsX()),2)+pow(histo[nc].GetBinError(histo[nc].GetNbinsX()+1),2),0.5))
-                histo[nc].SetBinContent(histo[nc].GetNbinsX()+1,0.0)
-                histo[nc].SetBinError  (histo[nc].GetNbinsX()+1,0.0)
+                foldOverflow1D(histo[nc])
                 histo[nc].Write()
             outputFile.Close()
+            nOutputFiles += 1
 
         # 1DMVA
-        histoMVA = [0 for x in range(nCat)]
-        for nc in range(nCat):
-            histoMVA[nc] = myfile[0].Get("histoMVA_{0}_{1}".format(nh,nc))
-            for nf in range(1,len(inputDataFolders)):
-                if(histoMVA[nc]):
-                    histoMVA[nc].Add(myfile[nf].Get("histoMVA_{0}_{1}".format(nh,nc)))
-
+        histoMVA = [histos.get("histoMVA_{0}_{1}".format(nh,nc)) for nc in range(nCat)]
         if(histoMVA[0]):
             outputFileName = "{0}/{1}_{2}_{3}_mva.root".format(output,os.path.basename(path),year,nh)
             print("Making 1D {0}".format(outputFileName))
             outputFile = TFile(outputFileName, "RECREATE")
             outputFile.cd()
             for nc in range(nCat):
+                if(not histoMVA[nc]): continue
                 histoMVA[nc].SetNameTitle("histoMVA{0}".format(nc),"histoMVA{0}".format(nc))
-                histoMVA[nc].SetBinContent(histoMVA[nc].GetNbinsX(),histoMVA[nc].GetBinContent(histoMVA[nc].GetNbinsX())+histoMVA[nc].GetBinContent(histoMVA[nc].GetNbinsX()+1))
-                histoMVA[nc].SetBinError  (histoMVA[nc].GetNbinsX(),pow(pow(histoMVA[nc].GetBinError(histoMVA[nc].GetNbinsX()),2)+pow(histoMVA[nc].GetBinError(histoMVA[nc].GetNbinsX()+1),2),0.5))
-                histoMVA[nc].SetBinContent(histoMVA[nc].GetNbinsX()+1,0.0)
-                histoMVA[nc].SetBinError  (histoMVA[nc].GetNbinsX()+1,0.0)
+                foldOverflow1D(histoMVA[nc])
                 histoMVA[nc].Write()
             outputFile.Close()
+            nOutputFiles += 1
 
         # 2D
-        histo2d = [0 for x in range(nCat)]
-        for nc in range(nCat):
-            histo2d[nc] = myfile[0].Get("histo2d_{0}_{1}".format(nh,nc))
-            for nf in range(1,len(inputDataFolders)):
-                if(histo2d[nc]):
-                    histo2d[nc].Add(myfile[nf].Get("histo2d_{0}_{1}".format(nh,nc)))
-
+        histo2d = [histos.get("histo2d_{0}_{1}".format(nh,nc)) for nc in range(nCat)]
         if(histo2d[0]):
             outputFileName = "{0}/{1}_{2}_{3}_2d.root".format(output,os.path.basename(path),year,nh)
             print("Making 2D {0}".format(outputFileName))
             outputFile = TFile(outputFileName, "RECREATE")
             outputFile.cd()
             for nc in range(nCat):
+                if(not histo2d[nc]): continue
                 histo2d[nc].SetNameTitle("histo2d{0}".format(nc),"histo2d{0}".format(nc))
-
-                for i in range(histo2d[nc].GetNbinsX()):
-                    histo2d[nc].SetBinContent(i+1,histo2d[nc].GetNbinsY(),histo2d[nc].GetBinContent(i+1,histo2d[nc].GetNbinsY())+histo2d[nc].GetBinContent(i+1,histo2d[nc].GetNbinsY()+1))
-                    histo2d[nc].SetBinError  (i+1,histo2d[nc].GetNbinsY(),pow(pow(histo2d[nc].GetBinError(i+1,histo2d[nc].GetNbinsY()),2)+pow(histo2d[nc].GetBinError(i+1,histo2d[nc].GetNbinsY()+1),2),0.5))
-                    histo2d[nc].SetBinContent(i+1,histo2d[nc].GetNbinsY()+1,0.0)
-                    histo2d[nc].SetBinError  (i+1,histo2d[nc].GetNbinsY()+1,0.0)
-
-                for i in range(histo2d[nc].GetNbinsY()):
-                    histo2d[nc].SetBinContent(histo2d[nc].GetNbinsX(),i+1,histo2d[nc].GetBinContent(histo2d[nc].GetNbinsX(),i+1)+histo2d[nc].GetBinContent(histo2d[nc].GetNbinsX()+1,i+1))
-                    histo2d[nc].SetBinError  (histo2d[nc].GetNbinsX(),i+1,pow(pow(histo2d[nc].GetBinError(histo2d[nc].GetNbinsX(),i+1),2)+pow(histo2d[nc].GetBinError(histo2d[nc].GetNbinsX()+1,i+1),2),0.5))
-                    histo2d[nc].SetBinContent(histo2d[nc].GetNbinsX()+1,i+1,0.0)
-                    histo2d[nc].SetBinError  (histo2d[nc].GetNbinsX()+1,i+1,0.0)
-
+                foldOverflow2D(histo2d[nc])
                 histo2d[nc].Write()
             outputFile.Close()
+            nOutputFiles += 1
 
-    for nf in range(len(inputDataFolders)):
-        print("Closing file... {0}".format(nf))
-        myfile[nf].Close()
+    print("Stage write: {0} output files ({1:.1f} s)".format(nOutputFiles,time.time()-startTime))
 
     print("DONE")
@@ -0,0 +1,241 @@
+#include <ROOT/RDataFrame.hxx>
+#include <ROOT/RDF/RActionImpl.hxx>
+#include <ROOT/RVec.hxx>
+#include "TH1.h"
+#include "TTreeReader.h"
+
+#include <algorithm>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+#include <vector>
+
+// Filled content of all the (category x variation x bin) histograms booked
+// with a single multihisto_helper action, stored contiguously in this order
+class multihisto_result {
+
+    public:
+        multihisto_result() {}
+
+        multihisto_result(unsigned int nCat, unsigned int nVar, const std::vector<double> &xBins, const std::vector<double> &yBins) :
+            fNCat(nCat), fNVar(nVar), fXBins(xBins), fYBins(yBins) {
+
+            fNBinsX = fXBins.size() + 1;
+            fNBinsY = fYBins.empty() ? 1 : fYBins.size() + 1;
+            fNBins = fNBinsX * fNBinsY;
+            fSumw  = std::vector<double>(std::size_t(fNCat) * fNVar * fNBins, 0.0);
+            fSumw2 = std::vector<double>(std::size_t(fNCat) * fNVar * fNBins, 0.0);
+            fEntries = std::vector<double>(fNCat, 0.0);
+        }
+
+        // same convention as TAxis::FindFixBin: 0 = underflow, n+1 = overflow (also for NaN)
+        static unsigned int FindBin(const std::vector<double> &edges, double x) {
+            if (x < edges.front()) return 0;
+            if (!(x < edges.back())) return edges.size();
+            return std::upper_bound(edges.begin(), edges.end(), x) - edges.begin();
+        }
+
+        unsigned int GetGlobalBin(double x, double y) const {
+            const unsigned int binX = FindBin(fXBins, x);
+            if (fYBins.empty()) return binX;
+            return binX + fNBinsX * FindBin(fYBins, y);
+        }
+
+        std::size_t GetIndex(unsigned int cat, unsigned int var, unsigned int bin) const {
+            return (std::size_t(cat) * fNVar + var) * fNBins + bin;
+        }
+
+        void Reset() {
+            std::fill(fSumw.begin(), fSumw.end(), 0.0);
+            std::fill(fSumw2.begin(), fSumw2.end(), 0.0);
+            std::fill(fEntries.begin(), fEntries.end(), 0.0);
+        }
+
+        void Add(const multihisto_result &other) {
+            for (std::size_t i = 0; i < fSumw.size(); i++) {
+                fSumw[i]  += other.fSumw[i];
+                fSumw2[i] += other.fSumw2[i];
+            }
+            for (std::size_t i = 0; i < fEntries.size(); i++) {
+                fEntries[i] += other.fEntries[i];
+            }
+        }
+
+        // Copy one (category, variation) slice into an already booked TH1D/TH2D
+        // with the same binning, global bins follow the TH1/TH2 numbering
+        void Fill(TH1 &h, unsigned int cat, unsigned int var) const {
+            if (cat >= fNCat || var >= fNVar)
+                throw std::runtime_error("multihisto_result: category or variation out of range.");
+            if (std::size_t(h.GetNcells()) != fNBins)
+                throw std::runtime_error("multihisto_result: histogram binning does not match.");
+
+            h.Sumw2();
+            const std::size_t offset = GetIndex(cat, var, 0);
+            for (unsigned int bin = 0; bin < fNBins; bin++) {
+                h.SetBinContent(bin, fSumw[offset + bin]);
+                h.GetSumw2()->fArray[bin] = fSumw2[offset + bin];
+            }
+            h.SetEntries(fEntries[cat]);
+        }
+
+        unsigned int GetNCategories() const { return fNCat; }
+        unsigned int GetNVariations() const { return fNVar; }
+        unsigned int GetNBins() const { return fNBins; }
+
+        unsigned int fNCat = 0;
+        unsigned int fNVar = 0;
+        unsigned int fNBinsX = 0;
+        unsigned int fNBinsY = 0;
+        unsigned int fNBins = 0;
+        std::vector<double> fXBins;
+        std::vector<double> fYBins;
+        std::vector<double> fSumw;
+        std::vector<double> fSumw2;
+        std::vector<double> fEntries;
+};
+
+// RDataFrame action filling all the weight variations of all the categories
+// in one pass: one Exec call per event instead of one Histo1D/Histo2D node
+// per (category, variation)
+class multihisto_helper : public ROOT::Detail::RDF::RActionImpl<multihisto_helper> {
+
+    public:
+        using Result_t = multihisto_result;
+
+        multihisto_helper(unsigned int nCat, unsigned int nVar, const std::vector<double> &xBins, const std::vector<double> &yBins) :
+            multihisto_helper(std::make_shared<multihisto_result>(nCat, nVar, xBins, yBins)) {}
+
+        multihisto_helper(const std::shared_ptr<multihisto_result> &result) : fResult(result) {
+
+            const unsigned int nSlots = ROOT::IsImplicitMTEnabled() ? ROOT::GetThreadPoolSize() : 1;
+            for (unsigned int islot = 0; islot < nSlots; ++islot) {
+                fSlots.emplace_back(fResult->fNCat, fResult->fNVar, fResult->fXBins, fResult->fYBins);
+            }
+        }
+
+        multihisto_helper(multihisto_helper &&) = default;
+        multihisto_helper(const multihisto_helper &) = delete;
+
+        std::shared_ptr<multihisto_result> GetResultPtr() const { return fResult; }
+
+        // Action of one systematic variation booked by VariationsFor (RDataFrame::Vary):
+        // newResult is a copy of the nominal result, filled from scratch
+        multihisto_helper MakeNew(void *newResult, std::string_view /*variation*/ = "nominal") {
+            auto &result = *static_cast<std::shared_ptr<multihisto_result> *>(newResult);
+            result->Reset();
+            return multihisto_helper(result);
+        }
+
+        void Initialize() {}
+
+        void InitTask(TTreeReader *, unsigned int) {}
+
+        void Exec(unsigned int slot, int cat, double x, double y, const ROOT::VecOps::RVec<double> &weights) {
+
+            multihisto_result &r = fSlots[slot];
+            if (cat < 0 || (unsigned int)cat >= r.fNCat) return;
+
+            const unsigned int nVar = std::min<std::size_t>(r.fNVar, weights.size());
+            const std::size_t offset = r.GetIndex(cat, 0, r.GetGlobalBin(x, y));
+            double *sumw  = r.fSumw.data()  + offset;
+            double *sumw2 = r.fSumw2.data() + offset;
+            for (unsigned int var = 0; var < nVar; var++) {
+                const double w = weights[var];
+                sumw [var * r.fNBins] += w;
+                sumw2[var * r.fNBins] += w * w;
+            }
+            r.fEntries[cat] += 1;
+        }
+
+        void Finalize() {
+            for (auto &r : fSlots) {
+                fResult->Add(r);
+            }
+            fSlots.clear();
+        }
+
+        std::string GetActionName() { return "multihisto_helper"; }
+
+    private:
+        std::shared_ptr<multihisto_result> fResult;
+        std::vector<multihisto_result> fSlots;
+};
+
+// Booking done in C++ so the column types are fixed (int, double, double, RVec<double>)
+ROOT::RDF::RResultPtr<multihisto_result> book_multihisto(ROOT::RDF::RNode df,
+                                                          const std::string &catCol, const std::string &xCol, const std::string &yCol, const std::string &wCol,
+                                                          unsigned int nCat, unsigned int nVar, const std::vector<double> &xBins, const std::vector<double> &yBins) {
+    return df.Book<int, double, double, ROOT::VecOps::RVec<double>>(multihisto_helper(nCat, nVar, xBins, yBins), {catCol, xCol, yCol, wCol});
+}
+
+// Same filling when each variation has its own x value and selection, e.g. the
+// JES/JER variations of a variable: x, the weights and pass are indexed by
+// variation and a variation is only filled when its pass flag is set
+class multihisto_variation_helper : public ROOT::Detail::RDF::RActionImpl<multihisto_variation_helper> {
+
+    public:
+        using Result_t = multihisto_result;
+
+        multihisto_variation_helper(unsigned int nCat, unsigned int nVar, const std::vector<double> &xBins, const std::vector<double> &yBins) {
+
+            const unsigned int nSlots = ROOT::IsImplicitMTEnabled() ? ROOT::GetThreadPoolSize() : 1;
+            fResult = std::make_shared<multihisto_result>(nCat, nVar, xBins, yBins);
+            for (unsigned int islot = 0; islot < nSlots; ++islot) {
+                fSlots.emplace_back(nCat, nVar, xBins, yBins);
+            }
+        }
+
+        multihisto_variation_helper(multihisto_variation_helper &&) = default;
+        multihisto_variation_helper(const multihisto_variation_helper &) = delete;
+
+        std::shared_ptr<multihisto_result> GetResultPtr() const { return fResult; }
+
+        void Initialize() {}
+
+        void InitTask(TTreeReader *, unsigned int) {}
+
+        void Exec(unsigned int slot, int cat, const ROOT::VecOps::RVec<double> &x, double y,
+                  const ROOT::VecOps::RVec<double> &weights, const ROOT::VecOps::RVec<int> &pass) {
+
+            multihisto_result &r = fSlots[slot];
+            if (cat < 0 || (unsigned int)cat >= r.fNCat) return;
+
+            const unsigned int nVar = std::min({std::size_t(r.fNVar), weights.size(), x.size(), pass.size()});
+            bool isFilled = false;
+            for (unsigned int var = 0; var < nVar; var++) {
+                if (!pass[var]) continue;
+                const std::size_t index = r.GetIndex(cat, var, r.GetGlobalBin(x[var], y));
+                const double w = weights[var];
+                r.fSumw [index] += w;
+                r.fSumw2[index] += w * w;
+                isFilled = true;
+            }
+            if (isFilled) r.fEntries[cat] += 1;
+        }
+
+        void Finalize() {
+            for (auto &r : fSlots) {
+                fResult->Add(r);
+            }
+            fSlots.clear();
+        }
+
+        std::string GetActionName() { return "multihisto_variation_helper"; }
+
+    private:
+        std::shared_ptr<multihisto_result> fResult;
+        std::vector<multihisto_result> fSlots;
+};
+
+// Per-variation columns of any arithmetic type converted to the booked RVec types
+template <typename U, typename T>
+ROOT::VecOps::RVec<U> multihisto_cast(const ROOT::VecOps::RVec<T> &v) {
+    return ROOT::VecOps::RVec<U>(v.begin(), v.end());
+}
+
+ROOT::RDF::RResultPtr<multihisto_result> book_multihisto_variations(ROOT::RDF::RNode df,
+                                                                     const std::string &catCol, const std::string &xCol, const std::string &yCol, const std::string &wCol, const std::string &passCol,
+                                                                     unsigned int nCat, unsigned int nVar, const std::vector<double> &xBins, const std::vector<double> &yBins) {
+    return df.Book<int, ROOT::VecOps::RVec<double>, double, ROOT::VecOps::RVec<double>, ROOT::VecOps::RVec<int>>(multihisto_variation_helper(nCat, nVar, xBins, yBins), {catCol, xCol, yCol, wCol, passCol});
+}
@@ -0,0 +1,181 @@
+import ROOT
+from array import array
+ROOT.gInterpreter.Declare('#include "multihisto_helper.h"')
+from utilsCategory import plotCategory
+from utilsSelection import getFinalVariableWeight
+from jit_cache import getNode
+
+# (bin,min,max) for a uniform axis, the list of edges otherwise
+def getBinEdges(bins):
+    if(isinstance(bins, tuple)):
+        return array('d', [bins[1]+(bins[2]-bins[1])*i/bins[0] for i in range(bins[0]+1)])
+    return array('d', bins)
+
+def getAxisArgs(bins, edges):
+    if(isinstance(bins, tuple)): return [bins[0], bins[1], bins[2]]
+    return [len(edges)-1, edges]
+
+class MultiHistoHelper():
+
+    nBooked = 0
+
+    # One action filling histo_<start+type>_<category> (histo2d_... if yBins is given)
+    # for all the weight types and all the categories in a single pass.
+    # catVar is either a fixed category (dataframe already filtered on it)
+    # or the name of the category column (e.g. "theCat").
+    # xBins/yBins are lists of edges or (bin,min,max) tuples, weights overrides
+    # the getFinalVariableWeight columns of the types.
+    # With passVar (an RVec mask, one entry per type) varX is an RVec as well and
+    # type nt is filled with varX[nt] only when passVar[nt] is set, e.g. the
+    # JES/JER variations of a variable in one action.
+    # With varyTypes ({"<variation>:<tag>": type}, see declareVary in utilsSelection) the
+    # RDataFrame::Vary variations of the action are booked with VariationsFor and filled
+    # as type start+type, the nominal types only if fillNominal.
+    # weightVec is an RVec column or expression holding the weights of all the types in
+    # order (e.g. weightPDFs), instead of one weight column per type
+    def __init__(self, df, varX, varY, catVar, theCat, start, xBins, yBins, types, weights=None, passVar=None, varyTypes=None, fillNominal=True, weightVec=None):
+
+        self.types = list(types)
+        self.start = start
+        self.xAxis = xBins
+        self.yAxis = yBins
+        self.xBins = getBinEdges(xBins)
+        self.yBins = getBinEdges(yBins if yBins is not None else [])
+        self.is2D = len(self.yBins) > 0
+        self.varyTypes = varyTypes
+        self.fillNominal = fillNominal
+        self.tag = "mvh{0}".format(MultiHistoHelper.nBooked)
+        MultiHistoHelper.nBooked += 1
+
+        if(isinstance(catVar, str)):
+            self.cats = list(range(plotCategory("kPlotCategories")))
+            catIndex = catVar
+        else:
+            self.cats = [catVar]
+            catIndex = "0"
+
+        if(weightVec is not None):
+            weightExpression = "multihisto_cast<double>({0})".format(weightVec)
+        else:
+            if(weights is None):
+                weights = [getFinalVariableWeight(theCat, type) for type in self.types]
+            weightExpression = "ROOT::VecOps::RVec<double>{{{0}}}".format(",".join(weights))
+
+        df = (df.Define("{0}_cat".format(self.tag), "(int)({0})".format(catIndex))
+                .Define("{0}_y".format(self.tag), "(double)({0})".format(varY if self.is2D else "0"))
+                .Define("{0}_w".format(self.tag), weightExpression)
+                )
+
+        if(passVar is None):
+            df = df.Define("{0}_x".format(self.tag), "(double)({0})".format(varX))
+            self.result = ROOT.book_multihisto(ROOT.RDF.AsRNode(getNode(df)),
+                                               "{0}_cat".format(self.tag), "{0}_x".format(self.tag), "{0}_y".format(self.tag), "{0}_w".format(self.tag),
+                                               len(self.cats), len(self.types),
+                                               ROOT.std.vector['double'](self.xBins), ROOT.std.vector['double'](self.yBins))
+        else:
+            df = (df.Define("{0}_x".format(self.tag), "multihisto_cast<double>({0})".format(varX))
+                    .Define("{0}_pass".format(self.tag), "multihisto_cast<int>({0})".format(passVar))
+                    )
+            self.result = ROOT.book_multihisto_variations(ROOT.RDF.AsRNode(getNode(df)),
+                                                          "{0}_cat".format(self.tag), "{0}_x".format(self.tag), "{0}_y".format(self.tag), "{0}_w".format(self.tag), "{0}_pass".format(self.tag),
+                                                          len(self.cats), len(self.types),
+                                                          ROOT.std.vector['double'](self.xBins), ROOT.std.vector['double'](self.yBins))
+
+        self.variations = None
+        if(varyTypes is not None):
+            self.variations = ROOT.RDF.Experimental.VariationsFor(self.result)
+
+    # Returns {(histoNumber, category): TH1D/TH2D}, runs the event loop if needed
+    def getHistos(self):
+
+        histos = {}
+        if(self.fillNominal == True):
+            self.fillHistos(histos, self.result.GetValue(), self.types)
+        if(self.variations is not None):
+            keys = [str(x) for x in self.variations.GetKeys()]
+            for key, type in self.varyTypes.items():
+                if(key not in keys): continue
+                self.fillHistos(histos, self.variations[key], [type])
+
+        return histos
+
+    # histograms of the types of a result, in the order of its variations
+    def fillHistos(self, histos, result, types):
+
+        for nc, cat in enumerate(self.cats):
+            for nt, type in enumerate(types):
+                histoNumber = self.start + type
+                if(self.is2D):
+                    name = "histo2d_{0}_{1}".format(histoNumber, cat)
+                    h = ROOT.TH2D(name, name, *(getAxisArgs(self.xAxis, self.xBins) + getAxisArgs(self.yAxis, self.yBins)))
+                else:
+                    name = "histo_{0}_{1}".format(histoNumber, cat)
+                    h = ROOT.TH1D(name, name, *getAxisArgs(self.xAxis, self.xBins))
+                h.SetDirectory(0)
+                result.Fill(h, nc, nt)
+                histos[(histoNumber, cat)] = h
+
+def makeFinalVariableVarBundle(df,var,theCat,start,x,xBins,types):
+    return MultiHistoHelper(df,var,None,x,theCat,start,xBins,None,types)
+
+def makeFinalVariable2DVarBundle(df,varX,varY,theCat,start,x,xBins,yBins,types):
+    return MultiHistoHelper(df,varX,varY,x,theCat,start,xBins,yBins,types)
+
+# One variable per type: var and passVar are RVecs indexed like types, e.g. the
+# *JesVar columns of makeJESBundle and the per-variation selection built from them
+def makeFinalVariableVarVariations(df,var,passVar,theCat,start,x,xBins,types):
+    return MultiHistoHelper(df,var,None,x,theCat,start,xBins,None,types,passVar=passVar)
+
+def makeFinalVariable2DVarVariations(df,varX,varY,passVar,theCat,start,x,xBins,yBins,types):
+    return MultiHistoHelper(df,varX,varY,x,theCat,start,xBins,yBins,types,passVar=passVar)
+
+# The Vary variations of var on df (declared with declareVary) as the types of varyTypes,
+# with the nominal histogram as type 0 if fillNominal
+def makeFinalVariableVarVary(df,var,theCat,start,x,xBins,varyTypes,fillNominal=True):
+    return MultiHistoHelper(df,var,None,x,theCat,start,xBins,None,[0],varyTypes=varyTypes,fillNominal=fillNominal)
+
+def makeFinalVariable2DVarVary(df,varX,varY,theCat,start,x,xBins,yBins,varyTypes,fillNominal=True):
+    return MultiHistoHelper(df,varX,varY,x,theCat,start,xBins,yBins,[0],varyTypes=varyTypes,fillNominal=fillNominal)
+
+# The PDF types (11-113, weightPDF0-102) of var from the weightPDFs column of
+# selectionTheoryWeigths in one action instead of 103 Histo1D/Histo2D
+def getPDFWeightVec(theCat):
+    if(theCat == plotCategory("kPlotData")): return None
+    return "weightPDFs"
+
+def makeFinalVariablePDFBundle(df,var,theCat,start,x,xBins):
+    return MultiHistoHelper(df,var,None,x,theCat,start,xBins,None,range(11,114),weightVec=getPDFWeightVec(theCat))
+
+def makeFinalVariable2DPDFBundle(df,varX,varY,theCat,start,x,xBins,yBins):
+    return MultiHistoHelper(df,varX,varY,x,theCat,start,xBins,yBins,range(11,114),weightVec=getPDFWeightVec(theCat))
+
+# histo_<histoNumber>_<category> of var: a plain Histo1D on a dataframe already
+# filtered on the category catVar, or one MultiHistoHelper for all the
+# categories when catVar is the name of the category column
+def makeCategoryHisto(df,var,weight,catVar,histoNumber,bin,min,max):
+    if(isinstance(catVar, str)):
+        return MultiHistoHelper(df,var,None,catVar,None,histoNumber,(bin,min,max),None,[0],[weight])
+    return df.Histo1D(("histo_{0}_{1}".format(histoNumber,catVar), "histo_{0}_{1}".format(histoNumber,catVar),bin,min,max), var, weight)
+
+def makeCategoryHistoVar(df,var,weight,catVar,histoNumber,xBins):
+    if(isinstance(catVar, str)):
+        return MultiHistoHelper(df,var,None,catVar,None,histoNumber,xBins,None,[0],[weight])
+    return df.Histo1D(("histo_{0}_{1}".format(histoNumber,catVar), "histo_{0}_{1}".format(histoNumber,catVar),len(xBins)-1,xBins), var, weight)
+
+# Events of category cat: the dataframe itself if already filtered on one
+# category, a filter on the category column catVar otherwise
+def selectCategory(df,catVar,cat):
+    if(isinstance(catVar, str)):
+        return df.Filter("{0}=={1}".format(catVar,cat))
+    return df
+
+# Replaces the MultiHistoHelper stored in histos[n][x] by its histo_<n>_<cat>
+# histograms, histos[n][cat] for all the filled categories
+def unpackCategoryHistos(histos):
+    for n in range(len(histos)):
+        for x in range(len(histos[n])):
+            if(not isinstance(histos[n][x], MultiHistoHelper)): continue
+            helper = histos[n][x]
+            histos[n][x] = 0
+            for (j, cat), h in helper.getHistos().items():
+                histos[j][cat] = h
@@ -2,11 +2,139 @@
 #include <stdio.h>
 #include <string.h>
 #include <iostream>
+#include <fstream>
+#include <atomic>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <variant>
+#include <sys/stat.h>
 
 #include "muonCrystalBall.h"
 
 //g++ $(correction config --cflags --ldflags) mysf.cpp -shared -fPIC -o mysf.so
 
+// Process-wide cache of the correction sets, shared by all the MyCorrections objects
+// (every year, every initJSONSFs call): a json.gz is read and parsed once per process.
+// The key is the path and the content hash, so a file changed on disk is loaded again.
+// Warm start: if correctionCacheDir has the decompressed copy of a file
+// (<hash>_<name>.json, written by makeCorrectionCache.py) it is read instead,
+// without the gzip decompression
+std::string correctionCacheDir = "corrcache";
+
+// FNV-1a 64 bit of the file content, memoized on path, size and modification time
+std::string correctionFileHash(const std::string &fileName) {
+  static std::mutex hashMutex;
+  static std::map<std::string, std::string> hashCache;
+
+  struct stat fileStat;
+  if(stat(fileName.c_str(), &fileStat) != 0) return "";
+  const std::string statKey = fileName + "#" + std::to_string(fileStat.st_size) + "#" + std::to_string(fileStat.st_mtime);
+
+  std::lock_guard<std::mutex> lock(hashMutex);
+  auto it = hashCache.find(statKey);
+  if(it != hashCache.end()) return it->second;
+
+  std::ifstream file(fileName, std::ios::binary);
+  uint64_t hash = 14695981039346656037ULL;
+  char buffer[1 << 16];
+  while(file.read(buffer, sizeof(buffer)) || file.gcount() > 0) {
+    for(std::streamsize i=0; i<file.gcount(); i++) {
+      hash ^= (unsigned char)buffer[i];
+      hash *= 1099511628211ULL;
+    }
+  }
+  char hashString[17];
+  snprintf(hashString, sizeof(hashString), "%016llx", (unsigned long long)hash);
+  hashCache[statKey] = hashString;
+  return hashString;
+}
+
+// name of the decompressed copy of fileName in correctionCacheDir
+std::string correctionCacheName(const std::string &fileName, const std::string &hash) {
+  std::string baseName = fileName.substr(fileName.find_last_of('/') + 1);
+  if(baseName.size() > 3 && baseName.compare(baseName.size() - 3, 3, ".gz") == 0) baseName = baseName.substr(0, baseName.size() - 3);
+  return correctionCacheDir + "/" + hash + "_" + baseName;
+}
+
+unsigned int correctionSetsParsed = 0;
+unsigned int correctionSetsFastLoaded = 0;
+unsigned int correctionSetsReused = 0;
+
+std::shared_ptr<const correction::CorrectionSet> getCorrectionSet(const std::string &fileName) {
+  static std::mutex csetMutex;
+  static std::map<std::string, std::shared_ptr<const correction::CorrectionSet>> csetCache;
+
+  const std::string hash = correctionFileHash(fileName);
+  const std::string key = fileName + "#" + hash;
+
+  std::lock_guard<std::mutex> lock(csetMutex);
+  auto it = csetCache.find(key);
+  if(it != csetCache.end()) {
+    correctionSetsReused++;
+    return it->second;
+  }
+
+  std::shared_ptr<const correction::CorrectionSet> cset;
+  const std::string fastName = correctionCacheName(fileName, hash);
+  struct stat fileStat;
+  if(hash != "" && stat(fastName.c_str(), &fileStat) == 0) {
+    cset = correction::CorrectionSet::from_file(fastName);
+    correctionSetsFastLoaded++;
+  }
+  else {
+    cset = correction::CorrectionSet::from_file(fileName);
+    correctionSetsParsed++;
+  }
+  csetCache[key] = cset;
+  return cset;
+}
+
+void printCorrectionSetStats() {
+  std::cout << "correction sets: " << correctionSetsParsed << " parsed from json.gz, "
+            << correctionSetsFastLoaded << " from " << correctionCacheDir << ", "
+            << correctionSetsReused << " reused" << std::endl;
+}
+
+// A correction with its fixed inputs (systematic, working point, era, ...) bound once
+// at setup (MyCorrections::bind_*): a call passes only the per-object numeric inputs,
+// written in order into the numeric slots of a per-thread copy of the bound inputs.
+// The copy is made once per handle and thread (indexed by the handle id, shared by the
+// copies of a handle), a call only overwrites the numeric slots.
+// The type of a numeric slot (int or double) is the one of its bound placeholder
+class CorrectionHandle {
+  public:
+    CorrectionHandle() {}
+    CorrectionHandle(const correction::Correction::Ref &corr, const std::vector<correction::Variable::Type> &inputs, const std::vector<unsigned int> &slots) :
+      corr_(corr), inputs_(inputs), slots_(slots) {}
+
+    double evaluate(std::initializer_list<double> values) const {
+      thread_local std::vector<std::vector<correction::Variable::Type>> buffers;
+      if(id_ >= buffers.size()) buffers.resize(id_ + 1);
+      std::vector<correction::Variable::Type> &buffer = buffers[id_];
+      if(buffer.size() != inputs_.size()) buffer = inputs_;
+      auto value = values.begin();
+      for(unsigned int i=0; i<slots_.size() && value != values.end(); i++, value++) {
+        if(std::holds_alternative<int>(buffer[slots_[i]])) buffer[slots_[i]] = (int)*value;
+        else                                               buffer[slots_[i]] = *value;
+      }
+      return corr_->evaluate(buffer);
+    }
+
+    bool isValid() const { return corr_ != nullptr; }
+
+  private:
+    static unsigned int newId() {
+      static std::atomic<unsigned int> nextId(0);
+      return nextId++;
+    }
+
+    correction::Correction::Ref corr_;
+    std::vector<correction::Variable::Type> inputs_;
+    std::vector<unsigned int> slots_;
+    unsigned int id_ = newId();
+};
+
 class MyCorrections {
   public:
     MyCorrections(int the_input_year);
@@ -30,6 +158,7 @@ class MyCorrections {
 
     double eval_jetCORR   (double area, double eta, double phi, double pt, double rho, int run, int type);
     double eval_jesUnc    (double eta, double pt, int type);
+    void   eval_jesUncAll (double eta, double pt, double *unc);
     double eval_jerScaleFactor(double eta, double pt, int type);
     double eval_jerPtResolution(double eta, double pt, double rho);
     double eval_puJetIDSF (char *valType, char *workingPoint, double eta, double pt);
@@ -42,6 +171,14 @@ class MyCorrections {
     double eval_muon_pt_scale_var(double pt, double eta, double phi, int charge, string updn);
     double eval_met_corr(const char *pt_phi, const char *met_type, const char *epoch, const char *dtmc, const char *variation, float met_pt, float met_phi, float npvGood);
 
+    // pre-resolved handles, same inputs and clamping as the eval_* methods (see CorrectionHandle)
+    CorrectionHandle bind_muonSF(int sfType, bool isHighPt, const char *valType);                                    // (eta, pt or p)
+    CorrectionHandle bind_electronSF(int sfType, const char *the_input_year, const char *valType, const char *workingPoint); // (eta, pt[, phi])
+    CorrectionHandle bind_photonSF(const char *the_input_year, const char *valType, const char *workingPoint);              // (eta, pt[, phi])
+    CorrectionHandle bind_tauJETSF(const char *workingPoint, const char *workingPoint_VSe, const char *valType);            // (pt, dm, genmatch)
+    CorrectionHandle bind_btvSF(const char *valType, const char *workingPoint, int flavor);                                 // (eta, pt)
+    bool hasPhiInput() const { return !(year <= 20221 || year >= 20240); }
+
   private:
     double muon_get_rndm(double eta, float nL);
     double muon_get_std(double pt, double eta, float nL);
@@ -118,28 +255,28 @@ MyCorrections::MyCorrections(int the_input_year) {
   else if(year == 20240 ||
           year == 20250) corrNameLUM = "Collisions2024_378981_386951_GoldenJson";
   
-  auto csetPU = correction::CorrectionSet::from_file(fileNameLUM);
+  auto csetPU = getCorrectionSet(fileNameLUM);
   puSF_ = csetPU->at(corrNameLUM);
 
   if(year == 20240 || year == 20250) {
     std::string fileNameHFBTV = dirName+"BTV/"+subDirName+"btagging_preliminary.json.gz";
-    auto csetHFBTV = correction::CorrectionSet::from_file(fileNameHFBTV);
+    auto csetHFBTV = getCorrectionSet(fileNameHFBTV);
     btvHFSF_ = csetHFBTV->at("UParTAK4_kinfit");
     std::string fileNameLFBTV = dirName+"BTV/"+subDirName+"btagging_preliminary.json.gz";
-    auto csetLFBTV = correction::CorrectionSet::from_file(fileNameLFBTV);
+    auto csetLFBTV = getCorrectionSet(fileNameLFBTV);
     btvLFSF_ = csetLFBTV->at("UParTAK4_negtagDY");
   }
   else {
     std::string fileNameHFBTV = dirName+"BTV/"+subDirName+"btagging.json.gz";
-    auto csetHFBTV = correction::CorrectionSet::from_file(fileNameHFBTV);
+    auto csetHFBTV = getCorrectionSet(fileNameHFBTV);
     btvHFSF_ = csetHFBTV->at("robustParticleTransformer_comb");
     std::string fileNameLFBTV = dirName+"BTV/"+subDirName+"btagging.json.gz";
-    auto csetLFBTV = correction::CorrectionSet::from_file(fileNameLFBTV);
+    auto csetLFBTV = getCorrectionSet(fileNameLFBTV);
     btvLFSF_ = csetLFBTV->at("robustParticleTransformer_light");
   }
 
   std::string fileNameScaleMu = dirName+"MUO/"+subDirName+"muon_scalesmearing.json.gz";
-  auto csetScaleMu = correction::CorrectionSet::from_file(fileNameScaleMu);
+  auto csetScaleMu = getCorrectionSet(fileNameScaleMu);
   muonScale_cb_params_   = csetScaleMu->at("cb_params");
   muonScale_poly_params_ = csetScaleMu->at("poly_params");
   muonScale_k_data_ = csetScaleMu->at("k_data");
@@ -150,40 +287,40 @@ MyCorrections::MyCorrections(int the_input_year) {
   muonScale_m_mc_   = csetScaleMu->at("m_mc");
 
   std::string fileNameMu = dirName+"MUO/"+subDirName+"muon_Z.json.gz";
-  auto csetMu = correction::CorrectionSet::from_file(fileNameMu);
+  auto csetMu = getCorrectionSet(fileNameMu);
   //muonTRKSF_ = csetMu->at("NUM_TrackerMuons_DEN_genTracks");
   muonIDSF_ = csetMu->at("NUM_MediumPromptID_DEN_TrackerMuons");
   muonISOSF_ = csetMu->at("NUM_LoosePFIso_DEN_MediumPromptID");
 
   std::string fileNameHighPtRECOMu       = dirName+"MUO/"+subDirName+"muon_HighPt.json.gz";
   if(year == 20240 || year == 20250) fileNameHighPtRECOMu = dirName+"MUO/"+subDirName+"ScaleFactors_Muon_highPt_RECO_2024_schemaV2.json.gz";
-  auto csetHighPtRECOMu = correction::CorrectionSet::from_file(fileNameHighPtRECOMu);
+  auto csetHighPtRECOMu = getCorrectionSet(fileNameHighPtRECOMu);
   muonHighPtTRKSF_ = csetHighPtRECOMu->at("NUM_GlobalMuons_DEN_TrackerMuonProbes");
 
   std::string fileNameHighPtIDISOMu       = dirName+"MUO/"+subDirName+"muon_HighPt.json.gz";
   if(year == 20240 || year == 20250) fileNameHighPtIDISOMu = dirName+"MUO/"+subDirName+"muon_HighPt.json.gz";
-  auto csetHighPtIDISOMu = correction::CorrectionSet::from_file(fileNameHighPtIDISOMu);
+  auto csetHighPtIDISOMu = getCorrectionSet(fileNameHighPtIDISOMu);
   muonHighPtIDSF_ = csetHighPtIDISOMu->at("NUM_MediumID_DEN_GlobalMuonProbes");
   muonHighPtISOSF_ = csetHighPtIDISOMu->at("NUM_probe_TightRelTkIso_DEN_MediumIDProbes");
   
   std::string fileNamePH = dirName+"EGM/"+subDirName+"photon.json.gz";
-  auto csetPH = correction::CorrectionSet::from_file(fileNamePH);
+  auto csetPH = getCorrectionSet(fileNamePH);
   photonSF_ = csetPH->at("Photon-ID-SF");
 
   std::string fileNameTRKELE = dirName+"EGM/"+subDirName+"electron.json.gz";
-  auto csetTRKELE = correction::CorrectionSet::from_file(fileNameTRKELE);
+  auto csetTRKELE = getCorrectionSet(fileNameTRKELE);
   electronTRKSF_ = csetTRKELE->at("Electron-ID-SF");
 
   std::string fileNameIDELE = dirName+"EGM/"+subDirName+"electron.json.gz";
-  auto csetIDELE = correction::CorrectionSet::from_file(fileNameIDELE);
+  auto csetIDELE = getCorrectionSet(fileNameIDELE);
   electronIDSF_ = csetIDELE->at("Electron-ID-SF");
 
   std::string fileNameMVAELE = dirName+"EGM/"+subDirName+"electron_mva.json.gz";
-  auto csetMVAELE = correction::CorrectionSet::from_file(fileNameMVAELE);
+  auto csetMVAELE = getCorrectionSet(fileNameMVAELE);
   electronMVASF_ = csetMVAELE->at("Electron-ID-SF");
 
   std::string fileNameEnergyEtDependentELE = dirName+"EGM/"+subDirName+"electronSS_EtDependent.json.gz";
-  auto csetEnergyEtDependentELE = correction::CorrectionSet::from_file(fileNameEnergyEtDependentELE);
+  auto csetEnergyEtDependentELE = getCorrectionSet(fileNameEnergyEtDependentELE);
   if     (year == 20220) {electronEtDependentScale_ = csetEnergyEtDependentELE->compound().at("Scale"); electronEtDependentSmearing_ = csetEnergyEtDependentELE->at("SmearAndSyst");}
   else if(year == 20221) {electronEtDependentScale_ = csetEnergyEtDependentELE->compound().at("Scale"); electronEtDependentSmearing_ = csetEnergyEtDependentELE->at("SmearAndSyst");}
   else if(year == 20230) {electronEtDependentScale_ = csetEnergyEtDependentELE->compound().at("Scale"); electronEtDependentSmearing_ = csetEnergyEtDependentELE->at("SmearAndSyst");}
@@ -192,16 +329,16 @@ MyCorrections::MyCorrections(int the_input_year) {
           year == 20250) {electronEtDependentScale_ = csetEnergyEtDependentELE->compound().at("Scale"); electronEtDependentSmearing_ = csetEnergyEtDependentELE->at("SmearAndSyst");}
 
   std::string fileNameTAU = dirName+"TAU/"+subDirName+"tau_DeepTau2018v2p5.json.gz";
-  auto csetTAU = correction::CorrectionSet::from_file(fileNameTAU);
+  auto csetTAU = getCorrectionSet(fileNameTAU);
   tauJETSF_ = csetTAU->at("DeepTau2018v2p5VSjet");
 
   std::string fileNameJER = dirName+"JME/"+subDirName+"jet_jerc.json.gz";
   //std::cout << fileNameJER << std::endl;
-  auto csetJER = correction::CorrectionSet::from_file(fileNameJER);
+  auto csetJER = getCorrectionSet(fileNameJER);
 
   std::string fileNameJEC = dirName+"JME/"+subDirName+"jet_jerc.json.gz";
   //std::cout << fileNameJEC << std::endl;
-  auto csetJEC = correction::CorrectionSet::from_file(fileNameJEC);
+  auto csetJEC = getCorrectionSet(fileNameJEC);
 
   std::string algoName = "AK4PFPuppi";
 
@@ -384,7 +521,7 @@ MyCorrections::MyCorrections(int the_input_year) {
 
   //std::cout << fileNameJEC << std::endl;
   std::string fileNamejetVetoMap = dirName+"JME/"+subDirName+"jetvetomaps.json.gz";
-  auto csetJetVetoMap = correction::CorrectionSet::from_file(fileNamejetVetoMap);
+  auto csetJetVetoMap = getCorrectionSet(fileNamejetVetoMap);
 
   for(int i=0; i<10; i++){
     if(jetVetoMapName[i].compare("NULL") == 0) continue;
@@ -393,12 +530,12 @@ MyCorrections::MyCorrections(int the_input_year) {
 
   std::string fileNameJetSel = dirName+"JME/"+subDirName+"jetid.json.gz";
   //std::cout << fileNameJetSel << std::endl;
-  auto csetJetSel = correction::CorrectionSet::from_file(fileNameJetSel);
+  auto csetJetSel = getCorrectionSet(fileNameJetSel);
   jetTightSel_           = csetJetSel->at("AK4PUPPI_Tight");
   jetTightLeptonVetoSel_ = csetJetSel->at("AK4PUPPI_TightLeptonVeto");
 
   std::string fileNameMetCorr = dirName+"JME/"+subDirName+"met_xyCorrections.json.gz";
-  auto csetMetCorr = correction::CorrectionSet::from_file(fileNameMetCorr);
+  auto csetMetCorr = getCorrectionSet(fileNameMetCorr);
   metCorr_ = csetMetCorr->at("met_xy_corrections");
 
 };
@@ -502,6 +639,12 @@ double MyCorrections::eval_jesUnc(double eta, double pt, int type) {
   return std::abs(jesSourcesUnc_[type]->evaluate({eta, pt}));
 };
 
+// all the 28 sources at once, the inputs are built only once per jet
+void MyCorrections::eval_jesUncAll(double eta, double pt, double *unc) {
+  const std::vector<correction::Variable::Type> inputs = {eta, pt};
+  for(int i=0; i<28; i++) unc[i] = std::abs(jesSourcesUnc_[i]->evaluate(inputs));
+};
+
 double MyCorrections::eval_jerScaleFactor(double eta, double pt, int type) {
   if     (type ==  0) return jerScaleFactor_->evaluate({eta,pt,"nom"});
   else if(type == +1) return jerScaleFactor_->evaluate({eta,pt,"up"});
@@ -545,6 +688,41 @@ double MyCorrections::eval_met_corr(const char *pt_phi, const char *met_type, co
 
 };
 
+// sfType: 0 (TRK), 1 (ID), 2 (ISO); the high pt TRK correction takes p instead of pt
+CorrectionHandle MyCorrections::bind_muonSF(int sfType, bool isHighPt, const char *valType) {
+  correction::Correction::Ref corr;
+  if     (sfType == 0 && isHighPt) corr = muonHighPtTRKSF_;
+  else if(sfType == 1)             corr = isHighPt ? muonHighPtIDSF_  : muonIDSF_;
+  else if(sfType == 2)             corr = isHighPt ? muonHighPtISOSF_ : muonISOSF_;
+  else return CorrectionHandle();
+  return CorrectionHandle(corr, {0.0, 0.0, std::string(valType)}, {0, 1});
+};
+
+// sfType: 0 (TRK), 1 (ID), 2 (MVA ID)
+CorrectionHandle MyCorrections::bind_electronSF(int sfType, const char *the_input_year, const char *valType, const char *workingPoint) {
+  correction::Correction::Ref corr = electronTRKSF_;
+  if     (sfType == 1) corr = electronIDSF_;
+  else if(sfType == 2) corr = electronMVASF_;
+  if(sfType == 2 || hasPhiInput() == false) return CorrectionHandle(corr, {std::string(the_input_year), std::string(valType), std::string(workingPoint), 0.0, 0.0}, {3, 4});
+  return CorrectionHandle(corr, {std::string(the_input_year), std::string(valType), std::string(workingPoint), 0.0, 0.0, 0.0}, {3, 4, 5});
+};
+
+CorrectionHandle MyCorrections::bind_photonSF(const char *the_input_year, const char *valType, const char *workingPoint) {
+  if(hasPhiInput() == false) return CorrectionHandle(photonSF_, {std::string(the_input_year), std::string(valType), std::string(workingPoint), 0.0, 0.0}, {3, 4});
+  return CorrectionHandle(photonSF_, {std::string(the_input_year), std::string(valType), std::string(workingPoint), 0.0, 0.0, 0.0}, {3, 4, 5});
+};
+
+CorrectionHandle MyCorrections::bind_tauJETSF(const char *workingPoint, const char *workingPoint_VSe, const char *valType) {
+  return CorrectionHandle(tauJETSF_, {0.0, 0, 0, std::string(workingPoint), std::string(workingPoint_VSe), std::string(valType), std::string("dm")}, {0, 1, 2});
+};
+
+// one handle per flavor (0, 4, 5); the 2024/2025 heavy flavour correction is evaluated with flavor 5 for b and c jets
+CorrectionHandle MyCorrections::bind_btvSF(const char *valType, const char *workingPoint, int flavor) {
+  if(flavor == 0) return CorrectionHandle(btvLFSF_, {std::string(valType), std::string(workingPoint), flavor, 0.0, 0.0}, {3, 4});
+  if(year == 20240 || year == 20250) flavor = 5;
+  return CorrectionHandle(btvHFSF_, {std::string(valType), std::string(workingPoint), flavor, 0.0, 0.0}, {3, 4});
+};
+
 // Muon momentum scale and resolution
 double MyCorrections::muon_get_rndm(double eta, float nL) {
 
@@ -0,0 +1,101 @@
+#ifndef RUNS_SUMS_H
+#define RUNS_SUMS_H
+
+#include <ROOT/RDataFrame.hxx>
+#include <ROOT/RDF/RActionImpl.hxx>
+#include <ROOT/RVec.hxx>
+#include "TTreeReader.h"
+
+#include <algorithm>
+#include <limits>
+#include <memory>
+#include <string>
+#include <vector>
+
+// Element-wise sum of an array column of the Runs tree (LHEScaleSumw, LHEPdfSumw,
+// PSSumw) over all its entries. fMinSize is the shortest array seen, i.e. the
+// number of variations available in all the entries
+class runssums_result {
+
+    public:
+        std::vector<double> fSumw;
+        std::size_t fMinSize = std::numeric_limits<std::size_t>::max();
+        unsigned long long fEntries = 0;
+
+        void Add(const ROOT::VecOps::RVec<double> &values) {
+            if (values.size() > fSumw.size()) fSumw.resize(values.size(), 0.0);
+            for (std::size_t i = 0; i < values.size(); i++) {
+                fSumw[i] += values[i];
+            }
+            fMinSize = std::min(fMinSize, values.size());
+            fEntries += 1;
+        }
+
+        void Add(const runssums_result &other) {
+            if (other.fSumw.size() > fSumw.size()) fSumw.resize(other.fSumw.size(), 0.0);
+            for (std::size_t i = 0; i < other.fSumw.size(); i++) {
+                fSumw[i] += other.fSumw[i];
+            }
+            fMinSize = std::min(fMinSize, other.fMinSize);
+            fEntries += other.fEntries;
+        }
+
+        // the sums of the variations available in all the entries
+        std::vector<double> GetSumw() const {
+            if (fEntries == 0) return {};
+            return std::vector<double>(fSumw.begin(), fSumw.begin() + std::min(fMinSize, fSumw.size()));
+        }
+};
+
+// RDataFrame action accumulating one array column in the same event loop as the
+// other Runs sums, instead of one Sum per index of the array
+class runssums_helper : public ROOT::Detail::RDF::RActionImpl<runssums_helper> {
+
+    public:
+        using Result_t = runssums_result;
+
+        runssums_helper() {
+
+            const unsigned int nSlots = ROOT::IsImplicitMTEnabled() ? ROOT::GetThreadPoolSize() : 1;
+            fResult = std::make_shared<runssums_result>();
+            fSlots.resize(nSlots);
+        }
+
+        runssums_helper(runssums_helper &&) = default;
+        runssums_helper(const runssums_helper &) = delete;
+
+        std::shared_ptr<runssums_result> GetResultPtr() const { return fResult; }
+
+        void Initialize() {}
+
+        void InitTask(TTreeReader *, unsigned int) {}
+
+        void Exec(unsigned int slot, const ROOT::VecOps::RVec<double> &values) {
+            fSlots[slot].Add(values);
+        }
+
+        void Finalize() {
+            for (auto &r : fSlots) {
+                fResult->Add(r);
+            }
+            fSlots.clear();
+        }
+
+        std::string GetActionName() { return "runssums_helper"; }
+
+    private:
+        std::shared_ptr<runssums_result> fResult;
+        std::vector<runssums_result> fSlots;
+};
+
+// The Runs arrays are Double_t in NanoAOD, other types are converted
+template <typename T>
+ROOT::VecOps::RVec<double> runssums_cast(const ROOT::VecOps::RVec<T> &v) {
+    return ROOT::VecOps::RVec<double>(v.begin(), v.end());
+}
+
+ROOT::RDF::RResultPtr<runssums_result> book_runssums(ROOT::RDF::RNode df, const std::string &col) {
+    return df.Book<ROOT::VecOps::RVec<double>>(runssums_helper(), {col});
+}
+
+#endif
@@ -3,11 +3,14 @@ import os, sys, getopt, json
 
 ROOT.ROOT.EnableImplicitMT(10)
 from utilsCategory import plotCategory
-from utilsAna import getMClist, getDATAlist
-from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi
+from utilsAna import getMClist, getDATAlist, loadSFTables, getLeptonSFTables, getEWKCorrSFTables, jitCacheDir
+from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi, getMCNormalization, getFileListFingerprint, getFileWeights
 from utilsSelection import selectionTauVeto, selectionPhoton, selectionJetMet, selection2LVar, selectionTrigger2L, selectionElMu, selectionWeigths, selectionGenLepJet, makeFinalVariable2DVar
 import tmva_helper_xml
+import bdt_forest
 from array import array
+from jit_cache import JitCache
+from multihisto_helper import makeCategoryHisto, makeCategoryHistoVar, selectCategory, unpackCategoryHistos
 
 correctionString = "_correction"
 makeDataCards = 1 # 1 (mjj diff), 2 (mll diff), 3 (njets diff), 4 (detajj diff), 5 (dphijj diff), 6 (mjj), 7 (mll), 8 (njets), 9 (detajj), 10 (dphijj)
@@ -28,6 +31,15 @@ doNtuples = False
 # 0 = T, 1 = M, 2 = L
 bTagSel = 2
 useBTaggingWeights = 1
+# BDT evaluated with the compiled forest (bdt_forest.h) instead of TMVA::Reader, to be
+# enabled once validateBDTForest.py agrees with TMVA on a reference sample
+useBDTForest = False
+# theCat as an axis of the booked histograms: the selection is built once instead
+# of once per category, histo_<n>_<cat> are split at write time
+useCategoryAxis = True
+# string expressions of the graph booked from the JIT cache library when compiled there,
+# recorded for makeJitCache.py otherwise; reports the jitting and event loop times
+useJitCache = True
 
 useFR = 1
 whichAna = 2
@@ -118,10 +130,14 @@ def selectionLL(df,year,PDType,isData,count):
 
     return dftag
 
-def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm):
 
     print("starting {0} / {1} / {2} / {3} / {4} / {5} / {6}".format(count,category,weight,year,PDType,isData,whichJob))
 
+    if(useJitCache == True):
+        jitCache = JitCache("sswwAnalysis", jitCacheDir)
+        df = jitCache.wrap(df)
+
     theCat = category
     if(theCat > 100): theCat = plotCategory("kPlotData")
     if(theCat == plotCategory("kPlotqqWW") or theCat == plotCategory("kPlotggWW") or
@@ -138,56 +154,6 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
     histo2D  = [[0 for y in range(nCat)] for x in range(nHistoMVA)]
     histoMVA = [[0 for y in range(nCat)] for x in range(nHistoMVA)]
 
-    ROOT.initHisto2D(histoFakeEtaPt_mu[0],0)
-    ROOT.initHisto2D(histoFakeEtaPt_el[0],1)
-    ROOT.initHisto2D(histoLepSFEtaPt_mu,2)
-    ROOT.initHisto2D(histoLepSFEtaPt_el,3)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_0, 4)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_1, 5)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_2, 6)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_3, 7)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_0, 8)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_1, 9)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_2,10)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_3,11)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_0,12)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_1,13)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_2,14)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_3,15)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_0,16)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_1,17)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_2,18)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_3,19)
-    ROOT.initHisto2D(histoBTVEffEtaPtLF,20)
-    ROOT.initHisto2D(histoBTVEffEtaPtCJ,21)
-    ROOT.initHisto2D(histoBTVEffEtaPtBJ,22)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[1],23)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[2],24)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[3],25)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[4],26)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[5],27)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[6],28)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[7],29)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[8],30)
-    ROOT.initHisto2D(histoFakeEtaPt_el[1],31)
-    ROOT.initHisto2D(histoFakeEtaPt_el[2],32)
-    ROOT.initHisto2D(histoFakeEtaPt_el[3],33)
-    ROOT.initHisto2D(histoFakeEtaPt_el[4],34)
-    ROOT.initHisto2D(histoFakeEtaPt_el[5],35)
-    ROOT.initHisto2D(histoFakeEtaPt_el[6],36)
-    ROOT.initHisto2D(histoFakeEtaPt_el[7],37)
-    ROOT.initHisto2D(histoFakeEtaPt_el[8],38)
-    ROOT.initHisto2D(wsWeights[2],39)
-    ROOT.initHisto1D(puWeights[0],0)
-    ROOT.initHisto1D(puWeights[1],1)
-    ROOT.initHisto1D(puWeights[2],2)
-    ROOT.initHisto1D(wsWeights[0],8)
-    ROOT.initHisto1D(wsWeights[1],9)
-    ROOT.initHisto1D(ewkCorrWeights[0],10)
-    ROOT.initHisto1D(ewkCorrWeights[1],11)
-    ROOT.initHisto1D(ewkCorrWeights[2],12)
-    ROOT.initHisto1D(ewkCorrWeights[3],13)
-
     ROOT.initJSONSFs(year)
 
     branchList = ROOT.vector('string')()
@@ -223,7 +189,10 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
     #print(variables)
 
     MVAweights = "weights_mva/bdt_BDTG_vbfinc_v{0}.weights.xml".format(versionMVA)
-    tmva_helper = tmva_helper_xml.TMVAHelperXML(MVAweights)
+    if(useBDTForest == True):
+        tmva_helper = bdt_forest.BDTForest(MVAweights)
+    else:
+        tmva_helper = tmva_helper_xml.TMVAHelperXML(MVAweights)
     print(tmva_helper.variables)
 
     dftag = selectionLL(df,year,PDType,isData,count)
@@ -329,10 +298,20 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
     dfwwbvbscatJERUp          = []
     dfwwbvbscatJESUp          = []
     dfwwbvbscatUnclusteredUp  = []
-    for x in range(nCat):
-        dfwwcat.append(dfbase.Filter("theCat=={0}".format(x), "correct category ({0})".format(x)))
+    nCatSel = nCat
+    if(useCategoryAxis == True): nCatSel = 1
+    for x in range(nCatSel):
+        catX = x
+        if(useCategoryAxis == True):
+            catX = "theCat"
+            dfwwcat.append(dfbase)
+        else:
+            dfwwcat.append(dfbase.Filter("theCat=={0}".format(x), "correct category ({0})".format(x)))
 
-        if((x == plotCategory("kPlotEWKSSWW")) and isData == "false"):
+        if(useCategoryAxis == True and isData == "false"):
+            dfwwcat[x] = (dfwwcat[x].Define("theGenCat" , "theCat == kPlotEWKSSWW ? compute_vbs_gen_category({0},ngood_GenJets,good_GenJet_pt,good_GenJet_eta,good_GenJet_phi,good_GenJet_mass,ngood_GenDressedLeptons,good_GenDressedLepton_pdgId,good_GenDressedLepton_hasTauAnc,good_GenDressedLepton_pt,good_GenDressedLepton_eta,good_GenDressedLepton_phi,good_GenDressedLepton_mass,3) : 0".format(genVBSSel))
+                                    )
+        elif((x == plotCategory("kPlotEWKSSWW")) and isData == "false"):
             dfwwcat[x] = (dfwwcat[x].Define("theGenCat" , "compute_vbs_gen_category({0},ngood_GenJets,good_GenJet_pt,good_GenJet_eta,good_GenJet_phi,good_GenJet_mass,ngood_GenDressedLeptons,good_GenDressedLepton_pdgId,good_GenDressedLepton_hasTauAnc,good_GenDressedLepton_pt,good_GenDressedLepton_eta,good_GenDressedLepton_phi,good_GenDressedLepton_mass,3)".format(genVBSSel))
                                     )
         else:
@@ -478,135 +457,135 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
         dfwwbvbscatJESUp        [x] = dfwwbvbscatJESUp        [x].Filter("mll{0}           > 20 && ptl1{0}           > 25 && ptl2{0}           > 20 && (DiLepton_flavor != 2 || abs(mll{0}           -86.1876) > 20) && nbtag_goodbtag_Jet_bjet        >  0 && nvbs_jets        >= 2 && vbs_mjj        > 500 && vbs_detajj        > 2.5 && vbs_zepvv        < 1.0 && PuppiMET_ptDef	> {1}".format(altMass,metCut))
         dfwwbvbscatUnclusteredUp[x] = dfwwbvbscatUnclusteredUp[x].Filter("mll{0}           > 20 && ptl1{0}           > 25 && ptl2{0}           > 20 && (DiLepton_flavor != 2 || abs(mll{0}           -86.1876) > 20) && nbtag_goodbtag_Jet_bjet        >  0 && nvbs_jets        >= 2 && vbs_mjj        > 500 && vbs_detajj        > 2.5 && vbs_zepvv        < 1.0 && PuppiMET_ptUnclUp	> {1}".format(altMass,metCut))
 
-        histo[ 0][x] = dfwwcat[x].Histo1D(("histo_{0}_{1}".format( 0,x), "histo_{0}_{1}".format( 0,x),40, 20, 220), "mll{0}".format(altMass),"weightNoBTag")
+        histo[ 0][x] = makeCategoryHisto(dfwwcat[x],"mll{0}".format(altMass),"weightNoBTag",catX,0,40,20,220)
         dfwwcat[x] = dfwwcat[x].Filter("DiLepton_flavor != 2 || abs(mll{0}-86.1876) > 20".format(altMass),"Z veto")
 
         dfwwbcat.append(dfwwcat[x].Filter("nbtag_goodbtag_Jet_bjet > 0","at least one good b-jets"))
 
-        histo[ 1][x] = dfwwcat[x].Histo1D(("histo_{0}_{1}".format( 1,x), "histo_{0}_{1}".format( 1,x), 5,-0.5 ,4.5),     "nbtag_goodbtag_Jet_bjet","weight")
+        histo[ 1][x] = makeCategoryHisto(dfwwcat[x],"nbtag_goodbtag_Jet_bjet","weight",catX,1,5,-0.5,4.5)
         dfwwcat[x] = dfwwcat[x].Filter("nbtag_goodbtag_Jet_bjet == 0","no good b-jets")
 
-        histo[ 2][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format( 2,x), "histo_{0}_{1}".format( 2,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[ 3][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format( 3,x), "histo_{0}_{1}".format( 3,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[ 4][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format( 4,x), "histo_{0}_{1}".format( 4,x), 6,-0.5, 5.5), "ngood_jets","weight")
-        histo[ 5][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format( 5,x), "histo_{0}_{1}".format( 5,x), 6,-0.5, 5.5), "ngood_jets","weight")
+        histo[ 2][x] = makeCategoryHisto(dfwwcat[x] ,"ltype","weight",catX,2,4,-0.5,3.5)
+        histo[ 3][x] = makeCategoryHisto(dfwwbcat[x],"ltype","weight",catX,3,4,-0.5,3.5)
+        histo[ 4][x] = makeCategoryHisto(dfwwcat[x] ,"ngood_jets","weight",catX,4,6,-0.5,5.5)
+        histo[ 5][x] = makeCategoryHisto(dfwwbcat[x],"ngood_jets","weight",catX,5,6,-0.5,5.5)
 
         dfwwcat[x]  = dfwwcat[x] .Filter("nvbs_jets >= 2 && vbs_mjj > 200", "vbs_mjj > 200")
         dfwwbcat[x] = dfwwbcat[x].Filter("nvbs_jets >= 2 && vbs_mjj > 200", "vbs_mjj > 200")
-        histo[14][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format(14,x), "histo_{0}_{1}".format(14,x), 20,0,2), "vbs_zepvv","weight")
-        histo[15][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format(15,x), "histo_{0}_{1}".format(15,x), 20,0,2), "vbs_zepvv","weight")
+        histo[14][x] = makeCategoryHisto(dfwwcat[x] ,"vbs_zepvv","weight",catX,14,20,0,2)
+        histo[15][x] = makeCategoryHisto(dfwwbcat[x],"vbs_zepvv","weight",catX,15,20,0,2)
 
         dfwwcat[x]  = dfwwcat[x] .Filter("vbs_zepvv < 1.0", "vbs_zepvv < 1.0")
         dfwwbcat[x] = dfwwbcat[x].Filter("vbs_zepvv < 1.0", "vbs_zepvv < 1.0")
-        histo[12][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format(12,x), "histo_{0}_{1}".format(12,x), 19,0.0,9.5), "vbs_detajj","weight")
-        histo[13][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format(13,x), "histo_{0}_{1}".format(13,x), 19,0.0,9.5), "vbs_detajj","weight")
+        histo[12][x] = makeCategoryHisto(dfwwcat[x] ,"vbs_detajj","weight",catX,12,19,0.0,9.5)
+        histo[13][x] = makeCategoryHisto(dfwwbcat[x],"vbs_detajj","weight",catX,13,19,0.0,9.5)
 
-        histo[ 6][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format( 6,x), "histo_{0}_{1}".format( 6,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[ 7][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format( 7,x), "histo_{0}_{1}".format( 7,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[ 8][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format( 8,x), "histo_{0}_{1}".format( 8,x), 4, 1.5, 5.5), "ngood_jets","weight")
-        histo[ 9][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format( 9,x), "histo_{0}_{1}".format( 9,x), 4, 1.5, 5.5), "ngood_jets","weight")
-        histo[10][x] = dfwwcat[x] .Histo1D(("histo_{0}_{1}".format(10,x), "histo_{0}_{1}".format(10,x), 28,200,3000), "vbs_mjj","weight")
-        histo[11][x] = dfwwbcat[x].Histo1D(("histo_{0}_{1}".format(11,x), "histo_{0}_{1}".format(11,x), 28,200,3000), "vbs_mjj","weight")
+        histo[ 6][x] = makeCategoryHisto(dfwwcat[x] ,"ltype","weight",catX,6,4,-0.5,3.5)
+        histo[ 7][x] = makeCategoryHisto(dfwwbcat[x],"ltype","weight",catX,7,4,-0.5,3.5)
+        histo[ 8][x] = makeCategoryHisto(dfwwcat[x] ,"ngood_jets","weight",catX,8,4,1.5,5.5)
+        histo[ 9][x] = makeCategoryHisto(dfwwbcat[x],"ngood_jets","weight",catX,9,4,1.5,5.5)
+        histo[10][x] = makeCategoryHisto(dfwwcat[x] ,"vbs_mjj","weight",catX,10,28,200,3000)
+        histo[11][x] = makeCategoryHisto(dfwwbcat[x],"vbs_mjj","weight",catX,11,28,200,3000)
 
         for ltype in range(4):
-            histo[70+ltype][x] = dfwwcat[x] .Filter("ltype == {0}".format(ltype)).Histo1D(("histo_{0}_{1}".format(70+ltype,x), "histo_{0}_{1}".format(70+ltype,x),20, 20, 120), "ptl2{0}".format(altMass),"weight")
-            histo[74+ltype][x] = dfwwbcat[x].Filter("ltype == {0}".format(ltype)).Histo1D(("histo_{0}_{1}".format(74+ltype,x), "histo_{0}_{1}".format(74+ltype,x),20, 20, 120), "ptl2{0}".format(altMass),"weight")
-            histo[78+ltype][x] = dfwwcat[x] .Filter("ltype == {0}".format(ltype)).Histo1D(("histo_{0}_{1}".format(78+ltype,x), "histo_{0}_{1}".format(78+ltype,x),12, 0, 2.4), "etal2","weight")
-            histo[82+ltype][x] = dfwwbcat[x].Filter("ltype == {0}".format(ltype)).Histo1D(("histo_{0}_{1}".format(82+ltype,x), "histo_{0}_{1}".format(82+ltype,x),12, 0, 2.4), "etal2","weight")
+            histo[70+ltype][x] = makeCategoryHisto(dfwwcat[x] .Filter("ltype == {0}".format(ltype)),"ptl2{0}".format(altMass),"weight",catX,70+ltype,20,20,120)
+            histo[74+ltype][x] = makeCategoryHisto(dfwwbcat[x].Filter("ltype == {0}".format(ltype)),"ptl2{0}".format(altMass),"weight",catX,74+ltype,20,20,120)
+            histo[78+ltype][x] = makeCategoryHisto(dfwwcat[x] .Filter("ltype == {0}".format(ltype)),"etal2","weight",catX,78+ltype,12,0,2.4)
+            histo[82+ltype][x] = makeCategoryHisto(dfwwbcat[x].Filter("ltype == {0}".format(ltype)),"etal2","weight",catX,82+ltype,12,0,2.4)
 
         dfwwvbscat .append(dfwwcat[x] .Filter(VBSSEL, "VBS selection"))
         dfwwbvbscat.append(dfwwbcat[x].Filter(VBSSEL, "VBS selection"))
-        histo[16][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(16,x), "histo_{0}_{1}".format(16,x),25,  0, 250), "PuppiMET_pt{0}".format(altMass),"weight")
-        histo[17][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(17,x), "histo_{0}_{1}".format(17,x),25,  0, 250), "PuppiMET_pt{0}".format(altMass),"weight")
-        histo[54][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(54,x), "histo_{0}_{1}".format(54,x),30, -3.16, 3.16), "PuppiMET_phi{0}".format(altMass),"weight")
-        histo[55][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(55,x), "histo_{0}_{1}".format(55,x),30, -3.16, 3.16), "PuppiMET_phi{0}".format(altMass),"weight")
+        histo[16][x] = makeCategoryHisto(dfwwvbscat[x] ,"PuppiMET_pt{0}".format(altMass),"weight",catX,16,25,0,250)
+        histo[17][x] = makeCategoryHisto(dfwwbvbscat[x],"PuppiMET_pt{0}".format(altMass),"weight",catX,17,25,0,250)
+        histo[54][x] = makeCategoryHisto(dfwwvbscat[x] ,"PuppiMET_phi{0}".format(altMass),"weight",catX,54,30,-3.16,3.16)
+        histo[55][x] = makeCategoryHisto(dfwwbvbscat[x],"PuppiMET_phi{0}".format(altMass),"weight",catX,55,30,-3.16,3.16)
 
         dfwwvbscat[x]  = dfwwvbscat[x] .Filter("PuppiMET_pt{0} > {1}".format(altMass,metCut), "PuppiMET_pt > cut")
         dfwwbvbscat[x] = dfwwbvbscat[x].Filter("PuppiMET_pt{0} > {1}".format(altMass,metCut), "PuppiMET_pt > cut")
-        histo[18][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(18,x), "histo_{0}_{1}".format(18,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[19][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(19,x), "histo_{0}_{1}".format(19,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[20][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(20,x), "histo_{0}_{1}".format(20,x), 4, 1.5, 5.5), "ngood_jets","weight")
-        histo[21][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(21,x), "histo_{0}_{1}".format(21,x), 4, 1.5, 5.5), "ngood_jets","weight")
-
-        histo[22][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(22,x), "histo_{0}_{1}".format(22,x), 25,500,3000), "vbs_mjj","weight")
-        histo[23][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(23,x), "histo_{0}_{1}".format(23,x), 25,500,3000), "vbs_mjj","weight")
-        histo[24][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(24,x), "histo_{0}_{1}".format(24,x), 14,2.5,9.5), "vbs_detajj","weight")
-        histo[25][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(25,x), "histo_{0}_{1}".format(25,x), 14,2.5,9.5), "vbs_detajj","weight")
-        histo[26][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(26,x), "histo_{0}_{1}".format(26,x), 10,0,3.1416), "vbs_dphijj","weight")
-        histo[27][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(27,x), "histo_{0}_{1}".format(27,x), 10,0,3.1416), "vbs_dphijj","weight")
-        histo[28][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(28,x), "histo_{0}_{1}".format(28,x), 10,0,1), "vbs_zepvv","weight")
-        histo[29][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(29,x), "histo_{0}_{1}".format(29,x), 10,0,1), "vbs_zepvv","weight")
-        histo[30][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(30,x), "histo_{0}_{1}".format(30,x), 20,-1,1), "bdt_vbfinc","weight")
-        histo[31][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(31,x), "histo_{0}_{1}".format(31,x), 20,-1,1), "bdt_vbfinc","weight")
-        histo[32][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(32,x), "histo_{0}_{1}".format(32,x),25, 50, 300), "vbs_ptj1","weight")
-        histo[33][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(33,x), "histo_{0}_{1}".format(33,x),25, 50, 300), "vbs_ptj1","weight")
-        histo[34][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(34,x), "histo_{0}_{1}".format(34,x),25, 50, 300), "vbs_ptj2","weight")
-        histo[35][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(35,x), "histo_{0}_{1}".format(35,x),25, 50, 300), "vbs_ptj2","weight")
-        histo[36][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(36,x), "histo_{0}_{1}".format(36,x),25, 0, 5), "vbs_etaj1","weight")
-        histo[37][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(37,x), "histo_{0}_{1}".format(37,x),25, 0, 5), "vbs_etaj1","weight")
-        histo[38][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(38,x), "histo_{0}_{1}".format(38,x),25, 0, 5), "vbs_etaj2","weight")
-        histo[39][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(39,x), "histo_{0}_{1}".format(39,x),25, 0, 5), "vbs_etaj2","weight")
-        histo[56][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(56,x), "histo_{0}_{1}".format(56,x),30, -3.16, 3.16), "vbs_phij1","weight")
-        histo[57][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(57,x), "histo_{0}_{1}".format(57,x),30, -3.16, 3.16), "vbs_phij1","weight")
-        histo[58][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(58,x), "histo_{0}_{1}".format(58,x),30, -3.16, 3.16), "vbs_phij2","weight")
-        histo[59][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(59,x), "histo_{0}_{1}".format(59,x),30, -3.16, 3.16), "vbs_phij2","weight")
-
-        histo[60][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(60,x), "histo_{0}_{1}".format(60,x),20, 25, 225), "ptl1{0}".format(altMass),"weight")
-        histo[61][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(61,x), "histo_{0}_{1}".format(61,x),20, 25, 225), "ptl1{0}".format(altMass),"weight")
-        histo[62][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(62,x), "histo_{0}_{1}".format(62,x),20, 20, 120), "ptl2{0}".format(altMass),"weight")
-        histo[63][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(63,x), "histo_{0}_{1}".format(63,x),20, 20, 120), "ptl2{0}".format(altMass),"weight")
-        histo[64][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(64,x), "histo_{0}_{1}".format(64,x),16, 20, 340), "mll{0}".format(altMass),"weight")
-        histo[65][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(65,x), "histo_{0}_{1}".format(65,x),16, 20, 340), "mll{0}".format(altMass),"weight")
-        histo[66][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(66,x), "histo_{0}_{1}".format(66,x),12, 0, 2.4), "etal1","weight")
-        histo[67][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(67,x), "histo_{0}_{1}".format(67,x),12, 0, 2.4), "etal1","weight")
-        histo[68][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(68,x), "histo_{0}_{1}".format(68,x),12, 0, 2.4), "etal2","weight")
-        histo[69][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(69,x), "histo_{0}_{1}".format(69,x),12, 0, 2.4), "etal2","weight")
-
-        histo[86][x] = dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} < 140".format(altMass)).Histo1D(("histo_{0}_{1}".format(86,x), "histo_{0}_{1}".format(86,x),24, 20, 140), "mll{0}".format(altMass),"weight")
-        histo[87][x] = dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} < 140".format(altMass)).Histo1D(("histo_{0}_{1}".format(87,x), "histo_{0}_{1}".format(87,x),24, 20, 140), "mll{0}".format(altMass),"weight")
-        histo[88][x] = dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} <  80".format(altMass)).Histo1D(("histo_{0}_{1}".format(88,x), "histo_{0}_{1}".format(88,x),4,-0.5, 3.5), "ltype","weight")
-        histo[89][x] = dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} <  80".format(altMass)).Histo1D(("histo_{0}_{1}".format(89,x), "histo_{0}_{1}".format(89,x),4,-0.5, 3.5), "ltype","weight")
-        histo[90][x] = dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} <  80".format(altMass)).Histo1D(("histo_{0}_{1}".format(90,x), "histo_{0}_{1}".format(90,x),20, 0, 200), "ptll{0}".format(altMass),"weight")
-        histo[91][x] = dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} <  80".format(altMass)).Histo1D(("histo_{0}_{1}".format(91,x), "histo_{0}_{1}".format(91,x),20, 0, 200), "ptll{0}".format(altMass),"weight")
-        histo[92][x] = dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} <  80".format(altMass)).Histo1D(("histo_{0}_{1}".format(92,x), "histo_{0}_{1}".format(92,x),20,30, 230), "PuppiMET_pt{0}".format(altMass),"weight")
-        histo[93][x] = dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} <  80".format(altMass)).Histo1D(("histo_{0}_{1}".format(93,x), "histo_{0}_{1}".format(93,x),20,30, 230), "PuppiMET_pt{0}".format(altMass),"weight")
-        histo[94][x] = dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 0    ".format(altMass)).Histo1D(("histo_{0}_{1}".format(94,x), "histo_{0}_{1}".format(94,x),24, 20, 140), "mll{0}".format(altMass),"weight")
-        histo[95][x] = dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 1    ".format(altMass)).Histo1D(("histo_{0}_{1}".format(95,x), "histo_{0}_{1}".format(95,x),24, 20, 140), "mll{0}".format(altMass),"weight")
-        histo[96][x] = dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 2    ".format(altMass)).Histo1D(("histo_{0}_{1}".format(96,x), "histo_{0}_{1}".format(96,x),24, 20, 140), "mll{0}".format(altMass),"weight")
-        histo[97][x] = dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 3    ".format(altMass)).Histo1D(("histo_{0}_{1}".format(97,x), "histo_{0}_{1}".format(97,x),24, 20, 140), "mll{0}".format(altMass),"weight")
+        histo[18][x] = makeCategoryHisto(dfwwvbscat[x] ,"ltype","weight",catX,18,4,-0.5,3.5)
+        histo[19][x] = makeCategoryHisto(dfwwbvbscat[x],"ltype","weight",catX,19,4,-0.5,3.5)
+        histo[20][x] = makeCategoryHisto(dfwwvbscat[x] ,"ngood_jets","weight",catX,20,4,1.5,5.5)
+        histo[21][x] = makeCategoryHisto(dfwwbvbscat[x],"ngood_jets","weight",catX,21,4,1.5,5.5)
+
+        histo[22][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_mjj","weight",catX,22,25,500,3000)
+        histo[23][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_mjj","weight",catX,23,25,500,3000)
+        histo[24][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_detajj","weight",catX,24,14,2.5,9.5)
+        histo[25][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_detajj","weight",catX,25,14,2.5,9.5)
+        histo[26][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_dphijj","weight",catX,26,10,0,3.1416)
+        histo[27][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_dphijj","weight",catX,27,10,0,3.1416)
+        histo[28][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_zepvv","weight",catX,28,10,0,1)
+        histo[29][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_zepvv","weight",catX,29,10,0,1)
+        histo[30][x] = makeCategoryHisto(dfwwvbscat[x] ,"bdt_vbfinc","weight",catX,30,20,-1,1)
+        histo[31][x] = makeCategoryHisto(dfwwbvbscat[x],"bdt_vbfinc","weight",catX,31,20,-1,1)
+        histo[32][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_ptj1","weight",catX,32,25,50,300)
+        histo[33][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_ptj1","weight",catX,33,25,50,300)
+        histo[34][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_ptj2","weight",catX,34,25,50,300)
+        histo[35][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_ptj2","weight",catX,35,25,50,300)
+        histo[36][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_etaj1","weight",catX,36,25,0,5)
+        histo[37][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_etaj1","weight",catX,37,25,0,5)
+        histo[38][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_etaj2","weight",catX,38,25,0,5)
+        histo[39][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_etaj2","weight",catX,39,25,0,5)
+        histo[56][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_phij1","weight",catX,56,30,-3.16,3.16)
+        histo[57][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_phij1","weight",catX,57,30,-3.16,3.16)
+        histo[58][x] = makeCategoryHisto(dfwwvbscat[x] ,"vbs_phij2","weight",catX,58,30,-3.16,3.16)
+        histo[59][x] = makeCategoryHisto(dfwwbvbscat[x],"vbs_phij2","weight",catX,59,30,-3.16,3.16)
+
+        histo[60][x] = makeCategoryHisto(dfwwvbscat[x] ,"ptl1{0}".format(altMass),"weight",catX,60,20,25,225)
+        histo[61][x] = makeCategoryHisto(dfwwbvbscat[x],"ptl1{0}".format(altMass),"weight",catX,61,20,25,225)
+        histo[62][x] = makeCategoryHisto(dfwwvbscat[x] ,"ptl2{0}".format(altMass),"weight",catX,62,20,20,120)
+        histo[63][x] = makeCategoryHisto(dfwwbvbscat[x],"ptl2{0}".format(altMass),"weight",catX,63,20,20,120)
+        histo[64][x] = makeCategoryHisto(dfwwvbscat[x] ,"mll{0}".format(altMass),"weight",catX,64,16,20,340)
+        histo[65][x] = makeCategoryHisto(dfwwbvbscat[x],"mll{0}".format(altMass),"weight",catX,65,16,20,340)
+        histo[66][x] = makeCategoryHisto(dfwwvbscat[x] ,"etal1","weight",catX,66,12,0,2.4)
+        histo[67][x] = makeCategoryHisto(dfwwbvbscat[x],"etal1","weight",catX,67,12,0,2.4)
+        histo[68][x] = makeCategoryHisto(dfwwvbscat[x] ,"etal2","weight",catX,68,12,0,2.4)
+        histo[69][x] = makeCategoryHisto(dfwwbvbscat[x],"etal2","weight",catX,69,12,0,2.4)
+
+        histo[86][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} < 140".format(altMass)),"mll{0}".format(altMass),"weight",catX,86,24,20,140)
+        histo[87][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} < 140".format(altMass)),"mll{0}".format(altMass),"weight",catX,87,24,20,140)
+        histo[88][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} <  80".format(altMass)),"ltype","weight",catX,88,4,-0.5,3.5)
+        histo[89][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} <  80".format(altMass)),"ltype","weight",catX,89,4,-0.5,3.5)
+        histo[90][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} <  80".format(altMass)),"ptll{0}".format(altMass),"weight",catX,90,20,0,200)
+        histo[91][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} <  80".format(altMass)),"ptll{0}".format(altMass),"weight",catX,91,20,0,200)
+        histo[92][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj < 900 && mll{0} <  80".format(altMass)),"PuppiMET_pt{0}".format(altMass),"weight",catX,92,20,30,230)
+        histo[93][x] = makeCategoryHisto(dfwwvbscat[x].Filter("vbs_mjj > 900 && mll{0} <  80".format(altMass)),"PuppiMET_pt{0}".format(altMass),"weight",catX,93,20,30,230)
+        histo[94][x] = makeCategoryHisto(dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 0    ".format(altMass)),"mll{0}".format(altMass),"weight",catX,94,24,20,140)
+        histo[95][x] = makeCategoryHisto(dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 1    ".format(altMass)),"mll{0}".format(altMass),"weight",catX,95,24,20,140)
+        histo[96][x] = makeCategoryHisto(dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 2    ".format(altMass)),"mll{0}".format(altMass),"weight",catX,96,24,20,140)
+        histo[97][x] = makeCategoryHisto(dfwwvbscat[x].Filter("mll{0} < 140 && ltype == 3    ".format(altMass)),"mll{0}".format(altMass),"weight",catX,97,24,20,140)
 
         dfwwjjcat .append(dfwwcat[x] .Filter("PuppiMET_pt{0} > {1}".format(altMass,metCut), "PuppiMET_pt > cut").Filter(VBSQCDSEL, "dijet non-vbf selection"))
         dfwwbjjcat.append(dfwwbcat[x].Filter("PuppiMET_pt{0} > {1}".format(altMass,metCut), "PuppiMET_pt > cut").Filter(VBSQCDSEL, "dijet non-vbf selection"))
-        histo[40][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(40,x), "histo_{0}_{1}".format(40,x), 14,0.0,7), "vbs_detajj","weight")
-        histo[41][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(41,x), "histo_{0}_{1}".format(41,x), 14,0.0,7), "vbs_detajj","weight")
-        histo[42][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(42,x), "histo_{0}_{1}".format(42,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[43][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(43,x), "histo_{0}_{1}".format(43,x), 4,-0.5, 3.5), "ltype","weight")
-        histo[44][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(44,x), "histo_{0}_{1}".format(44,x), 4, 1.5, 5.5), "ngood_jets","weight")
-        histo[45][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(45,x), "histo_{0}_{1}".format(45,x), 4, 1.5, 5.5), "ngood_jets","weight")
-        histo[46][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(46,x), "histo_{0}_{1}".format(46,x),25, 50, 300), "vbs_ptj1","weight")
-        histo[47][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(47,x), "histo_{0}_{1}".format(47,x),25, 50, 300), "vbs_ptj1","weight")
-        histo[48][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(48,x), "histo_{0}_{1}".format(48,x),25, 50, 300), "vbs_ptj2","weight")
-        histo[49][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(49,x), "histo_{0}_{1}".format(49,x),25, 50, 300), "vbs_ptj2","weight")
-        histo[50][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(50,x), "histo_{0}_{1}".format(50,x),25, 0, 5), "vbs_etaj1","weight")
-        histo[51][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(51,x), "histo_{0}_{1}".format(51,x),25, 0, 5), "vbs_etaj1","weight")
-        histo[52][x] = dfwwjjcat[x] .Histo1D(("histo_{0}_{1}".format(52,x), "histo_{0}_{1}".format(52,x),25, 0, 5), "vbs_etaj2","weight")
-        histo[53][x] = dfwwbjjcat[x].Histo1D(("histo_{0}_{1}".format(53,x), "histo_{0}_{1}".format(53,x),25, 0, 5), "vbs_etaj2","weight")
-
-        if(doNtuples == True and x == theCat):
+        histo[40][x] = makeCategoryHisto(dfwwjjcat[x] ,"vbs_detajj","weight",catX,40,14,0.0,7)
+        histo[41][x] = makeCategoryHisto(dfwwbjjcat[x],"vbs_detajj","weight",catX,41,14,0.0,7)
+        histo[42][x] = makeCategoryHisto(dfwwjjcat[x] ,"ltype","weight",catX,42,4,-0.5,3.5)
+        histo[43][x] = makeCategoryHisto(dfwwbjjcat[x],"ltype","weight",catX,43,4,-0.5,3.5)
+        histo[44][x] = makeCategoryHisto(dfwwjjcat[x] ,"ngood_jets","weight",catX,44,4,1.5,5.5)
+        histo[45][x] = makeCategoryHisto(dfwwbjjcat[x],"ngood_jets","weight",catX,45,4,1.5,5.5)
+        histo[46][x] = makeCategoryHisto(dfwwjjcat[x] ,"vbs_ptj1","weight",catX,46,25,50,300)
+        histo[47][x] = makeCategoryHisto(dfwwbjjcat[x],"vbs_ptj1","weight",catX,47,25,50,300)
+        histo[48][x] = makeCategoryHisto(dfwwjjcat[x] ,"vbs_ptj2","weight",catX,48,25,50,300)
+        histo[49][x] = makeCategoryHisto(dfwwbjjcat[x],"vbs_ptj2","weight",catX,49,25,50,300)
+        histo[50][x] = makeCategoryHisto(dfwwjjcat[x] ,"vbs_etaj1","weight",catX,50,25,0,5)
+        histo[51][x] = makeCategoryHisto(dfwwbjjcat[x],"vbs_etaj1","weight",catX,51,25,0,5)
+        histo[52][x] = makeCategoryHisto(dfwwjjcat[x] ,"vbs_etaj2","weight",catX,52,25,0,5)
+        histo[53][x] = makeCategoryHisto(dfwwbjjcat[x],"vbs_etaj2","weight",catX,53,25,0,5)
+
+        if(doNtuples == True and (useCategoryAxis == True or x == theCat)):
             outputFile = "ntupleSSWWAna_sample{0}_year{1}_job{2}.root".format(count,year,whichJob)
-            dfwwvbscat[x].Snapshot("events", outputFile, branchList)
-
-        histo[ 99][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format( 99,x), "histo_{0}_{1}".format( 99,x),12,500,3500), "vbs_mjj","weight")
-        histo[100][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(100,x), "histo_{0}_{1}".format(100,x),12,500,3500), "vbs_mjj","weight0")
-        histo[101][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(101,x), "histo_{0}_{1}".format(101,x),12,500,3500), "vbs_mjj","weight1")
-        histo[102][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(102,x), "histo_{0}_{1}".format(102,x),12,500,3500), "vbs_mjj","weight2")
-        histo[103][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(103,x), "histo_{0}_{1}".format(103,x),12,500,3500), "vbs_mjj","weight3")
-        histo[104][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(104,x), "histo_{0}_{1}".format(104,x),12,500,3500), "vbs_mjj","weight4")
-        histo[105][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(105,x), "histo_{0}_{1}".format(105,x),12,500,3500), "vbs_mjj","weight5")
-        histo[106][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(106,x), "histo_{0}_{1}".format(106,x),12,500,3500), "vbs_mjj","weight6")
-        histo[107][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(107,x), "histo_{0}_{1}".format(107,x),12,500,3500), "vbs_mjj","weight7")
-        histo[108][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(108,x), "histo_{0}_{1}".format(108,x),12,500,3500), "vbs_mjj","weightWSUnc0")
-        histo[109][x] = dfwwvbscat[x].Histo1D(("histo_{0}_{1}".format(109,x), "histo_{0}_{1}".format(109,x),12,500,3500), "vbs_mjj","weightWSUnc1")
+            selectCategory(dfwwvbscat[x],catX,theCat).Snapshot("events", outputFile, branchList)
+
+        histo[ 99][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight",catX,99,12,500,3500)
+        histo[100][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight0",catX,100,12,500,3500)
+        histo[101][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight1",catX,101,12,500,3500)
+        histo[102][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight2",catX,102,12,500,3500)
+        histo[103][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight3",catX,103,12,500,3500)
+        histo[104][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight4",catX,104,12,500,3500)
+        histo[105][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight5",catX,105,12,500,3500)
+        histo[106][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight6",catX,106,12,500,3500)
+        histo[107][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weight7",catX,107,12,500,3500)
+        histo[108][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weightWSUnc0",catX,108,12,500,3500)
+        histo[109][x] = makeCategoryHisto(dfwwvbscat[x],"vbs_mjj","weightWSUnc1",catX,109,12,500,3500)
 
         x1Bins = array('d', [0.0,0.1,0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.9,1.0])
         x2Bins = array('d', [0.0,0.1,0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.9,1.0])
@@ -733,12 +712,12 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
                 x1Bins = array('d', [2.5,3.0,3.6,4.0,4.5,5.0,5.5,6.0,7.0])
             elif(makeDataCards == 10):
                 x1Bins = array('d', [0.0,0.9,1.8,2.1,2.5,2.7,2.9,3.0,3.1416])
-            histo[110][x] = dfwwvbscat[x] .Histo1D(("histo_{0}_{1}".format(110,x), "histo_{0}_{1}".format(110,x),len(x1Bins)-1,x1Bins), "finalVar","weight")
+            histo[110][x] = makeCategoryHistoVar(dfwwvbscat[x] ,"finalVar","weight",catX,110,x1Bins)
 
             x2Bins = array('d', [-0.5,0.5,1.5,2.5,3.5])
             if(makeDataCards == 6 or makeDataCards == 7 or makeDataCards == 8 or makeDataCards == 9 or makeDataCards == 10):
                 x2Bins = x1Bins
-            histo[111][x] = dfwwbvbscat[x].Histo1D(("histo_{0}_{1}".format(111,x), "histo_{0}_{1}".format(111,x),len(x2Bins)-1,x2Bins), "finalVar","weight")
+            histo[111][x] = makeCategoryHistoVar(dfwwbvbscat[x],"finalVar","weight",catX,111,x2Bins)
 
             # loop over Njets for ssww and sswwb regions (njets >= 2)
             for nj in range(0,1):
@@ -749,168 +728,183 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
                 startF = 0+nj*400
                 if(nj == 0):
                     for nv in range(0,136):
-                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwvbs2Jcat[x],"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,nv)
+                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwvbs2Jcat[x],"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,nv)
                 elif(nj == 1):
                     for nv in range(0,136):
-                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwvbs3Jcat[x],"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,nv)
+                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwvbs3Jcat[x],"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,nv)
                 elif(nj == 2):
                     for nv in range(0,136):
-                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwvbs4Jcat[x],"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,nv)
-                histo2D[startF+136][x]    = makeFinalVariable2DVar(dfwwvbscatMuonMomUp    [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,136)
-                histo2D[startF+137][x]    = makeFinalVariable2DVar(dfwwvbscatElectronMomUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,137)
-                histo2D[startF+138][x]    = makeFinalVariable2DVar(dfwwvbscatJes00Up      [x].Filter("ngood_jetsJes00Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,138)
-                histo2D[startF+139][x]    = makeFinalVariable2DVar(dfwwvbscatJes01Up      [x].Filter("ngood_jetsJes01Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,139)
-                histo2D[startF+140][x]    = makeFinalVariable2DVar(dfwwvbscatJes02Up      [x].Filter("ngood_jetsJes02Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,140)
-                histo2D[startF+141][x]    = makeFinalVariable2DVar(dfwwvbscatJes03Up      [x].Filter("ngood_jetsJes03Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,141)
-                histo2D[startF+142][x]    = makeFinalVariable2DVar(dfwwvbscatJes04Up      [x].Filter("ngood_jetsJes04Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,142)
-                histo2D[startF+143][x]    = makeFinalVariable2DVar(dfwwvbscatJes05Up      [x].Filter("ngood_jetsJes05Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,143)
-                histo2D[startF+144][x]    = makeFinalVariable2DVar(dfwwvbscatJes06Up      [x].Filter("ngood_jetsJes06Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,144)
-                histo2D[startF+145][x]    = makeFinalVariable2DVar(dfwwvbscatJes07Up      [x].Filter("ngood_jetsJes07Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,145)
-                histo2D[startF+146][x]    = makeFinalVariable2DVar(dfwwvbscatJes08Up      [x].Filter("ngood_jetsJes08Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,146)
-                histo2D[startF+147][x]    = makeFinalVariable2DVar(dfwwvbscatJes09Up      [x].Filter("ngood_jetsJes09Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,147)
-                histo2D[startF+148][x]    = makeFinalVariable2DVar(dfwwvbscatJes10Up      [x].Filter("ngood_jetsJes10Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,148)
-                histo2D[startF+149][x]    = makeFinalVariable2DVar(dfwwvbscatJes11Up      [x].Filter("ngood_jetsJes11Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,149)
-                histo2D[startF+150][x]    = makeFinalVariable2DVar(dfwwvbscatJes12Up      [x].Filter("ngood_jetsJes12Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,150)
-                histo2D[startF+151][x]    = makeFinalVariable2DVar(dfwwvbscatJes13Up      [x].Filter("ngood_jetsJes13Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,151)
-                histo2D[startF+152][x]    = makeFinalVariable2DVar(dfwwvbscatJes14Up      [x].Filter("ngood_jetsJes14Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,152)
-                histo2D[startF+153][x]    = makeFinalVariable2DVar(dfwwvbscatJes15Up      [x].Filter("ngood_jetsJes15Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,153)
-                histo2D[startF+154][x]    = makeFinalVariable2DVar(dfwwvbscatJes16Up      [x].Filter("ngood_jetsJes16Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,154)
-                histo2D[startF+155][x]    = makeFinalVariable2DVar(dfwwvbscatJes17Up      [x].Filter("ngood_jetsJes17Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,155)
-                histo2D[startF+156][x]    = makeFinalVariable2DVar(dfwwvbscatJes18Up      [x].Filter("ngood_jetsJes18Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,156)
-                histo2D[startF+157][x]    = makeFinalVariable2DVar(dfwwvbscatJes19Up      [x].Filter("ngood_jetsJes19Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,157)
-                histo2D[startF+158][x]    = makeFinalVariable2DVar(dfwwvbscatJes20Up      [x].Filter("ngood_jetsJes20Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,158)
-                histo2D[startF+159][x]    = makeFinalVariable2DVar(dfwwvbscatJes21Up      [x].Filter("ngood_jetsJes21Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,159)
-                histo2D[startF+160][x]    = makeFinalVariable2DVar(dfwwvbscatJes22Up      [x].Filter("ngood_jetsJes22Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,160)
-                histo2D[startF+161][x]    = makeFinalVariable2DVar(dfwwvbscatJes23Up      [x].Filter("ngood_jetsJes23Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,161)
-                histo2D[startF+162][x]    = makeFinalVariable2DVar(dfwwvbscatJes24Up      [x].Filter("ngood_jetsJes24Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,162)
-                histo2D[startF+163][x]    = makeFinalVariable2DVar(dfwwvbscatJes25Up      [x].Filter("ngood_jetsJes25Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,163)
-                histo2D[startF+164][x]    = makeFinalVariable2DVar(dfwwvbscatJes26Up      [x].Filter("ngood_jetsJes26Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,164)
-                histo2D[startF+165][x]    = makeFinalVariable2DVar(dfwwvbscatJes27Up      [x].Filter("ngood_jetsJes27Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,165)
-                histo2D[startF+166][x]    = makeFinalVariable2DVar(dfwwvbscatJerUp        [x].Filter("ngood_jetsJerUp  {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,166)
-                histo2D[startF+167][x]    = makeFinalVariable2DVar(dfwwvbscatJERUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,167)
-                histo2D[startF+168][x]    = makeFinalVariable2DVar(dfwwvbscatJESUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,168)
-                histo2D[startF+169][x]    = makeFinalVariable2DVar(dfwwvbscatUnclusteredUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x1Bins,yBins,169)
-                if(x == plotCategory("kPlotWS")):
+                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwvbs4Jcat[x],"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,nv)
+                histo2D[startF+136][x]    = makeFinalVariable2DVar(dfwwvbscatMuonMomUp    [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,136)
+                histo2D[startF+137][x]    = makeFinalVariable2DVar(dfwwvbscatElectronMomUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,137)
+                histo2D[startF+138][x]    = makeFinalVariable2DVar(dfwwvbscatJes00Up      [x].Filter("ngood_jetsJes00Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,138)
+                histo2D[startF+139][x]    = makeFinalVariable2DVar(dfwwvbscatJes01Up      [x].Filter("ngood_jetsJes01Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,139)
+                histo2D[startF+140][x]    = makeFinalVariable2DVar(dfwwvbscatJes02Up      [x].Filter("ngood_jetsJes02Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,140)
+                histo2D[startF+141][x]    = makeFinalVariable2DVar(dfwwvbscatJes03Up      [x].Filter("ngood_jetsJes03Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,141)
+                histo2D[startF+142][x]    = makeFinalVariable2DVar(dfwwvbscatJes04Up      [x].Filter("ngood_jetsJes04Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,142)
+                histo2D[startF+143][x]    = makeFinalVariable2DVar(dfwwvbscatJes05Up      [x].Filter("ngood_jetsJes05Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,143)
+                histo2D[startF+144][x]    = makeFinalVariable2DVar(dfwwvbscatJes06Up      [x].Filter("ngood_jetsJes06Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,144)
+                histo2D[startF+145][x]    = makeFinalVariable2DVar(dfwwvbscatJes07Up      [x].Filter("ngood_jetsJes07Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,145)
+                histo2D[startF+146][x]    = makeFinalVariable2DVar(dfwwvbscatJes08Up      [x].Filter("ngood_jetsJes08Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,146)
+                histo2D[startF+147][x]    = makeFinalVariable2DVar(dfwwvbscatJes09Up      [x].Filter("ngood_jetsJes09Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,147)
+                histo2D[startF+148][x]    = makeFinalVariable2DVar(dfwwvbscatJes10Up      [x].Filter("ngood_jetsJes10Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,148)
+                histo2D[startF+149][x]    = makeFinalVariable2DVar(dfwwvbscatJes11Up      [x].Filter("ngood_jetsJes11Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,149)
+                histo2D[startF+150][x]    = makeFinalVariable2DVar(dfwwvbscatJes12Up      [x].Filter("ngood_jetsJes12Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,150)
+                histo2D[startF+151][x]    = makeFinalVariable2DVar(dfwwvbscatJes13Up      [x].Filter("ngood_jetsJes13Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,151)
+                histo2D[startF+152][x]    = makeFinalVariable2DVar(dfwwvbscatJes14Up      [x].Filter("ngood_jetsJes14Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,152)
+                histo2D[startF+153][x]    = makeFinalVariable2DVar(dfwwvbscatJes15Up      [x].Filter("ngood_jetsJes15Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,153)
+                histo2D[startF+154][x]    = makeFinalVariable2DVar(dfwwvbscatJes16Up      [x].Filter("ngood_jetsJes16Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,154)
+                histo2D[startF+155][x]    = makeFinalVariable2DVar(dfwwvbscatJes17Up      [x].Filter("ngood_jetsJes17Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,155)
+                histo2D[startF+156][x]    = makeFinalVariable2DVar(dfwwvbscatJes18Up      [x].Filter("ngood_jetsJes18Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,156)
+                histo2D[startF+157][x]    = makeFinalVariable2DVar(dfwwvbscatJes19Up      [x].Filter("ngood_jetsJes19Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,157)
+                histo2D[startF+158][x]    = makeFinalVariable2DVar(dfwwvbscatJes20Up      [x].Filter("ngood_jetsJes20Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,158)
+                histo2D[startF+159][x]    = makeFinalVariable2DVar(dfwwvbscatJes21Up      [x].Filter("ngood_jetsJes21Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,159)
+                histo2D[startF+160][x]    = makeFinalVariable2DVar(dfwwvbscatJes22Up      [x].Filter("ngood_jetsJes22Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,160)
+                histo2D[startF+161][x]    = makeFinalVariable2DVar(dfwwvbscatJes23Up      [x].Filter("ngood_jetsJes23Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,161)
+                histo2D[startF+162][x]    = makeFinalVariable2DVar(dfwwvbscatJes24Up      [x].Filter("ngood_jetsJes24Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,162)
+                histo2D[startF+163][x]    = makeFinalVariable2DVar(dfwwvbscatJes25Up      [x].Filter("ngood_jetsJes25Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,163)
+                histo2D[startF+164][x]    = makeFinalVariable2DVar(dfwwvbscatJes26Up      [x].Filter("ngood_jetsJes26Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,164)
+                histo2D[startF+165][x]    = makeFinalVariable2DVar(dfwwvbscatJes27Up      [x].Filter("ngood_jetsJes27Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,165)
+                histo2D[startF+166][x]    = makeFinalVariable2DVar(dfwwvbscatJerUp        [x].Filter("ngood_jetsJerUp  {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,166)
+                histo2D[startF+167][x]    = makeFinalVariable2DVar(dfwwvbscatJERUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,167)
+                histo2D[startF+168][x]    = makeFinalVariable2DVar(dfwwvbscatJESUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,168)
+                histo2D[startF+169][x]    = makeFinalVariable2DVar(dfwwvbscatUnclusteredUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x1Bins,yBins,169)
+                if(useCategoryAxis == True or x == plotCategory("kPlotWS")):
                     startWS = 0+nj*4
                     if(nj == 0):
-                        histoWS[0+startWS] = dfwwvbs2Jcat[x].Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc0")
-                        histoWS[1+startWS] = dfwwvbs2Jcat[x].Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc1")
+                        dfWS = selectCategory(dfwwvbs2Jcat[x],catX,plotCategory("kPlotWS"))
+                        histoWS[0+startWS] = dfWS.Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc0")
+                        histoWS[1+startWS] = dfWS.Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc1")
                     elif(nj == 1):
-                        histoWS[0+startWS] = dfwwvbs3Jcat[x].Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc0")
-                        histoWS[1+startWS] = dfwwvbs3Jcat[x].Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc1")
+                        dfWS = selectCategory(dfwwvbs3Jcat[x],catX,plotCategory("kPlotWS"))
+                        histoWS[0+startWS] = dfWS.Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc0")
+                        histoWS[1+startWS] = dfWS.Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc1")
                     elif(nj == 2):
-                        histoWS[0+startWS] = dfwwvbs4Jcat[x].Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc0")
-                        histoWS[1+startWS] = dfwwvbs4Jcat[x].Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc1")
-                if(x == plotCategory("kPlotNonPrompt")):
+                        dfWS = selectCategory(dfwwvbs4Jcat[x],catX,plotCategory("kPlotWS"))
+                        histoWS[0+startWS] = dfWS.Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc0")
+                        histoWS[1+startWS] = dfWS.Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x1Bins)-1,x1Bins), "finalVar","weightWSUnc1")
+                if(useCategoryAxis == True or x == plotCategory("kPlotNonPrompt")):
                     startNonPrompt = 0+nj*12
                     if(nj == 0):
-                        histoNonPrompt[0+startNonPrompt] = dfwwvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm0")
-                        histoNonPrompt[1+startNonPrompt] = dfwwvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm1")
-                        histoNonPrompt[2+startNonPrompt] = dfwwvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm2")
-                        histoNonPrompt[3+startNonPrompt] = dfwwvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte0")
-                        histoNonPrompt[4+startNonPrompt] = dfwwvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte1")
-                        histoNonPrompt[5+startNonPrompt] = dfwwvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte2")
+                        dfNonPrompt = selectCategory(dfwwvbs2Jcat[x],catX,plotCategory("kPlotNonPrompt"))
+                        histoNonPrompt[0+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm0")
+                        histoNonPrompt[1+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm1")
+                        histoNonPrompt[2+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm2")
+                        histoNonPrompt[3+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte0")
+                        histoNonPrompt[4+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte1")
+                        histoNonPrompt[5+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte2")
                     elif(nj == 1):
-                        histoNonPrompt[0+startNonPrompt] = dfwwvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm0")
-                        histoNonPrompt[1+startNonPrompt] = dfwwvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm1")
-                        histoNonPrompt[2+startNonPrompt] = dfwwvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm2")
-                        histoNonPrompt[3+startNonPrompt] = dfwwvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte0")
-                        histoNonPrompt[4+startNonPrompt] = dfwwvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte1")
-                        histoNonPrompt[5+startNonPrompt] = dfwwvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte2")
+                        dfNonPrompt = selectCategory(dfwwvbs3Jcat[x],catX,plotCategory("kPlotNonPrompt"))
+                        histoNonPrompt[0+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm0")
+                        histoNonPrompt[1+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm1")
+                        histoNonPrompt[2+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm2")
+                        histoNonPrompt[3+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte0")
+                        histoNonPrompt[4+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte1")
+                        histoNonPrompt[5+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte2")
                     elif(nj == 2):
-                        histoNonPrompt[0+startNonPrompt] = dfwwvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm0")
-                        histoNonPrompt[1+startNonPrompt] = dfwwvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm1")
-                        histoNonPrompt[2+startNonPrompt] = dfwwvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm2")
-                        histoNonPrompt[3+startNonPrompt] = dfwwvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte0")
-                        histoNonPrompt[4+startNonPrompt] = dfwwvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte1")
-                        histoNonPrompt[5+startNonPrompt] = dfwwvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte2")
+                        dfNonPrompt = selectCategory(dfwwvbs4Jcat[x],catX,plotCategory("kPlotNonPrompt"))
+                        histoNonPrompt[0+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm0")
+                        histoNonPrompt[1+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm1")
+                        histoNonPrompt[2+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAltm2")
+                        histoNonPrompt[3+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte0")
+                        histoNonPrompt[4+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte1")
+                        histoNonPrompt[5+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x1Bins)-1,x1Bins), "finalVar","weightFakeAlte2")
 
                 startF = 200+nj*400
                 if(nj == 0):
                     for nv in range(0,136):
-                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwbvbs2Jcat[x],"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,nv)
+                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwbvbs2Jcat[x],"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,nv)
                 elif(nj == 1):
                     for nv in range(0,136):
-                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwbvbs3Jcat[x],"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,nv)
+                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwbvbs3Jcat[x],"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,nv)
                 elif(nj == 2):
                     for nv in range(0,136):
-                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwbvbs4Jcat[x],"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,nv)
-                histo2D[startF+136][x]    = makeFinalVariable2DVar(dfwwbvbscatMuonMomUp    [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,136)
-                histo2D[startF+137][x]    = makeFinalVariable2DVar(dfwwbvbscatElectronMomUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,137)
-                histo2D[startF+138][x]    = makeFinalVariable2DVar(dfwwbvbscatJes00Up      [x].Filter("ngood_jetsJes00Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,138)
-                histo2D[startF+139][x]    = makeFinalVariable2DVar(dfwwbvbscatJes01Up      [x].Filter("ngood_jetsJes01Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,139)
-                histo2D[startF+140][x]    = makeFinalVariable2DVar(dfwwbvbscatJes02Up      [x].Filter("ngood_jetsJes02Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,140)
-                histo2D[startF+141][x]    = makeFinalVariable2DVar(dfwwbvbscatJes03Up      [x].Filter("ngood_jetsJes03Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,141)
-                histo2D[startF+142][x]    = makeFinalVariable2DVar(dfwwbvbscatJes04Up      [x].Filter("ngood_jetsJes04Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,142)
-                histo2D[startF+143][x]    = makeFinalVariable2DVar(dfwwbvbscatJes05Up      [x].Filter("ngood_jetsJes05Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,143)
-                histo2D[startF+144][x]    = makeFinalVariable2DVar(dfwwbvbscatJes06Up      [x].Filter("ngood_jetsJes06Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,144)
-                histo2D[startF+145][x]    = makeFinalVariable2DVar(dfwwbvbscatJes07Up      [x].Filter("ngood_jetsJes07Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,145)
-                histo2D[startF+146][x]    = makeFinalVariable2DVar(dfwwbvbscatJes08Up      [x].Filter("ngood_jetsJes08Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,146)
-                histo2D[startF+147][x]    = makeFinalVariable2DVar(dfwwbvbscatJes09Up      [x].Filter("ngood_jetsJes09Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,147)
-                histo2D[startF+148][x]    = makeFinalVariable2DVar(dfwwbvbscatJes10Up      [x].Filter("ngood_jetsJes10Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,148)
-                histo2D[startF+149][x]    = makeFinalVariable2DVar(dfwwbvbscatJes11Up      [x].Filter("ngood_jetsJes11Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,149)
-                histo2D[startF+150][x]    = makeFinalVariable2DVar(dfwwbvbscatJes12Up      [x].Filter("ngood_jetsJes12Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,150)
-                histo2D[startF+151][x]    = makeFinalVariable2DVar(dfwwbvbscatJes13Up      [x].Filter("ngood_jetsJes13Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,151)
-                histo2D[startF+152][x]    = makeFinalVariable2DVar(dfwwbvbscatJes14Up      [x].Filter("ngood_jetsJes14Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,152)
-                histo2D[startF+153][x]    = makeFinalVariable2DVar(dfwwbvbscatJes15Up      [x].Filter("ngood_jetsJes15Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,153)
-                histo2D[startF+154][x]    = makeFinalVariable2DVar(dfwwbvbscatJes16Up      [x].Filter("ngood_jetsJes16Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,154)
-                histo2D[startF+155][x]    = makeFinalVariable2DVar(dfwwbvbscatJes17Up      [x].Filter("ngood_jetsJes17Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,155)
-                histo2D[startF+156][x]    = makeFinalVariable2DVar(dfwwbvbscatJes18Up      [x].Filter("ngood_jetsJes18Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,156)
-                histo2D[startF+157][x]    = makeFinalVariable2DVar(dfwwbvbscatJes19Up      [x].Filter("ngood_jetsJes19Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,157)
-                histo2D[startF+158][x]    = makeFinalVariable2DVar(dfwwbvbscatJes20Up      [x].Filter("ngood_jetsJes20Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,158)
-                histo2D[startF+159][x]    = makeFinalVariable2DVar(dfwwbvbscatJes21Up      [x].Filter("ngood_jetsJes21Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,159)
-                histo2D[startF+160][x]    = makeFinalVariable2DVar(dfwwbvbscatJes22Up      [x].Filter("ngood_jetsJes22Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,160)
-                histo2D[startF+161][x]    = makeFinalVariable2DVar(dfwwbvbscatJes23Up      [x].Filter("ngood_jetsJes23Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,161)
-                histo2D[startF+162][x]    = makeFinalVariable2DVar(dfwwbvbscatJes24Up      [x].Filter("ngood_jetsJes24Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,162)
-                histo2D[startF+163][x]    = makeFinalVariable2DVar(dfwwbvbscatJes25Up      [x].Filter("ngood_jetsJes25Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,163)
-                histo2D[startF+164][x]    = makeFinalVariable2DVar(dfwwbvbscatJes26Up      [x].Filter("ngood_jetsJes26Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,164)
-                histo2D[startF+165][x]    = makeFinalVariable2DVar(dfwwbvbscatJes27Up      [x].Filter("ngood_jetsJes27Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,165)
-                histo2D[startF+166][x]    = makeFinalVariable2DVar(dfwwbvbscatJerUp        [x].Filter("ngood_jetsJerUp  {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,166)
-                histo2D[startF+167][x]    = makeFinalVariable2DVar(dfwwbvbscatJERUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,167)
-                histo2D[startF+168][x]    = makeFinalVariable2DVar(dfwwbvbscatJESUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,168)
-                histo2D[startF+169][x]    = makeFinalVariable2DVar(dfwwbvbscatUnclusteredUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,x,x2Bins,yBins,169)
-                if(x == plotCategory("kPlotWS")):
+                        histo2D[startF+nv][x] = makeFinalVariable2DVar(dfwwbvbs4Jcat[x],"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,nv)
+                histo2D[startF+136][x]    = makeFinalVariable2DVar(dfwwbvbscatMuonMomUp    [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,136)
+                histo2D[startF+137][x]    = makeFinalVariable2DVar(dfwwbvbscatElectronMomUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,137)
+                histo2D[startF+138][x]    = makeFinalVariable2DVar(dfwwbvbscatJes00Up      [x].Filter("ngood_jetsJes00Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,138)
+                histo2D[startF+139][x]    = makeFinalVariable2DVar(dfwwbvbscatJes01Up      [x].Filter("ngood_jetsJes01Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,139)
+                histo2D[startF+140][x]    = makeFinalVariable2DVar(dfwwbvbscatJes02Up      [x].Filter("ngood_jetsJes02Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,140)
+                histo2D[startF+141][x]    = makeFinalVariable2DVar(dfwwbvbscatJes03Up      [x].Filter("ngood_jetsJes03Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,141)
+                histo2D[startF+142][x]    = makeFinalVariable2DVar(dfwwbvbscatJes04Up      [x].Filter("ngood_jetsJes04Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,142)
+                histo2D[startF+143][x]    = makeFinalVariable2DVar(dfwwbvbscatJes05Up      [x].Filter("ngood_jetsJes05Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,143)
+                histo2D[startF+144][x]    = makeFinalVariable2DVar(dfwwbvbscatJes06Up      [x].Filter("ngood_jetsJes06Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,144)
+                histo2D[startF+145][x]    = makeFinalVariable2DVar(dfwwbvbscatJes07Up      [x].Filter("ngood_jetsJes07Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,145)
+                histo2D[startF+146][x]    = makeFinalVariable2DVar(dfwwbvbscatJes08Up      [x].Filter("ngood_jetsJes08Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,146)
+                histo2D[startF+147][x]    = makeFinalVariable2DVar(dfwwbvbscatJes09Up      [x].Filter("ngood_jetsJes09Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,147)
+                histo2D[startF+148][x]    = makeFinalVariable2DVar(dfwwbvbscatJes10Up      [x].Filter("ngood_jetsJes10Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,148)
+                histo2D[startF+149][x]    = makeFinalVariable2DVar(dfwwbvbscatJes11Up      [x].Filter("ngood_jetsJes11Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,149)
+                histo2D[startF+150][x]    = makeFinalVariable2DVar(dfwwbvbscatJes12Up      [x].Filter("ngood_jetsJes12Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,150)
+                histo2D[startF+151][x]    = makeFinalVariable2DVar(dfwwbvbscatJes13Up      [x].Filter("ngood_jetsJes13Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,151)
+                histo2D[startF+152][x]    = makeFinalVariable2DVar(dfwwbvbscatJes14Up      [x].Filter("ngood_jetsJes14Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,152)
+                histo2D[startF+153][x]    = makeFinalVariable2DVar(dfwwbvbscatJes15Up      [x].Filter("ngood_jetsJes15Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,153)
+                histo2D[startF+154][x]    = makeFinalVariable2DVar(dfwwbvbscatJes16Up      [x].Filter("ngood_jetsJes16Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,154)
+                histo2D[startF+155][x]    = makeFinalVariable2DVar(dfwwbvbscatJes17Up      [x].Filter("ngood_jetsJes17Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,155)
+                histo2D[startF+156][x]    = makeFinalVariable2DVar(dfwwbvbscatJes18Up      [x].Filter("ngood_jetsJes18Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,156)
+                histo2D[startF+157][x]    = makeFinalVariable2DVar(dfwwbvbscatJes19Up      [x].Filter("ngood_jetsJes19Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,157)
+                histo2D[startF+158][x]    = makeFinalVariable2DVar(dfwwbvbscatJes20Up      [x].Filter("ngood_jetsJes20Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,158)
+                histo2D[startF+159][x]    = makeFinalVariable2DVar(dfwwbvbscatJes21Up      [x].Filter("ngood_jetsJes21Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,159)
+                histo2D[startF+160][x]    = makeFinalVariable2DVar(dfwwbvbscatJes22Up      [x].Filter("ngood_jetsJes22Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,160)
+                histo2D[startF+161][x]    = makeFinalVariable2DVar(dfwwbvbscatJes23Up      [x].Filter("ngood_jetsJes23Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,161)
+                histo2D[startF+162][x]    = makeFinalVariable2DVar(dfwwbvbscatJes24Up      [x].Filter("ngood_jetsJes24Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,162)
+                histo2D[startF+163][x]    = makeFinalVariable2DVar(dfwwbvbscatJes25Up      [x].Filter("ngood_jetsJes25Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,163)
+                histo2D[startF+164][x]    = makeFinalVariable2DVar(dfwwbvbscatJes26Up      [x].Filter("ngood_jetsJes26Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,164)
+                histo2D[startF+165][x]    = makeFinalVariable2DVar(dfwwbvbscatJes27Up      [x].Filter("ngood_jetsJes27Up{0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,165)
+                histo2D[startF+166][x]    = makeFinalVariable2DVar(dfwwbvbscatJerUp        [x].Filter("ngood_jetsJerUp  {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,166)
+                histo2D[startF+167][x]    = makeFinalVariable2DVar(dfwwbvbscatJERUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,167)
+                histo2D[startF+168][x]    = makeFinalVariable2DVar(dfwwbvbscatJESUp        [x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,168)
+                histo2D[startF+169][x]    = makeFinalVariable2DVar(dfwwbvbscatUnclusteredUp[x].Filter("ngood_jets       {0}".format(njStringCut)),"finalVar","theGenCat",theCat,startF,catX,x2Bins,yBins,169)
+                if(useCategoryAxis == True or x == plotCategory("kPlotWS")):
                     startWS = 2+nj*4
                     if(nj == 0):
-                        histoWS[0+startWS] = dfwwbvbs2Jcat[x].Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc0")
-                        histoWS[1+startWS] = dfwwbvbs2Jcat[x].Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc1")
+                        dfWS = selectCategory(dfwwbvbs2Jcat[x],catX,plotCategory("kPlotWS"))
+                        histoWS[0+startWS] = dfWS.Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc0")
+                        histoWS[1+startWS] = dfWS.Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc1")
                     elif(nj == 1):
-                        histoWS[0+startWS] = dfwwbvbs3Jcat[x].Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc0")
-                        histoWS[1+startWS] = dfwwbvbs3Jcat[x].Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc1")
+                        dfWS = selectCategory(dfwwbvbs3Jcat[x],catX,plotCategory("kPlotWS"))
+                        histoWS[0+startWS] = dfWS.Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc0")
+                        histoWS[1+startWS] = dfWS.Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc1")
                     elif(nj == 2):
-                        histoWS[0+startWS] = dfwwbvbs4Jcat[x].Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc0")
-                        histoWS[1+startWS] = dfwwbvbs4Jcat[x].Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc1")
-                if(x == plotCategory("kPlotNonPrompt")):
+                        dfWS = selectCategory(dfwwbvbs4Jcat[x],catX,plotCategory("kPlotWS"))
+                        histoWS[0+startWS] = dfWS.Histo1D(("histoWS_{0}".format(0+startWS), "histoWS_{0}".format(0+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc0")
+                        histoWS[1+startWS] = dfWS.Histo1D(("histoWS_{0}".format(1+startWS), "histoWS_{0}".format(1+startWS), len(x2Bins)-1,x2Bins), "finalVar","weightWSUnc1")
+                if(useCategoryAxis == True or x == plotCategory("kPlotNonPrompt")):
                     startNonPrompt = 6+nj*12
                     if(nj == 0):
-                        histoNonPrompt[0+startNonPrompt] = dfwwbvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm0")
-                        histoNonPrompt[1+startNonPrompt] = dfwwbvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm1")
-                        histoNonPrompt[2+startNonPrompt] = dfwwbvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm2")
-                        histoNonPrompt[3+startNonPrompt] = dfwwbvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte0")
-                        histoNonPrompt[4+startNonPrompt] = dfwwbvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte1")
-                        histoNonPrompt[5+startNonPrompt] = dfwwbvbs2Jcat[x].Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte2")
+                        dfNonPrompt = selectCategory(dfwwbvbs2Jcat[x],catX,plotCategory("kPlotNonPrompt"))
+                        histoNonPrompt[0+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm0")
+                        histoNonPrompt[1+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm1")
+                        histoNonPrompt[2+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm2")
+                        histoNonPrompt[3+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte0")
+                        histoNonPrompt[4+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte1")
+                        histoNonPrompt[5+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte2")
                     elif(nj == 1):
-                        histoNonPrompt[0+startNonPrompt] = dfwwbvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm0")
-                        histoNonPrompt[1+startNonPrompt] = dfwwbvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm1")
-                        histoNonPrompt[2+startNonPrompt] = dfwwbvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm2")
-                        histoNonPrompt[3+startNonPrompt] = dfwwbvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte0")
-                        histoNonPrompt[4+startNonPrompt] = dfwwbvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte1")
-                        histoNonPrompt[5+startNonPrompt] = dfwwbvbs3Jcat[x].Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte2")
+                        dfNonPrompt = selectCategory(dfwwbvbs3Jcat[x],catX,plotCategory("kPlotNonPrompt"))
+                        histoNonPrompt[0+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm0")
+                        histoNonPrompt[1+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm1")
+                        histoNonPrompt[2+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm2")
+                        histoNonPrompt[3+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte0")
+                        histoNonPrompt[4+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte1")
+                        histoNonPrompt[5+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte2")
                     elif(nj == 2):
-                        histoNonPrompt[0+startNonPrompt] = dfwwbvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm0")
-                        histoNonPrompt[1+startNonPrompt] = dfwwbvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm1")
-                        histoNonPrompt[2+startNonPrompt] = dfwwbvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm2")
-                        histoNonPrompt[3+startNonPrompt] = dfwwbvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte0")
-                        histoNonPrompt[4+startNonPrompt] = dfwwbvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte1")
-                        histoNonPrompt[5+startNonPrompt] = dfwwbvbs4Jcat[x].Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte2")
+                        dfNonPrompt = selectCategory(dfwwbvbs4Jcat[x],catX,plotCategory("kPlotNonPrompt"))
+                        histoNonPrompt[0+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(0+startNonPrompt), "histoNonPrompt_{0}".format(0+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm0")
+                        histoNonPrompt[1+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(1+startNonPrompt), "histoNonPrompt_{0}".format(1+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm1")
+                        histoNonPrompt[2+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(2+startNonPrompt), "histoNonPrompt_{0}".format(2+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAltm2")
+                        histoNonPrompt[3+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(3+startNonPrompt), "histoNonPrompt_{0}".format(3+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte0")
+                        histoNonPrompt[4+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(4+startNonPrompt), "histoNonPrompt_{0}".format(4+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte1")
+                        histoNonPrompt[5+startNonPrompt] = dfNonPrompt.Histo1D(("histoNonPrompt_{0}".format(5+startNonPrompt), "histoNonPrompt_{0}".format(5+startNonPrompt), len(x2Bins)-1,x2Bins), "finalVar","weightFakeAlte2")
 
     report = []
-    for x in range(nCat):
+    for x in range(nCatSel):
         report.append(dfwwvbscat[x].Report())
-        if(x != theCat): continue
+        if(useCategoryAxis == False and x != theCat): continue
         print("---------------- SUMMARY {0} -------------".format(x))
         report[x].Print()
 
+    unpackCategoryHistos(histo)
+    unpackCategoryHistos(histo2D)
+
     if(makeDataCards >= 1):
         for j in range(0,nHistoMVA):
             if((j >= 0 and j < 200) or (j >= 400 and j < 600) or (j >= 800 and j < 1000)):
@@ -980,51 +974,17 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
         histoNonPrompt[i].Write()
     myfile.Close()
 
-def readMCSample(sampleNOW,year,skimType,whichJob,group,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+    if(useJitCache == True):
+        jitCache.report()
+        jitCache.write()
+
+def readMCSample(sampleNOW,year,skimType,whichJob,group):
 
     files = getMClist(sampleNOW, skimType)
     print("Total files: {0}".format(len(files)))
 
-    genEventSumWeight = 0
-    genEventSumNoWeight = 0
-    nTheoryReplicas = [103, 9, 4]
-    genEventSumLHEScaleWeight = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-    genEventSumPSWeight = [0, 0, 0, 0, 0]
-
-    dfRuns = ROOT.RDataFrame("Runs", files)
-    genEventSumWeight = dfRuns.Sum("genEventSumw").GetValue()
-    genEventSumNoWeight = dfRuns.Sum("genEventCount").GetValue()
-    try:
-        if(dfRuns.Min("nLHEPdfSumw").GetValue() < nTheoryReplicas[0]):
-            nTheoryReplicas[0] = int(dfRuns.Min("nLHEPdfSumw").GetValue())
-    except Exception as e:
-        nTheoryReplicas[0] = 0
-    for n in range(9):
-        try:
-            if(dfRuns.Min("nLHEScaleSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumLHEScaleWeight{0}".format(n),"LHEScaleSumw[{0}]".format(n))
-                genEventSumLHEScaleWeight[n] = dfRuns.Sum("genEventSumLHEScaleWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[1] = int(dfRuns.Min("nLHEScaleSumw").GetValue())
-        except Exception as e:
-            genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[1] = n
-            print("Problem with LHEScaleWeights {0}".format(e))
-    for n in range(4):
-        try:
-            if(dfRuns.Min("nPSSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumPSWeight{0}".format(n),"PSSumw[{0}]".format(n))
-                genEventSumPSWeight[n] = dfRuns.Sum("genEventSumPSWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[2] = int(dfRuns.Min("nPSSumw").GetValue())
-        except Exception as e:
-            genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[2] = n
-            print("Problem with PSWeights {0}".format(e))
-    genEventSumPSWeight[4] = dfRuns.Count().GetValue()
-    runGetEntries = dfRuns.Count().GetValue()
+    fingerprint = getFileListFingerprint(files)
+    genEventSumWeight, genEventSumNoWeight, nTheoryReplicas, genEventSumLHEScaleWeight, genEventSumPSWeight, runGetEntries = getMCNormalization(sampleNOW, skimType, files, fingerprint)
 
     print("Number of Theory replicas: {0} / {1} / {2}".format(nTheoryReplicas[0],nTheoryReplicas[1],nTheoryReplicas[2]))
 
@@ -1048,7 +1008,7 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,ewkCorrWeights,wsWeights
     weightApprox = (SwitchSample(sampleNOW, skimType)[1] / genEventSumNoWeight)*getLumi(year)
 
     if(whichJob != -1):
-        groupedFile = groupFiles(files, group)
+        groupedFile = groupFiles(files, group, getFileWeights(files, SwitchSample(sampleNOW, skimType)[0], fingerprint))
         files = groupedFile[whichJob]
         if(len(files) == 0):
             print("no files in job/group: {0} / {1}".format(whichJob, group))
@@ -1063,9 +1023,9 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,ewkCorrWeights,wsWeights
 
     PDType = os.path.basename(SwitchSample(sampleNOW, skimType)[0]).split('+')[0]
 
-    analysis(df,sampleNOW,SwitchSample(sampleNOW,skimType)[2],weight,year,PDType,"false",whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+    analysis(df,sampleNOW,SwitchSample(sampleNOW,skimType)[2],weight,year,PDType,"false",whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
 
-def readDASample(sampleNOW,year,skimType,whichJob,group,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def readDASample(sampleNOW,year,skimType,whichJob,group):
 
     PDType = "0"
     if  (sampleNOW >= 1000 and sampleNOW <= 1009): PDType = "SingleMuon"
@@ -1095,7 +1055,7 @@ def readDASample(sampleNOW,year,skimType,whichJob,group,ewkCorrWeights,wsWeights
     nevents = df.Count().GetValue()
     print("%s entries in the dataset" %nevents)
 
-    analysis(df,sampleNOW,sampleNOW,weight,year,PDType,"true",whichJob,0,genEventSumLHEScaleRenorm,genEventSumPSRenorm,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+    analysis(df,sampleNOW,sampleNOW,weight,year,PDType,"true",whichJob,0,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
 
 if __name__ == "__main__":
 
@@ -1128,124 +1088,16 @@ if __name__ == "__main__":
         if opt == "--whichJob":
             whichJob = int(arg)
 
-    ewkCorrWeights = []
-    ewkCorrPath = "data/VV_NLO_LO_CMS_mjj.root"
-    fewkCorrFile = ROOT.TFile(ewkCorrPath)
-    ewkCorrWeights.append(fewkCorrFile.Get("hWW13p6_KF_CMS"))
-    ewkCorrWeights.append(fewkCorrFile.Get("hWZ13p0_KF_CMS"))
-    ewkCorrWeights.append(fewkCorrFile.Get("hWW13p6_KF_CMSUp"))
-    ewkCorrWeights.append(fewkCorrFile.Get("hWZ13p0_KF_CMSUp"))
-    for x in range(4):
-        ewkCorrWeights[x].SetDirectory(0)
-    fewkCorrFile.Close()
-
-    wsWeights = []
-    wsPath = "data/histoWSSF_{0}.root".format(year)
-    fwsFile = ROOT.TFile(wsPath)
-    wsWeights.append(fwsFile.Get("histoWSEtaSF"))
-    wsWeights.append(fwsFile.Get("histoWSEtaSF_unc"))
-    wsWeights.append(fwsFile.Get("histoWSEtaPtSF"))
-    for x in range(3):
-        wsWeights[x].SetDirectory(0)
-    fwsFile.Close()
-
-    puWeights = []
-    puPath = "data/puWeights_UL_{0}.root".format(year)
-    fPuFile = ROOT.TFile(puPath)
-    puWeights.append(fPuFile.Get("puWeights"))
-    puWeights.append(fPuFile.Get("puWeightsUp"))
-    puWeights.append(fPuFile.Get("puWeightsDown"))
-    for x in range(3):
-        puWeights[x].SetDirectory(0)
-    fPuFile.Close()
-
-    histoFakeEtaPt_mu = []
-    histoFakeEtaPt_el = []
-    fakePath = "data/histoFakeEtaPt_{0}.root".format(year)
+    fakeSource = "histoFakeEtaPt_{0}"
     if(whichAna == 3):
-        fakePath = "data/histoFakeEtaPt_ptlcone_{0}.root".format(year)
-    fFakeFile = ROOT.TFile(fakePath)
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType3".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType3".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType3".format(elSelChoice)))
-    for x in range(9):
-        histoFakeEtaPt_mu[x].SetDirectory(0)
-        histoFakeEtaPt_el[x].SetDirectory(0)
-    fFakeFile.Close()
-
-    lepSFPath = "data/histoLepSFEtaPt_{0}{1}.root".format(year,correctionString)
-    fLepSFFile = ROOT.TFile(lepSFPath)
-    histoLepSFEtaPt_mu = fLepSFFile.Get("histoLepSFEtaPt_0_{0}".format(muSelChoice))
-    histoLepSFEtaPt_el = fLepSFFile.Get("histoLepSFEtaPt_1_{0}".format(elSelChoice))
-    histoLepSFEtaPt_mu.SetDirectory(0)
-    histoLepSFEtaPt_el.SetDirectory(0)
-    fLepSFFile.Close()
-
-    triggerSFPath = "data/histoTriggerSFEtaPt_{0}.root".format(year)
-    fTriggerSFFile = ROOT.TFile(triggerSFPath)
-    histoTriggerSFEtaPt_0_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_0")
-    histoTriggerSFEtaPt_0_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_1")
-    histoTriggerSFEtaPt_0_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_2")
-    histoTriggerSFEtaPt_0_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_3")
-    histoTriggerSFEtaPt_1_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_0")
-    histoTriggerSFEtaPt_1_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_1")
-    histoTriggerSFEtaPt_1_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_2")
-    histoTriggerSFEtaPt_1_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_3")
-    histoTriggerSFEtaPt_2_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_0")
-    histoTriggerSFEtaPt_2_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_1")
-    histoTriggerSFEtaPt_2_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_2")
-    histoTriggerSFEtaPt_2_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_3")
-    histoTriggerSFEtaPt_3_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_0")
-    histoTriggerSFEtaPt_3_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_1")
-    histoTriggerSFEtaPt_3_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_2")
-    histoTriggerSFEtaPt_3_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_3")
-    histoTriggerSFEtaPt_0_0.SetDirectory(0)
-    histoTriggerSFEtaPt_0_1.SetDirectory(0)
-    histoTriggerSFEtaPt_0_2.SetDirectory(0)
-    histoTriggerSFEtaPt_0_3.SetDirectory(0)
-    histoTriggerSFEtaPt_1_0.SetDirectory(0)
-    histoTriggerSFEtaPt_1_1.SetDirectory(0)
-    histoTriggerSFEtaPt_1_2.SetDirectory(0)
-    histoTriggerSFEtaPt_1_3.SetDirectory(0)
-    histoTriggerSFEtaPt_2_0.SetDirectory(0)
-    histoTriggerSFEtaPt_2_1.SetDirectory(0)
-    histoTriggerSFEtaPt_2_2.SetDirectory(0)
-    histoTriggerSFEtaPt_2_3.SetDirectory(0)
-    histoTriggerSFEtaPt_3_0.SetDirectory(0)
-    histoTriggerSFEtaPt_3_1.SetDirectory(0)
-    histoTriggerSFEtaPt_3_2.SetDirectory(0)
-    histoTriggerSFEtaPt_3_3.SetDirectory(0)
-    fTriggerSFFile.Close()
-
-    BTVEffPath = "data/histoBtagEffSelEtaPt_{0}.root".format(year)
-    fBTVEffPathFile = ROOT.TFile(BTVEffPath)
-    histoBTVEffEtaPtLF = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(0+3*bTagSel))
-    histoBTVEffEtaPtCJ = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(1+3*bTagSel))
-    histoBTVEffEtaPtBJ = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(2+3*bTagSel))
-    histoBTVEffEtaPtLF.SetDirectory(0)
-    histoBTVEffEtaPtCJ.SetDirectory(0)
-    histoBTVEffEtaPtBJ.SetDirectory(0)
-    fBTVEffPathFile.Close()
+        fakeSource = "histoFakeEtaPt_ptlcone_{0}"
+    sfTables = getLeptonSFTables(muSelChoice,elSelChoice,bTagSel,"histoLepSFEtaPt_{0}"+correctionString,fakeSource) + getEWKCorrSFTables()
+    loadSFTables(year, sfTables)
 
     try:
         if(process >= 0 and process < 1000):
-            readMCSample(process,year,skimType,whichJob,group,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+            readMCSample(process,year,skimType,whichJob,group)
         elif(process >= 1000):
-            readDASample(process,year,skimType,whichJob,group,ewkCorrWeights,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+            readDASample(process,year,skimType,whichJob,group)
     except Exception as e:
         print("FAILED {0}".format(e))
@@ -50,6 +50,55 @@ class tmva_xml {
             }
         }
 
+        // Evaluates nSets input sets stored one after the other in x (nSets x nVariables)
+        // into out (nSets x nOutputs, resized only when needed). A set identical to the
+        // first one (the nominal) is not evaluated again, its outputs are copied. A set
+        // with pass[set] == 0 is not evaluated at all, its outputs are -999
+        void ComputeSets(const Vec_f &x, const Vec_i &pass, unsigned int nSets, Vec_f &out, unsigned long &nEvaluated, unsigned long &nSkipped, unsigned long &nFailed) {
+
+            const std::size_t numVars = fVariables.size();
+            if (x.size() != nSets * numVars)
+                throw std::runtime_error("Size of input vector is not equal to number of sets times number of variables.");
+            if (pass.size() != nSets)
+                throw std::runtime_error("Size of preselection vector is not equal to number of sets.");
+
+            for (unsigned int set = 0; set < nSets; set++) {
+                const float *xSet = x.data() + set * numVars;
+                if (pass[set] == 0) {
+                    nFailed++;
+                    continue;
+                }
+                if (set > 0 && pass[0] != 0 && std::equal(xSet, xSet + numVars, x.data())) {
+                    const std::size_t numOut = out.size() / nSets;
+                    std::copy(out.begin(), out.begin() + numOut, out.begin() + set * numOut);
+                    nSkipped++;
+                    continue;
+                }
+
+                for (std::size_t i = 0; i < numVars; i++) {
+                    fValues[i] = xSet[i];
+                }
+                nEvaluated++;
+
+                // Classification, no temporary vector
+                if (fAnalysisType == TMVA::Experimental::Internal::AnalysisType::Classification) {
+                    if (out.size() != nSets) out.resize(nSets);
+                    out[set] = static_cast<float>(fReader->EvaluateMVA(name));
+                }
+                // Regression and multiclass
+                else {
+                    const std::vector<float> res = Compute(Vec_f(xSet, xSet + numVars));
+                    if (out.size() != nSets * res.size()) out.resize(nSets * res.size());
+                    std::copy(res.begin(), res.end(), out.begin() + set * res.size());
+                }
+            }
+
+            const std::size_t numOut = out.size() / nSets;
+            for (unsigned int set = 0; set < nSets; set++) {
+                if (pass[set] == 0) std::fill(out.begin() + set * numOut, out.begin() + (set + 1) * numOut, -999.0f);
+            }
+        }
+
     private:
         std::unique_ptr<TMVA::Reader> fReader;
 		std::vector<float> fValues;
@@ -76,7 +125,64 @@ class tmva_helper_xml {
 			return interpreters_[slot]->Compute(vars);
         }
 
+        tmva_xml *GetInterpreter(unsigned int slot) const {
+            return interpreters_[slot];
+        }
+
+        unsigned int GetNSlots() const {
+            return interpreters_.size();
+        }
+
     private:
         std::vector<tmva_xml *> interpreters_;
 
 };
+
+// All the input variations (e.g. nominal + JES/JER) of an event evaluated in one
+// call per slot, sharing the readers of a tmva_helper_xml. Input: nSets x nVariables
+// and the preselection of each set, output: nSets x nOutputs, filled into per-slot
+// storage allocated once and returned as a non-owning RVec on it (valid until the
+// next event of the slot, no copy per event).
+// The storage and the counters are shared by the copies RDataFrame makes of the functor
+class tmva_helper_xml_variations {
+    public:
+        tmva_helper_xml_variations(const tmva_helper_xml &helper, const unsigned int nSets) : helper_(&helper), nSets_(nSets) {
+
+            out_ = std::make_shared<std::vector<Vec_f>>(helper_->GetNSlots(), Vec_f(nSets));
+            nEvaluated_ = std::make_shared<std::vector<unsigned long>>(helper_->GetNSlots(), 0);
+            nSkipped_ = std::make_shared<std::vector<unsigned long>>(helper_->GetNSlots(), 0);
+            nFailed_ = std::make_shared<std::vector<unsigned long>>(helper_->GetNSlots(), 0);
+        }
+
+        Vec_f operator()(unsigned int slot, const Vec_f &vars, const Vec_i &pass) {
+            Vec_f &out = (*out_)[slot];
+            helper_->GetInterpreter(slot)->ComputeSets(vars, pass, nSets_, out, (*nEvaluated_)[slot], (*nSkipped_)[slot], (*nFailed_)[slot]);
+            return Vec_f(out.data(), out.size());
+        }
+
+        unsigned long GetNEvaluated() const {
+            unsigned long n = 0;
+            for (auto x : *nEvaluated_) n += x;
+            return n;
+        }
+
+        unsigned long GetNSkipped() const {
+            unsigned long n = 0;
+            for (auto x : *nSkipped_) n += x;
+            return n;
+        }
+
+        unsigned long GetNFailed() const {
+            unsigned long n = 0;
+            for (auto x : *nFailed_) n += x;
+            return n;
+        }
+
+    private:
+        const tmva_helper_xml *helper_;
+        unsigned int nSets_;
+        std::shared_ptr<std::vector<Vec_f>> out_;
+        std::shared_ptr<std::vector<unsigned long>> nEvaluated_;
+        std::shared_ptr<std::vector<unsigned long>> nSkipped_;
+        std::shared_ptr<std::vector<unsigned long>> nFailed_;
+};
@@ -12,6 +12,8 @@ class TMVAHelperXML():
 
         self.tmva_helper = ROOT.tmva_helper_xml(self.model_input, self.nthreads)
         self.var_col = f"tmva_vars_{self.model_name}"
+        self.variations = []
+        self.variation_helpers = []
 
     def run_inference(self, df, col_name = "mva_score", theType = 0):
 
@@ -28,3 +30,43 @@ class TMVAHelperXML():
             df = df.Redefine(self.var_col, f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
         df = df.DefineSlot(col_name, self.tmva_helper, [self.var_col])
         return df
+
+    # Nominal and variations evaluated in one call per event: the inputs of the
+    # variation varString are var+varString for the variables in redefined_vars and
+    # the nominal ones otherwise. A variation with the same inputs as the nominal is
+    # not evaluated again. presel is the requirement of a set with {0} for varString
+    # ("" for the nominal), a set failing it is not evaluated and its outputs are -999.
+    # Defines col_name (if not there yet) and col_name+varString.
+    def run_inference_variations(self, df, col_name, var_strings, redefined_vars, presel=None):
+
+        cols = df.GetColumnNames()
+        sets = [self.variables]
+        for var_string in var_strings:
+            sets.append([f"{var}{var_string}" if var in redefined_vars else var for var in self.variables])
+        for var in [x for y in sets for x in y]:
+            if not var in cols:
+                raise Exception(f"Variable {var} not defined in dataframe.")
+
+        vars_str = ', '.join([x for y in sets for x in y])
+        helper = ROOT.tmva_helper_xml_variations(self.tmva_helper, len(sets))
+        self.variation_helpers.append(helper)
+        if presel is None:
+            presel_str = f"ROOT::VecOps::RVec<int>({len(sets)}, 1)"
+        else:
+            presel_str = "ROOT::VecOps::RVec<int>{{{0}}}".format(", ".join([f"int({presel.format(x)})" for x in [""] + var_strings]))
+
+        all_col = f"{col_name}_variations{len(self.variation_helpers)}"
+        df = df.Define(f"{self.var_col}_variations{len(self.variation_helpers)}", f"ROOT::VecOps::RVec<float>{{{vars_str}}}")
+        df = df.Define(f"{self.var_col}_presel{len(self.variation_helpers)}", presel_str)
+        df = df.DefineSlot(all_col, helper, [f"{self.var_col}_variations{len(self.variation_helpers)}", f"{self.var_col}_presel{len(self.variation_helpers)}"])
+        n_out = f"({all_col}.size()/{len(sets)})"
+        if not col_name in cols:
+            df = df.Define(col_name, f"ROOT::VecOps::RVec<float>({all_col}.begin(), {all_col}.begin()+{n_out})")
+        for nv, var_string in enumerate(var_strings):
+            df = df.Define(f"{col_name}{var_string}", f"ROOT::VecOps::RVec<float>({all_col}.begin()+{nv+1}*{n_out}, {all_col}.begin()+{nv+2}*{n_out})")
+            self.variations.append(var_string)
+        return df
+
+    def print_variation_stats(self):
+        for helper in self.variation_helpers:
+            print("BDT variations: {0} evaluated / {1} skipped (same inputs as the nominal) / {2} not preselected".format(helper.GetNEvaluated(),helper.GetNSkipped(),helper.GetNFailed()))
@@ -1,7 +1,8 @@
 import ROOT
-import os, json, sys
+import os, json, sys, hashlib, heapq
 from utilsCategory import plotCategory
 from subprocess import call,check_output
+from jit_cache import loadFunctions
 #from correctionlib import _core
 import correctionlib
 correctionlib.register_pyroot_binding()
@@ -10,6 +11,26 @@ correctionlib.register_pyroot_binding()
 
 useXROOTD = False
 
+# per-sample normalization cache, built with makeNormCache.py
+normCacheDir = "normcache"
+# split the files of a sample in jobs with similar number of events instead of strided
+useBalancedGroups = True
+# per-sample theory normalization (Runs sums with the full LHEScale/PS vectors), built with makeNormCache.py --theoryNorm=1
+theoryNormDir = "theorynorm"
+useTheoryNorm = True
+# sample catalog (files, size, mtime, entries and Runs sums per directory), built with makeSampleCatalog.py
+sampleCatalogFile = "catalog/sampleCatalog.json"
+useSampleCatalog = True
+sampleCatalog = None
+sampleCatalogIndex = None
+# consolidated scale factor histograms of a year, built with makeSFRegistry.py
+sfRegistryFile = "data/sfRegistry_{0}.root"
+# functions.h and the expressions recorded by the analyses compiled in one library,
+# built with makeJitCache.py and named after the hash of the headers
+jitCacheDir = "jitcache"
+jitCacheHeaders = ["functions.h", "jit_cache.h"]
+useJitCacheLibrary = True
+
 def getLumi(year):
     lumi = [36.1, 41.5, 60.0, 8.1, 26.7, 18.1, 9.7, 109.6, 105.0]
 
@@ -30,13 +51,68 @@ def getLumi(year):
 
 #if "/functions.so" not in ROOT.gSystem.GetLibraries():
 #    ROOT.gSystem.CompileMacro("functions.cc","k")
-ROOT.gInterpreter.ProcessLine('#include "functions.h"')
+jitCacheLoaded = loadFunctions(jitCacheDir, jitCacheHeaders, useJitCacheLibrary)
+ROOT.gInterpreter.Declare('#include "runs_sums.h"')
 
 #def loadCorrectionSet(year):
 #    ROOT.gInterpreter.Load("mysf.so")
 #    ROOT.gInterpreter.Declare('#include "mysf.h"')
 #    ROOT.gInterpreter.ProcessLine('auto corr_sf = MyCorrections(%d);' % (year))
 
+# Fills the scale factor tables of functions.h by slot name (sfSlots there). sfTables is a
+# list of (slot, source, histoName), source being the name of the data/ file without the
+# extension and with {0} in place of the year. The histograms are read from the consolidated
+# file of the year when it exists (directory source.format("YEAR")), from data/ otherwise
+def loadSFTables(year, sfTables):
+
+    registryName = sfRegistryFile.format(year)
+    useRegistry = os.path.exists(registryName)
+    for slot, source, histoName in sfTables:
+        isLoaded = False
+        if(useRegistry == True):
+            isLoaded = ROOT.loadSFTable(slot, registryName, "{0}/{1}".format(source.format("YEAR"),histoName))
+        if(isLoaded == False):
+            isLoaded = ROOT.loadSFTable(slot, "data/{0}.root".format(source.format(year)), histoName)
+        if(isLoaded == False):
+            raise Exception("Scale factor table {0} not loaded: {1} / {2}".format(slot,source,histoName))
+    ROOT.closeSFFiles()
+
+# (slot, source, histoName) of the scale factor tables shared by the lepton analyses
+def getLeptonSFTables(muSelChoice, elSelChoice, bTagSel, lepSFSource, fakeSource = "histoFakeEtaPt_{0}", lepSFNames = None, useWSSF = True):
+
+    if(lepSFNames is None):
+        lepSFNames = ["histoLepSFEtaPt_0_{0}".format(muSelChoice), "histoLepSFEtaPt_1_{0}".format(elSelChoice)]
+
+    sfTables = []
+    for x in range(9):
+        fakeAnalysis = "fakeAnalysis{0}_anaType{1}".format(1001+x%3,1+x//3)
+        sfTables.append(("fake_mu_{0}".format(x), fakeSource, "histoFakeEffSelEtaPt_0_{0}_{1}".format(muSelChoice,fakeAnalysis)))
+        sfTables.append(("fake_el_{0}".format(x), fakeSource, "histoFakeEffSelEtaPt_1_{0}_{1}".format(elSelChoice,fakeAnalysis)))
+    sfTables.append(("lepsf_mu", lepSFSource, lepSFNames[0]))
+    sfTables.append(("lepsf_el", lepSFSource, lepSFNames[1]))
+    for x in range(4):
+        for y in range(4):
+            sfTables.append(("trigsf_{0}_{1}".format(x,y), "histoTriggerSFEtaPt_{0}", "histoTriggerV1SFEtaPt_{0}_{1}".format(x,y)))
+    for x, flavor in enumerate(["lf", "cj", "bj"]):
+        sfTables.append(("btveff_{0}".format(flavor), "histoBtagEffSelEtaPt_{0}", "histoBtagEffSelEtaPt_{0}".format(x+3*bTagSel)))
+    sfTables.append(("pu", "puWeights_UL_{0}", "puWeights"))
+    sfTables.append(("pu_up", "puWeights_UL_{0}", "puWeightsUp"))
+    sfTables.append(("pu_down", "puWeights_UL_{0}", "puWeightsDown"))
+    if(useWSSF == True):
+        sfTables.append(("ws_eta_sf", "histoWSSF_{0}", "histoWSEtaSF"))
+        sfTables.append(("ws_eta_sf_unc", "histoWSSF_{0}", "histoWSEtaSF_unc"))
+        sfTables.append(("ws_etapt_sf", "histoWSSF_{0}", "histoWSEtaPtSF"))
+
+    return sfTables
+
+# EWK k-factors of the VBS WW and WZ samples
+def getEWKCorrSFTables():
+
+    return [("kf_ewk_ww", "VV_NLO_LO_CMS_mjj", "hWW13p6_KF_CMS"),
+            ("kf_ewk_wz", "VV_NLO_LO_CMS_mjj", "hWZ13p0_KF_CMS"),
+            ("kf_ewk_ww_unc", "VV_NLO_LO_CMS_mjj", "hWW13p6_KF_CMSUp"),
+            ("kf_ewk_wz_unc", "VV_NLO_LO_CMS_mjj", "hWZ13p0_KF_CMSUp")]
+
 def loadJSON(fIn):
 
     if not os.path.isfile(fIn):
@@ -94,6 +170,29 @@ def findDataset(name):
 
     return files_ROOT
 
+def walkDIR(directory):
+
+    filesPath = []
+    for root, directories, filenames in os.walk(directory):
+        for f in filenames:
+
+            isBadFile = False
+            filePath = os.path.join(os.path.abspath(root), f)
+            if "failed/" in filePath: continue
+            if "log/" in filePath: continue
+            if ".txt" in filePath: continue
+            if(("XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX" in filePath) or
+
+               ("XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX" in filePath)
+               ): isBadFile = True
+
+            if(isBadFile == True):
+                print("Bad file: {0}".format(filePath))
+                continue
+            filesPath.append(filePath)
+
+    return filesPath
+
 def findDIR(directory):
 
     print(directory)
@@ -111,7 +210,15 @@ def findDIR(directory):
     counter = 0
     rootFiles = ROOT.vector('string')()
 
-    if(useXROOTD == True and "/ceph/submit/data/group/cms" in directory):
+    catalogEntry = getCatalogDirectory(directory)
+    if(catalogEntry is not None):
+        for fileEntry in catalogEntry["files"][:maxFiles]:
+            filePath = fileEntry["path"]
+            if(useXROOTD == True and "/ceph/submit/data/group/cms" in filePath):
+                filePath = filePath.replace("/ceph/submit/data/group/cms","root://submit50.mit.edu/")
+            rootFiles.push_back(filePath)
+
+    elif(useXROOTD == True and "/ceph/submit/data/group/cms" in directory):
         xrd = "root://submit50.mit.edu/"
         xrdpath = directory.replace("/ceph/submit/data/group/cms","")
         f = check_output(['xrdfs', f'{xrd}', 'ls', xrdpath]).decode(sys.stdout.encoding)
@@ -126,25 +233,10 @@ def findDIR(directory):
             rootFiles.push_back(filePath)
 
     else:
-        for root, directories, filenames in os.walk(directory):
-            for f in filenames:
-
-                isBadFile = False
-                filePath = os.path.join(os.path.abspath(root), f)
-                if "failed/" in filePath: continue
-                if "log/" in filePath: continue
-                if ".txt" in filePath: continue
-                if(("XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX" in filePath) or
-
-                   ("XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX" in filePath)
-                   ): isBadFile = True
-
-                if(isBadFile == True):
-                    print("Bad file: {0}".format(filePath))
-                    continue
-                counter+=1
-                if(counter > maxFiles): break
-                rootFiles.push_back(filePath)
+        for filePath in walkDIR(directory):
+            counter+=1
+            if(counter > maxFiles): break
+            rootFiles.push_back(filePath)
 
     #print(rootFiles)
     return rootFiles
@@ -166,13 +258,67 @@ def findMany(basedir, regex):
 
     return rootFiles
 
-# split fIns files in group files
-def groupFiles(fIns, group):
+# split fIns files in group files, balancing the total weight per group when weights are given
+def groupFiles(fIns, group, weights = None):
+
+    if(weights is None or useBalancedGroups == False):
+        ret =  [fIns[i::group] for i in range(group)]
+        return ret
 
-    ret =  [fIns[i::group] for i in range(group)]
+    ret = groupFilesBalanced(fIns, group, weights)
+    printGroupBalance(ret, dict(zip([str(x) for x in fIns], weights)))
 
     return ret
 
+# largest files first, each one into the lightest group (ties go to the lowest group index),
+# so the result only depends on the file list and the weights, never on whichJob
+def groupFilesBalanced(fIns, group, weights):
+
+    order = sorted(range(len(fIns)), key=lambda i: (-weights[i], str(fIns[i])))
+    heap = [(0, n) for n in range(group)]
+    indices = [[] for n in range(group)]
+    for i in order:
+        load, n = heapq.heappop(heap)
+        indices[n].append(i)
+        heapq.heappush(heap, (load + weights[i], n))
+
+    ret = [[str(fIns[i]) for i in sorted(x)] for x in indices]
+
+    return ret
+
+def printGroupBalance(groups, weightDict):
+
+    loads = [sum([weightDict[str(x)] for x in y]) for y in groups]
+    if(len(loads) == 0 or sum(loads) == 0):
+        return
+    meanLoad = float(sum(loads)) / len(loads)
+    print("Group balance: groups/files: {0} / {1}, weight total/mean/min/max: {2} / {3:.1f} / {4} / {5}, max/mean: {6:.3f}, largest file: {7}".format(
+          len(groups),sum([len(x) for x in groups]),sum(loads),meanLoad,min(loads),max(loads),max(loads)/meanLoad,max(weightDict.values())))
+
+# weight of each file for the job splitting (MC): number of events from the normalization cache or,
+# without a cache, from the sample catalog. Both are shipped with the jobs and the fingerprint does not
+# depend on the node, so all the jobs of a sample get the same split. None (plain split on the file
+# names) when neither of them has the sample; a cache or catalog that misses some files is an error
+def getFileWeights(files, directory, fingerprint):
+
+    cache = readNormCache(directory, fingerprint)
+    if(cache is not None):
+        if(not all([str(x) in cache["files"] and "nEvents" in cache["files"][str(x)] for x in files])):
+            raise Exception("Normalization cache {0} has no number of events for some files, rebuild it with makeNormCache.py --force=1".format(getNormCacheName(directory)))
+        print("File weights read from cache {0}".format(getNormCacheName(directory)))
+        return [cache["files"][str(x)]["nEvents"] for x in files]
+
+    catalogFiles = getCatalogFiles(files)
+    if(catalogFiles is not None):
+        print("File weights read from the sample catalog {0}".format(sampleCatalogFile))
+        return [x["entries"] for x in catalogFiles]
+
+    if(getCatalogDirectory(directory) is not None):
+        raise Exception("Sample catalog {0} does not have all the files of {1}, refresh it with makeSampleCatalog.py".format(sampleCatalogFile,directory))
+
+    print("No normalization cache or catalog for {0}, plain split of the files".format(directory))
+    return None
+
 def concatenate(result, tmp1):
     for f in tmp1:
         result.push_back(f)
@@ -182,6 +328,334 @@ def getMClist(sampleNOW, skimType):
     files = findDIR("{}".format(SwitchSample(sampleNOW, skimType)[0]))
     return files
 
+# sums over all the entries of the Runs tree of a single file
+def getRunsSums(fileName):
+
+    sums = {"nRuns": 0, "genEventSumw": 0.0, "genEventCount": 0.0,
+            "nLHEPdfSumw": None, "nLHEScaleSumw": None, "LHEScaleSumw": [], "nPSSumw": None, "PSSumw": []}
+
+    fIn = ROOT.TFile.Open(fileName)
+    if(not fIn or fIn.IsZombie()):
+        raise RuntimeError("Cannot open file {0}".format(fileName))
+    runTree = fIn.Get("Runs")
+    if(not runTree):
+        fIn.Close()
+        raise RuntimeError("No Runs tree in file {0}".format(fileName))
+
+    hasBranch = {}
+    for brName in ["nLHEPdfSumw", "nLHEScaleSumw", "nPSSumw"]:
+        hasBranch[brName] = bool(runTree.GetBranch(brName))
+
+    for entry in runTree:
+        sums["nRuns"] += 1
+        sums["genEventSumw"] += entry.genEventSumw
+        sums["genEventCount"] += entry.genEventCount
+        if(hasBranch["nLHEPdfSumw"]):
+            if(sums["nLHEPdfSumw"] is None or entry.nLHEPdfSumw < sums["nLHEPdfSumw"]):
+                sums["nLHEPdfSumw"] = int(entry.nLHEPdfSumw)
+        for theType in ["LHEScale", "PS"]:
+            if(hasBranch["n{0}Sumw".format(theType)] == False): continue
+            nValues = int(getattr(entry, "n{0}Sumw".format(theType)))
+            values = getattr(entry, "{0}Sumw".format(theType))
+            if(sums["n{0}Sumw".format(theType)] is None or nValues < sums["n{0}Sumw".format(theType)]):
+                sums["n{0}Sumw".format(theType)] = nValues
+            sumValues = sums["{0}Sumw".format(theType)]
+            for n in range(nValues):
+                if(n < len(sumValues)): sumValues[n] += values[n]
+                else: sumValues.append(values[n])
+
+    # not a Runs quantity, but it is needed to balance the jobs
+    eventTree = fIn.Get("Events")
+    if(eventTree):
+        sums["nEvents"] = eventTree.GetEntries()
+    else:
+        sums["nEvents"] = 0
+
+    fIn.Close()
+    return sums
+
+# combine the per-file Runs sums the same way the Runs RDataFrame loops in readMCSample do
+def combineRunsSums(listSums):
+
+    nTheoryReplicas = [103, 9, 4]
+    genEventSumLHEScaleWeight = [0, 0, 0, 0, 0, 0, 0, 0, 0]
+    genEventSumPSWeight = [0, 0, 0, 0, 0]
+
+    runGetEntries = sum([x["nRuns"] for x in listSums])
+    genEventSumWeight = sum([x["genEventSumw"] for x in listSums])
+    genEventSumNoWeight = sum([x["genEventCount"] for x in listSums])
+
+    minReplicas = {}
+    for theType in ["LHEPdf", "LHEScale", "PS"]:
+        values = [x["n{0}Sumw".format(theType)] for x in listSums]
+        if(len(values) == 0 or None in values): minReplicas[theType] = None
+        else: minReplicas[theType] = min(values)
+
+    if(minReplicas["LHEPdf"] is None):
+        nTheoryReplicas[0] = 0
+    elif(minReplicas["LHEPdf"] < nTheoryReplicas[0]):
+        nTheoryReplicas[0] = minReplicas["LHEPdf"]
+
+    for n in range(9):
+        if(minReplicas["LHEScale"] is None):
+            genEventSumLHEScaleWeight[n] = runGetEntries
+            nTheoryReplicas[1] = n
+            print("Problem with LHEScaleWeights: nLHEScaleSumw not available")
+        elif(minReplicas["LHEScale"] > n):
+            genEventSumLHEScaleWeight[n] = sum([x["LHEScaleSumw"][n] for x in listSums])
+        else:
+            genEventSumLHEScaleWeight[n] = runGetEntries
+            nTheoryReplicas[1] = minReplicas["LHEScale"]
+    for n in range(4):
+        if(minReplicas["PS"] is None):
+            genEventSumPSWeight[n] = runGetEntries
+            nTheoryReplicas[2] = n
+            print("Problem with PSWeights: nPSSumw not available")
+        elif(minReplicas["PS"] > n):
+            genEventSumPSWeight[n] = sum([x["PSSumw"][n] for x in listSums])
+        else:
+            genEventSumPSWeight[n] = runGetEntries
+            nTheoryReplicas[2] = minReplicas["PS"]
+    genEventSumPSWeight[4] = runGetEntries
+
+    return genEventSumWeight, genEventSumNoWeight, nTheoryReplicas, genEventSumLHEScaleWeight, genEventSumPSWeight, runGetEntries
+
+def getNormCacheName(directory):
+
+    return os.path.join(normCacheDir, "{0}_{1}.json".format(os.path.basename(directory.rstrip("/"))[:120],hashlib.sha1(directory.encode()).hexdigest()[:12]))
+
+# the fingerprint uses the file names and, when the sample catalog has all the files, their catalog
+# size and modification time. It never looks at the files themselves, so that it is cheap and the same
+# on every node (a file rewritten with the same name is seen once the catalog is refreshed).
+# Computed once per job and passed to the cache readers
+def getFileListFingerprint(files):
+
+    names = sorted([str(x) for x in files])
+    catalogFiles = getCatalogFiles(names)
+    if(catalogFiles is not None):
+        entries = ["{0} {1} {2}".format(x,y["size"],int(y["mtime"])) for x, y in zip(names, catalogFiles)]
+    else:
+        entries = names
+
+    return hashlib.sha1("\n".join(entries).encode()).hexdigest()
+
+def readNormCache(directory, fingerprint):
+
+    cacheName = getNormCacheName(directory)
+    if(not os.path.exists(cacheName)):
+        return None
+
+    try:
+        with open(cacheName) as jsonFile:
+            cache = json.load(jsonFile)
+    except Exception as e:
+        print("Corrupted normalization cache {0}: {1}".format(cacheName,e))
+        return None
+
+    if(cache["directory"] != directory or cache["fingerprint"] != fingerprint):
+        print("Normalization cache {0} does not match the current file list".format(cacheName))
+        return None
+
+    return cache
+
+def writeNormCache(directory, fingerprint, files, listSums):
+
+    cache = {"directory": directory, "fingerprint": fingerprint, "files": {}}
+    for fileName, sums in zip(files, listSums):
+        cache["files"][str(fileName)] = sums
+
+    if(not os.path.exists(normCacheDir)):
+        os.makedirs(normCacheDir)
+    cacheName = getNormCacheName(directory)
+    # write and rename so that concurrent jobs never see a partial file
+    with open(cacheName + ".tmp{0}".format(os.getpid()), "w") as jsonFile:
+        json.dump(cache, jsonFile)
+    os.replace(cacheName + ".tmp{0}".format(os.getpid()), cacheName)
+
+    return cache
+
+def getTheoryNormName(directory):
+
+    return os.path.join(theoryNormDir, "{0}_{1}.json".format(os.path.basename(directory.rstrip("/"))[:120],hashlib.sha1(directory.encode()).hexdigest()[:12]))
+
+# Runs sums of all the files in one event loop: the sums of weights and the full LHEScale/PS
+# vectors, accumulated with runssums_helper. Only the number of LHEPdf members is kept, the
+# PDF weights are not normalized. Same content as a getRunsSums entry, so combineRunsSums
+# works on it as well
+def makeTheoryNorm(files):
+
+    df = ROOT.RDataFrame("Runs", [str(x) for x in files])
+    results = {"nRuns": df.Count(), "genEventSumw": df.Sum("genEventSumw"), "genEventCount": df.Sum("genEventCount")}
+    for theType in ["LHEScale", "LHEPdf", "PS"]:
+        if(df.HasColumn("{0}Sumw".format(theType)) == False): continue
+        dfType = df.Define("runssums_{0}".format(theType), "runssums_cast({0}Sumw)".format(theType))
+        results["{0}Sumw".format(theType)] = ROOT.book_runssums(ROOT.RDF.AsRNode(dfType), "runssums_{0}".format(theType))
+
+    # all the results are booked on the same dataframe, the first GetValue runs the loop for all of them
+    theoryNorm = {"nRuns": int(results["nRuns"].GetValue()), "genEventSumw": float(results["genEventSumw"].GetValue()), "genEventCount": float(results["genEventCount"].GetValue())}
+    for theType in ["LHEScale", "LHEPdf", "PS"]:
+        if("{0}Sumw".format(theType) in results):
+            sumw = [float(x) for x in results["{0}Sumw".format(theType)].GetValue().GetSumw()]
+            theoryNorm["n{0}Sumw".format(theType)] = len(sumw)
+            if(theType != "LHEPdf"): theoryNorm["{0}Sumw".format(theType)] = sumw
+        else:
+            theoryNorm["n{0}Sumw".format(theType)] = None
+            if(theType != "LHEPdf"): theoryNorm["{0}Sumw".format(theType)] = []
+
+    return theoryNorm
+
+def readTheoryNorm(directory, fingerprint):
+
+    theoryNormName = getTheoryNormName(directory)
+    if(not os.path.exists(theoryNormName)):
+        return None
+
+    try:
+        with open(theoryNormName) as jsonFile:
+            theoryNorm = json.load(jsonFile)
+    except Exception as e:
+        print("Corrupted theory normalization {0}: {1}".format(theoryNormName,e))
+        return None
+
+    if(theoryNorm["directory"] != directory or theoryNorm["fingerprint"] != fingerprint):
+        print("Theory normalization {0} does not match the current file list".format(theoryNormName))
+        return None
+
+    return theoryNorm["sums"]
+
+def writeTheoryNorm(directory, fingerprint, theoryNorm):
+
+    if(not os.path.exists(theoryNormDir)):
+        os.makedirs(theoryNormDir)
+    theoryNormName = getTheoryNormName(directory)
+    # write and rename so that concurrent jobs never see a partial file
+    with open(theoryNormName + ".tmp{0}".format(os.getpid()), "w") as jsonFile:
+        json.dump({"directory": directory, "fingerprint": fingerprint, "sums": theoryNorm}, jsonFile)
+    os.replace(theoryNormName + ".tmp{0}".format(os.getpid()), theoryNormName)
+
+# normalization sums for all the files of a MC sample, read from the theory normalization
+# or the cache when available (fingerprint: getFileListFingerprint of the files)
+def getMCNormalization(sampleNOW, skimType, files, fingerprint, writeCache = False):
+
+    directory = SwitchSample(sampleNOW, skimType)[0]
+    theoryNorm = readTheoryNorm(directory, fingerprint) if useTheoryNorm == True else None
+    if(theoryNorm is not None):
+        print("Normalization read from the theory normalization {0}".format(getTheoryNormName(directory)))
+        return combineRunsSums([theoryNorm])
+
+    cache = readNormCache(directory, fingerprint)
+    if(cache is not None):
+        print("Normalization read from cache {0}".format(getNormCacheName(directory)))
+        listSums = [cache["files"][str(x)] for x in files]
+    elif(getCatalogFiles(files) is not None and all([x["runs"] is not None for x in getCatalogFiles(files)])):
+        print("Normalization read from the sample catalog {0}".format(sampleCatalogFile))
+        listSums = [x["runs"] for x in getCatalogFiles(files)]
+    else:
+        listSums = [getRunsSums(str(x)) for x in files]
+        if(writeCache == True):
+            writeNormCache(directory, fingerprint, files, listSums)
+
+    return combineRunsSums(listSums)
+
+def loadSampleCatalog(fileName = None):
+
+    global sampleCatalog
+    if(fileName is None): fileName = sampleCatalogFile
+    if(sampleCatalog is not None and fileName == sampleCatalogFile):
+        return sampleCatalog
+
+    catalog = {"version": 1, "directories": {}}
+    if(os.path.exists(fileName)):
+        try:
+            with open(fileName) as jsonFile:
+                catalog = json.load(jsonFile)
+        except Exception as e:
+            print("Corrupted sample catalog {0}: {1}".format(fileName,e))
+
+    if(fileName == sampleCatalogFile):
+        sampleCatalog = catalog
+    return catalog
+
+def writeSampleCatalog(catalog, fileName = None):
+
+    if(fileName is None): fileName = sampleCatalogFile
+    if(os.path.dirname(fileName) != "" and not os.path.exists(os.path.dirname(fileName))):
+        os.makedirs(os.path.dirname(fileName))
+    # write and rename so that concurrent jobs never see a partial file
+    with open(fileName + ".tmp{0}".format(os.getpid()), "w") as jsonFile:
+        json.dump(catalog, jsonFile)
+    os.replace(fileName + ".tmp{0}".format(os.getpid()), fileName)
+
+# catalog entry of a directory, None if the catalog is not used or does not have it
+def getCatalogDirectory(directory):
+
+    if(useSampleCatalog == False):
+        return None
+
+    return loadSampleCatalog()["directories"].get(directory)
+
+# per-file catalog entries of a list of files (any directory), None if any of them is missing
+def getCatalogFiles(files):
+
+    global sampleCatalogIndex
+    if(useSampleCatalog == False):
+        return None
+
+    if(sampleCatalogIndex is None):
+        sampleCatalogIndex = {}
+        for directory in loadSampleCatalog()["directories"]:
+            for fileEntry in sampleCatalog["directories"][directory]["files"]:
+                sampleCatalogIndex[fileEntry["path"]] = fileEntry
+                sampleCatalogIndex[fileEntry["path"].replace("/ceph/submit/data/group/cms","root://submit50.mit.edu/")] = fileEntry
+
+    ret = []
+    for x in files:
+        if(str(x) not in sampleCatalogIndex):
+            return None
+        ret.append(sampleCatalogIndex[str(x)])
+
+    return ret
+
+def getCatalogFileEntry(fileName):
+
+    fileEntry = {"path": fileName, "size": os.path.getsize(fileName), "mtime": os.path.getmtime(fileName), "entries": 0, "runs": None}
+    try:
+        fileEntry["runs"] = getRunsSums(fileName)
+        fileEntry["entries"] = fileEntry["runs"]["nEvents"]
+    except RuntimeError:
+        # no Runs tree (or unreadable file), keep at least the number of events
+        fIn = ROOT.TFile.Open(fileName)
+        if(fIn and not fIn.IsZombie()):
+            eventTree = fIn.Get("Events")
+            if(eventTree): fileEntry["entries"] = eventTree.GetEntries()
+            fIn.Close()
+
+    return fileEntry
+
+# (re)build the catalog entry of a directory, only the new or modified files are read again
+def refreshCatalogDirectory(catalog, directory, force = False):
+
+    oldEntries = {}
+    if(directory in catalog["directories"] and force == False):
+        for fileEntry in catalog["directories"][directory]["files"]:
+            oldEntries[fileEntry["path"]] = fileEntry
+
+    nNew, nKept = 0, 0
+    fileEntries = []
+    for fileName in walkDIR(directory):
+        oldEntry = oldEntries.get(fileName)
+        if(oldEntry is not None and oldEntry["size"] == os.path.getsize(fileName) and oldEntry["mtime"] == os.path.getmtime(fileName)):
+            fileEntries.append(oldEntry)
+            nKept += 1
+        else:
+            fileEntries.append(getCatalogFileEntry(fileName))
+            nNew += 1
+
+    catalog["directories"][directory] = {"files": fileEntries}
+    nRemoved = len(oldEntries) - nKept
+
+    return nNew, nKept, nRemoved
+
 def getDATAlist(type, year, skimType):
 
     if(year > 10000): year = year // 10
@@ -796,8 +1270,17 @@ def getDATAlist(type, year, skimType):
 
     return files
 
+# the sample table only depends on skimType, it is built once per process
+sampleSwitch = {}
 def SwitchSample(argument, skimType):
 
+    if(skimType not in sampleSwitch):
+        sampleSwitch[skimType] = makeSampleSwitch(skimType)
+
+    return sampleSwitch[skimType].get(argument, "BKGdefault, xsecDefault, category")
+
+def makeSampleSwitch(skimType):
+
     #dirT2 = "/scratch/submit/cms/ceballos/nanoaod/skims_submit/" + skimType
     dirT2 = "/ceph/submit/data/group/cms/store/user/ceballos/nanoaod/skims_submit/" + skimType
     dirScratch = "/scratch/submit/cms/ceballos/nanoaod/samples"
@@ -1311,4 +1794,4 @@ def SwitchSample(argument, skimType):
 
        983: (dirScratch+"/WWJJto2L2Nu-SS-noTop-EWK_TuneCP5_13p6TeV_sherpa+Run3+NANOAODSIM",0.0398961*1000,plotCategory("kPlotEWKSSWW")),
     }
-    return switch.get(argument, "BKGdefault, xsecDefault, category")
+    return switch
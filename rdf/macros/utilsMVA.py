@@ -1,6 +1,20 @@
 import ROOT
 import os, json
 
+# MVA inputs that change with the jet energy scale/resolution variations
+mvaVariationVariables = ["ngood_jets", "vbs_mjj", "vbs_ptjj", "vbs_detajj", "vbs_dphijj", "vbs_ptj1", "vbs_ptj2", "vbs_etaj1", "vbs_etaj2",
+                         "vbs_zepvv", "vbs_zepmax", "vbs_sumHT", "vbs_ptvv", "vbs_pttot", "vbs_detavvj1", "vbs_detavvj2", "vbs_ptbalance"]
+
+# loose VBS preselection of each input set ({0} = variation, "" for the nominal), part of all the
+# selections where the BDT is used: the sets failing it are not evaluated (-999)
+mvaVariationPreselection = "nvbs_jets{0} >= 2"
+
+# all the JES/JER variations evaluated together once per event, each of them only if it passes
+# the VBS preselection, i.e. where the per-variation selections evaluated it
+def defineMVAVariations(df,tmva_helper,varStrings,mvaSel):
+
+    return tmva_helper.run_inference_variations(df,"bdt_vbfinc",varStrings,mvaVariationVariables,mvaVariationPreselection)
+
 def redefineMVAVariables(df,tmva_helper,varString,mvaSel):
 
     dftag = df
@@ -23,6 +37,8 @@ def redefineMVAVariables(df,tmva_helper,varString,mvaSel):
                  .Redefine("vbs_detavvj2" ,"vbs_detavvj2{0}".format(varString))
                  .Redefine("vbs_ptbalance","vbs_ptbalance{0}".format(varString))
                  )
-    dftag = tmva_helper.run_inference(dftag,"bdt_vbfinc{0}".format(varString),1)
+    # already evaluated by defineMVAVariations
+    if(varString not in tmva_helper.variations):
+        dftag = tmva_helper.run_inference(dftag,"bdt_vbfinc{0}".format(varString),1)
 
     return dftag
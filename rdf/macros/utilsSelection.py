@@ -2,6 +2,51 @@ import ROOT
 import os, json
 from utilsCategory import plotCategory
 
+# all the jet pt variations (JER and the 28 JES sources) computed in a single pass per event
+useBatchedJES = True
+# JSON scale factors evaluated with correction handles bound once per dataframe (bindJSON_* in functions.h)
+useCorrectionHandles = True
+# the scalar columns of makeJES for the JES sources and JER computed in one call per event
+# (makeJESBundle), each of them also as one RVec column indexed by variation (<name>JesVar)
+useJESBundle = True
+jesBundleVariations = ["Jes{0:02d}Up".format(nv) for nv in range(28)]+["JerUp"]
+# the scalar columns of makeJES in the order of compute_jes_bundle (functions.h)
+jesBundleQuantities = ["ngood_jets","ngood_jetsVeto","ngood_cen_jets","ngood_fwd_jets","nbtag_good_Jet_bjet",
+                       "mjj","ptjj","detajj","dphijj","ptj1","ptj2","etaj1","etaj2",
+                       "nbtag_goodbtag_Jet_bjet","nvbs_jets",
+                       "vbs_mjj","vbs_ptjj","vbs_detajj","vbs_dphijj","vbs_ptj1","vbs_ptj2","vbs_etaj1","vbs_etaj2","vbs_phij1","vbs_phij2",
+                       "PuppiMET_pt","PuppiMET_phi",
+                       "vbs_zepvv","vbs_zepmax","vbs_sumHT","vbs_ptvv","vbs_pttot","vbs_detavvj1","vbs_detavvj2","vbs_ptbalance"]
+# analyses booking their systematic variations with RDataFrame::Vary (declareVary), e.g. ["wz"],
+# the others keep one filtered node per variation. Empty until the Vary histograms have been
+# compared with the legacy backend (benchmarkVary.py)
+varyAnalyses = []
+
+def jsonBTVSF(key,flavorToStudy,bTagSel,year):
+    if(useCorrectionHandles == True):
+        return "compute_JSON_BTV_SF_h({0},goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,{1})".format(ROOT.bindJSON_BTV_SF(key,flavorToStudy,bTagSel),getBTagCut(bTagSel,year))
+    return "compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"{0}\",{1},{2},{3})".format(key,flavorToStudy,bTagSel,getBTagCut(bTagSel,year))
+
+def jsonMUOSFs(valType0,valType1,valType2,type):
+    if(useCorrectionHandles == True):
+        return "compute_JSON_MUO_SFs_h({0},fake_Muon_pt,fake_Muon_eta,fake_Muon_p,{1})".format(ROOT.bindJSON_MUO_SFs(valType0,valType1,valType2),type)
+    return "compute_JSON_MUO_SFs(\"{0}\",\"{1}\",\"{2}\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,{3})".format(valType0,valType1,valType2,type)
+
+def jsonELESFs(ELEYEAR,valType0,valType1,ELEWP):
+    if(useCorrectionHandles == True):
+        return "compute_JSON_ELE_SFs_h({0},fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)".format(ROOT.bindJSON_ELE_SFs(ELEYEAR,valType0,valType1,ELEWP))
+    return "compute_JSON_ELE_SFs(\"{0}\",\"{1}\",\"{2}\",\"{3}\",fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)".format(ELEYEAR,valType0,valType1,ELEWP)
+
+def jsonPHOSFs(PHOYEAR,valType,PHOWP):
+    if(useCorrectionHandles == True):
+        return "compute_JSON_PHO_SFs_h({0},good_Photons_pt,good_Photons_eta,good_Photons_phi)".format(ROOT.bindJSON_PHO_SFs(PHOYEAR,valType,PHOWP))
+    return "compute_JSON_PHO_SFs(\"{0}\",\"{1}\",\"{2}\",good_Photons_pt,good_Photons_eta,good_Photons_phi)".format(PHOYEAR,valType,PHOWP)
+
+def jsonTAUSFs(valType):
+    if(useCorrectionHandles == True):
+        return "compute_JSON_TAU_SFs_h({0},good_Tau_pt,good_Tau_eta,good_Tau_decayMode,good_Tau_genPartFlav)".format(ROOT.bindJSON_TAU_SFs(valType))
+    return "compute_JSON_TAU_SFs(good_Tau_pt,good_Tau_eta,good_Tau_decayMode,good_Tau_genPartFlav,\"{0}\")".format(valType)
+
 # DeepJet
 def getBTagCut_DeepJet(type,year):
 
@@ -228,6 +273,21 @@ def makeJES(df,year,postFix,bTagSel,jetEtaCut,jetTypeCorr):
 
     return dftag
 
+# The scalar columns of makeJES for all the postFixes at once, from the nominal ones
+# of makeJES(df,...,"",...): <name><postFix> for each variation and <name>JesVar with
+# all of them, indexed like postFixes. The per-variation jet collections are not defined
+def makeJESBundle(df,year,postFixes,bTagSel,jetEtaCut,jetTypeCorr):
+    dftag =(df.Define("clean_Jet_ptJesVar", "stack_jet_pt_variations({{{0}}})".format(",".join(["clean_Jet_pt{0}".format(x) for x in postFixes])))
+              .Define("jes_bundle", "compute_jes_bundle(clean_Jet_ptJesVar,{0},clean_Jet_ptDef,clean_Jet_eta,clean_Jet_phi,clean_Jet_mass,clean_Jet_btagUnifiedParTB,clean_Jet_chEmEF,clean_Jet_neEmEF,clean_Jet_muonSubtrFactor,clean_Jet_rawFactor,good_Jet_eta,good_Jet_phi,good_Jet_mass,vbs_Jet_eta,vbs_Jet_phi,vbs_Jet_mass,fake_Muon_pt,fake_Muon_eta,fake_Muon_phi,fake_Muon_mass,fake_Electron_pt,fake_Electron_eta,fake_Electron_phi,fake_Electron_mass,PuppiMET_pt,PuppiMET_phi,RawPuppiMET_pt,RawPuppiMET_phi,{1},{2},{3},{4})".format(len(postFixes),jetEtaCut,getBTagCut(bTagSel,year),jetTypeCorr,year))
+              )
+
+    for nq, name in enumerate(jesBundleQuantities):
+        dftag = dftag.Define("{0}JesVar".format(name), "get_jes_bundle(jes_bundle,{0})".format(nq))
+        for nv, postFix in enumerate(postFixes):
+            dftag = dftag.Define("{0}{1}".format(name,postFix), "{0}JesVar[{1}]".format(name,nv))
+
+    return dftag
+
 def selectionJetMet(df,year,bTagSel,isData,count,jetEtaCut):
 
     jetTypeCorr = -1
@@ -266,14 +326,29 @@ def selectionJetMet(df,year,bTagSel,isData,count,jetEtaCut):
               .Define("clean_Jet_neHEF",  "Jet_neHEF[clean_jet]")
               )
 
-    if(isData == "false"):
+    if(isData == "false" and useBatchedJES == True):
         dftag =(dftag.Define("clean_Jet_genJetIdx", "Jet_genJetIdx[clean_jet]")
                      .Define("clean_Jet_ptRaw"     ,"clean_Jet_pt*(1-clean_Jet_rawFactor)")
                      .Define("clean_Jet_ptNoJESJER","clean_Jet_pt")
-                     .Define("clean_Jet_ptNoJES"   ,"compute_JSON_JER_Unc(clean_Jet_pt,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0)")
+                     .Define("clean_Jet_ptNoJES"   ,"compute_JSON_JER_Unc(clean_Jet_pt,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0,run,luminosityBlock,event)")
                      .Define("clean_Jet_ptNoJER"   ,"compute_JSON_JES_Unc(clean_Jet_pt,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run,0,-1)")
-                     .Define("clean_Jet_ptDef"    , "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0)")
-                     .Define("clean_Jet_ptJerUp"  , "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,+1)")
+                     .Define("clean_Jet_ptVar"     ,"compute_JSON_JET_Var(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,run,luminosityBlock,event)")
+                     .Define("clean_Jet_ptDef"     ,"get_JSON_JET_Var(clean_Jet_ptVar,0)")
+                     .Define("clean_Jet_ptJerUp"   ,"get_JSON_JET_Var(clean_Jet_ptVar,1)")
+                     .Define("PuppiMET_phiUnclUp","PuppiMET_phiUnclusteredUp")
+                     .Define("PuppiMET_ptUnclUp" ,"PuppiMET_ptUnclusteredUp")
+                     )
+        for nv in range(0,28):
+            dftag = dftag.Define("clean_Jet_ptJes{0:02d}Up".format(nv), "get_JSON_JET_Var(clean_Jet_ptVar,{0})".format(nv+2))
+
+    elif(isData == "false"):
+        dftag =(dftag.Define("clean_Jet_genJetIdx", "Jet_genJetIdx[clean_jet]")
+                     .Define("clean_Jet_ptRaw"     ,"clean_Jet_pt*(1-clean_Jet_rawFactor)")
+                     .Define("clean_Jet_ptNoJESJER","clean_Jet_pt")
+                     .Define("clean_Jet_ptNoJES"   ,"compute_JSON_JER_Unc(clean_Jet_pt,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0,run,luminosityBlock,event)")
+                     .Define("clean_Jet_ptNoJER"   ,"compute_JSON_JES_Unc(clean_Jet_pt,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run,0,-1)")
+                     .Define("clean_Jet_ptDef"    , "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,0,run,luminosityBlock,event)")
+                     .Define("clean_Jet_ptJerUp"  , "compute_JSON_JER_Unc(clean_Jet_ptNoJER,clean_Jet_eta,clean_Jet_genJetIdx,GenJet_pt,Rho_fixedGridRhoFastjetAll,+1,run,luminosityBlock,event)")
                      .Define("clean_Jet_ptJes00Up", "compute_JSON_JES_Unc(clean_Jet_ptDef,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run, +1,{0})".format(jetTypeCorr))
                      .Define("clean_Jet_ptJes01Up", "compute_JSON_JES_Unc(clean_Jet_ptDef,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run, +2,{0})".format(jetTypeCorr))
                      .Define("clean_Jet_ptJes02Up", "compute_JSON_JES_Unc(clean_Jet_ptDef,clean_Jet_eta,clean_Jet_phi,clean_Jet_rawFactor,clean_Jet_area,Rho_fixedGridRhoFastjetAll,run, +3,{0})".format(jetTypeCorr))
@@ -362,35 +437,38 @@ def selectionJetMet(df,year,bTagSel,isData,count,jetEtaCut):
                      )
 
     dftag = makeJES(dftag,year,""        ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes00Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes01Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes02Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes03Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes04Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes05Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes06Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes07Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes08Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes09Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes10Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes11Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes12Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes13Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes14Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes15Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes16Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes17Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes18Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes19Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes20Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes21Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes22Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes23Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes24Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes25Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes26Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"Jes27Up" ,bTagSel,jetEtaCut,jetTypeCorr)
-    dftag = makeJES(dftag,year,"JerUp"   ,bTagSel,jetEtaCut,jetTypeCorr)
+    if(useJESBundle == True):
+        dftag = makeJESBundle(dftag,year,jesBundleVariations,bTagSel,jetEtaCut,jetTypeCorr)
+    else:
+        dftag = makeJES(dftag,year,"Jes00Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes01Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes02Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes03Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes04Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes05Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes06Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes07Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes08Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes09Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes10Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes11Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes12Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes13Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes14Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes15Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes16Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes17Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes18Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes19Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes20Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes21Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes22Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes23Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes24Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes25Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes26Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"Jes27Up" ,bTagSel,jetEtaCut,jetTypeCorr)
+        dftag = makeJES(dftag,year,"JerUp"   ,bTagSel,jetEtaCut,jetTypeCorr)
     dftag = makeJES(dftag,year,"Raw"     ,bTagSel,jetEtaCut,jetTypeCorr)
     dftag = makeJES(dftag,year,"NoJESJER",bTagSel,jetEtaCut,jetTypeCorr)
     dftag = makeJES(dftag,year,"NoJES"   ,bTagSel,jetEtaCut,jetTypeCorr)
@@ -945,11 +1023,11 @@ def selectionMCWeigths(df,year,PDType,weight,type,bTagSel,useBTaggingWeights,nTh
 
               .Define("weightFake","compute_fakeRate(isData,fake_Muon_pt,fake_Muon_eta,fake_Muon_jetRelIso,tight_mu,{0},fake_Electron_pt,fake_Electron_eta,fake_Electron_jetRelIso,tight_el,{1},{2})".format(fakeRateSel[0],fakeRateSel[0],whichAna))
 
-              .Define("weightBtagSF","compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",0,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
+              .Define("weightBtagSF",jsonBTVSF("central",0,bTagSel,year))
 
-              .Define("weightMuoSFJSON","compute_JSON_MUO_SFs(\"nominal\",\"nominal\",\"nominal\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,0)")
+              .Define("weightMuoSFJSON",jsonMUOSFs("nominal","nominal","nominal",0))
 
-              .Define("weightEleSFJSON","compute_JSON_ELE_SFs(ELEYEAR,\"sf\",\"sf\",ELEWP,fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)")
+              .Define("weightEleSFJSON",jsonELESFs(ELEYEAR,"sf","sf",ELEWP))
 
               .Define("weightPUSF_Nom","compute_JSON_PU_SF(Pileup_nTrueInt,\"nominal\")")
 
@@ -1030,29 +1108,29 @@ def selectionMCWeigths(df,year,PDType,weight,type,bTagSel,useBTaggingWeights,nTh
                  .Define("weight6","weightMC*weightFake")
                  .Define("weight7","weight/weightEWKCorr")
 
-                 .Define("weightMuoSFTRKUp","weight/weightMuoSFJSON*compute_JSON_MUO_SFs(\"syst\",\"nominal\",\"nominal\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,+1)")
-                 .Define("weightMuoSFIDUp" ,"weight/weightMuoSFJSON*compute_JSON_MUO_SFs(\"nominal\",\"syst\",\"nominal\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,+1)")
-                 .Define("weightMuoSFISOUp","weight/weightMuoSFJSON*compute_JSON_MUO_SFs(\"nominal\",\"nominal\",\"syst\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,+1)")
+                 .Define("weightMuoSFTRKUp","weight/weightMuoSFJSON*"+jsonMUOSFs("syst","nominal","nominal",+1))
+                 .Define("weightMuoSFIDUp" ,"weight/weightMuoSFJSON*"+jsonMUOSFs("nominal","syst","nominal",+1))
+                 .Define("weightMuoSFISOUp","weight/weightMuoSFJSON*"+jsonMUOSFs("nominal","nominal","syst",+1))
 
-                 .Define("weightMuoSFTRKDown","weight/weightMuoSFJSON*compute_JSON_MUO_SFs(\"syst\",\"nominal\",\"nominal\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,-1)")
-                 .Define("weightMuoSFIDDown" ,"weight/weightMuoSFJSON*compute_JSON_MUO_SFs(\"nominal\",\"syst\",\"nominal\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,-1)")
-                 .Define("weightMuoSFISODown","weight/weightMuoSFJSON*compute_JSON_MUO_SFs(\"nominal\",\"nominal\",\"syst\",fake_Muon_pt,fake_Muon_eta,fake_Muon_p,-1)")
+                 .Define("weightMuoSFTRKDown","weight/weightMuoSFJSON*"+jsonMUOSFs("syst","nominal","nominal",-1))
+                 .Define("weightMuoSFIDDown" ,"weight/weightMuoSFJSON*"+jsonMUOSFs("nominal","syst","nominal",-1))
+                 .Define("weightMuoSFISODown","weight/weightMuoSFJSON*"+jsonMUOSFs("nominal","nominal","syst",-1))
 
-                 .Define("weightEleSFTRKUp","weight/weightEleSFJSON*compute_JSON_ELE_SFs(ELEYEAR,\"sfup\",\"sf\",ELEWP,fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)")
-                 .Define("weightEleSFIDUp" ,"weight/weightEleSFJSON*compute_JSON_ELE_SFs(ELEYEAR,\"sf\",\"sfup\",ELEWP,fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)")
+                 .Define("weightEleSFTRKUp","weight/weightEleSFJSON*"+jsonELESFs(ELEYEAR,"sfup","sf",ELEWP))
+                 .Define("weightEleSFIDUp" ,"weight/weightEleSFJSON*"+jsonELESFs(ELEYEAR,"sf","sfup",ELEWP))
 
-                 .Define("weightEleSFTRKDown","weight/weightEleSFJSON*compute_JSON_ELE_SFs(ELEYEAR,\"sfdown\",\"sf\",ELEWP,fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)")
-                 .Define("weightEleSFIDDown" ,"weight/weightEleSFJSON*compute_JSON_ELE_SFs(ELEYEAR,\"sf\",\"sfdown\",ELEWP,fake_Electron_pt,fake_Electron_eta,fake_Electron_phi)")
+                 .Define("weightEleSFTRKDown","weight/weightEleSFJSON*"+jsonELESFs(ELEYEAR,"sfdown","sf",ELEWP))
+                 .Define("weightEleSFIDDown" ,"weight/weightEleSFJSON*"+jsonELESFs(ELEYEAR,"sf","sfdown",ELEWP))
 
                  #.Define("weightPUSF_Up"  ,"weight/weightPUSF_Nom*compute_JSON_PU_SF(Pileup_nTrueInt,\"up\")")
                  #.Define("weightPUSF_Down","weight/weightPUSF_Nom*compute_JSON_PU_SF(Pileup_nTrueInt,\"down\")")
                  .Define("weightPUSF_Up"  ,"weight/weightPURecoSF*compute_PURecoSF(fake_Muon_pt,fake_Muon_eta,fake_Electron_pt,fake_Electron_eta,Pileup_nTrueInt,1)")
                  .Define("weightPUSF_Down","weight/weightPURecoSF*compute_PURecoSF(fake_Muon_pt,fake_Muon_eta,fake_Electron_pt,fake_Electron_eta,Pileup_nTrueInt,2)")
 
-                 .Define("weightPhoSFJSON","compute_JSON_PHO_SFs(PHOYEAR,\"sf\",PHOWP,good_Photons_pt,good_Photons_eta,good_Photons_phi)")
+                 .Define("weightPhoSFJSON",jsonPHOSFs(PHOYEAR,"sf","Medium"))
                  .Filter("weightPhoSFJSON > 0","weightPhoSFJSON > 0")
 
-                 .Define("weightTauSFJSON","compute_JSON_TAU_SFs(good_Tau_pt,good_Tau_eta,good_Tau_decayMode,good_Tau_genPartFlav,\"nom\")")
+                 .Define("weightTauSFJSON",jsonTAUSFs("nom"))
                  .Filter("weightTauSFJSON > 0","weightTauSFJSON > 0")
 
                  .Define("weightFakeAltm0","weight/weightFake*compute_fakeRate(isData,fake_Muon_pt,fake_Muon_eta,fake_Muon_jetRelIso,tight_mu,{0},fake_Electron_pt,fake_Electron_eta,fake_Electron_jetRelIso,tight_el,{1},{2})".format(fakeRateSel[1],fakeRateSel[0],whichAna))
@@ -1073,68 +1151,69 @@ def selectionMCWeigths(df,year,PDType,weight,type,bTagSel,useBTaggingWeights,nTh
                  )
 
     if(year < 20240):
-        dftag =(dftag.Define("weightBtagSFBC_02Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_03Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_bfragmentation\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_04Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_colorreconnection\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_05Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_hdamp\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_06Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_jer\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_07Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_jes\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_08Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_pdf\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_09Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_pileup\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_10Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_topmass\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_11Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_type3\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_12Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_statistic\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-
-                 .Define("weightBtagSFBC_02Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_03Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_bfragmentation\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_04Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_colorreconnection\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_05Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_hdamp\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_06Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_jer\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_07Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_jes\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_08Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_pdf\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_09Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_pileup\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_10Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_topmass\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_11Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_type3\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_12Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_statistic\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-
-                 .Define("weightBtagSFLF_00Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up\",-1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFLF_00Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down\",-1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
+        dftag =(dftag.Define("weightBtagSFBC_02Up"  ,"weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_03Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_bfragmentation",1,bTagSel,year))
+                 .Define("weightBtagSFBC_04Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_colorreconnection",1,bTagSel,year))
+                 .Define("weightBtagSFBC_05Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_hdamp",1,bTagSel,year))
+                 .Define("weightBtagSFBC_06Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_jer",1,bTagSel,year))
+                 .Define("weightBtagSFBC_07Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_jes",1,bTagSel,year))
+                 .Define("weightBtagSFBC_08Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_pdf",1,bTagSel,year))
+                 .Define("weightBtagSFBC_09Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_pileup",1,bTagSel,year))
+                 .Define("weightBtagSFBC_10Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_topmass",1,bTagSel,year))
+                 .Define("weightBtagSFBC_11Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_type3",1,bTagSel,year))
+                 .Define("weightBtagSFBC_12Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_statistic",1,bTagSel,year))
+
+                 .Define("weightBtagSFBC_02Down","weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_03Down","weight/weightBtagSF*"+jsonBTVSF("down_bfragmentation",1,bTagSel,year))
+                 .Define("weightBtagSFBC_04Down","weight/weightBtagSF*"+jsonBTVSF("down_colorreconnection",1,bTagSel,year))
+                 .Define("weightBtagSFBC_05Down","weight/weightBtagSF*"+jsonBTVSF("down_hdamp",1,bTagSel,year))
+                 .Define("weightBtagSFBC_06Down","weight/weightBtagSF*"+jsonBTVSF("down_jer",1,bTagSel,year))
+                 .Define("weightBtagSFBC_07Down","weight/weightBtagSF*"+jsonBTVSF("down_jes",1,bTagSel,year))
+                 .Define("weightBtagSFBC_08Down","weight/weightBtagSF*"+jsonBTVSF("down_pdf",1,bTagSel,year))
+                 .Define("weightBtagSFBC_09Down","weight/weightBtagSF*"+jsonBTVSF("down_pileup",1,bTagSel,year))
+                 .Define("weightBtagSFBC_10Down","weight/weightBtagSF*"+jsonBTVSF("down_topmass",1,bTagSel,year))
+                 .Define("weightBtagSFBC_11Down","weight/weightBtagSF*"+jsonBTVSF("down_type3",1,bTagSel,year))
+                 .Define("weightBtagSFBC_12Down","weight/weightBtagSF*"+jsonBTVSF("down_statistic",1,bTagSel,year))
+
+                 .Define("weightBtagSFLF_00Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up",-1,bTagSel,year))
+                 .Define("weightBtagSFLF_00Down","weight/weightBtagSF*"+jsonBTVSF("down",-1,bTagSel,year))
                  )
 
     else:
-        dftag =(dftag.Define("weightBtagSFBC_02Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_03Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_fsrdef\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_04Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_isrdef\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_05Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_hdamp\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_06Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_jer\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_07Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_jes\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_08Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_tune\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_09Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_10Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_mass\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_11Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_12Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up_statistic\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-
-                 .Define("weightBtagSFBC_02Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_03Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_fsrdef\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_04Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_isrdef\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_05Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_hdamp\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_06Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_jer\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_07Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_jes\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_08Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_tune\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_09Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_10Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_mass\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_11Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"central\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFBC_12Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down_statistic\",1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-
-                 .Define("weightBtagSFLF_00Up"  ,"weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"up\",-1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
-                 .Define("weightBtagSFLF_00Down","weight/weightBtagSF*compute_JSON_BTV_SF(goodbtag_Jet_pt,goodbtag_Jet_eta,goodbtag_Jet_btagUnifiedParTB,goodbtag_Jet_hadronFlavour,\"down\",-1,{0},{1})".format(bTagSel,getBTagCut(bTagSel,year)))
+        dftag =(dftag.Define("weightBtagSFBC_02Up"  ,"weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_03Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_fsrdef",1,bTagSel,year))
+                 .Define("weightBtagSFBC_04Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_isrdef",1,bTagSel,year))
+                 .Define("weightBtagSFBC_05Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_hdamp",1,bTagSel,year))
+                 .Define("weightBtagSFBC_06Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_jer",1,bTagSel,year))
+                 .Define("weightBtagSFBC_07Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_jes",1,bTagSel,year))
+                 .Define("weightBtagSFBC_08Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_tune",1,bTagSel,year))
+                 .Define("weightBtagSFBC_09Up"  ,"weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_10Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_mass",1,bTagSel,year))
+                 .Define("weightBtagSFBC_11Up"  ,"weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_12Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up_statistic",1,bTagSel,year))
+
+                 .Define("weightBtagSFBC_02Down","weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_03Down","weight/weightBtagSF*"+jsonBTVSF("down_fsrdef",1,bTagSel,year))
+                 .Define("weightBtagSFBC_04Down","weight/weightBtagSF*"+jsonBTVSF("down_isrdef",1,bTagSel,year))
+                 .Define("weightBtagSFBC_05Down","weight/weightBtagSF*"+jsonBTVSF("down_hdamp",1,bTagSel,year))
+                 .Define("weightBtagSFBC_06Down","weight/weightBtagSF*"+jsonBTVSF("down_jer",1,bTagSel,year))
+                 .Define("weightBtagSFBC_07Down","weight/weightBtagSF*"+jsonBTVSF("down_jes",1,bTagSel,year))
+                 .Define("weightBtagSFBC_08Down","weight/weightBtagSF*"+jsonBTVSF("down_tune",1,bTagSel,year))
+                 .Define("weightBtagSFBC_09Down","weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_10Down","weight/weightBtagSF*"+jsonBTVSF("down_mass",1,bTagSel,year))
+                 .Define("weightBtagSFBC_11Down","weight/weightBtagSF*"+jsonBTVSF("central",1,bTagSel,year))
+                 .Define("weightBtagSFBC_12Down","weight/weightBtagSF*"+jsonBTVSF("down_statistic",1,bTagSel,year))
+
+                 .Define("weightBtagSFLF_00Up"  ,"weight/weightBtagSF*"+jsonBTVSF("up",-1,bTagSel,year))
+                 .Define("weightBtagSFLF_00Down","weight/weightBtagSF*"+jsonBTVSF("down",-1,bTagSel,year))
                  )
 
+    dftag = defineTheoryRenorm(dftag,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
     if(hasTheoryColumnName[0] == True and nTheoryReplicas[2] == 4):
-        dftag =(dftag.Define("weightPS0" ,"weight*PSWeight[0]/{0}".format(genEventSumPSRenorm[0]))
-                     .Define("weightPS1" ,"weight*PSWeight[1]/{0}".format(genEventSumPSRenorm[1]))
-                     .Define("weightPS2" ,"weight*PSWeight[2]/{0}".format(genEventSumPSRenorm[2]))
-                     .Define("weightPS3" ,"weight*PSWeight[3]/{0}".format(genEventSumPSRenorm[3]))
+        dftag =(dftag.Define("weightPS0" ,"weight*PSWeight[0]/theoryRenormPS0")
+                     .Define("weightPS1" ,"weight*PSWeight[1]/theoryRenormPS1")
+                     .Define("weightPS2" ,"weight*PSWeight[2]/theoryRenormPS2")
+                     .Define("weightPS3" ,"weight*PSWeight[3]/theoryRenormPS3")
                      )
     else:
         dftag =(dftag.Define("weightPS0" ,"weight*1.0")
@@ -1145,12 +1224,12 @@ def selectionMCWeigths(df,year,PDType,weight,type,bTagSel,useBTaggingWeights,nTh
 
     if(hasTheoryColumnName[1] == True and nTheoryReplicas[1] == 9):
         #LHEScaleWeight 2 / 4 / 6 not used
-        dftag =(dftag.Define("weightQCDScale0" ,"weight*LHEScaleWeight[0]/{0}".format(genEventSumLHEScaleRenorm[0]))
-                     .Define("weightQCDScale1" ,"weight*LHEScaleWeight[1]/{0}".format(genEventSumLHEScaleRenorm[1]))
-                     .Define("weightQCDScale2" ,"weight*LHEScaleWeight[3]/{0}".format(genEventSumLHEScaleRenorm[2]))
-                     .Define("weightQCDScale3" ,"weight*LHEScaleWeight[5]/{0}".format(genEventSumLHEScaleRenorm[3]))
-                     .Define("weightQCDScale4" ,"weight*LHEScaleWeight[7]/{0}".format(genEventSumLHEScaleRenorm[4]))
-                     .Define("weightQCDScale5" ,"weight*LHEScaleWeight[8]/{0}".format(genEventSumLHEScaleRenorm[5]))
+        dftag =(dftag.Define("weightQCDScale0" ,"weight*LHEScaleWeight[0]/theoryRenormLHEScale0")
+                     .Define("weightQCDScale1" ,"weight*LHEScaleWeight[1]/theoryRenormLHEScale1")
+                     .Define("weightQCDScale2" ,"weight*LHEScaleWeight[3]/theoryRenormLHEScale2")
+                     .Define("weightQCDScale3" ,"weight*LHEScaleWeight[5]/theoryRenormLHEScale3")
+                     .Define("weightQCDScale4" ,"weight*LHEScaleWeight[7]/theoryRenormLHEScale4")
+                     .Define("weightQCDScale5" ,"weight*LHEScaleWeight[8]/theoryRenormLHEScale5")
                      )
     else:
         dftag =(dftag.Define("weightQCDScale0" ,"weight*1.0")
@@ -1168,10 +1247,22 @@ def selectionMCWeigths(df,year,PDType,weight,type,bTagSel,useBTaggingWeights,nTh
                 dftag = dftag.Define("weightPDF{0}".format(xpdf),"weight*LHEPdfWeight[{0}]".format(xpdf))
             else:
                 dftag = dftag.Define("weightPDF{0}".format(xpdf),"weight*1.0")
+        # the same 103 weights in one column, filled at once by makeFinalVariablePDFBundle
+        dftag = dftag.Define("weightPDFs","compute_theory_weights(LHEPdfWeight,weight,103,{0})".format(nTheoryReplicas[0]))
     else:
         for xpdf in range(103):
             dftag = dftag.Define("weightPDF{0}".format(xpdf),"weight*1.0")
+        dftag = dftag.Define("weightPDFs","ROOT::VecOps::RVec<double>(103,weight)")
+
+    return dftag
 
+# theory weight normalization of the sample as constant columns, so that the weightQCDScale/weightPS
+# expressions are the same for all the samples and every graph keeps its own normalization
+def defineTheoryRenorm(dftag,genEventSumLHEScaleRenorm,genEventSumPSRenorm):
+    for n in range(len(genEventSumLHEScaleRenorm)):
+        dftag = dftag.Define("theoryRenormLHEScale{0}".format(n),"{0}".format(float(genEventSumLHEScaleRenorm[n])))
+    for n in range(len(genEventSumPSRenorm)):
+        dftag = dftag.Define("theoryRenormPS{0}".format(n),"{0}".format(float(genEventSumPSRenorm[n])))
     return dftag
 
 def selectionTheoryWeigths(dftag,weight,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm):
@@ -1185,11 +1276,12 @@ def selectionTheoryWeigths(dftag,weight,nTheoryReplicas,genEventSumLHEScaleRenor
             print("No {0} weights: {1}".format(theoryColumnName[x],e))
             hasTheoryColumnName[x] = False
 
+    dftag = defineTheoryRenorm(dftag,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
     if(hasTheoryColumnName[0] == True and nTheoryReplicas[2] == 4):
-        dftag =(dftag.Define("weightPS0" ,"weight*PSWeight[0]/{0}".format(genEventSumPSRenorm[0]))
-                     .Define("weightPS1" ,"weight*PSWeight[1]/{0}".format(genEventSumPSRenorm[1]))
-                     .Define("weightPS2" ,"weight*PSWeight[2]/{0}".format(genEventSumPSRenorm[2]))
-                     .Define("weightPS3" ,"weight*PSWeight[3]/{0}".format(genEventSumPSRenorm[3]))
+        dftag =(dftag.Define("weightPS0" ,"weight*PSWeight[0]/theoryRenormPS0")
+                     .Define("weightPS1" ,"weight*PSWeight[1]/theoryRenormPS1")
+                     .Define("weightPS2" ,"weight*PSWeight[2]/theoryRenormPS2")
+                     .Define("weightPS3" ,"weight*PSWeight[3]/theoryRenormPS3")
                      )
     else:
         dftag =(dftag.Define("weightPS0" ,"weight*1.0")
@@ -1200,21 +1292,21 @@ def selectionTheoryWeigths(dftag,weight,nTheoryReplicas,genEventSumLHEScaleRenor
 
     if(hasTheoryColumnName[1] == True and nTheoryReplicas[1] == 9):
         #LHEScaleWeight 2 / 4 / 6 not used
-        dftag =(dftag.Define("weightQCDScale0" ,"weight*LHEScaleWeight[0]/{0}".format(genEventSumLHEScaleRenorm[0]))
-                     .Define("weightQCDScale1" ,"weight*LHEScaleWeight[1]/{0}".format(genEventSumLHEScaleRenorm[1]))
-                     .Define("weightQCDScale2" ,"weight*LHEScaleWeight[3]/{0}".format(genEventSumLHEScaleRenorm[2]))
-                     .Define("weightQCDScale3" ,"weight*LHEScaleWeight[5]/{0}".format(genEventSumLHEScaleRenorm[3]))
-                     .Define("weightQCDScale4" ,"weight*LHEScaleWeight[7]/{0}".format(genEventSumLHEScaleRenorm[4]))
-                     .Define("weightQCDScale5" ,"weight*LHEScaleWeight[8]/{0}".format(genEventSumLHEScaleRenorm[5]))
+        dftag =(dftag.Define("weightQCDScale0" ,"weight*LHEScaleWeight[0]/theoryRenormLHEScale0")
+                     .Define("weightQCDScale1" ,"weight*LHEScaleWeight[1]/theoryRenormLHEScale1")
+                     .Define("weightQCDScale2" ,"weight*LHEScaleWeight[3]/theoryRenormLHEScale2")
+                     .Define("weightQCDScale3" ,"weight*LHEScaleWeight[5]/theoryRenormLHEScale3")
+                     .Define("weightQCDScale4" ,"weight*LHEScaleWeight[7]/theoryRenormLHEScale4")
+                     .Define("weightQCDScale5" ,"weight*LHEScaleWeight[8]/theoryRenormLHEScale5")
                      )
     elif(hasTheoryColumnName[1] == True and nTheoryReplicas[1] == 7):
         #LHEScaleWeight 3 not used
-        dftag =(dftag.Define("weightQCDScale0" ,"weight*LHEScaleWeight[0]/{0}".format(genEventSumLHEScaleRenorm[0]))
-                     .Define("weightQCDScale1" ,"weight*LHEScaleWeight[1]/{0}".format(genEventSumLHEScaleRenorm[1]))
-                     .Define("weightQCDScale2" ,"weight*LHEScaleWeight[2]/{0}".format(genEventSumLHEScaleRenorm[2]))
-                     .Define("weightQCDScale3" ,"weight*LHEScaleWeight[4]/{0}".format(genEventSumLHEScaleRenorm[3]))
-                     .Define("weightQCDScale4" ,"weight*LHEScaleWeight[5]/{0}".format(genEventSumLHEScaleRenorm[4]))
-                     .Define("weightQCDScale5" ,"weight*LHEScaleWeight[6]/{0}".format(genEventSumLHEScaleRenorm[5]))
+        dftag =(dftag.Define("weightQCDScale0" ,"weight*LHEScaleWeight[0]/theoryRenormLHEScale0")
+                     .Define("weightQCDScale1" ,"weight*LHEScaleWeight[1]/theoryRenormLHEScale1")
+                     .Define("weightQCDScale2" ,"weight*LHEScaleWeight[2]/theoryRenormLHEScale2")
+                     .Define("weightQCDScale3" ,"weight*LHEScaleWeight[4]/theoryRenormLHEScale3")
+                     .Define("weightQCDScale4" ,"weight*LHEScaleWeight[5]/theoryRenormLHEScale4")
+                     .Define("weightQCDScale5" ,"weight*LHEScaleWeight[6]/theoryRenormLHEScale5")
                      )
     else:
         dftag =(dftag.Define("weightQCDScale0" ,"weight*1.0")
@@ -1232,9 +1324,12 @@ def selectionTheoryWeigths(dftag,weight,nTheoryReplicas,genEventSumLHEScaleRenor
                 dftag = dftag.Define("weightPDF{0}".format(xpdf),"weight*LHEPdfWeight[{0}]".format(xpdf))
             else:
                 dftag = dftag.Define("weightPDF{0}".format(xpdf),"weight*1.0")
+        # the same 103 weights in one column, filled at once by makeFinalVariablePDFBundle
+        dftag = dftag.Define("weightPDFs","compute_theory_weights(LHEPdfWeight,weight,103,{0})".format(nTheoryReplicas[0]))
     else:
         for xpdf in range(103):
             dftag = dftag.Define("weightPDF{0}".format(xpdf),"weight*1.0")
+        dftag = dftag.Define("weightPDFs","ROOT::VecOps::RVec<double>(103,weight)")
 
     return dftag
 
@@ -1254,7 +1349,69 @@ def selectionWeigths(df,isData,year,PDType,weight,type,bTagSel,useBTaggingWeight
     if(isData == "true"): return selectionDAWeigths(df,year,PDType,whichAna,fakeRateSel)
     else:                 return selectionMCWeigths(df,year,PDType,weight,type,bTagSel,useBTaggingWeights,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,MUOWP,ELEWP,correctionString,whichAna,fakeRateSel)
 
+# Systematic variations for declareVary: (variation name, tags, histogram type of each
+# tag, {nominal column: [column of each tag]}). The varied values are the <name><postFix>
+# columns already defined for the per-variation nodes, so both backends fill the same histograms
+def getVaryJES(types,quantities):
+    columns = {}
+    for name in quantities:
+        nominal = name
+        if(name.startswith("PuppiMET_")): nominal = "{0}Def".format(name)
+        columns[nominal] = ["{0}{1}".format(name,x) for x in jesBundleVariations]
+    return [("jes", jesBundleVariations, list(types), columns)]
+
+def getVaryLeptonMomentum(types,quantities,postFix):
+    columnsMu = {}
+    columnsEl = {}
+    for name in quantities:
+        columnsMu["{0}{1}".format(name,postFix)] = ["{0}MuonMomUp".format(name)]
+        columnsEl["{0}{1}".format(name,postFix)] = ["{0}ElectronMomUp".format(name)]
+    return [("muonMom", ["MuonMomUp"], [types[0]], columnsMu), ("electronMom", ["ElectronMomUp"], [types[1]], columnsEl)]
+
+def getVaryWeights(theCat,types):
+    return [("weights", ["type{0}".format(x) for x in types], list(types), {"weight": [getFinalVariableWeight(theCat,x) for x in types]})]
+
+# {"<variation name>:<tag>": histogram type}, the keys of VariationsFor
+def getVaryTypes(systematics):
+    varyTypes = {}
+    for name, tags, types, columns in systematics:
+        for tag, type in zip(tags, types):
+            varyTypes["{0}:{1}".format(name,tag)] = type
+    return varyTypes
+
+# Declares the systematics on df with RDataFrame::Vary, the columns of a variation varied
+# together. All the columns of a Vary call need the same type: one call per column type,
+# with the same variation name. Columns without all their varied columns stay nominal
+def declareVary(df,systematics):
+    for name, tags, types, columns in systematics:
+        columnTypes = {}
+        for nominal in columns:
+            if(not df.HasColumn(nominal)): continue
+            # a nominal column without some of its variations would silently stay nominal in them
+            missing = [x for x in columns[nominal] if not df.HasColumn(x)]
+            if(len(missing) > 0):
+                raise Exception("Variation {0} of {1}: columns not defined: {2}".format(name,nominal,",".join(missing)))
+            columnType = str(df.GetColumnType(nominal))
+            if(columnType not in columnTypes): columnTypes[columnType] = []
+            columnTypes[columnType].append(nominal)
+
+        for columnType, nominals in columnTypes.items():
+            values = ["ROOT::VecOps::RVec<{0}>{{{1}}}".format(columnType,",".join(["({0})({1})".format(columnType,x) for x in columns[nominal]])) for nominal in nominals]
+            if(len(nominals) == 1):
+                df = df.Vary(nominals[0], values[0], ROOT.std.vector['std::string'](tags), name)
+            else:
+                df = df.Vary(ROOT.std.vector['std::string'](nominals), "ROOT::VecOps::RVec<ROOT::VecOps::RVec<{0}>>{{{1}}}".format(columnType,",".join(values)), ROOT.std.vector['std::string'](tags), name)
+
+    return df
+
+# x given as the name of the category column (e.g. "theCat"): all the categories
+# filled by one MultiHistoHelper, split in histo_<n>_<cat> by unpackCategoryHistos
+def makeCategoryAxisVariable(df,varX,varY,theCat,start,catVar,xBins,yBins,type):
+    from multihisto_helper import MultiHistoHelper # multihisto_helper imports this module
+    return MultiHistoHelper(df,varX,varY,catVar,theCat,start,xBins,yBins,[type])
+
 def makeFinalVariable(df,var,theCat,start,x,bin,min,max,type):
+    if(isinstance(x, str)): return makeCategoryAxisVariable(df,var,None,theCat,start,x,(bin,min,max),None,type)
     histoNumber = start+type
     if(theCat == plotCategory("kPlotData")):
         return df.Histo1D(("histo_{0}_{1}".format(histoNumber,x), "histo_{0}_{1}".format(histoNumber,x),bin,min,max), "{0}".format(var),"weight")
@@ -1299,6 +1456,7 @@ def makeFinalVariable(df,var,theCat,start,x,bin,min,max,type):
     else:              return df.Histo1D(("histo_{0}_{1}".format(histoNumber,x), "histo_{0}_{1}".format(histoNumber,x),bin,min,max), "{0}".format(var),"weight")
 
 def makeFinalVariableVar(df,var,theCat,start,x,xBins,type):
+    if(isinstance(x, str)): return makeCategoryAxisVariable(df,var,None,theCat,start,x,xBins,None,type)
     histoNumber = start+type
     if(theCat == plotCategory("kPlotData")):
         return df.Histo1D(("histo_{0}_{1}".format(histoNumber,x), "histo_{0}_{1}".format(histoNumber,x),len(xBins)-1,xBins), "{0}".format(var),"weight")
@@ -1343,6 +1501,7 @@ def makeFinalVariableVar(df,var,theCat,start,x,xBins,type):
     else:              return df.Histo1D(("histo_{0}_{1}".format(histoNumber,x), "histo_{0}_{1}".format(histoNumber,x),len(xBins)-1,xBins), "{0}".format(var),"weight")
 
 def makeFinalVariable2D(df,varX,varY,theCat,start,x,binX,minX,maxX,binY,minY,maxY,type):
+    if(isinstance(x, str)): return makeCategoryAxisVariable(df,varX,varY,theCat,start,x,(binX,minX,maxX),(binY,minY,maxY),type)
     histoNumber = start+type
     if(theCat == plotCategory("kPlotData")):
         return df.Histo2D(("histo2d_{0}_{1}".format(histoNumber,x), "histo2d_{0}_{1}".format(histoNumber,x),binX,minX,maxX,binY,minY,maxY), "{0}".format(varX), "{0}".format(varY),"weight")
@@ -1387,6 +1546,7 @@ def makeFinalVariable2D(df,varX,varY,theCat,start,x,binX,minX,maxX,binY,minY,max
     else:              return df.Histo2D(("histo2d_{0}_{1}".format(histoNumber,x), "histo2d_{0}_{1}".format(histoNumber,x),binX,minX,maxX,binY,minY,maxY), "{0}".format(varX), "{0}".format(varY),"weight")
 
 def makeFinalVariable2DVar(df,varX,varY,theCat,start,x,xBins,yBins,type):
+    if(isinstance(x, str)): return makeCategoryAxisVariable(df,varX,varY,theCat,start,x,xBins,yBins,type)
     histoNumber = start+type
     if(theCat == plotCategory("kPlotData")):
         return df.Histo2D(("histo2d_{0}_{1}".format(histoNumber,x), "histo2d_{0}_{1}".format(histoNumber,x),len(xBins)-1,xBins,len(yBins)-1,yBins), "{0}".format(varX), "{0}".format(varY),"weight")
@@ -1429,3 +1589,25 @@ def makeFinalVariable2DVar(df,varX,varY,theCat,start,x,xBins,yBins,type):
     elif(type == 135): return df.Histo2D(("histo2d_{0}_{1}".format(histoNumber,x), "histo2d_{0}_{1}".format(histoNumber,x),len(xBins)-1,xBins,len(yBins)-1,yBins), "{0}".format(varX), "{0}".format(varY),"weightEWKCorrUnc")
 
     else:              return df.Histo2D(("histo2d_{0}_{1}".format(histoNumber,x), "histo2d_{0}_{1}".format(histoNumber,x),len(xBins)-1,xBins,len(yBins)-1,yBins), "{0}".format(varX), "{0}".format(varY),"weight")
+
+def getFinalVariableWeight(theCat,type):
+    if(theCat == plotCategory("kPlotData")): return "weight"
+
+    if  (type ==  0): return "weight"
+    elif(type >=  1 and type <=   4): return "weightPS{0}".format(type-1)
+    elif(type >=  5 and type <=  10): return "weightQCDScale{0}".format(type-5)
+    elif(type >= 11 and type <= 113): return "weightPDF{0}".format(type-11)
+    elif(type == 114): return "weightMuoSFTRKUp"
+    elif(type == 115): return "weightMuoSFIDUp"
+    elif(type == 116): return "weightMuoSFISOUp"
+    elif(type == 117): return "weightEleSFTRKUp"
+    elif(type == 118): return "weightEleSFIDUp"
+    elif(type == 119): return "weightPUSF_Up"
+    elif(type == 120): return "weightTriggerSFUp"
+    elif(type == 121): return "weightMuonTightSFUp"
+    elif(type == 122): return "weightElectronTightSFUp"
+    elif(type >= 123 and type <= 133): return "weightBtagSFBC_{0:02d}Up".format(type-121)
+    elif(type == 134): return "weightBtagSFLF_00Up"
+    elif(type == 135): return "weightEWKCorrUnc"
+
+    else:              return "weight"
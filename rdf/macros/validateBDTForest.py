@@ -0,0 +1,105 @@
+import ROOT
+import os, sys, getopt, time
+
+import tmva_helper_xml
+import bdt_forest
+
+# Compares the compiled BDT forest (bdt_forest.py) with the TMVA::Reader evaluation
+# (tmva_helper_xml.py) event by event and reports the throughput of both.
+# Without --input a synthetic sample uniformly distributed within the training
+# ranges of the variables (Min/Max in the XML) is used.
+
+def runInference(helper, fileName, treeName):
+
+    df = ROOT.RDataFrame(treeName, fileName)
+    df = helper.run_inference(df, "bdt_score", 0).Define("bdt", "bdt_score[0]")
+    score = df.Take["float"]("bdt")
+    entry = df.Take["ULong64_t"]("rdfentry_")
+    startTime = time.time()
+    values = score.GetValue()
+    # rdfentry_ is the tree entry for a single input tree, also with several threads
+    return dict(zip(entry.GetValue(), values)), time.time() - startTime
+
+if __name__ == "__main__":
+
+    weights = "weights_mva/bdt_BDTG_vbfinc_v0.weights.xml"
+    fileName = ""
+    treeName = "Events"
+    nEvents = 1000000
+    nThreads = 1
+
+    valid = ['weights=', 'input=', 'tree=', 'nEvents=', 'nThreads=', 'help']
+    usage  =  "Usage: validateBDTForest.py --weights=<{0}>\n".format(weights)
+    usage +=  "                            --input=<{0}> (empty: synthetic sample)\n".format(fileName)
+    usage +=  "                            --tree=<{0}>\n".format(treeName)
+    usage +=  "                            --nEvents=<{0}> (synthetic sample only)\n".format(nEvents)
+    usage +=  "                            --nThreads=<{0}>".format(nThreads)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--weights":
+            weights = str(arg)
+        if opt == "--input":
+            fileName = str(arg)
+        if opt == "--tree":
+            treeName = str(arg)
+        if opt == "--nEvents":
+            nEvents = int(arg)
+        if opt == "--nThreads":
+            nThreads = int(arg)
+
+    if(not os.path.exists(weights)):
+        print("Weights file does not exist: {0}".format(weights))
+        sys.exit(1)
+
+    forest = bdt_forest.BDTForest(weights)
+
+    # synthetic sample, written single-threaded so that it is the same for every run
+    isSynthetic = fileName == ""
+    if(isSynthetic == True):
+        fileName = "validateBDTForest_input.root"
+        ROOT.gRandom.SetSeed(1234)
+        df = ROOT.RDataFrame(nEvents)
+        for var, (varMin, varMax) in zip(forest.variables, forest.ranges):
+            df = df.Define(var, "(float)gRandom->Uniform({0},{1})".format(varMin,varMax))
+        df.Snapshot(treeName, fileName, forest.variables)
+        print("Synthetic sample: {0} events in {1}".format(nEvents,fileName))
+
+    if(nThreads > 1): ROOT.ROOT.EnableImplicitMT(nThreads)
+
+    # helpers created after EnableImplicitMT, they need one slot per thread
+    forest = bdt_forest.BDTForest(weights, "forest")
+    tmva = tmva_helper_xml.TMVAHelperXML(weights, "tmva")
+
+    scoreTMVA, timeTMVA = runInference(tmva, fileName, treeName)
+    scoreForest, timeForest = runInference(forest, fileName, treeName)
+
+    if(isSynthetic == True):
+        os.remove(fileName)
+
+    if(len(scoreTMVA) != len(scoreForest)):
+        print("FAILURE: different number of events {0} / {1}".format(len(scoreTMVA),len(scoreForest)))
+        sys.exit(1)
+
+    diffs = [abs(scoreTMVA[x]-scoreForest.get(x, float("inf"))) for x in scoreTMVA]
+    maxDiff = max(diffs) if len(diffs) > 0 else 0.0
+    nDiff = len([x for x in diffs if x > 0])
+    nEventsRead = len(scoreTMVA)
+
+    print("TMVA::Reader: {0} events in {1:.2f} s ({2:.0f} events/s)".format(nEventsRead,timeTMVA,nEventsRead/max(timeTMVA,1e-9)))
+    print("BDT forest  : {0} events in {1:.2f} s ({2:.0f} events/s)".format(nEventsRead,timeForest,nEventsRead/max(timeForest,1e-9)))
+    print("Speedup: {0:.1f}, {1} threads".format(timeTMVA/max(timeForest,1e-9),max(nThreads,1)))
+    print("Maximum difference: {0:.3e}, events with a difference: {1}".format(maxDiff,nDiff))
+
+    if(maxDiff > 1e-6):
+        print("FAILURE: the BDT forest does not reproduce TMVA")
+        sys.exit(1)
+    print("SUCCESS: the BDT forest reproduces TMVA")
@@ -3,8 +3,8 @@ import os, sys, getopt, json
 
 ROOT.ROOT.EnableImplicitMT(10)
 from utilsCategory import plotCategory
-from utilsAna import getMClist, getDATAlist
-from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi
+from utilsAna import getMClist, getDATAlist, loadSFTables, getLeptonSFTables
+from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi, getMCNormalization, getFileListFingerprint, getFileWeights
 from utilsSelection import selectionTauVeto, selectionPhoton, selectionJetMet, selection2LVar, selectionTrigger2L, selectionElMu, selectionWeigths, selectionGenLepJet, makeFinalVariable2D
 #from utilsAna import loadCorrectionSet
 
@@ -99,7 +99,7 @@ def selectionLL(df,year,PDType,isData,TRIGGERMUEG,TRIGGERDMU,TRIGGERSMU,TRIGGERD
     return dftag
 
 
-def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm):
 
     print("starting {0} / {1} / {2} / {3} / {4} / {5} / {6}".format(count,category,weight,year,PDType,isData,whichJob))
 
@@ -112,72 +112,6 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
     histoMVA = [[0 for y in range(nCat)] for x in range(nHistoMVA)]
     histoNonPrompt = [0 for y in range(nhistoNonPrompt)]
 
-    ROOT.initHisto2D(histoFakeEtaPt_mu[0],0)
-    ROOT.initHisto2D(histoFakeEtaPt_el[0],1)
-    ROOT.initHisto2D(histoLepSFEtaPt_mu,2)
-    ROOT.initHisto2D(histoLepSFEtaPt_el,3)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_0, 4)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_1, 5)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_2, 6)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_3, 7)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_0, 8)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_1, 9)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_2,10)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_3,11)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_0,12)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_1,13)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_2,14)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_3,15)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_0,16)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_1,17)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_2,18)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_3,19)
-    ROOT.initHisto2D(histoBTVEffEtaPtLF,20)
-    ROOT.initHisto2D(histoBTVEffEtaPtCJ,21)
-    ROOT.initHisto2D(histoBTVEffEtaPtBJ,22)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[1],23)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[2],24)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[3],25)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[4],26)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[5],27)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[6],28)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[7],29)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[8],30)
-    ROOT.initHisto2D(histoFakeEtaPt_el[1],31)
-    ROOT.initHisto2D(histoFakeEtaPt_el[2],32)
-    ROOT.initHisto2D(histoFakeEtaPt_el[3],33)
-    ROOT.initHisto2D(histoFakeEtaPt_el[4],34)
-    ROOT.initHisto2D(histoFakeEtaPt_el[5],35)
-    ROOT.initHisto2D(histoFakeEtaPt_el[6],36)
-    ROOT.initHisto2D(histoFakeEtaPt_el[7],37)
-    ROOT.initHisto2D(histoFakeEtaPt_el[8],38)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[0],40)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[1],41)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[2],42)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[3],43)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[4],44)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[5],45)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[6],46)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[7],47)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[8],48)
-    ROOT.initHisto2D(histoTriggerDAEtaPt[9],49)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[0],50)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[1],51)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[2],52)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[3],53)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[4],54)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[5],55)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[6],56)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[7],57)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[8],58)
-    ROOT.initHisto2D(histoTriggerMCEtaPt[9],59)
-    ROOT.initHisto2D(wsWeights[2],39)
-    ROOT.initHisto1D(puWeights[0],0)
-    ROOT.initHisto1D(puWeights[1],1)
-    ROOT.initHisto1D(puWeights[2],2)
-    ROOT.initHisto1D(wsWeights[0],8)
-    ROOT.initHisto1D(wsWeights[1],9)
-
     ROOT.initJSONSFs(year)
 
     overallTriggers = jsonObject['triggers']
@@ -988,51 +922,13 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
         histoNonPrompt[i].Write()
     myfile.Close()
 
-def readMCSample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def readMCSample(sampleNOW,year,skimType,whichJob,group):
 
     files = getMClist(sampleNOW, skimType)
     print("Total files: {0}".format(len(files)))
 
-    genEventSumWeight = 0
-    genEventSumNoWeight = 0
-    nTheoryReplicas = [103, 9, 4]
-    genEventSumLHEScaleWeight = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-    genEventSumPSWeight = [0, 0, 0, 0, 0]
-
-    dfRuns = ROOT.RDataFrame("Runs", files)
-    genEventSumWeight = dfRuns.Sum("genEventSumw").GetValue()
-    genEventSumNoWeight = dfRuns.Sum("genEventCount").GetValue()
-    try:
-        if(dfRuns.Min("nLHEPdfSumw").GetValue() < nTheoryReplicas[0]):
-            nTheoryReplicas[0] = int(dfRuns.Min("nLHEPdfSumw").GetValue())
-    except Exception as e:
-        nTheoryReplicas[0] = 0
-    for n in range(9):
-        try:
-            if(dfRuns.Min("nLHEScaleSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumLHEScaleWeight{0}".format(n),"LHEScaleSumw[{0}]".format(n))
-                genEventSumLHEScaleWeight[n] = dfRuns.Sum("genEventSumLHEScaleWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[1] = int(dfRuns.Min("nLHEScaleSumw").GetValue())
-        except Exception as e:
-            genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[1] = n
-            print("Problem with LHEScaleWeights {0}".format(e))
-    for n in range(4):
-        try:
-            if(dfRuns.Min("nPSSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumPSWeight{0}".format(n),"PSSumw[{0}]".format(n))
-                genEventSumPSWeight[n] = dfRuns.Sum("genEventSumPSWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[2] = int(dfRuns.Min("nPSSumw").GetValue())
-        except Exception as e:
-            genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[2] = n
-            print("Problem with PSWeights {0}".format(e))
-    genEventSumPSWeight[4] = dfRuns.Count().GetValue()
-    runGetEntries = dfRuns.Count().GetValue()
+    fingerprint = getFileListFingerprint(files)
+    genEventSumWeight, genEventSumNoWeight, nTheoryReplicas, genEventSumLHEScaleWeight, genEventSumPSWeight, runGetEntries = getMCNormalization(sampleNOW, skimType, files, fingerprint)
 
     print("Number of Theory replicas: {0} / {1} / {2}".format(nTheoryReplicas[0],nTheoryReplicas[1],nTheoryReplicas[2]))
 
@@ -1061,7 +957,7 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,hist
     weightApprox = (SwitchSample(sampleNOW, skimType)[1] / genEventSumNoWeight)*getLumi(year)
 
     if(whichJob != -1):
-        groupedFile = groupFiles(files, group)
+        groupedFile = groupFiles(files, group, getFileWeights(files, SwitchSample(sampleNOW, skimType)[0], fingerprint))
         files = groupedFile[whichJob]
         if(len(files) == 0):
             print("no files in job/group: {0} / {1}".format(whichJob, group))
@@ -1076,9 +972,9 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,hist
 
     PDType = os.path.basename(SwitchSample(sampleNOW, skimType)[0]).split('+')[0]
 
-    analysis(df,sampleNOW,SwitchSample(sampleNOW,skimType)[2],weight,year,PDType,"false",whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+    analysis(df,sampleNOW,SwitchSample(sampleNOW,skimType)[2],weight,year,PDType,"false",whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
 
-def readDASample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def readDASample(sampleNOW,year,skimType,whichJob,group):
 
     PDType = "0"
     if  (sampleNOW >= 1000 and sampleNOW <= 1009): PDType = "SingleMuon"
@@ -1108,7 +1004,7 @@ def readDASample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,hist
     nevents = df.Count().GetValue()
     print("%s entries in the dataset" %nevents)
 
-    analysis(df,sampleNOW,sampleNOW,weight,year,PDType,"true",whichJob,0,genEventSumLHEScaleRenorm,genEventSumPSRenorm,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+    analysis(df,sampleNOW,sampleNOW,weight,year,PDType,"true",whichJob,0,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
 
 if __name__ == "__main__":
 
@@ -1141,140 +1037,16 @@ if __name__ == "__main__":
         if opt == "--whichJob":
             whichJob = int(arg)
 
-    wsWeights = []
-    wsPath = "data/histoWSSF_{0}.root".format(year)
-    fwsFile = ROOT.TFile(wsPath)
-    wsWeights.append(fwsFile.Get("histoWSEtaSF"))
-    wsWeights.append(fwsFile.Get("histoWSEtaSF_unc"))
-    wsWeights.append(fwsFile.Get("histoWSEtaPtSF"))
-    for x in range(3):
-        wsWeights[x].SetDirectory(0)
-    fwsFile.Close()
-
-    puWeights = []
-    puPath = "data/puWeights_UL_{0}.root".format(year)
-    fPuFile = ROOT.TFile(puPath)
-    puWeights.append(fPuFile.Get("puWeights"))
-    puWeights.append(fPuFile.Get("puWeightsUp"))
-    puWeights.append(fPuFile.Get("puWeightsDown"))
-    for x in range(3):
-        puWeights[x].SetDirectory(0)
-    fPuFile.Close()
-
-    histoFakeEtaPt_mu = []
-    histoFakeEtaPt_el = []
-    fakePath = "data/histoFakeEtaPt_{0}.root".format(year)
-    fFakeFile = ROOT.TFile(fakePath)
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType3".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType3".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType3".format(elSelChoice)))
-    for x in range(9):
-        histoFakeEtaPt_mu[x].SetDirectory(0)
-        histoFakeEtaPt_el[x].SetDirectory(0)
-    fFakeFile.Close()
-
-    lepSFPath = "data/histoLepSFEtaPt_{0}{1}.root".format(year,correctionString)
-    fLepSFFile = ROOT.TFile(lepSFPath)
-    histoLepSFEtaPt_mu = fLepSFFile.Get("histoLepSFEtaPt_0_{0}".format(muSelChoice))
-    histoLepSFEtaPt_el = fLepSFFile.Get("histoLepSFEtaPt_1_{0}".format(elSelChoice))
-    histoLepSFEtaPt_mu.SetDirectory(0)
-    histoLepSFEtaPt_el.SetDirectory(0)
-    fLepSFFile.Close()
-
-    triggerSFPath = "data/histoTriggerSFEtaPt_{0}.root".format(year)
-    fTriggerSFFile = ROOT.TFile(triggerSFPath)
-    histoTriggerSFEtaPt_0_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_0")
-    histoTriggerSFEtaPt_0_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_1")
-    histoTriggerSFEtaPt_0_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_2")
-    histoTriggerSFEtaPt_0_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_3")
-    histoTriggerSFEtaPt_1_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_0")
-    histoTriggerSFEtaPt_1_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_1")
-    histoTriggerSFEtaPt_1_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_2")
-    histoTriggerSFEtaPt_1_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_3")
-    histoTriggerSFEtaPt_2_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_0")
-    histoTriggerSFEtaPt_2_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_1")
-    histoTriggerSFEtaPt_2_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_2")
-    histoTriggerSFEtaPt_2_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_3")
-    histoTriggerSFEtaPt_3_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_0")
-    histoTriggerSFEtaPt_3_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_1")
-    histoTriggerSFEtaPt_3_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_2")
-    histoTriggerSFEtaPt_3_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_3")
-    histoTriggerSFEtaPt_0_0.SetDirectory(0)
-    histoTriggerSFEtaPt_0_1.SetDirectory(0)
-    histoTriggerSFEtaPt_0_2.SetDirectory(0)
-    histoTriggerSFEtaPt_0_3.SetDirectory(0)
-    histoTriggerSFEtaPt_1_0.SetDirectory(0)
-    histoTriggerSFEtaPt_1_1.SetDirectory(0)
-    histoTriggerSFEtaPt_1_2.SetDirectory(0)
-    histoTriggerSFEtaPt_1_3.SetDirectory(0)
-    histoTriggerSFEtaPt_2_0.SetDirectory(0)
-    histoTriggerSFEtaPt_2_1.SetDirectory(0)
-    histoTriggerSFEtaPt_2_2.SetDirectory(0)
-    histoTriggerSFEtaPt_2_3.SetDirectory(0)
-    histoTriggerSFEtaPt_3_0.SetDirectory(0)
-    histoTriggerSFEtaPt_3_1.SetDirectory(0)
-    histoTriggerSFEtaPt_3_2.SetDirectory(0)
-    histoTriggerSFEtaPt_3_3.SetDirectory(0)
-    fTriggerSFFile.Close()
-
-    BTVEffPath = "data/histoBtagEffSelEtaPt_{0}.root".format(year)
-    fBTVEffPathFile = ROOT.TFile(BTVEffPath)
-    histoBTVEffEtaPtLF = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(0+3*bTagSel))
-    histoBTVEffEtaPtCJ = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(1+3*bTagSel))
-    histoBTVEffEtaPtBJ = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(2+3*bTagSel))
-    histoBTVEffEtaPtLF.SetDirectory(0)
-    histoBTVEffEtaPtCJ.SetDirectory(0)
-    histoBTVEffEtaPtBJ.SetDirectory(0)
-    fBTVEffPathFile.Close()
-
-    histoTriggerDAEtaPt = []
-    histoTriggerMCEtaPt = []
-    triggerDataPath = "data/histoTriggerForSingleLegs.root"
-    fTriggerDataPathFile = ROOT.TFile(triggerDataPath)
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_sel".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_smu".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_del0".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_del1".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_dmu0".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_dmu1".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_emu0".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_emu1".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_mue0".format(year)))
-    histoTriggerDAEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_da_mue1".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_sel".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_smu".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_del0".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_del1".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_dmu0".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_dmu1".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_emu0".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_emu1".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_mue0".format(year)))
-    histoTriggerMCEtaPt.append(fTriggerDataPathFile.Get("triggerEff_{0}_mc_mue1".format(year)))
-    for x in range(10):
-        histoTriggerDAEtaPt[x].SetDirectory(0)
-        histoTriggerMCEtaPt[x].SetDirectory(0)
-    fTriggerDataPathFile.Close()
+    sfTables = getLeptonSFTables(muSelChoice,elSelChoice,bTagSel,"histoLepSFEtaPt_{0}"+correctionString)
+    for x, trigger in enumerate(["sel", "smu", "del0", "del1", "dmu0", "dmu1", "emu0", "emu1", "mue0", "mue1"]):
+        sfTables.append(("trigda_{0}".format(x), "histoTriggerForSingleLegs", "triggerEff_{0}_da_{1}".format(year,trigger)))
+        sfTables.append(("trigmc_{0}".format(x), "histoTriggerForSingleLegs", "triggerEff_{0}_mc_{1}".format(year,trigger)))
+    loadSFTables(year, sfTables)
 
     try:
         if(process >= 0 and process < 1000):
-            readMCSample(process,year,skimType,whichJob,group,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+            readMCSample(process,year,skimType,whichJob,group)
         elif(process >= 1000):
-            readDASample(process,year,skimType,whichJob,group,wsWeights,puWeights,histoTriggerDAEtaPt,histoTriggerMCEtaPt,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+            readDASample(process,year,skimType,whichJob,group)
     except Exception as e:
         print("FAILED {0}".format(e))
@@ -3,11 +3,14 @@ import os, sys, getopt, json, time
 
 ROOT.ROOT.EnableImplicitMT(4)
 from utilsCategory import plotCategory
-from utilsAna import getMClist, getDATAlist
-from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi
+from utilsAna import getMClist, getDATAlist, loadSFTables, getLeptonSFTables, jitCacheDir
+from utilsAna import SwitchSample, groupFiles, getTriggerFromJson, getLeptomSelFromJson, getLumi, getMCNormalization, getFileListFingerprint, getFileWeights
 from utilsSelection import selectionTauVeto, selectionPhoton, selectionJetMet, selection4LVar, selectionTrigger2L, selectionElMu, selectionWeigths, selectionGenLepJet, makeFinalVariable
-from utilsMVA import redefineMVAVariables
+from utilsMVA import redefineMVAVariables, defineMVAVariations
 import tmva_helper_xml
+import bdt_forest
+from jit_cache import JitCache
+from multihisto_helper import makeCategoryHisto, selectCategory, unpackCategoryHistos
 
 makeDataCards = 3 # 1 (njets), 2 (lepton flavor), 3 (mjj)
 
@@ -18,6 +21,17 @@ doNtuples = False
 # 0 = T, 1 = M, 2 = L
 bTagSel = 0
 useBTaggingWeights = 1
+# BDT evaluated with the compiled forest (bdt_forest.h) instead of TMVA::Reader, to be
+# enabled once validateBDTForest.py agrees with TMVA on a reference sample
+useBDTForest = False
+# all the JES/JER variations of the BDT evaluated in one call per event
+useMVAVariations = True
+# theCat as an axis of the booked histograms: the selection is built once instead
+# of once per category, histo_<n>_<cat> are split at write time
+useCategoryAxis = True
+# string expressions of the graph booked from the JIT cache library when compiled there,
+# recorded for makeJitCache.py otherwise; reports the jitting and event loop times
+useJitCache = True
 
 useFR = 0
 
@@ -114,62 +128,20 @@ def selectionLL(df,year,PDType,isData,count):
     return dftag
 
 
-def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm):
 
     print("starting {0} / {1} / {2} / {3} / {4} / {5} / {6}".format(count,category,weight,year,PDType,isData,whichJob))
 
+    if(useJitCache == True):
+        jitCache = JitCache("zzAnalysis", jitCacheDir)
+        df = jitCache.wrap(df)
+
     theCat = category
     if(theCat > 100): theCat = plotCategory("kPlotData")
 
     nCat, nHisto = plotCategory("kPlotCategories"), 500
     histo    = [[0 for y in range(nCat)] for x in range(nHisto)]
 
-    ROOT.initHisto2D(histoFakeEtaPt_mu[0],0)
-    ROOT.initHisto2D(histoFakeEtaPt_el[0],1)
-    ROOT.initHisto2D(histoLepSFEtaPt_mu,2)
-    ROOT.initHisto2D(histoLepSFEtaPt_el,3)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_0, 4)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_1, 5)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_2, 6)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_0_3, 7)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_0, 8)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_1, 9)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_2,10)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_1_3,11)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_0,12)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_1,13)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_2,14)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_2_3,15)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_0,16)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_1,17)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_2,18)
-    ROOT.initHisto2D(histoTriggerSFEtaPt_3_3,19)
-    ROOT.initHisto2D(histoBTVEffEtaPtLF,20)
-    ROOT.initHisto2D(histoBTVEffEtaPtCJ,21)
-    ROOT.initHisto2D(histoBTVEffEtaPtBJ,22)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[1],23)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[2],24)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[3],25)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[4],26)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[5],27)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[6],28)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[7],29)
-    ROOT.initHisto2D(histoFakeEtaPt_mu[8],30)
-    ROOT.initHisto2D(histoFakeEtaPt_el[1],31)
-    ROOT.initHisto2D(histoFakeEtaPt_el[2],32)
-    ROOT.initHisto2D(histoFakeEtaPt_el[3],33)
-    ROOT.initHisto2D(histoFakeEtaPt_el[4],34)
-    ROOT.initHisto2D(histoFakeEtaPt_el[5],35)
-    ROOT.initHisto2D(histoFakeEtaPt_el[6],36)
-    ROOT.initHisto2D(histoFakeEtaPt_el[7],37)
-    ROOT.initHisto2D(histoFakeEtaPt_el[8],38)
-    ROOT.initHisto2D(wsWeights[2],39)
-    ROOT.initHisto1D(puWeights[0],0)
-    ROOT.initHisto1D(puWeights[1],1)
-    ROOT.initHisto1D(puWeights[2],2)
-    ROOT.initHisto1D(wsWeights[0],8)
-    ROOT.initHisto1D(wsWeights[1],9)
-
     ROOT.initJSONSFs(year)
 
     branchList = ROOT.vector('string')()
@@ -198,7 +170,10 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
         branchList.push_back(branchName)
 
     MVAweights = "weights_mva/bdt_BDTG_vbfinc_v{0}.weights.xml".format(versionMVA)
-    tmva_helper = tmva_helper_xml.TMVAHelperXML(MVAweights)
+    if(useBDTForest == True):
+        tmva_helper = bdt_forest.BDTForest(MVAweights)
+    else:
+        tmva_helper = tmva_helper_xml.TMVAHelperXML(MVAweights)
     print(tmva_helper.variables)
 
     dftag = selectionLL(df,year,PDType,isData,count)
@@ -220,8 +195,6 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
                     .Define("theCat","compute_category({0},kPlotNonPrompt,kPlotWS,nFake,nTight,0)".format(theCat))
                     )
 
-    dfbase = tmva_helper.run_inference(dfbase,"bdt_vbfinc",0)
-
     dfzzcat = []
     dfzzxycat = []
     dfzzjjcat = []
@@ -261,24 +234,38 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
     dfzzcatJERUp           = []
     dfzzcatJESUp           = []
     dfzzcatUnclusteredUp   = []
-    for x in range(nCat):
-        dfzzcat.append(dfbase.Filter("theCat=={0}".format(x), "correct category ({0})".format(x)))
-
-        histo[ 0][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 0,x), "histo_{0}_{1}".format( 0,x),120,  0, 120), "mllmin{0}".format(altMass),"weight")
+    nCatSel = nCat
+    if(useCategoryAxis == True): nCatSel = 1
+    for x in range(nCatSel):
+        catX = x
+        if(useCategoryAxis == True):
+            catX = "theCat"
+            dfzzcat.append(dfbase)
+        else:
+            dfzzcat.append(dfbase.Filter("theCat=={0}".format(x), "correct category ({0})".format(x)))
+
+        histo[ 0][x] = makeCategoryHisto(dfzzcat[x],"mllmin{0}".format(altMass),"weight",catX,0,120,0,120)
         dfzzcat[x] = dfzzcat[x].Filter("mllmin{0} > 5".format(altMass),"mllmin cut")
 
-        histo[21][x] = dfzzcat[x].Filter("mllZ1 == -1 && Sum(vtight_mu)+Sum(vtight_el) == 4").Histo1D(("histo_{0}_{1}".format(21,x), "histo_{0}_{1}".format(21,x),3,-0.5, 2.5), "FourLepton_flavor","weight")
-        histo[22][x] = dfzzcat[x].Filter("mllZ1 == -1 && Sum(vtight_mu)+Sum(vtight_el) == 4").Histo1D(("histo_{0}_{1}".format(22,x), "histo_{0}_{1}".format(22,x),10, 0, 500), "m4l","weight")
-        histo[23][x] = dfzzcat[x].Filter("mllZ1 == -1 && Sum(vtight_mu)+Sum(vtight_el) == 4").Histo1D(("histo_{0}_{1}".format(23,x), "histo_{0}_{1}".format(23,x),5,-0.5 ,4.5), "nbtag_goodbtag_Jet_bjet","weightBTag")
+        histo[21][x] = makeCategoryHisto(dfzzcat[x].Filter("mllZ1 == -1 && Sum(vtight_mu)+Sum(vtight_el) == 4"),"FourLepton_flavor","weight",catX,21,3,-0.5,2.5)
+        histo[22][x] = makeCategoryHisto(dfzzcat[x].Filter("mllZ1 == -1 && Sum(vtight_mu)+Sum(vtight_el) == 4"),"m4l","weight",catX,22,10,0,500)
+        histo[23][x] = makeCategoryHisto(dfzzcat[x].Filter("mllZ1 == -1 && Sum(vtight_mu)+Sum(vtight_el) == 4"),"nbtag_goodbtag_Jet_bjet","weightBTag",catX,23,5,-0.5,4.5)
 
-        histo[ 1][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 1,x), "histo_{0}_{1}".format( 1,x),100,  0, 100), "mllZ1{0}".format(altMass),"weight")
+        histo[ 1][x] = makeCategoryHisto(dfzzcat[x],"mllZ1{0}".format(altMass),"weight",catX,1,100,0,100)
         dfzzcat[x] = dfzzcat[x].Filter("mllZ1{0} < 10000 && mllZ1{0} > 0".format(altMass),"mllZ1 cut")
 
         dfzzxycat.append(dfzzcat[x].Filter("mllxy{0} > 0 && Sum(vtight_mu)+Sum(vtight_el) == 4 && mllZ1{0} < 15".format(altMass)))
 
-        histo[ 2][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 2,x), "histo_{0}_{1}".format( 2,x),100,  0, 100), "mllZ2{0}".format(altMass),"weight")
+        histo[ 2][x] = makeCategoryHisto(dfzzcat[x],"mllZ2{0}".format(altMass),"weight",catX,2,100,0,100)
         dfzzcat[x] = dfzzcat[x].Filter("mllZ2{0} < 10000".format(altMass),"mllZ2 cut")
 
+        # BDT booked where the VBS selections branch off, the variations are only evaluated
+        # for the events passing their VBS preselection (see defineMVAVariations)
+        if(useMVAVariations == True):
+            dfzzcat[x] = defineMVAVariations(dfzzcat[x],tmva_helper,["Jes{0:02d}Up".format(nv) for nv in range(28)]+["JerUp"],versionMVA)
+        else:
+            dfzzcat[x] = tmva_helper.run_inference(dfzzcat[x],"bdt_vbfinc",0)
+
         dfzzcatMuonMomUp    .append(dfzzcat[x])
         dfzzcatElectronMomUp.append(dfzzcat[x])
         dfzzcatJes00Up      .append(dfzzcat[x])
@@ -416,52 +403,52 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
             dfzzcatJes27Up[x] = redefineMVAVariables(dfzzcatJes27Up[x],tmva_helper,"Jes27Up",versionMVA)
             dfzzcatJerUp  [x] = redefineMVAVariables(dfzzcatJerUp  [x],tmva_helper,"JerUp"  ,versionMVA)
 
-        histo[ 3][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 3,x), "histo_{0}_{1}".format( 3,x), 40, 10, 210), "ptl1Z1{0}".format(altMass),"weight")
-        histo[ 4][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 4,x), "histo_{0}_{1}".format( 4,x), 20, 10, 110), "ptl2Z1{0}".format(altMass),"weight")
-        histo[ 5][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 5,x), "histo_{0}_{1}".format( 5,x), 40, 10, 210), "ptl1Z2{0}".format(altMass),"weight")
-        histo[ 6][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 6,x), "histo_{0}_{1}".format( 6,x), 20, 10, 110), "ptl2Z2{0}".format(altMass),"weight")
-        histo[ 7][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 7,x), "histo_{0}_{1}".format( 7,x), 40,150, 550), "m4l{0}".format(altMass),"weight")
-        histo[ 8][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 8,x), "histo_{0}_{1}".format( 8,x),3,-0.5, 2.5), "FourLepton_flavor","weight")
-        histo[ 9][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format( 9,x), "histo_{0}_{1}".format( 9,x), 4,-0.5, 3.5), "ngood_jets","weight")
-        histo[10][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format(10,x), "histo_{0}_{1}".format(10,x), 40,  0, 200), "PuppiMET_pt{0}".format(altMass),"weight")
+        histo[ 3][x] = makeCategoryHisto(dfzzcat[x],"ptl1Z1{0}".format(altMass),"weight",catX,3,40,10,210)
+        histo[ 4][x] = makeCategoryHisto(dfzzcat[x],"ptl2Z1{0}".format(altMass),"weight",catX,4,20,10,110)
+        histo[ 5][x] = makeCategoryHisto(dfzzcat[x],"ptl1Z2{0}".format(altMass),"weight",catX,5,40,10,210)
+        histo[ 6][x] = makeCategoryHisto(dfzzcat[x],"ptl2Z2{0}".format(altMass),"weight",catX,6,20,10,110)
+        histo[ 7][x] = makeCategoryHisto(dfzzcat[x],"m4l{0}".format(altMass),"weight",catX,7,40,150,550)
+        histo[ 8][x] = makeCategoryHisto(dfzzcat[x],"FourLepton_flavor","weight",catX,8,3,-0.5,2.5)
+        histo[ 9][x] = makeCategoryHisto(dfzzcat[x],"ngood_jets","weight",catX,9,4,-0.5,3.5)
+        histo[10][x] = makeCategoryHisto(dfzzcat[x],"PuppiMET_pt{0}".format(altMass),"weight",catX,10,40,0,200)
 
         dfzzjjcat.append(dfzzcat[x] .Filter("nvbs_jets >= 2", "At least two VBS jets"))
-        histo[11][x] = dfzzjjcat[x]  .Histo1D(("histo_{0}_{1}".format(11,x), "histo_{0}_{1}".format(11,x), 4,1.5, 5.5), "ngood_jets","weight")
-        histo[12][x] = dfzzjjcat[x]  .Histo1D(("histo_{0}_{1}".format(12,x), "histo_{0}_{1}".format(12,x), 20,0,2000), "vbs_mjj","weight")
-        histo[13][x] = dfzzjjcat[x]  .Histo1D(("histo_{0}_{1}".format(13,x), "histo_{0}_{1}".format(13,x), 20,0,10), "vbs_detajj","weight")
-        histo[14][x] = dfzzjjcat[x]  .Histo1D(("histo_{0}_{1}".format(14,x), "histo_{0}_{1}".format(14,x), 20,0,3.1416), "vbs_dphijj","weight")
-        histo[15][x] = dfzzjjcat[x]  .Histo1D(("histo_{0}_{1}".format(15,x), "histo_{0}_{1}".format(15,x), 20,-1,1), "bdt_vbfinc","weight")
+        histo[11][x] = makeCategoryHisto(dfzzjjcat[x]  ,"ngood_jets","weight",catX,11,4,1.5,5.5)
+        histo[12][x] = makeCategoryHisto(dfzzjjcat[x]  ,"vbs_mjj","weight",catX,12,20,0,2000)
+        histo[13][x] = makeCategoryHisto(dfzzjjcat[x]  ,"vbs_detajj","weight",catX,13,20,0,10)
+        histo[14][x] = makeCategoryHisto(dfzzjjcat[x]  ,"vbs_dphijj","weight",catX,14,20,0,3.1416)
+        histo[15][x] = makeCategoryHisto(dfzzjjcat[x]  ,"bdt_vbfinc","weight",catX,15,20,-1,1)
 
         dfzzvbscat.append(dfzzjjcat[x] .Filter(VBSSEL, "VBS selection"))
-        histo[16][x] = dfzzvbscat[x] .Histo1D(("histo_{0}_{1}".format(16,x), "histo_{0}_{1}".format(16,x), 4,1.5, 5.5), "ngood_jets","weight")
-        histo[17][x] = dfzzvbscat[x] .Histo1D(("histo_{0}_{1}".format(17,x), "histo_{0}_{1}".format(17,x), 10,500,2500), "vbs_mjj","weight")
-        histo[18][x] = dfzzvbscat[x] .Histo1D(("histo_{0}_{1}".format(18,x), "histo_{0}_{1}".format(18,x), 14,2.5,9.5), "vbs_detajj","weight")
-        histo[19][x] = dfzzvbscat[x] .Histo1D(("histo_{0}_{1}".format(19,x), "histo_{0}_{1}".format(19,x), 10,0,3.1416), "vbs_dphijj","weight")
-        histo[20][x] = dfzzvbscat[x] .Histo1D(("histo_{0}_{1}".format(20,x), "histo_{0}_{1}".format(20,x), 20,-1,1), "bdt_vbfinc","weight")
+        histo[16][x] = makeCategoryHisto(dfzzvbscat[x] ,"ngood_jets","weight",catX,16,4,1.5,5.5)
+        histo[17][x] = makeCategoryHisto(dfzzvbscat[x] ,"vbs_mjj","weight",catX,17,10,500,2500)
+        histo[18][x] = makeCategoryHisto(dfzzvbscat[x] ,"vbs_detajj","weight",catX,18,14,2.5,9.5)
+        histo[19][x] = makeCategoryHisto(dfzzvbscat[x] ,"vbs_dphijj","weight",catX,19,10,0,3.1416)
+        histo[20][x] = makeCategoryHisto(dfzzvbscat[x] ,"bdt_vbfinc","weight",catX,20,20,-1,1)
 
         if(makeDataCards == 3):
             dfzzcat[x] = dfzzcat[x].Filter(VBSSEL, "VBS selection")
 
-        if(doNtuples == True and x == theCat):
+        if(doNtuples == True and (useCategoryAxis == True or x == theCat)):
             outputFile = "ntupleZZAna_sample{0}_year{1}_job{2}.root".format(count,year,whichJob)
-            dfzzcat[x].Snapshot("events", outputFile, branchList)
+            selectCategory(dfzzcat[x],catX,theCat).Snapshot("events", outputFile, branchList)
 
-        histo[24][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(24,x), "histo_{0}_{1}".format(24,x),5,-0.5 ,4.5), "nbtag_goodbtag_Jet_bjet","weightBTag")
-        histo[25][x] = dfzzxycat[x].Filter("nbtag_goodbtag_Jet_bjet > 0").Histo1D(("histo_{0}_{1}".format(25,x), "histo_{0}_{1}".format(25,x),20, 0, 500), "m4l","weightBTag")
+        histo[24][x] = makeCategoryHisto(dfzzxycat[x],"nbtag_goodbtag_Jet_bjet","weightBTag",catX,24,5,-0.5,4.5)
+        histo[25][x] = makeCategoryHisto(dfzzxycat[x].Filter("nbtag_goodbtag_Jet_bjet > 0"),"m4l","weightBTag",catX,25,20,0,500)
 
         dfzzxycat[x] = dfzzxycat[x].Filter("nbtag_goodbtag_Jet_bjet == 0")
 
-        histo[26][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(26,x), "histo_{0}_{1}".format(26,x),3,-0.5, 2.5), "FourLepton_flavor","weightBTag")
-        histo[27][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(27,x), "histo_{0}_{1}".format(27,x),20, 5, 205), "mllxy{0}".format(altMass),"weightBTag")
-        histo[28][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(28,x), "histo_{0}_{1}".format(28,x),20, 0, 200), "PuppiMET_pt{0}".format(altMass),"weightBTag")
-        histo[29][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(29,x), "histo_{0}_{1}".format(29,x),20, 0, 500), "m4l{0}".format(altMass),"weightBTag")
-        histo[30][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(30,x), "histo_{0}_{1}".format(30,x),20, 0, 200), "ptZ2{0}".format(altMass),"weightBTag")
-        histo[31][x] = dfzzxycat[x].Histo1D(("histo_{0}_{1}".format(31,x), "histo_{0}_{1}".format(31,x),20, 0, 200), "mtxy{0}".format(altMass),"weightBTag")
+        histo[26][x] = makeCategoryHisto(dfzzxycat[x],"FourLepton_flavor","weightBTag",catX,26,3,-0.5,2.5)
+        histo[27][x] = makeCategoryHisto(dfzzxycat[x],"mllxy{0}".format(altMass),"weightBTag",catX,27,20,5,205)
+        histo[28][x] = makeCategoryHisto(dfzzxycat[x],"PuppiMET_pt{0}".format(altMass),"weightBTag",catX,28,20,0,200)
+        histo[29][x] = makeCategoryHisto(dfzzxycat[x],"m4l{0}".format(altMass),"weightBTag",catX,29,20,0,500)
+        histo[30][x] = makeCategoryHisto(dfzzxycat[x],"ptZ2{0}".format(altMass),"weightBTag",catX,30,20,0,200)
+        histo[31][x] = makeCategoryHisto(dfzzxycat[x],"mtxy{0}".format(altMass),"weightBTag",catX,31,20,0,200)
 
-        histo[91][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format(91,x), "histo_{0}_{1}".format(91,x),3,-0.5, 2.5), "FourLepton_flavor","weight3")
-        histo[92][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format(92,x), "histo_{0}_{1}".format(92,x),3,-0.5, 2.5), "FourLepton_flavor","weight4")
-        histo[93][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format(93,x), "histo_{0}_{1}".format(93,x),3,-0.5, 2.5), "FourLepton_flavor","weightBTag")
-        histo[94][x] = dfzzcat[x].Histo1D(("histo_{0}_{1}".format(94,x), "histo_{0}_{1}".format(94,x),3,-0.5, 2.5), "FourLepton_flavor","weightNoBTag")
+        histo[91][x] = makeCategoryHisto(dfzzcat[x],"FourLepton_flavor","weight3",catX,91,3,-0.5,2.5)
+        histo[92][x] = makeCategoryHisto(dfzzcat[x],"FourLepton_flavor","weight4",catX,92,3,-0.5,2.5)
+        histo[93][x] = makeCategoryHisto(dfzzcat[x],"FourLepton_flavor","weightBTag",catX,93,3,-0.5,2.5)
+        histo[94][x] = makeCategoryHisto(dfzzcat[x],"FourLepton_flavor","weightNoBTag",catX,94,3,-0.5,2.5)
 
         if(makeDataCards == 1):
             BinXF = 4
@@ -470,41 +457,41 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
 
             startF = 300
             for nv in range(0,135):
-                histo[startF+nv][x] = makeFinalVariable(dfzzcat[x],"ngood_jets",theCat,startF,x,BinXF,minXF,maxXF,nv)
-            histo[startF+135][x]    = makeFinalVariable(dfzzcatMuonMomUp      [x],"ngood_jets",theCat,startF,x,BinXF,minXF,maxXF,135)
-            histo[startF+136][x]    = makeFinalVariable(dfzzcatElectronMomUp  [x],"ngood_jets",theCat,startF,x,BinXF,minXF,maxXF,136)
-            histo[startF+137][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes00Up"        ,theCat,startF,x,BinXF,minXF,maxXF,137)
-            histo[startF+138][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes01Up"        ,theCat,startF,x,BinXF,minXF,maxXF,138)
-            histo[startF+139][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes02Up"        ,theCat,startF,x,BinXF,minXF,maxXF,139)
-            histo[startF+140][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes03Up"        ,theCat,startF,x,BinXF,minXF,maxXF,140)
-            histo[startF+141][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes04Up"        ,theCat,startF,x,BinXF,minXF,maxXF,141)
-            histo[startF+142][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes05Up"        ,theCat,startF,x,BinXF,minXF,maxXF,142)
-            histo[startF+143][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes06Up"        ,theCat,startF,x,BinXF,minXF,maxXF,143)
-            histo[startF+144][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes07Up"        ,theCat,startF,x,BinXF,minXF,maxXF,144)
-            histo[startF+145][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes08Up"        ,theCat,startF,x,BinXF,minXF,maxXF,145)
-            histo[startF+146][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes09Up"        ,theCat,startF,x,BinXF,minXF,maxXF,146)
-            histo[startF+147][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes10Up"        ,theCat,startF,x,BinXF,minXF,maxXF,147)
-            histo[startF+148][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes11Up"        ,theCat,startF,x,BinXF,minXF,maxXF,148)
-            histo[startF+149][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes12Up"        ,theCat,startF,x,BinXF,minXF,maxXF,149)
-            histo[startF+150][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes13Up"        ,theCat,startF,x,BinXF,minXF,maxXF,150)
-            histo[startF+151][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes14Up"        ,theCat,startF,x,BinXF,minXF,maxXF,151)
-            histo[startF+152][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes15Up"        ,theCat,startF,x,BinXF,minXF,maxXF,152)
-            histo[startF+153][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes16Up"        ,theCat,startF,x,BinXF,minXF,maxXF,153)
-            histo[startF+154][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes17Up"        ,theCat,startF,x,BinXF,minXF,maxXF,154)
-            histo[startF+155][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes18Up"        ,theCat,startF,x,BinXF,minXF,maxXF,155)
-            histo[startF+156][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes19Up"        ,theCat,startF,x,BinXF,minXF,maxXF,156)
-            histo[startF+157][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes20Up"        ,theCat,startF,x,BinXF,minXF,maxXF,157)
-            histo[startF+158][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes21Up"        ,theCat,startF,x,BinXF,minXF,maxXF,158)
-            histo[startF+159][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes22Up"        ,theCat,startF,x,BinXF,minXF,maxXF,159)
-            histo[startF+160][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes23Up"        ,theCat,startF,x,BinXF,minXF,maxXF,160)
-            histo[startF+161][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes24Up"        ,theCat,startF,x,BinXF,minXF,maxXF,161)
-            histo[startF+162][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes25Up"        ,theCat,startF,x,BinXF,minXF,maxXF,162)
-            histo[startF+163][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes26Up"        ,theCat,startF,x,BinXF,minXF,maxXF,163)
-            histo[startF+164][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes27Up"        ,theCat,startF,x,BinXF,minXF,maxXF,164)
-            histo[startF+165][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJerUp"          ,theCat,startF,x,BinXF,minXF,maxXF,165)
-            histo[startF+166][x]    = makeFinalVariable(dfzzcat[x],"ngood_jets"               ,theCat,startF,x,BinXF,minXF,maxXF,166)
-            histo[startF+167][x]    = makeFinalVariable(dfzzcat[x],"ngood_jets"               ,theCat,startF,x,BinXF,minXF,maxXF,167)
-            histo[startF+168][x]    = makeFinalVariable(dfzzcat[x],"ngood_jets"               ,theCat,startF,x,BinXF,minXF,maxXF,168)
+                histo[startF+nv][x] = makeFinalVariable(dfzzcat[x],"ngood_jets",theCat,startF,catX,BinXF,minXF,maxXF,nv)
+            histo[startF+135][x]    = makeFinalVariable(dfzzcatMuonMomUp      [x],"ngood_jets",theCat,startF,catX,BinXF,minXF,maxXF,135)
+            histo[startF+136][x]    = makeFinalVariable(dfzzcatElectronMomUp  [x],"ngood_jets",theCat,startF,catX,BinXF,minXF,maxXF,136)
+            histo[startF+137][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes00Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,137)
+            histo[startF+138][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes01Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,138)
+            histo[startF+139][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes02Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,139)
+            histo[startF+140][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes03Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,140)
+            histo[startF+141][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes04Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,141)
+            histo[startF+142][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes05Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,142)
+            histo[startF+143][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes06Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,143)
+            histo[startF+144][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes07Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,144)
+            histo[startF+145][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes08Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,145)
+            histo[startF+146][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes09Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,146)
+            histo[startF+147][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes10Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,147)
+            histo[startF+148][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes11Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,148)
+            histo[startF+149][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes12Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,149)
+            histo[startF+150][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes13Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,150)
+            histo[startF+151][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes14Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,151)
+            histo[startF+152][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes15Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,152)
+            histo[startF+153][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes16Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,153)
+            histo[startF+154][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes17Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,154)
+            histo[startF+155][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes18Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,155)
+            histo[startF+156][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes19Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,156)
+            histo[startF+157][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes20Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,157)
+            histo[startF+158][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes21Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,158)
+            histo[startF+159][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes22Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,159)
+            histo[startF+160][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes23Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,160)
+            histo[startF+161][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes24Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,161)
+            histo[startF+162][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes25Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,162)
+            histo[startF+163][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes26Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,163)
+            histo[startF+164][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJes27Up"        ,theCat,startF,catX,BinXF,minXF,maxXF,164)
+            histo[startF+165][x]    = makeFinalVariable(dfzzcat[x],"ngood_jetsJerUp"          ,theCat,startF,catX,BinXF,minXF,maxXF,165)
+            histo[startF+166][x]    = makeFinalVariable(dfzzcat[x],"ngood_jets"               ,theCat,startF,catX,BinXF,minXF,maxXF,166)
+            histo[startF+167][x]    = makeFinalVariable(dfzzcat[x],"ngood_jets"               ,theCat,startF,catX,BinXF,minXF,maxXF,167)
+            histo[startF+168][x]    = makeFinalVariable(dfzzcat[x],"ngood_jets"               ,theCat,startF,catX,BinXF,minXF,maxXF,168)
 
         elif(makeDataCards == 2):
             BinXF = 1
@@ -513,41 +500,41 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
 
             startF = 300
             for nv in range(0,135):
-                histo[startF+nv][x] = makeFinalVariable(dfzzcat[x],"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,nv)
-            histo[startF+135][x]    = makeFinalVariable(dfzzcatMuonMomUp      [x],"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,135)
-            histo[startF+136][x]    = makeFinalVariable(dfzzcatElectronMomUp  [x],"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,136)
-            histo[startF+137][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,137)
-            histo[startF+138][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,138)
-            histo[startF+139][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,139)
-            histo[startF+140][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,140)
-            histo[startF+141][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,141)
-            histo[startF+142][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,142)
-            histo[startF+143][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,143)
-            histo[startF+144][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,144)
-            histo[startF+145][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,145)
-            histo[startF+146][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,146)
-            histo[startF+147][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,147)
-            histo[startF+148][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,148)
-            histo[startF+149][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,149)
-            histo[startF+150][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,150)
-            histo[startF+151][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,151)
-            histo[startF+152][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,152)
-            histo[startF+153][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,153)
-            histo[startF+154][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,154)
-            histo[startF+155][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,155)
-            histo[startF+156][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,156)
-            histo[startF+157][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,157)
-            histo[startF+158][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,158)
-            histo[startF+159][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,159)
-            histo[startF+160][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,160)
-            histo[startF+161][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,161)
-            histo[startF+162][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,162)
-            histo[startF+163][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,163)
-            histo[startF+164][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,164)
-            histo[startF+165][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,165)
-            histo[startF+166][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,166)
-            histo[startF+167][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,167)
-            histo[startF+168][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,x,BinXF,minXF,maxXF,168)
+                histo[startF+nv][x] = makeFinalVariable(dfzzcat[x],"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,nv)
+            histo[startF+135][x]    = makeFinalVariable(dfzzcatMuonMomUp      [x],"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,135)
+            histo[startF+136][x]    = makeFinalVariable(dfzzcatElectronMomUp  [x],"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,136)
+            histo[startF+137][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,137)
+            histo[startF+138][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,138)
+            histo[startF+139][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,139)
+            histo[startF+140][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,140)
+            histo[startF+141][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,141)
+            histo[startF+142][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,142)
+            histo[startF+143][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,143)
+            histo[startF+144][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,144)
+            histo[startF+145][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,145)
+            histo[startF+146][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,146)
+            histo[startF+147][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,147)
+            histo[startF+148][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,148)
+            histo[startF+149][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,149)
+            histo[startF+150][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,150)
+            histo[startF+151][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,151)
+            histo[startF+152][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,152)
+            histo[startF+153][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,153)
+            histo[startF+154][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,154)
+            histo[startF+155][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,155)
+            histo[startF+156][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,156)
+            histo[startF+157][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,157)
+            histo[startF+158][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,158)
+            histo[startF+159][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,159)
+            histo[startF+160][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,160)
+            histo[startF+161][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,161)
+            histo[startF+162][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,162)
+            histo[startF+163][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,163)
+            histo[startF+164][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,164)
+            histo[startF+165][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,165)
+            histo[startF+166][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,166)
+            histo[startF+167][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,167)
+            histo[startF+168][x]    = makeFinalVariable(dfzzcat[x]               ,"FourLepton_flavor",theCat,startF,catX,BinXF,minXF,maxXF,168)
 
         elif(makeDataCards == 3):
             BinXF = 4
@@ -593,49 +580,53 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
 
             startF = 300
             for nv in range(0,136):
-                histo[startF+nv][x] = makeFinalVariable(dfzzcat[x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,nv)
-            histo[startF+136][x]    = makeFinalVariable(dfzzcatMuonMomUp    [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,136)
-            histo[startF+137][x]    = makeFinalVariable(dfzzcatElectronMomUp[x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,137)
-            histo[startF+138][x]    = makeFinalVariable(dfzzcatJes00Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,138)
-            histo[startF+139][x]    = makeFinalVariable(dfzzcatJes01Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,139)
-            histo[startF+140][x]    = makeFinalVariable(dfzzcatJes02Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,140)
-            histo[startF+141][x]    = makeFinalVariable(dfzzcatJes03Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,141)
-            histo[startF+142][x]    = makeFinalVariable(dfzzcatJes04Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,142)
-            histo[startF+143][x]    = makeFinalVariable(dfzzcatJes05Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,143)
-            histo[startF+144][x]    = makeFinalVariable(dfzzcatJes06Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,144)
-            histo[startF+145][x]    = makeFinalVariable(dfzzcatJes07Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,145)
-            histo[startF+146][x]    = makeFinalVariable(dfzzcatJes08Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,146)
-            histo[startF+147][x]    = makeFinalVariable(dfzzcatJes09Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,147)
-            histo[startF+148][x]    = makeFinalVariable(dfzzcatJes10Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,148)
-            histo[startF+149][x]    = makeFinalVariable(dfzzcatJes11Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,149)
-            histo[startF+150][x]    = makeFinalVariable(dfzzcatJes12Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,150)
-            histo[startF+151][x]    = makeFinalVariable(dfzzcatJes13Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,151)
-            histo[startF+152][x]    = makeFinalVariable(dfzzcatJes14Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,152)
-            histo[startF+153][x]    = makeFinalVariable(dfzzcatJes15Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,153)
-            histo[startF+154][x]    = makeFinalVariable(dfzzcatJes16Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,154)
-            histo[startF+155][x]    = makeFinalVariable(dfzzcatJes17Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,155)
-            histo[startF+156][x]    = makeFinalVariable(dfzzcatJes18Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,156)
-            histo[startF+157][x]    = makeFinalVariable(dfzzcatJes19Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,157)
-            histo[startF+158][x]    = makeFinalVariable(dfzzcatJes20Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,158)
-            histo[startF+159][x]    = makeFinalVariable(dfzzcatJes21Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,159)
-            histo[startF+160][x]    = makeFinalVariable(dfzzcatJes22Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,160)
-            histo[startF+161][x]    = makeFinalVariable(dfzzcatJes23Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,161)
-            histo[startF+162][x]    = makeFinalVariable(dfzzcatJes24Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,162)
-            histo[startF+163][x]    = makeFinalVariable(dfzzcatJes25Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,163)
-            histo[startF+164][x]    = makeFinalVariable(dfzzcatJes26Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,164)
-            histo[startF+165][x]    = makeFinalVariable(dfzzcatJes27Up      [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,165)
-            histo[startF+166][x]    = makeFinalVariable(dfzzcatJerUp        [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,166)
-            histo[startF+167][x]    = makeFinalVariable(dfzzcatJERUp        [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,167)
-            histo[startF+168][x]    = makeFinalVariable(dfzzcatJESUp        [x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,168)
-            histo[startF+169][x]    = makeFinalVariable(dfzzcatUnclusteredUp[x],"finalVar",theCat,startF,x,BinXF,minXF,maxXF,169)
+                histo[startF+nv][x] = makeFinalVariable(dfzzcat[x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,nv)
+            histo[startF+136][x]    = makeFinalVariable(dfzzcatMuonMomUp    [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,136)
+            histo[startF+137][x]    = makeFinalVariable(dfzzcatElectronMomUp[x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,137)
+            histo[startF+138][x]    = makeFinalVariable(dfzzcatJes00Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,138)
+            histo[startF+139][x]    = makeFinalVariable(dfzzcatJes01Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,139)
+            histo[startF+140][x]    = makeFinalVariable(dfzzcatJes02Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,140)
+            histo[startF+141][x]    = makeFinalVariable(dfzzcatJes03Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,141)
+            histo[startF+142][x]    = makeFinalVariable(dfzzcatJes04Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,142)
+            histo[startF+143][x]    = makeFinalVariable(dfzzcatJes05Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,143)
+            histo[startF+144][x]    = makeFinalVariable(dfzzcatJes06Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,144)
+            histo[startF+145][x]    = makeFinalVariable(dfzzcatJes07Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,145)
+            histo[startF+146][x]    = makeFinalVariable(dfzzcatJes08Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,146)
+            histo[startF+147][x]    = makeFinalVariable(dfzzcatJes09Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,147)
+            histo[startF+148][x]    = makeFinalVariable(dfzzcatJes10Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,148)
+            histo[startF+149][x]    = makeFinalVariable(dfzzcatJes11Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,149)
+            histo[startF+150][x]    = makeFinalVariable(dfzzcatJes12Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,150)
+            histo[startF+151][x]    = makeFinalVariable(dfzzcatJes13Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,151)
+            histo[startF+152][x]    = makeFinalVariable(dfzzcatJes14Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,152)
+            histo[startF+153][x]    = makeFinalVariable(dfzzcatJes15Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,153)
+            histo[startF+154][x]    = makeFinalVariable(dfzzcatJes16Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,154)
+            histo[startF+155][x]    = makeFinalVariable(dfzzcatJes17Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,155)
+            histo[startF+156][x]    = makeFinalVariable(dfzzcatJes18Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,156)
+            histo[startF+157][x]    = makeFinalVariable(dfzzcatJes19Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,157)
+            histo[startF+158][x]    = makeFinalVariable(dfzzcatJes20Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,158)
+            histo[startF+159][x]    = makeFinalVariable(dfzzcatJes21Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,159)
+            histo[startF+160][x]    = makeFinalVariable(dfzzcatJes22Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,160)
+            histo[startF+161][x]    = makeFinalVariable(dfzzcatJes23Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,161)
+            histo[startF+162][x]    = makeFinalVariable(dfzzcatJes24Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,162)
+            histo[startF+163][x]    = makeFinalVariable(dfzzcatJes25Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,163)
+            histo[startF+164][x]    = makeFinalVariable(dfzzcatJes26Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,164)
+            histo[startF+165][x]    = makeFinalVariable(dfzzcatJes27Up      [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,165)
+            histo[startF+166][x]    = makeFinalVariable(dfzzcatJerUp        [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,166)
+            histo[startF+167][x]    = makeFinalVariable(dfzzcatJERUp        [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,167)
+            histo[startF+168][x]    = makeFinalVariable(dfzzcatJESUp        [x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,168)
+            histo[startF+169][x]    = makeFinalVariable(dfzzcatUnclusteredUp[x],"finalVar",theCat,startF,catX,BinXF,minXF,maxXF,169)
 
     report = []
-    for x in range(nCat):
+    for x in range(nCatSel):
         report.append(dfzzvbscat[x].Report())
-        if(x != theCat): continue
+        if(useCategoryAxis == False and x != theCat): continue
         print("---------------- SUMMARY {0} -------------".format(x))
         report[x].Print()
 
+    unpackCategoryHistos(histo)
+
+    tmva_helper.print_variation_stats()
+
     myfile = ROOT.TFile("fillhisto_zzAnalysis_sample{0}_year{1}_job{2}.root".format(count,year,whichJob),'RECREATE')
     for i in range(nCat):
         for j in range(nHisto):
@@ -643,51 +634,17 @@ def analysis(df,count,category,weight,year,PDType,isData,whichJob,nTheoryReplica
             histo[j][i].Write()
     myfile.Close()
 
-def readMCSample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+    if(useJitCache == True):
+        jitCache.report()
+        jitCache.write()
+
+def readMCSample(sampleNOW,year,skimType,whichJob,group):
 
     files = getMClist(sampleNOW, skimType)
     print("Total files: {0}".format(len(files)))
 
-    genEventSumWeight = 0
-    genEventSumNoWeight = 0
-    nTheoryReplicas = [103, 9, 4]
-    genEventSumLHEScaleWeight = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-    genEventSumPSWeight = [0, 0, 0, 0, 0]
-
-    dfRuns = ROOT.RDataFrame("Runs", files)
-    genEventSumWeight = dfRuns.Sum("genEventSumw").GetValue()
-    genEventSumNoWeight = dfRuns.Sum("genEventCount").GetValue()
-    try:
-        if(dfRuns.Min("nLHEPdfSumw").GetValue() < nTheoryReplicas[0]):
-            nTheoryReplicas[0] = int(dfRuns.Min("nLHEPdfSumw").GetValue())
-    except Exception as e:
-        nTheoryReplicas[0] = 0
-    for n in range(9):
-        try:
-            if(dfRuns.Min("nLHEScaleSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumLHEScaleWeight{0}".format(n),"LHEScaleSumw[{0}]".format(n))
-                genEventSumLHEScaleWeight[n] = dfRuns.Sum("genEventSumLHEScaleWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[1] = int(dfRuns.Min("nLHEScaleSumw").GetValue())
-        except Exception as e:
-            genEventSumLHEScaleWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[1] = n
-            print("Problem with LHEScaleWeights {0}".format(e))
-    for n in range(4):
-        try:
-            if(dfRuns.Min("nPSSumw").GetValue() > n):
-                dfRuns = dfRuns.Define("genEventSumPSWeight{0}".format(n),"PSSumw[{0}]".format(n))
-                genEventSumPSWeight[n] = dfRuns.Sum("genEventSumPSWeight{0}".format(n)).GetValue()
-            else:
-                genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-                nTheoryReplicas[2] = int(dfRuns.Min("nPSSumw").GetValue())
-        except Exception as e:
-            genEventSumPSWeight[n] = dfRuns.Count().GetValue()
-            nTheoryReplicas[2] = n
-            print("Problem with PSWeights {0}".format(e))
-    genEventSumPSWeight[4] = dfRuns.Count().GetValue()
-    runGetEntries = dfRuns.Count().GetValue()
+    fingerprint = getFileListFingerprint(files)
+    genEventSumWeight, genEventSumNoWeight, nTheoryReplicas, genEventSumLHEScaleWeight, genEventSumPSWeight, runGetEntries = getMCNormalization(sampleNOW, skimType, files, fingerprint)
 
     print("Number of Theory replicas: {0} / {1} / {2}".format(nTheoryReplicas[0],nTheoryReplicas[1],nTheoryReplicas[2]))
 
@@ -711,7 +668,7 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,hist
     weightApprox = (SwitchSample(sampleNOW, skimType)[1] / genEventSumNoWeight)*getLumi(year)
 
     if(whichJob != -1):
-        groupedFile = groupFiles(files, group)
+        groupedFile = groupFiles(files, group, getFileWeights(files, SwitchSample(sampleNOW, skimType)[0], fingerprint))
         files = groupedFile[whichJob]
         if(len(files) == 0):
             print("no files in job/group: {0} / {1}".format(whichJob, group))
@@ -726,9 +683,9 @@ def readMCSample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,hist
 
     PDType = os.path.basename(SwitchSample(sampleNOW, skimType)[0]).split('+')[0]
 
-    analysis(df,sampleNOW,SwitchSample(sampleNOW,skimType)[2],weight,year,PDType,"false",whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+    analysis(df,sampleNOW,SwitchSample(sampleNOW,skimType)[2],weight,year,PDType,"false",whichJob,nTheoryReplicas,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
 
-def readDASample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3):
+def readDASample(sampleNOW,year,skimType,whichJob,group):
 
     PDType = "0"
     if  (sampleNOW >= 1000 and sampleNOW <= 1009): PDType = "SingleMuon"
@@ -758,7 +715,7 @@ def readDASample(sampleNOW,year,skimType,whichJob,group,wsWeights,puWeights,hist
     nevents = df.Count().GetValue()
     print("%s entries in the dataset" %nevents)
 
-    analysis(df,sampleNOW,sampleNOW,weight,year,PDType,"true",whichJob,0,genEventSumLHEScaleRenorm,genEventSumPSRenorm,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+    analysis(df,sampleNOW,sampleNOW,weight,year,PDType,"true",whichJob,0,genEventSumLHEScaleRenorm,genEventSumPSRenorm)
 
 if __name__ == "__main__":
 
@@ -791,111 +748,13 @@ if __name__ == "__main__":
         if opt == "--whichJob":
             whichJob = int(arg)
 
-    wsWeights = []
-    wsPath = "data/histoWSSF_{0}.root".format(year)
-    fwsFile = ROOT.TFile(wsPath)
-    wsWeights.append(fwsFile.Get("histoWSEtaSF"))
-    wsWeights.append(fwsFile.Get("histoWSEtaSF_unc"))
-    wsWeights.append(fwsFile.Get("histoWSEtaPtSF"))
-    for x in range(3):
-        wsWeights[x].SetDirectory(0)
-    fwsFile.Close()
-
-    puWeights = []
-    puPath = "data/puWeights_UL_{0}.root".format(year)
-    fPuFile = ROOT.TFile(puPath)
-    puWeights.append(fPuFile.Get("puWeights"))
-    puWeights.append(fPuFile.Get("puWeightsUp"))
-    puWeights.append(fPuFile.Get("puWeightsDown"))
-    for x in range(3):
-        puWeights[x].SetDirectory(0)
-    fPuFile.Close()
-
-    histoFakeEtaPt_mu = []
-    histoFakeEtaPt_el = []
-    fakePath = "data/histoFakeEtaPt_{0}.root".format(year)
-    fFakeFile = ROOT.TFile(fakePath)
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType1".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType2".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1001_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1002_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_mu.append(fFakeFile.Get("histoFakeEffSelEtaPt_0_{0}_fakeAnalysis1003_anaType3".format(muSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType1".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType2".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1001_anaType3".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1002_anaType3".format(elSelChoice)))
-    histoFakeEtaPt_el.append(fFakeFile.Get("histoFakeEffSelEtaPt_1_{0}_fakeAnalysis1003_anaType3".format(elSelChoice)))
-    for x in range(9):
-        histoFakeEtaPt_mu[x].SetDirectory(0)
-        histoFakeEtaPt_el[x].SetDirectory(0)
-    fFakeFile.Close()
-
-    lepSFPath = "data/histoLepSFEtaPt_{0}{1}.root".format(year,correctionString)
-    fLepSFFile = ROOT.TFile(lepSFPath)
-    histoLepSFEtaPt_mu = fLepSFFile.Get("histoLepSFEtaPt_0_{0}".format(muSelChoice))
-    histoLepSFEtaPt_el = fLepSFFile.Get("histoLepSFEtaPt_1_{0}".format(elSelChoice))
-    histoLepSFEtaPt_mu.SetDirectory(0)
-    histoLepSFEtaPt_el.SetDirectory(0)
-    fLepSFFile.Close()
-
-    triggerSFPath = "data/histoTriggerSFEtaPt_{0}.root".format(year)
-    fTriggerSFFile = ROOT.TFile(triggerSFPath)
-    histoTriggerSFEtaPt_0_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_0")
-    histoTriggerSFEtaPt_0_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_1")
-    histoTriggerSFEtaPt_0_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_2")
-    histoTriggerSFEtaPt_0_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_0_3")
-    histoTriggerSFEtaPt_1_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_0")
-    histoTriggerSFEtaPt_1_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_1")
-    histoTriggerSFEtaPt_1_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_2")
-    histoTriggerSFEtaPt_1_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_1_3")
-    histoTriggerSFEtaPt_2_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_0")
-    histoTriggerSFEtaPt_2_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_1")
-    histoTriggerSFEtaPt_2_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_2")
-    histoTriggerSFEtaPt_2_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_2_3")
-    histoTriggerSFEtaPt_3_0 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_0")
-    histoTriggerSFEtaPt_3_1 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_1")
-    histoTriggerSFEtaPt_3_2 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_2")
-    histoTriggerSFEtaPt_3_3 = fTriggerSFFile.Get("histoTriggerV1SFEtaPt_3_3")
-    histoTriggerSFEtaPt_0_0.SetDirectory(0)
-    histoTriggerSFEtaPt_0_1.SetDirectory(0)
-    histoTriggerSFEtaPt_0_2.SetDirectory(0)
-    histoTriggerSFEtaPt_0_3.SetDirectory(0)
-    histoTriggerSFEtaPt_1_0.SetDirectory(0)
-    histoTriggerSFEtaPt_1_1.SetDirectory(0)
-    histoTriggerSFEtaPt_1_2.SetDirectory(0)
-    histoTriggerSFEtaPt_1_3.SetDirectory(0)
-    histoTriggerSFEtaPt_2_0.SetDirectory(0)
-    histoTriggerSFEtaPt_2_1.SetDirectory(0)
-    histoTriggerSFEtaPt_2_2.SetDirectory(0)
-    histoTriggerSFEtaPt_2_3.SetDirectory(0)
-    histoTriggerSFEtaPt_3_0.SetDirectory(0)
-    histoTriggerSFEtaPt_3_1.SetDirectory(0)
-    histoTriggerSFEtaPt_3_2.SetDirectory(0)
-    histoTriggerSFEtaPt_3_3.SetDirectory(0)
-    fTriggerSFFile.Close()
-
-    BTVEffPath = "data/histoBtagEffSelEtaPt_{0}.root".format(year)
-    fBTVEffPathFile = ROOT.TFile(BTVEffPath)
-    histoBTVEffEtaPtLF = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(0+3*bTagSel))
-    histoBTVEffEtaPtCJ = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(1+3*bTagSel))
-    histoBTVEffEtaPtBJ = fBTVEffPathFile.Get("histoBtagEffSelEtaPt_{0}".format(2+3*bTagSel))
-    histoBTVEffEtaPtLF.SetDirectory(0)
-    histoBTVEffEtaPtCJ.SetDirectory(0)
-    histoBTVEffEtaPtBJ.SetDirectory(0)
-    fBTVEffPathFile.Close()
+    sfTables = getLeptonSFTables(muSelChoice,elSelChoice,bTagSel,"histoLepSFEtaPt_{0}"+correctionString)
+    loadSFTables(year, sfTables)
 
     try:
         if(process >= 0 and process < 1000):
-            readMCSample(process,year,skimType,whichJob,group,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+            readMCSample(process,year,skimType,whichJob,group)
         elif(process >= 1000):
-            readDASample(process,year,skimType,whichJob,group,wsWeights,puWeights,histoBTVEffEtaPtLF,histoBTVEffEtaPtCJ,histoBTVEffEtaPtBJ,histoFakeEtaPt_mu,histoFakeEtaPt_el,histoLepSFEtaPt_mu,histoLepSFEtaPt_el,histoTriggerSFEtaPt_0_0,histoTriggerSFEtaPt_0_1,histoTriggerSFEtaPt_0_2,histoTriggerSFEtaPt_0_3,histoTriggerSFEtaPt_1_0,histoTriggerSFEtaPt_1_1,histoTriggerSFEtaPt_1_2,histoTriggerSFEtaPt_1_3,histoTriggerSFEtaPt_2_0,histoTriggerSFEtaPt_2_1,histoTriggerSFEtaPt_2_2,histoTriggerSFEtaPt_2_3,histoTriggerSFEtaPt_3_0,histoTriggerSFEtaPt_3_1,histoTriggerSFEtaPt_3_2,histoTriggerSFEtaPt_3_3)
+            readDASample(process,year,skimType,whichJob,group)
     except Exception as e:
         print("FAILED {0}".format(e))
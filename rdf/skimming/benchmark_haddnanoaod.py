@@ -0,0 +1,115 @@
+import ROOT
+import os, sys, getopt, time, subprocess
+
+# Benchmark of haddnanoaod.py on inputs with heterogeneous schemas (mixed NanoAOD
+# versions): every input has a different set of HLT_* bits in Events and of
+# counters in Runs. Both merge modes are timed and their merged trees compared.
+
+def makeInput(fileName, index, nEvents, nFiles):
+    df = (ROOT.RDataFrame(nEvents)
+          .Define("run", "(UInt_t)(1)")
+          .Define("luminosityBlock", "(UInt_t)({0})".format(index+1))
+          .Define("event", "(ULong64_t)(rdfentry_ + {0})".format(index*nEvents))
+          .Define("nMuon", "(Int_t)(rdfentry_ % 5)")
+          .Define("Muon_pt", "ROOT::VecOps::RVec<Float_t>(nMuon, 10.f + rdfentry_ % 7)")
+          .Define("PuppiMET_pt", "(Float_t)(rdfentry_ % 97)")
+          )
+    columns = ["run", "luminosityBlock", "event", "nMuon", "Muon_pt", "PuppiMET_pt"]
+    # trigger bits present only in a subset of the inputs
+    for nt in range(nFiles):
+        if((index + nt) % 3 != 0): continue
+        df = df.Define("HLT_Path{0}".format(nt), "(Bool_t)((rdfentry_ + {0}) % 2)".format(nt))
+        columns.append("HLT_Path{0}".format(nt))
+    df.Snapshot("Events", fileName, columns)
+
+    runs = (ROOT.RDataFrame(1)
+            .Define("run", "(UInt_t)(1)")
+            .Define("genEventCount", "(Long64_t)({0})".format(nEvents))
+            .Define("genEventSumw", "(Double_t)({0})".format(nEvents))
+            )
+    columnsRuns = ["run", "genEventCount", "genEventSumw"]
+    if(index % 2 == 0):
+        runs = runs.Define("genEventSumw2", "(Double_t)({0})".format(nEvents))
+        columnsRuns.append("genEventSumw2")
+    opts = ROOT.RDF.RSnapshotOptions()
+    opts.fMode = "UPDATE"
+    runs.Snapshot("Runs", fileName, columnsRuns, opts)
+
+def runMerge(mode, outputName, inputNames):
+    startTime = time.time()
+    returncode = subprocess.call("python3 haddnanoaod.py --mode={0} {1} {2} > {1}.log 2>&1".format(mode,outputName," ".join(inputNames)), shell=True)
+    if(returncode != 0):
+        print("haddnanoaod {0} failed ({1}), see {2}.log".format(mode,returncode,outputName))
+        sys.exit(1)
+    return time.time()-startTime
+
+# returns the first difference between two trees (None if they have the same content)
+def compareTrees(fileName1, fileName2, treeName):
+    f1 = ROOT.TFile.Open(fileName1)
+    f2 = ROOT.TFile.Open(fileName2)
+    t1 = f1.Get(treeName)
+    t2 = f2.Get(treeName)
+    names1 = sorted([x.GetName() for x in t1.GetListOfBranches()])
+    names2 = sorted([x.GetName() for x in t2.GetListOfBranches()])
+    if(names1 != names2): return "branches {0} / {1}".format(names1,names2)
+    if(t1.GetEntries() != t2.GetEntries()): return "entries {0} / {1}".format(t1.GetEntries(),t2.GetEntries())
+    for name in names1:
+        if(t1.GetLeaf(name).GetTypeName() != t2.GetLeaf(name).GetTypeName()): return "type of {0}".format(name)
+    # sums do not depend on the entry order, the vector branch is covered by nMuon
+    for name in names1:
+        if(name in ["Muon_pt"]): continue
+        sum1 = ROOT.RDataFrame(treeName, fileName1).Sum(name).GetValue()
+        sum2 = ROOT.RDataFrame(treeName, fileName2).Sum(name).GetValue()
+        if(sum1 != sum2): return "content of {0}: {1} / {2}".format(name,sum1,sum2)
+    return None
+
+if __name__ == "__main__":
+
+    nFiles = 20
+    nEvents = 20000
+    workDir = "benchmark_haddnanoaod"
+
+    valid = ['nFiles=', 'nEvents=', 'workDir=', 'help']
+    usage  =  "Usage: benchmark_haddnanoaod.py --nFiles=<{0}>\n".format(nFiles)
+    usage +=  "                                --nEvents=<{0}>\n".format(nEvents)
+    usage +=  "                                --workDir=<{0}>".format(workDir)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--nFiles":
+            nFiles = int(arg)
+        if opt == "--nEvents":
+            nEvents = int(arg)
+        if opt == "--workDir":
+            workDir = str(arg)
+
+    if(not os.path.exists(workDir)):
+        os.makedirs(workDir)
+
+    inputNames = []
+    for nf in range(nFiles):
+        inputNames.append("{0}/input_{1}.root".format(workDir,nf))
+        makeInput(inputNames[-1], nf, nEvents, nFiles)
+    print("Created {0} inputs with {1} events each".format(nFiles,nEvents))
+
+    timeLegacy = runMerge("legacy", "{0}/merged_legacy.root".format(workDir), inputNames)
+    timeUnion  = runMerge("union" , "{0}/merged_union.root".format(workDir) , inputNames)
+
+    print("Legacy merge: {0:.2f} s".format(timeLegacy))
+    print("Union merge : {0:.2f} s".format(timeUnion))
+    print("Speedup: {0:.2f}".format(timeLegacy/max(timeUnion,1e-9)))
+
+    for treeName in ["Events", "Runs"]:
+        diff = compareTrees("{0}/merged_legacy.root".format(workDir), "{0}/merged_union.root".format(workDir), treeName)
+        if(diff is None):
+            print("{0}: same content in both modes".format(treeName))
+        else:
+            print("{0}: DIFFERENT ({1})".format(treeName,diff))
@@ -2,20 +2,45 @@
 import ROOT
 import numpy
 import sys
+import time
 
-if len(sys.argv) < 3:
-    print("Syntax: haddnano.py out.root input1.root input2.root ...")
+# merge modes:
+#   union  (default) the union of the Events/Runs branches is computed up front over
+#          all the inputs, missing branches are backfilled in C++ and all the inputs
+#          are merged with a single (fast when possible) Merge call
+#   legacy the original file-by-file backfill with a python loop per entry
+mode = "union"
+if len(sys.argv) > 1 and sys.argv[1].startswith("--mode="):
+    mode = sys.argv[1].split("=")[1]
+    del sys.argv[1]
+
+if len(sys.argv) < 3 or mode not in ["union", "legacy"]:
+    print("Syntax: haddnano.py [--mode=union|legacy] out.root input1.root input2.root ...")
+    sys.exit(1)
 ofname = sys.argv[1]
 files = sys.argv[2:]
 
+# typename: (numpy type code, root type code)
+branch_type_dict = {'Bool_t': ('?', 'O'), 'Float_t': ('f4', 'F'), 'UInt_t': (
+    'u4', 'i'), 'Long64_t': ('i8', 'L'), 'Double_t': ('f8', 'D')}
+
+# same baskets as the python loop in zeroFill, but the entries are filled in C++
+ROOT.gInterpreter.Declare("""
+void haddnano_backfill(TTree *tree, const char *name, const char *leaflist, int size) {
+    std::vector<char> buff(size, 0);
+    TBranch *b = tree->Branch(name, buff.data(), leaflist);
+    // be sure we do not trigger flushing
+    b->SetBasketSize(tree->GetEntries() * 2);
+    for (Long64_t i = 0; i < tree->GetEntries(); i++) b->Fill();
+    b->ResetAddress();
+}
+""")
+
 
 def zeroFill(tree, brName, brObj, allowNonBool=False):
-    # typename: (numpy type code, root type code)
-    branch_type_dict = {'Bool_t': ('?', 'O'), 'Float_t': ('f4', 'F'), 'UInt_t': (
-        'u4', 'i'), 'Long64_t': ('i8', 'L'), 'Double_t': ('f8', 'D')}
     brType = brObj.GetLeaf(brName).GetTypeName()
     if (not allowNonBool) and (brType != "Bool_t"):
-        print(("Did not expect to back fill non-boolean branches", tree, brName, brObj.GetLeaf(br).GetTypeName()))
+        print(("Did not expect to back fill non-boolean branches", tree, brName, brObj.GetLeaf(brName).GetTypeName()))
     else:
         if brType not in branch_type_dict:
             raise RuntimeError('Impossible to backfill branch of type %s' % brType)
@@ -29,6 +54,67 @@ def zeroFill(tree, brName, brObj, allowNonBool=False):
         b.ResetAddress()
 
 
+def bulkZeroFill(tree, brName, brObj, allowNonBool=False):
+    brType = brObj.GetLeaf(brName).GetTypeName()
+    if (not allowNonBool) and (brType != "Bool_t"):
+        print(("Did not expect to back fill non-boolean branches", tree, brName, brType))
+    else:
+        if brType not in branch_type_dict:
+            raise RuntimeError('Impossible to backfill branch of type %s' % brType)
+        ROOT.haddnano_backfill(tree, brName, brName + "/" + branch_type_dict[brType][1],
+                               numpy.dtype(branch_type_dict[brType][0]).itemsize)
+
+
+# branch names in order of appearance over all the inputs and the branch object
+# of the first input that has each of them
+def unionSchema(trees):
+    names = []
+    brObjs = {}
+    for tree in trees:
+        for x in tree.GetListOfBranches():
+            if x.GetName() not in brObjs:
+                names.append(x.GetName())
+                brObjs[x.GetName()] = x
+    return names, brObjs
+
+
+def mergeUnion(obj, others):
+    inputs = ROOT.TList()
+    isTree = obj.IsA().InheritsFrom(ROOT.TTree.Class())
+    if isTree:
+        trees = [obj] + others
+        obj = obj.CloneTree(-1, "fast" if goFast else "")
+        if obj.GetName() in ['Events', 'Runs']:
+            names, brObjs = unionSchema(trees)
+            # the clone gets the missing branches in order of appearance, like the legacy mode
+            for otherObj in [obj] + others:
+                if otherObj is not obj:
+                    otherObj.SetAutoFlush(0)
+                otherBranches = set([x.GetName() for x in otherObj.GetListOfBranches()])
+                missingBranches = [br for br in names if br not in otherBranches]
+                if len(missingBranches) > 0:
+                    print("missing in " + str(otherObj.GetDirectory().GetName()) + ": " + str(missingBranches))
+                for br in missingBranches:
+                    bulkZeroFill(otherObj, br, brObjs[br], allowNonBool=(obj.GetName() == 'Runs'))
+    for otherObj in others:
+        inputs.Add(otherObj)
+
+    if isTree:
+        if inputs.GetSize() > 0:
+            obj.Merge(inputs, "fast" if goFast else "")
+        obj.Write()
+    elif obj.IsA().InheritsFrom(ROOT.TH1.Class()):
+        obj.Merge(inputs)
+        obj.Write()
+    elif obj.IsA().InheritsFrom(ROOT.TObjString.Class()):
+        for st in inputs:
+            if st.GetString() != obj.GetString():
+                print("Strings are not matching")
+        obj.Write()
+    else:
+        print("Cannot handle " + str(obj.IsA().GetName()))
+
+
 fileHandles = []
 goFast = True
 for fn in files:
@@ -42,7 +128,20 @@ if goFast:
     of.SetCompressionSettings(fileHandles[0].GetCompressionSettings())
 of.cd()
 
+startTime = time.time()
 for e in fileHandles[0].GetListOfKeys():
+    if mode != "legacy":
+        name = e.GetName()
+        print("Merging" + str(name))
+        others = []
+        for fh in fileHandles[1:]:
+            try:
+                others.append(fh.GetListOfKeys().FindObject(name).ReadObj())
+            except Exception as ex:
+                print(ex)
+        mergeUnion(e.ReadObj(), others)
+        continue
+
     name = e.GetName()
     print("Merging" + str(name))
     obj = e.ReadObj()
@@ -108,3 +207,5 @@ for e in fileHandles[0].GetListOfKeys():
         obj.Write()
     else:
         print("Cannot handle " + str(obj.IsA().GetName()))
+
+print("Merged {0} files in {1} mode ({2:.2f} s)".format(len(files), mode, time.time() - startTime))
@@ -1,21 +1,19 @@
-import ROOT
 import os, sys, getopt
 from subprocess import call,check_output
 
-def findDataset(name):
+def findDataset(name, withEvents):
 
     DASclient = "dasgoclient -query '%(query)s'"
     cmd= DASclient%{'query':'file dataset=%s'%name}
+    if(withEvents == True):
+        cmd= DASclient%{'query':'file dataset=%s | grep file.name, file.nevents'%name}
     print(cmd)
-    check_output(cmd,shell=True)
-    fileList=[ 'root://xrootd-cms.infn.it/'+ str(x) for x in check_output(cmd,shell=True).decode('utf8').split() ]
-    #fileList=[ 'root://cmsxrootd.fnal.gov/'+ str(x) for x in check_output(cmd,shell=True).decode('utf8').split() ]
-    #fileList=[ 'root://cms-xrd-global.cern.ch/'+ str(x) for x in check_output(cmd,shell=True).decode('utf8').split() ]
+    # the number of events (optional trailing column) is used by skim.py to balance the jobs
+    fileList=[ ('root://xrootd-cms.infn.it/'+ str(x.split()[0]), " ".join(x.split()[1:2])) for x in check_output(cmd,shell=True).decode('utf8').splitlines() if x.strip() ]
+    #fileList=[ ('root://cmsxrootd.fnal.gov/'+ str(x.split()[0]), " ".join(x.split()[1:2])) for x in check_output(cmd,shell=True).decode('utf8').splitlines() if x.strip() ]
+    #fileList=[ ('root://cms-xrd-global.cern.ch/'+ str(x.split()[0]), " ".join(x.split()[1:2])) for x in check_output(cmd,shell=True).decode('utf8').splitlines() if x.strip() ]
 
-    files_ROOT = ROOT.vector('string')()
-    for f in fileList: files_ROOT.push_back(f)
-
-    return files_ROOT
+    return fileList
 
 #dasgoclient --query="dataset status=* dataset=/*/*Run3Summer23NanoAODv12*/NANOAODSIM" | sort > lll;
 #grep FAKE skim_input_samples_2023a_fromDAS.cfg|awk '{split($1,a,"+");print"grep "a[1]" lll"}' > ll
@@ -28,12 +26,16 @@ if __name__ == "__main__":
     outputCfg = "skim_input_files_fromDAS.cfg"
     outputForCondorCfg = "skim_input_condor_jobs_fromDAS.cfg"
     group = 5
+    # number of events of each file as a second column of outputCfg, read by skim.py to
+    # balance the jobs; without it the file has only the file names as before
+    withEvents = False
 
-    valid = ["inputCfg=", "outputCfg=", "outputForCondorCfg=", "group=", 'help']
+    valid = ["inputCfg=", "outputCfg=", "outputForCondorCfg=", "group=", "withEvents=", 'help']
     usage  =  "Usage: ana.py --inputCfg=<{0}>\n".format(inputCfg)
     usage +=  "              --outputCfg=<{0}>\n".format(outputCfg)
     usage +=  "              --outputForCondorCfg=<{0}>\n".format(outputForCondorCfg)
-    usage +=  "              --group=<{0}>".format(group)
+    usage +=  "              --group=<{0}>\n".format(group)
+    usage +=  "              --withEvents=<{0}>".format(int(withEvents))
     try:
         opts, args = getopt.getopt(sys.argv[1:], "", valid)
     except getopt.GetoptError as ex:
@@ -53,6 +55,8 @@ if __name__ == "__main__":
             outputForCondorCfg = str(arg)
         if opt == "--group":
             group = int(arg)
+        if opt == "--withEvents":
+            withEvents = int(arg) != 0
 
     outputFile = open(outputCfg, 'w')
     outputForCondorFile = open(outputForCondorCfg, 'w')
@@ -67,12 +71,12 @@ if __name__ == "__main__":
         print(line)
 
         lineForDAS = "/" + line.replace("+","/")
-        filesDAS = findDataset(lineForDAS)
+        filesDAS = findDataset(lineForDAS, withEvents)
 
         countJobs = 0
         countFiles = 0
         for nf in range(len(filesDAS)):
-            lineRaw = filesDAS[nf]
+            lineRaw = "{0} {1}".format(filesDAS[nf][0],filesDAS[nf][1]).strip()
             if(countFiles%group == 0):
                 lineForCondor = "{0} {1} {2} {3}\n".format(countSamples-1,countJobs,group,line)
                 outputForCondorFile.writelines(lineForCondor)
@@ -0,0 +1,196 @@
+import os, sys, getopt, time, subprocess, shutil, threading
+
+# Background prefetch of the skim inputs into a bounded local staging area:
+# while file nf is skimmed the next ones are already being copied.
+# copyCommand is the shell copier ("xrdcp --force", "cp", ...) or "local" for an
+# in-process filesystem copy, so the pipeline can be run without any network.
+class FilePrefetcher():
+
+    def __init__(self, fileNames, copyCommand, depth = 2, stagingDir = ".", maxStagingMB = 20000, minFreeMB = 1000, nRetries = 5, backoff = 0.1):
+
+        self.fileNames = [str(x) for x in fileNames]
+        self.copyCommand = copyCommand
+        self.depth = max(depth, 1)
+        self.stagingDir = stagingDir
+        self.maxStagingBytes = maxStagingMB * 1024 * 1024
+        self.minFreeBytes = minFreeMB * 1024 * 1024
+        self.nRetries = nRetries
+        self.backoff = backoff
+
+        # per file: None (not done yet), True (staged) or False (failed)
+        self.status = [None] * len(self.fileNames)
+        self.released = [False] * len(self.fileNames)
+        self.stagedBytes = 0
+        self.transfers = []
+        self.waitTime = 0.0
+        self.stopped = False
+        self.condition = threading.Condition()
+        self.thread = None
+
+        if(not os.path.exists(self.stagingDir)):
+            os.makedirs(self.stagingDir)
+
+    def localName(self, nf):
+        return os.path.join(self.stagingDir, os.path.basename(self.fileNames[nf]))
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def copy(self, fileName, localFileName):
+        if(self.copyCommand == "local"):
+            try:
+                shutil.copyfile(fileName, localFileName)
+                return 0
+            except Exception as e:
+                print("Copying file {0} failed: {1}".format(fileName,e))
+                return 1
+        p = subprocess.Popen("{0} {1} {2}".format(self.copyCommand,fileName,localFileName), shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, error = p.communicate()
+        if(p.returncode != 0):
+            print("command {0} {1} {2}, out {3}, error{4}, returncode {5}".format(self.copyCommand,fileName,localFileName,out,error,p.returncode))
+        return p.returncode
+
+    # room for one more file: at most depth files staged and not released (the one being skimmed included),
+    # and the staging quota and the free disk space are honoured (the next
+    # file is always allowed when nothing is staged, otherwise nothing would progress)
+    def hasRoom(self, nf):
+        nStaged = len([x for x in range(nf) if self.status[x] == True and self.released[x] == False])
+        if(nStaged == 0):
+            return True
+        if(nStaged >= self.depth):
+            return False
+        if(self.stagedBytes >= self.maxStagingBytes):
+            return False
+        if(shutil.disk_usage(self.stagingDir).free < self.minFreeBytes):
+            return False
+        return True
+
+    def run(self):
+        for nf in range(len(self.fileNames)):
+            with self.condition:
+                while(self.stopped == False and self.hasRoom(nf) == False):
+                    self.condition.wait(1.0)
+                if(self.stopped == True): return
+
+            localFileName = self.localName(nf)
+            result = False
+            for nRetry in range(self.nRetries):
+                startTime = time.time()
+                returncode = self.copy(self.fileNames[nf], localFileName)
+                if(os.path.exists(localFileName) and returncode == 0):
+                    size = os.path.getsize(localFileName)
+                    self.transfers.append((self.fileNames[nf], size, time.time()-startTime))
+                    result = True
+                    break
+                print("Copying file {0} failed ({1}), retrying".format(localFileName,returncode))
+                # exponential backoff, 0.1, 0.2, 0.4, ... s
+                time.sleep(self.backoff * pow(2, nRetry))
+
+            with self.condition:
+                self.status[nf] = result
+                if(result == True):
+                    self.stagedBytes += os.path.getsize(localFileName)
+                    if(self.stopped == True or self.released[nf] == True):
+                        self.removeLocal(nf)
+                self.condition.notify_all()
+
+    def removeLocal(self, nf):
+        localFileName = self.localName(nf)
+        if(os.path.exists(localFileName)):
+            self.stagedBytes -= os.path.getsize(localFileName)
+            os.remove(localFileName)
+
+    # blocks until file nf is staged, returns (localFileName, True) or (localFileName, False) if the copy failed
+    def get(self, nf):
+        startTime = time.time()
+        with self.condition:
+            while(self.status[nf] is None):
+                self.condition.wait(1.0)
+            self.waitTime += time.time() - startTime
+            return self.localName(nf), self.status[nf]
+
+    # the skim of file nf is done, its staged copy is deleted
+    def release(self, nf):
+        with self.condition:
+            if(self.released[nf] == False and self.status[nf] == True):
+                self.removeLocal(nf)
+            self.released[nf] = True
+            self.condition.notify_all()
+
+    # stops the prefetch and deletes everything still staged
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        if(self.thread is not None):
+            self.thread.join()
+        with self.condition:
+            for nf in range(len(self.fileNames)):
+                if(self.released[nf] == False and self.status[nf] == True):
+                    self.removeLocal(nf)
+                    self.released[nf] = True
+
+    def summary(self):
+        totalBytes = sum([x[1] for x in self.transfers])
+        totalTime = sum([x[2] for x in self.transfers])
+        print("Prefetch: {0} files, {1:.1f} MB in {2:.1f} s ({3:.1f} MB/s), time waiting for inputs: {4:.1f} s".format(
+              len(self.transfers),totalBytes/1024./1024.,totalTime,totalBytes/1024./1024./max(totalTime,1e-9),self.waitTime))
+        for fileName, size, transferTime in self.transfers:
+            print("Transfer {0}: {1:.1f} MB in {2:.1f} s ({3:.1f} MB/s)".format(fileName,size/1024./1024.,transferTime,size/1024./1024./max(transferTime,1e-9)))
+
+# Offline check of the pipeline: copies a list of local files with the
+# "local" copier while a fake skim sleeps on each of them
+if __name__ == "__main__":
+
+    inputDir = "."
+    stagingDir = "prefetch_staging"
+    depth = 2
+    maxStagingMB = 20000
+    skimTime = 1.0
+
+    valid = ['inputDir=', 'stagingDir=', 'depth=', 'maxStagingMB=', 'skimTime=', 'help']
+    usage  =  "Usage: prefetch_skim.py --inputDir=<{0}>\n".format(inputDir)
+    usage +=  "                        --stagingDir=<{0}>\n".format(stagingDir)
+    usage +=  "                        --depth=<{0}>\n".format(depth)
+    usage +=  "                        --maxStagingMB=<{0}>\n".format(maxStagingMB)
+    usage +=  "                        --skimTime=<{0}>".format(skimTime)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--inputDir":
+            inputDir = str(arg)
+        if opt == "--stagingDir":
+            stagingDir = str(arg)
+        if opt == "--depth":
+            depth = int(arg)
+        if opt == "--maxStagingMB":
+            maxStagingMB = int(arg)
+        if opt == "--skimTime":
+            skimTime = float(arg)
+
+    fileNames = sorted([os.path.join(inputDir, x) for x in os.listdir(inputDir) if x.endswith(".root")])
+    if(len(fileNames) == 0):
+        print("No root files in {0}".format(inputDir))
+        sys.exit(1)
+
+    startTime = time.time()
+    prefetcher = FilePrefetcher(fileNames, "local", depth, stagingDir, maxStagingMB, 0).start()
+    for nf in range(len(fileNames)):
+        localFileName, result = prefetcher.get(nf)
+        print("Processing({0}): {1} / {2}".format(nf,localFileName,result))
+        time.sleep(skimTime)
+        prefetcher.release(nf)
+    prefetcher.stop()
+    prefetcher.summary()
+    print("Total time: {0:.1f} s (no prefetch would be at least {1:.1f} s of skim time plus the transfers)".format(time.time()-startTime,skimTime*len(fileNames)))
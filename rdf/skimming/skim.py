@@ -1,7 +1,9 @@
 import ROOT
-import os, sys, getopt, json, time, subprocess, socket
+import os, sys, getopt, json, time, subprocess, socket, hashlib
 import fnmatch
 import math
+import heapq
+from prefetch_skim import FilePrefetcher
 
 ROOT.ROOT.EnableImplicitMT(2)
 
@@ -45,10 +47,30 @@ def loadJSON(fIn):
             vec.push_back(pair)
             ROOT.jsonMap[int(k)] = vec
 
-# split fIns files in groups of group files
-def groupFiles(fIns, group):
+# split fIns files in groups of group files, balancing the total weight per group when weights are given
+def groupFiles(fIns, group, weights = None):
 
-    ret = [fIns[x:x+group] for x in range(0, len(fIns), group)]
+    if(weights is None):
+        ret = [fIns[x:x+group] for x in range(0, len(fIns), group)]
+        return ret
+
+    # same number of jobs as the plain splitting, largest files first into the lightest job
+    nGroups = (len(fIns) + group - 1) // group
+    order = sorted(range(len(fIns)), key=lambda i: (-weights[i], str(fIns[i])))
+    heap = [(0, n) for n in range(nGroups)]
+    indices = [[] for n in range(nGroups)]
+    for i in order:
+        load, n = heapq.heappop(heap)
+        indices[n].append(i)
+        heapq.heappush(heap, (load + weights[i], n))
+
+    ret = [[str(fIns[i]) for i in sorted(x)] for x in indices]
+
+    loads = [sum([weights[i] for i in x]) for x in indices]
+    if(len(loads) > 0 and sum(loads) > 0):
+        meanLoad = float(sum(loads)) / len(loads)
+        print("Group balance: groups/files: {0} / {1}, weight total/mean/min/max: {2} / {3:.1f} / {4} / {5}, max/mean: {6:.3f}, largest file: {7}".format(
+              len(ret),len(fIns),sum(loads),meanLoad,min(loads),max(loads),max(loads)/meanLoad,max(weights)))
 
     return ret
 
@@ -57,6 +79,92 @@ def getTriggerFromJson(overall, type, year ):
     for trigger in overall:
         if(trigger['name'] == type and trigger['year'] == year): return trigger['definition']
 
+# Writes the Runs (and for data LuminosityBlocks) trees of the input into new output files,
+# the event trees are added afterwards by the snapshots in UPDATE mode. The metadata of the
+# input is read once into memory and fast cloned into every output, i.e. the compressed
+# baskets are written as they are instead of copying the trees entry by entry
+def writeMetadataTrees(inputFileName, outputFileNames, isSkimData, compression):
+
+    treeNames = ["Runs"]
+    if(isSkimData == 1): treeNames.append("LuminosityBlocks")
+
+    fIn = ROOT.TFile.Open(inputFileName)
+    trees = []
+    for treeName in treeNames:
+        tree = fIn.Get(treeName)
+        if(not tree):
+            print("No {0} tree in {1}".format(treeName,inputFileName))
+            continue
+        tree.LoadBaskets()
+        trees.append(tree)
+
+    for outputFileName in outputFileNames:
+        fOut = ROOT.TFile(outputFileName,"RECREATE","",compression)
+        fOut.cd()
+        for tree in trees:
+            treeCopy = tree.CloneTree(-1, "fast")
+            treeCopy.Write()
+        fOut.Close()
+    fIn.Close()
+
+# Incremental mode: the sidecar manifest of a job records, per input file, its fingerprint
+# (name and number of events of the input list) and the entries written in each skim output
+def getInputFingerprint(fileName, nEvents):
+
+    return hashlib.sha1("{0} {1}".format(fileName,nEvents).encode()).hexdigest()[:16]
+
+def readSkimManifest(manifestName):
+
+    if(not os.path.exists(manifestName)):
+        return {"inputs": {}}
+
+    try:
+        with open(manifestName) as jsonFile:
+            return json.load(jsonFile)
+    except Exception as e:
+        print("Corrupted skim manifest {0}: {1}".format(manifestName,e))
+        return {"inputs": {}}
+
+def writeSkimManifest(manifestName, manifest):
+
+    # write and rename so that a preempted job never leaves a partial file
+    with open(manifestName + ".tmp", "w") as jsonFile:
+        json.dump(manifest, jsonFile)
+    os.replace(manifestName + ".tmp", manifestName)
+
+# header-level check of a skim output of the manifest: it opens without recovery, has the
+# Runs tree and the recorded number of selected events
+def isSkimOutputGood(fileName, nEntries):
+
+    if(not os.path.exists(fileName)):
+        return False
+
+    fIn = ROOT.TFile.Open(fileName)
+    if(not fIn or fIn.IsZombie()):
+        return False
+
+    isGood = fIn.TestBit(ROOT.TFile.kRecovered) == False and bool(fIn.Get("Runs"))
+    eventTree = fIn.Get("Events")
+    if(nEntries > 0):
+        isGood = isGood and bool(eventTree) and eventTree.GetEntries() == nEntries
+    fIn.Close()
+
+    return isGood
+
+# manifest entry of an input already skimmed with all its outputs in place, None otherwise
+def getSkimmedInput(manifest, nf, fingerprint, fOutIndivNames):
+
+    entry = manifest["inputs"].get(str(nf))
+    if(entry is None or entry["fingerprint"] != fingerprint):
+        return None
+
+    for fOutIndivName, nEntries in zip(fOutIndivNames, entry["eventCounts"]):
+        if(isSkimOutputGood(fOutIndivName, nEntries) == False):
+            print("Skim output {0} missing or corrupted, skimming again".format(fOutIndivName))
+            return None
+
+    return entry
+
 if __name__ == "__main__":
 
     copyFilesToFS = True
@@ -70,14 +178,29 @@ if __name__ == "__main__":
     whichSample = 1
     whichJob = -1
     group = 10
-
-    valid = ['outputDir=', "inputSamplesCfg=", "inputFilesCfg=", "whichSample=", "whichJob=", "group=", 'help']
+    # book all the skims lazily and run them in a single event loop per input file
+    useLazySnapshot = True
+    # number of input files staged ahead in the background (0: blocking copy of each file)
+    prefetch = 2
+    maxStagingMB = 20000
+    # incremental mode: the per-input outputs and the job manifest are kept in this
+    # directory and the inputs already skimmed are skipped on restart ("" to disable)
+    incrementalDir = ""
+    # write the metadata trees of every output before its snapshot instead of copying them in UPDATE mode afterwards
+    useMetadataInSnapshot = True
+
+    valid = ['outputDir=', "inputSamplesCfg=", "inputFilesCfg=", "whichSample=", "whichJob=", "group=", "lazySnapshot=", "prefetch=", "maxStagingMB=", "incrementalDir=", "metadataInSnapshot=", 'help']
     usage  =  "Usage: ana.py --outputDir=<{0}>\n".format(outputDir)
     usage +=  "              --inputSamplesCfg=<{0}>\n".format(inputSamplesCfg)
     usage +=  "              --inputFilesCfg=<{0}>\n".format(inputFilesCfg)
     usage +=  "              --whichSample=<{0}>\n".format(whichSample)
     usage +=  "              --whichJob=<{0}>\n".format(whichJob)
-    usage +=  "              --group=<{0}>".format(group)
+    usage +=  "              --group=<{0}>\n".format(group)
+    usage +=  "              --lazySnapshot=<{0}>\n".format(int(useLazySnapshot))
+    usage +=  "              --prefetch=<{0}>\n".format(prefetch)
+    usage +=  "              --maxStagingMB=<{0}>\n".format(maxStagingMB)
+    usage +=  "              --incrementalDir=<{0}>\n".format(incrementalDir)
+    usage +=  "              --metadataInSnapshot=<{0}>".format(int(useMetadataInSnapshot))
     try:
         opts, args = getopt.getopt(sys.argv[1:], "", valid)
     except getopt.GetoptError as ex:
@@ -101,6 +224,16 @@ if __name__ == "__main__":
             whichJob = int(arg)
         if opt == "--group":
             group = int(arg)
+        if opt == "--lazySnapshot":
+            useLazySnapshot = int(arg) != 0
+        if opt == "--prefetch":
+            prefetch = int(arg)
+        if opt == "--maxStagingMB":
+            maxStagingMB = int(arg)
+        if opt == "--incrementalDir":
+            incrementalDir = str(arg)
+        if opt == "--metadataInSnapshot":
+            useMetadataInSnapshot = int(arg) != 0
 
     theHost = socket.gethostname()
     msgCPInput  = "xrdcp --force"
@@ -226,6 +359,9 @@ if __name__ == "__main__":
         sampleToFilter[0] = "/"+sampleToSkim.split("+")[0]+"/"
         sampleToFilter[1] = sampleToSkim.split("+")[1].split("-")[0]
         sampleToFilter[2] = sampleToSkim.split("+")[1].split("-")[1]
+    # each line is the file name, optionally followed by its number of events (make_skim_input_files_fromDAS.py
+    # --withEvents=1): the files are balanced by events only if all of them have it
+    fileWeights = []
     while True:
         line = inputFilesFile.readline().strip()
         if not line:
@@ -236,9 +372,19 @@ if __name__ == "__main__":
             continue
         if(sampleToFilter[2] not in line):
             continue
-        rootFiles.push_back(line)
-
-    groupedFiles = groupFiles(rootFiles, group)
+        lineFields = line.split()
+        rootFiles.push_back(lineFields[0])
+        if(len(lineFields) > 1 and lineFields[1].isdigit() and fileWeights is not None):
+            fileWeights.append(int(lineFields[1]))
+        else:
+            fileWeights = None
+
+    groupedFiles = groupFiles(rootFiles, group, fileWeights)
+    inputEvents = {}
+    if(fileWeights is not None):
+        inputEvents = dict(zip([str(x) for x in rootFiles], fileWeights))
+    if(incrementalDir != "" and not os.path.exists(incrementalDir)):
+        os.makedirs(incrementalDir)
     finalOutputDir1 = os.path.join(outputDir, "1l", sampleToSkim)
     finalOutputDir2 = os.path.join(outputDir, "2l", sampleToSkim)
     finalOutputDir3 = os.path.join(outputDir, "3l", sampleToSkim)
@@ -256,6 +402,7 @@ if __name__ == "__main__":
     for i, groupedFile in enumerate(groupedFiles):
         passJob = whichJob == -1 or whichJob == i
         if(passJob == False): continue
+        prefetcher = None
         try:
             atLeastOneFile = [False, False, False, False, False]
 
@@ -276,12 +423,31 @@ if __name__ == "__main__":
 
             isJobFailure = False
 
+            # incremental mode: the inputs of the manifest with all their outputs in place are not skimmed again
+            manifestName = ""
+            manifest = {"inputs": {}}
+            skimmedInputs = {}
+            if(incrementalDir != ""):
+                manifestName = os.path.join(incrementalDir, "skim_manifest_{0}_{1}.json".format(whichSample,i))
+                manifest = readSkimManifest(manifestName)
+                for nf in range(len(groupedFile)):
+                    fOutIndivNames = [os.path.join(incrementalDir, "output_{0}_{1}_{2}_{3}.root".format(x,whichSample,i,nf)) for x in ["1l", "2l", "3l", "met", "pho"]]
+                    entry = getSkimmedInput(manifest, nf, getInputFingerprint(groupedFile[nf],inputEvents.get(str(groupedFile[nf]),-1)), fOutIndivNames)
+                    if(entry is not None):
+                        skimmedInputs[nf] = entry
+                print("Inputs already skimmed: {0} / {1} ({2})".format(len(skimmedInputs),len(groupedFile),manifestName))
+            toSkim = [nf for nf in range(len(groupedFile)) if nf not in skimmedInputs]
+
+            # the next inputs are copied while the current one is skimmed
+            if(prefetch > 0):
+                prefetcher = FilePrefetcher([groupedFile[nf] for nf in toSkim], msgCPInput, prefetch + 1, ".", maxStagingMB).start()
+
             for nf in range(len(groupedFile)):
-                fOutIndivName1 = "output_1l_{0}_{1}_{2}.root".format(whichSample,i,nf)
-                fOutIndivName2 = "output_2l_{0}_{1}_{2}.root".format(whichSample,i,nf)
-                fOutIndivName3 = "output_3l_{0}_{1}_{2}.root".format(whichSample,i,nf)
-                fOutIndivName4 = "output_met_{0}_{1}_{2}.root".format(whichSample,i,nf)
-                fOutIndivName5 = "output_pho_{0}_{1}_{2}.root".format(whichSample,i,nf)
+                fOutIndivName1 = os.path.join(incrementalDir, "output_1l_{0}_{1}_{2}.root".format(whichSample,i,nf))
+                fOutIndivName2 = os.path.join(incrementalDir, "output_2l_{0}_{1}_{2}.root".format(whichSample,i,nf))
+                fOutIndivName3 = os.path.join(incrementalDir, "output_3l_{0}_{1}_{2}.root".format(whichSample,i,nf))
+                fOutIndivName4 = os.path.join(incrementalDir, "output_met_{0}_{1}_{2}.root".format(whichSample,i,nf))
+                fOutIndivName5 = os.path.join(incrementalDir, "output_pho_{0}_{1}_{2}.root".format(whichSample,i,nf))
 
                 msgRm = msgRm + " " + fOutIndivName1
                 msgRm = msgRm + " " + fOutIndivName2
@@ -291,11 +457,33 @@ if __name__ == "__main__":
 
                 inputSingleFile = groupedFile[nf]
                 inputSingleFileBase = os.path.basename(inputSingleFile)
+
+                if(nf in skimmedInputs):
+                    eventCounts = skimmedInputs[nf]["eventCounts"]
+                    print("Skipping({0}): {1} already skimmed, selected events(1l/2l/3l/met/pho): {2} / {3} / {4} / {5} / {6}".format(nf,inputSingleFile,*eventCounts))
+                    if(eventCounts[0] > 0):
+                        atLeastOneFile[0] = True
+                        msgMerge1 = msgMerge1 + " " + fOutIndivName1
+                    if(eventCounts[1] > 0):
+                        atLeastOneFile[1] = True
+                        msgMerge2 = msgMerge2 + " " + fOutIndivName2
+                    if(eventCounts[2] > 0):
+                        atLeastOneFile[2] = True
+                        msgMerge3 = msgMerge3 + " " + fOutIndivName3
+                    if(eventCounts[3] > 0):
+                        atLeastOneFile[3] = True
+                        msgMerge4 = msgMerge4 + " " + fOutIndivName4
+                    if(eventCounts[4] > 0):
+                        atLeastOneFile[4] = True
+                        msgMerge5 = msgMerge5 + " " + fOutIndivName5
+                    continue
                 copycommand = "%s %s %s" % (msgCPInput,inputSingleFile, inputSingleFileBase)
 
                 copy_result = False
                 n_retries = 0
-                while n_retries < 5 and copy_result is False:
+                if(prefetcher is not None):
+                    inputSingleFileBase, copy_result = prefetcher.get(toSkim.index(nf))
+                while prefetcher is None and n_retries < 5 and copy_result is False:
                     returncode = buildcommand(copycommand)
                     if os.path.exists(inputSingleFileBase) and returncode == 0:
                         copy_result = True
@@ -313,10 +501,27 @@ if __name__ == "__main__":
                             .Define("isSkimData","{}".format(isSkimData))\
                             .Define("applyDataJson","{}".format(JSON)).Filter("applyDataJson","pass JSON")
 
-                print("Processing({0}): {1} / {2}".format(nf,inputSingleFile,rdf.Count().GetValue()))
+                # in lazy mode every snapshot and counter is booked first and
+                # they are all filled together in one event loop
+                snapshotOptions = ROOT.RDF.RSnapshotOptions()
+                snapshotOptions.fLazy = useLazySnapshot
+                if(useMetadataInSnapshot == True):
+                    startTime = time.time()
+                    writeMetadataTrees(inputSingleFileBase, [fOutIndivName1, fOutIndivName2, fOutIndivName3, fOutIndivName4, fOutIndivName5], isSkimData,
+                                       ROOT.CompressionSettings(snapshotOptions.fCompressionAlgorithm, snapshotOptions.fCompressionLevel))
+                    snapshotOptions.fMode = "UPDATE"
+                    print("Metadata trees({0}): {1:.2f} s (written with the snapshots)".format(nf,time.time()-startTime))
+                skimSnapshots = []
+                skimCounts = [None, None, None, None, None]
+
                 nonZeroEvents = True
-                if(rdf.Count().GetValue() == 0):
-                    nonZeroEvents = False
+                if(useLazySnapshot == True):
+                    totalCount = rdf.Count()
+                else:
+                    totalCount = rdf.Count().GetValue()
+                    print("Processing({0}): {1} / {2}".format(nf,inputSingleFile,totalCount))
+                    if(totalCount == 0):
+                        nonZeroEvents = False
 
                 if((doSkimSel[1] == True or doSkimSel[2] == True) and nonZeroEvents == True):
                     rdf_ll = rdf.Define("skim_mu", "abs(Muon_eta) < 2.4 && Muon_pt > 10 && Muon_looseId == true")\
@@ -337,27 +542,31 @@ if __name__ == "__main__":
 
                     rdf_2l = rdf_ll.Define("trigger2l","({0}) or ({1})".format(TRIGGERLEP,TRIGGERFAKE))\
                                    .Filter("trigger2l > 0","Passed trigger2l")\
-                                   .Filter("skim >= 2","Two loose leptons with mll > 10 GeV")\
-                                   .Snapshot("Events", fOutIndivName2)
+                                   .Filter("skim >= 2","Two loose leptons with mll > 10 GeV")
+                    skimCounts[1] = rdf_2l.Count()
+                    skimSnapshots.append(rdf_2l.Snapshot("Events", fOutIndivName2, "", snapshotOptions))
 
                     rdf_3l = rdf_ll.Define("trigger2l","{0}".format(TRIGGERLEP))\
                                    .Filter("trigger2l > 0","Passed trigger2l")\
-                                   .Filter("skim == 1 || skim == 2 || skim == 3",">=3, q(l1+l2)!=0, met>50/ptll>50")\
-                                   .Snapshot("Events", fOutIndivName3)
+                                   .Filter("skim == 1 || skim == 2 || skim == 3",">=3, q(l1+l2)!=0, met>50/ptll>50")
+                    skimCounts[2] = rdf_3l.Count()
+                    skimSnapshots.append(rdf_3l.Snapshot("Events", fOutIndivName3, "", snapshotOptions))
 
                 if(doSkimSel[0] == True and nonZeroEvents == True):
                     rdf_1l = rdf.Define("trigger1l","{0}".format(TRIGGERFAKE))\
                                 .Filter("trigger1l > 0","Passed trigger1l")\
                                 .Define("skim_fake_mu", "abs(Muon_eta) < 2.4 && Muon_pt > 10 && Muon_looseId == true")\
                                 .Define("skim_fake_el", "abs(Electron_eta) < 2.5 && Electron_pt > 10 && Electron_cutBased >= 1")\
-                                .Filter("Sum(skim_fake_mu)+Sum(skim_fake_el) == 1","One fake lepton")\
-                                .Snapshot("Events", fOutIndivName1)
+                                .Filter("Sum(skim_fake_mu)+Sum(skim_fake_el) == 1","One fake lepton")
+                    skimCounts[0] = rdf_1l.Count()
+                    skimSnapshots.append(rdf_1l.Snapshot("Events", fOutIndivName1, "", snapshotOptions))
 
                 if(doSkimSel[3] == True and nonZeroEvents == True):
                     rdf_met= rdf_ll.Define("triggermet","{0}".format(TRIGGERMET))\
                                    .Filter("triggermet > 0","Passed triggermet")\
-                                   .Filter("skim >= 1","Two or more loose leptons")\
-                                   .Snapshot("Events", fOutIndivName4)
+                                   .Filter("skim >= 1","Two or more loose leptons")
+                    skimCounts[3] = rdf_met.Count()
+                    skimSnapshots.append(rdf_met.Snapshot("Events", fOutIndivName4, "", snapshotOptions))
 
                 if(doSkimSel[4] == True and nonZeroEvents == True):
                     rdf_pho = rdf.Define("triggerlep","{0}".format(TRIGGERALLLEP))\
@@ -366,108 +575,118 @@ if __name__ == "__main__":
                                  .Define("skim_el", "abs(Electron_eta) < 2.5 && Electron_pt > 10 && Electron_cutBased >= 1")\
                                  .Define("photon_mask", "cleaningMask(Electron_photonIdx[skim_el],nPhoton)")\
                                  .Define("skim_photon", "Photon_pt > 20 && abs(Photon_eta) < 2.5 && photon_mask && Photon_pfRelIso03_chg*Photon_pt < 10 && cleaningBitmap(Photon_vidNestedWPBitmap,4,2) && cleaningBitmap(Photon_vidNestedWPBitmap,10,2) && cleaningBitmap(Photon_vidNestedWPBitmap,12,2)")\
-                                 .Filter("Sum(skim_photon) >= 1","One loose photon")\
-                                 .Snapshot("Events", fOutIndivName5)
+                                 .Filter("Sum(skim_photon) >= 1","One loose photon")
+                    skimCounts[4] = rdf_pho.Count()
+                    skimSnapshots.append(rdf_pho.Snapshot("Events", fOutIndivName5, "", snapshotOptions))
+
+                if(useLazySnapshot == True):
+                    startTime = time.time()
+                    ROOT.RDF.RunGraphs(skimSnapshots + [x for x in skimCounts if x is not None] + [totalCount])
+                    print("Processing({0}): {1} / {2} ({3:.1f} s, single event loop)".format(nf,inputSingleFile,totalCount.GetValue(),time.time()-startTime))
 
                 eventCounts = [0, 0, 0, 0, 0]
-                try:
-                    eventCounts[0] = rdf_1l.Count().GetValue()
-                    del rdf_1l
-                except Exception as e:
-                    print("No selected events in {0}".format(fOutIndivName1))
-                try:
-                    eventCounts[1] = rdf_2l.Count().GetValue()
-                    del rdf_2l
-                except Exception as e:
-                    print("No selected events in {0}".format(fOutIndivName2))
-                try:
-                    eventCounts[2] = rdf_3l.Count().GetValue()
-                    del rdf_3l
-                except Exception as e:
-                    print("No selected events in {0}".format(fOutIndivName3))
-                try:
-                    eventCounts[3] = rdf_met.Count().GetValue()
-                    del rdf_met
-                except Exception as e:
-                    print("No selected events in {0}".format(fOutIndivName4))
-                try:
-                    eventCounts[4] = rdf_pho.Count().GetValue()
-                    del rdf_pho
-                except Exception as e:
-                    print("No selected events in {0}".format(fOutIndivName5))
+                fOutIndivNames = [fOutIndivName1, fOutIndivName2, fOutIndivName3, fOutIndivName4, fOutIndivName5]
+                for nSkim in range(len(skimCounts)):
+                    if(skimCounts[nSkim] is not None):
+                        eventCounts[nSkim] = skimCounts[nSkim].GetValue()
+                    else:
+                        print("No selected events in {0}".format(fOutIndivNames[nSkim]))
+                print("Selected events(1l/2l/3l/met/pho): {0} / {1} / {2} / {3} / {4}".format(*eventCounts))
+                del skimSnapshots, skimCounts
 
                 try:
                     del rdf, rdf_ll
                 except Exception as e:
                     print("Delete exception {0}".format(e))
 
-                runTree = ROOT.TChain("Runs")
-                runTree.AddFile(inputSingleFileBase)
-                lumiTree = ROOT.TChain("LuminosityBlocks")
-                if(isSkimData == 1):
-                    lumiTree.AddFile(inputSingleFileBase)
-
-                fOut1 = ROOT.TFile(fOutIndivName1,"UPDATE")
-                fOut1.cd()
-                runTreeCopy1 = runTree.CopyTree("");
-                runTreeCopy1.Write()
-                if(isSkimData == 1):
-                    lumiTreeCopy1 = lumiTree.CopyTree("");
-                    lumiTreeCopy1.Write()
-                fOut1.Close()
+                # legacy metadata copy: every output reopened in UPDATE mode and the trees copied entry by entry
+                if(useMetadataInSnapshot == False):
+                    startTime = time.time()
+                    runTree = ROOT.TChain("Runs")
+                    runTree.AddFile(inputSingleFileBase)
+                    lumiTree = ROOT.TChain("LuminosityBlocks")
+                    if(isSkimData == 1):
+                        lumiTree.AddFile(inputSingleFileBase)
+
+                    fOut1 = ROOT.TFile(fOutIndivName1,"UPDATE")
+                    fOut1.cd()
+                    runTreeCopy1 = runTree.CopyTree("");
+                    runTreeCopy1.Write()
+                    if(isSkimData == 1):
+                        lumiTreeCopy1 = lumiTree.CopyTree("");
+                        lumiTreeCopy1.Write()
+                    fOut1.Close()
+
+                    fOut2 = ROOT.TFile(fOutIndivName2,"UPDATE")
+                    fOut2.cd()
+                    runTreeCopy2 = runTree.CopyTree("");
+                    runTreeCopy2.Write()
+                    if(isSkimData == 1):
+                        lumiTreeCopy2 = lumiTree.CopyTree("");
+                        lumiTreeCopy2.Write()
+                    fOut2.Close()
+
+                    fOut3 = ROOT.TFile(fOutIndivName3,"UPDATE")
+                    fOut3.cd()
+                    runTreeCopy3 = runTree.CopyTree("");
+                    runTreeCopy3.Write()
+                    if(isSkimData == 1):
+                        lumiTreeCopy3 = lumiTree.CopyTree("");
+                        lumiTreeCopy3.Write()
+                    fOut3.Close()
+
+                    fOut4 = ROOT.TFile(fOutIndivName4,"UPDATE")
+                    fOut4.cd()
+                    runTreeCopy4 = runTree.CopyTree("");
+                    runTreeCopy4.Write()
+                    if(isSkimData == 1):
+                        lumiTreeCopy4 = lumiTree.CopyTree("");
+                        lumiTreeCopy4.Write()
+                    fOut4.Close()
+
+                    fOut5 = ROOT.TFile(fOutIndivName5,"UPDATE")
+                    fOut5.cd()
+                    runTreeCopy5 = runTree.CopyTree("");
+                    runTreeCopy5.Write()
+                    if(isSkimData == 1):
+                        lumiTreeCopy5 = lumiTree.CopyTree("");
+                        lumiTreeCopy5.Write()
+                    fOut5.Close()
+                    print("Metadata trees({0}): {1:.2f} s (copied in UPDATE mode)".format(nf,time.time()-startTime))
+
                 if(eventCounts[0] > 0): #  or isSkimData == 1
                     atLeastOneFile[0] = True
                     msgMerge1 = msgMerge1 + " " + fOutIndivName1
 
-                fOut2 = ROOT.TFile(fOutIndivName2,"UPDATE")
-                fOut2.cd()
-                runTreeCopy2 = runTree.CopyTree("");
-                runTreeCopy2.Write()
-                if(isSkimData == 1):
-                    lumiTreeCopy2 = lumiTree.CopyTree("");
-                    lumiTreeCopy2.Write()
-                fOut2.Close()
                 if(eventCounts[1] > 0):
                     atLeastOneFile[1] = True
                     msgMerge2 = msgMerge2 + " " + fOutIndivName2
 
-                fOut3 = ROOT.TFile(fOutIndivName3,"UPDATE")
-                fOut3.cd()
-                runTreeCopy3 = runTree.CopyTree("");
-                runTreeCopy3.Write()
-                if(isSkimData == 1):
-                    lumiTreeCopy3 = lumiTree.CopyTree("");
-                    lumiTreeCopy3.Write()
-                fOut3.Close()
                 if(eventCounts[2] > 0):
                     atLeastOneFile[2] = True
                     msgMerge3 = msgMerge3 + " " + fOutIndivName3
 
-                fOut4 = ROOT.TFile(fOutIndivName4,"UPDATE")
-                fOut4.cd()
-                runTreeCopy4 = runTree.CopyTree("");
-                runTreeCopy4.Write()
-                if(isSkimData == 1):
-                    lumiTreeCopy4 = lumiTree.CopyTree("");
-                    lumiTreeCopy4.Write()
-                fOut4.Close()
                 if(eventCounts[3] > 0):
                     atLeastOneFile[3] = True
                     msgMerge4 = msgMerge4 + " " + fOutIndivName4
 
-                fOut5 = ROOT.TFile(fOutIndivName5,"UPDATE")
-                fOut5.cd()
-                runTreeCopy5 = runTree.CopyTree("");
-                runTreeCopy5.Write()
-                if(isSkimData == 1):
-                    lumiTreeCopy5 = lumiTree.CopyTree("");
-                    lumiTreeCopy5.Write()
-                fOut5.Close()
                 if(eventCounts[4] > 0):
                     atLeastOneFile[4] = True
                     msgMerge5 = msgMerge5 + " " + fOutIndivName5
 
-                os.remove(inputSingleFileBase)
+                if(incrementalDir != ""):
+                    manifest["inputs"][str(nf)] = {"input": inputSingleFile, "fingerprint": getInputFingerprint(inputSingleFile,inputEvents.get(str(inputSingleFile),-1)),
+                                                   "inputEntries": int(totalCount.GetValue() if useLazySnapshot == True else totalCount), "eventCounts": [int(x) for x in eventCounts]}
+                    writeSkimManifest(manifestName, manifest)
+
+                if(prefetcher is not None):
+                    prefetcher.release(toSkim.index(nf))
+                else:
+                    os.remove(inputSingleFileBase)
+
+            if(prefetcher is not None):
+                prefetcher.stop()
+                prefetcher.summary()
 
             if(isJobFailure == True):
                 print("Job ({0}/{1}) failed completely".format(outputDir,i))
@@ -736,8 +955,12 @@ if __name__ == "__main__":
                     os.remove(fOutName5)
 
             # Delete used files
+            if(manifestName != ""):
+                msgRm = msgRm + " " + manifestName
             print(msgRm)
             os.system(msgRm)
 
         except Exception as e:
             print("PROBLEM {0} / {1} / {2}".format(outputDir,i,e))
+            if(prefetcher is not None):
+                prefetcher.stop()
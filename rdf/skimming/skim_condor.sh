@@ -23,7 +23,7 @@ cp /tmp/x509up_u${USERPROXY} /home/submit/ceballos/x509up_u${USERPROXY}
 
 tar cvzf skim.tgz --exclude='*.csv' \
 skim.py skim_*.cfg \
-functions_skim.h haddnanoaod.py \
+functions_skim.h haddnanoaod.py prefetch_skim.py \
 jsns/* config/*
 
 mkdir -p logs;
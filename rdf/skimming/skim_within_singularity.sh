@@ -22,7 +22,7 @@ echo $PWD
 python3 skim.py --whichSample=$1 --whichJob=$2 --group=$3 --inputSamplesCfg=$4 --inputFilesCfg=$5
 status=$?
 
-rm -rf skim.tgz skim.py skim_*.cfg functions_skim.h haddnanoaod.py jsns config
+rm -rf skim.tgz skim.py skim_*.cfg functions_skim.h haddnanoaod.py prefetch_skim.py jsns config
 
 if [ $status -eq 0 ]; then
   echo "SUCCESS"
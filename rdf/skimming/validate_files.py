@@ -0,0 +1,220 @@
+import ROOT
+import os, sys, getopt, time, json, glob
+import multiprocessing
+
+# Parallel validation of skim and analysis output files reading only the file headers and
+# the tree metadata (no basket is decompressed): the file opens without recovery, its end
+# is within the file size, it has keys, the required trees are there and the entries of
+# all their branches agree with the tree and point inside the file.
+# With --condorCfg the expected skim outputs of every job are checked (the same names and
+# the same minimum size as check_missing_skim_files.py, every skim directory is listed once):
+# a skim type of a job is good when any of its existing candidates passes, and the jobs with
+# a missing or bad output are written to the resubmission list in the same format.
+# With --input the root files of the given files/directories/patterns are checked
+# (e.g. the fillhisto outputs of the analyses) and the bad ones are listed.
+# All the per-file results are written to a json file.
+
+skimTypes = ["1l", "2l", "3l", "met", "pho"]
+
+# Worker: header-level checks of one file, returns a dictionary with the result
+def checkFile(args):
+
+    (fileName, trees, compression, minSize) = args
+    result = {"path": fileName, "status": "good", "errors": [], "size": 0, "keys": 0,
+              "compression": None, "recovered": False, "trees": {}}
+
+    if(fileName.endswith(".txt")):
+        # skim jobs without selected events leave an empty marker file
+        result["status"] = "empty"
+        return result
+
+    ROOT.gErrorIgnoreLevel = ROOT.kFatal
+    inputFile = ROOT.TFile.Open(fileName)
+    if(not inputFile or inputFile.IsZombie()):
+        result["status"] = "bad"
+        result["errors"].append("cannot open")
+        return result
+
+    result["size"] = inputFile.GetSize()
+    if(result["size"] <= minSize):
+        result["errors"].append("size {0} not above {1} bytes".format(result["size"],minSize))
+    result["keys"] = inputFile.GetNkeys()
+    result["compression"] = inputFile.GetCompressionSettings()
+    result["recovered"] = inputFile.TestBit(ROOT.TFile.kRecovered)
+    if(result["recovered"] == True):
+        result["errors"].append("keys recovered, the file was not closed")
+    if(inputFile.GetEND() > result["size"]):
+        result["errors"].append("truncated: end {0} beyond size {1}".format(inputFile.GetEND(),result["size"]))
+    if(result["keys"] == 0):
+        result["errors"].append("no keys")
+    if(compression >= 0 and result["compression"] != compression):
+        result["errors"].append("compression {0} instead of {1}".format(result["compression"],compression))
+
+    for treeName in trees:
+        tree = inputFile.Get(treeName)
+        if(not tree or not tree.InheritsFrom("TTree")):
+            result["errors"].append("no {0} tree".format(treeName))
+            continue
+        nEntries = tree.GetEntries()
+        result["trees"][treeName] = nEntries
+        for branch in tree.GetListOfBranches():
+            if(branch.GetEntries() != nEntries):
+                result["errors"].append("{0}.{1}: {2} entries instead of {3}".format(treeName,branch.GetName(),branch.GetEntries(),nEntries))
+                break
+            nBaskets = branch.GetWriteBasket()
+            if(nBaskets > 0 and branch.GetBasketSeek(nBaskets-1) >= inputFile.GetEND()):
+                result["errors"].append("{0}.{1}: basket beyond the end of the file".format(treeName,branch.GetName()))
+                break
+
+    inputFile.Close()
+
+    if(len(result["errors"]) > 0): result["status"] = "bad"
+    return result
+
+# expected skim outputs of the jobs of a condor configuration: per job and skim type all the
+# existing candidates (merged, per job and empty marker), an empty list if there is none
+def getSkimOutputs(outputForCondorCfg, outputDir, types):
+
+    jobs = []
+    listings = {}
+    with open(outputForCondorCfg) as outputFile:
+        for lineRaw in outputFile:
+            line = lineRaw.strip().split(None, 4)
+            if not line: continue
+            outputs = {}
+            for skimType in types:
+                directory = os.path.join(outputDir, skimType, line[3])
+                if(directory not in listings):
+                    listings[directory] = set(os.listdir(directory)) if os.path.isdir(directory) else set()
+                outputs[skimType] = []
+                for name in ["output_{0}_{1}.root".format(skimType,line[1]),
+                             "output_{0}_{1}_{2}.root".format(skimType,line[0],line[1]),
+                             "output_{0}_{1}_{2}.txt".format(skimType,line[0],line[1])]:
+                    if(name in listings[directory]):
+                        outputs[skimType].append(os.path.join(directory, name))
+            jobs.append((lineRaw, outputs))
+
+    return jobs
+
+def getInputFiles(inputs):
+
+    fileNames = []
+    for x in inputs:
+        if(os.path.isdir(x)):
+            for root, dirs, files in os.walk(x):
+                fileNames += [os.path.join(root, y) for y in sorted(files) if y.endswith(".root")]
+        else:
+            fileNames += sorted(glob.glob(x))
+
+    return fileNames
+
+if __name__ == "__main__":
+
+    outputDir = "/ceph/submit/data/group/cms/store/user/ceballos/nanoaod/skims_submit"
+    outputForCondorCfg = ""
+    inputs = ""
+    types = "1l,2l,3l,met"
+    trees = "Events"
+    compression = -1
+    nWorkers = 8
+    jsonName = "validate_files.json"
+    resubmitName = "skim_input_condor_missing_jobs_fromDAS.cfg"
+
+    valid = ['outputDir=', 'condorCfg=', 'input=', 'types=', 'trees=', 'compression=', 'nWorkers=', 'json=', 'resubmit=', 'help']
+    usage  =  "Usage: validate_files.py --outputDir=<{0}>\n".format(outputDir)
+    usage +=  "                         --condorCfg=<{0}> (skim outputs of the jobs)\n".format(outputForCondorCfg)
+    usage +=  "                         --input=<{0}> (comma separated files, directories or patterns)\n".format(inputs)
+    usage +=  "                         --types=<{0}>\n".format(types)
+    usage +=  "                         --trees=<{0}> (comma separated, empty for none)\n".format(trees)
+    usage +=  "                         --compression=<{0}> (expected settings, -1 for any)\n".format(compression)
+    usage +=  "                         --nWorkers=<{0}>\n".format(nWorkers)
+    usage +=  "                         --json=<{0}>\n".format(jsonName)
+    usage +=  "                         --resubmit=<{0}>".format(resubmitName)
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], "", valid)
+    except getopt.GetoptError as ex:
+        print(usage)
+        print(str(ex))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt == "--help":
+            print(usage)
+            sys.exit(1)
+        if opt == "--outputDir":
+            outputDir = str(arg)
+        if opt == "--condorCfg":
+            outputForCondorCfg = str(arg)
+        if opt == "--input":
+            inputs = str(arg)
+        if opt == "--types":
+            types = str(arg)
+        if opt == "--trees":
+            trees = str(arg)
+        if opt == "--compression":
+            compression = int(arg)
+        if opt == "--nWorkers":
+            nWorkers = int(arg)
+        if opt == "--json":
+            jsonName = str(arg)
+        if opt == "--resubmit":
+            resubmitName = str(arg)
+
+    if((outputForCondorCfg == "") == (inputs == "")):
+        print("Exactly one of --condorCfg and --input is needed")
+        print(usage)
+        sys.exit(1)
+
+    treeList = [x for x in trees.split(",") if x != ""]
+    startTime = time.time()
+
+    jobs = []
+    minSize = 0
+    if(outputForCondorCfg != ""):
+        typeList = [x for x in types.split(",") if x != ""]
+        for skimType in typeList:
+            if(skimType not in skimTypes):
+                print("Unknown skim type: {0}".format(skimType))
+                sys.exit(1)
+        jobs = getSkimOutputs(outputForCondorCfg, outputDir, typeList)
+        fileNames = [z for x in jobs for y in x[1].values() for z in y]
+        # same rule as check_missing_skim_files.py for the skim root files
+        minSize = 1000
+    else:
+        fileNames = getInputFiles(inputs.split(","))
+
+    pool = multiprocessing.Pool(max(nWorkers,1))
+    results = pool.map(checkFile, [(x, treeList, compression, minSize) for x in fileNames], chunksize=8)
+    pool.close()
+    pool.join()
+    resultsByName = dict([(x["path"], x) for x in results])
+
+    resubmitLines = []
+    if(outputForCondorCfg != ""):
+        for lineRaw, outputs in jobs:
+            isGood = True
+            for skimType, fileNamesType in outputs.items():
+                if(not any([resultsByName[x]["status"] != "bad" for x in fileNamesType])):
+                    isGood = False
+            if(isGood == False):
+                resubmitLines.append(lineRaw if lineRaw.endswith("\n") else lineRaw + "\n")
+    else:
+        resubmitLines = ["{0}\n".format(x["path"]) for x in results if x["status"] == "bad"]
+
+    with open(resubmitName, "w") as resubmitFile:
+        resubmitFile.writelines(resubmitLines)
+
+    summary = {"files": len(results), "good": len([x for x in results if x["status"] == "good"]),
+               "empty": len([x for x in results if x["status"] == "empty"]), "bad": len([x for x in results if x["status"] == "bad"]),
+               "jobs": len(jobs), "missing": len([y for x in jobs for y in x[1].values() if len(y) == 0]),
+               "resubmit": len(resubmitLines), "time": time.time()-startTime}
+    with open(jsonName + ".tmp", "w") as jsonFile:
+        json.dump({"summary": summary, "files": results,
+                   "jobs": [{"line": x[0].strip(), "outputs": x[1]} for x in jobs]}, jsonFile, indent=1)
+    os.replace(jsonName + ".tmp", jsonName)
+
+    for x in results:
+        if(x["status"] == "bad"): print("BAD {0}: {1}".format(x["path"],"; ".join(x["errors"])))
+    print("Files: {0} good / {1} empty / {2} bad, jobs: {3} with {4} missing outputs ({5:.1f} s)".format(
+          summary["good"],summary["empty"],summary["bad"],summary["jobs"],summary["missing"],summary["time"]))
+    print("Results in {0}, {1} entries to resubmit in {2}".format(jsonName,len(resubmitLines),resubmitName))